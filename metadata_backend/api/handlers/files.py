@@ -1,17 +1,25 @@
 """Files API handler."""
 
-from typing import Annotated
+from typing import Annotated, AsyncGenerator
 
 from fastapi import HTTPException, Path, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from ...api.dependencies import UserDependency
 from ...helpers.logger import LOG
 from ...services.auth_service import AuthServiceHandler
-from ..services.file import FileProviderService
 from .restapi import RESTAPIHandler
 
 BucketNamePathParam = Annotated[str, Path(description="The bucket name")]
 ProjectIdQueryParam = Annotated[str, Query(alias="projectId", description="The project ID")]
+PrefixQueryParam = Annotated[str | None, Query(description="List only files whose path starts with the prefix")]
+DelimiterQueryParam = Annotated[
+    str | None,
+    Query(description="List only files whose path does not contain the delimiter after the prefix"),
+]
+
+# Bytes of the JSON file list written to the response at a time.
+FILE_LIST_CHUNK_SIZE = 64 * 1024
 
 
 class FilesAPIHandler(RESTAPIHandler):
@@ -55,8 +63,13 @@ class FilesAPIHandler(RESTAPIHandler):
         user: UserDependency,
         bucket: BucketNamePathParam,
         project_id: ProjectIdQueryParam,
-    ) -> FileProviderService.Files:
-        """List all files in a specific bucket."""
+        prefix: PrefixQueryParam = None,
+        delimiter: DelimiterQueryParam = None,
+    ) -> StreamingResponse:
+        """List all files in a specific bucket.
+
+        The files are streamed as a JSON array while they are listed from the bucket.
+        """
 
         project_service = self._services.project
         file_service = self._services.file_provider
@@ -65,9 +78,26 @@ class FilesAPIHandler(RESTAPIHandler):
         user_id = user.user_id
         await project_service.verify_user_project(user_id, project_id)
 
-        files = await file_service.list_files_in_bucket(bucket)
-        LOG.info("Retrieved %d files in bucket %s.", len(files.root), bucket)
-        return files
+        # Check the bucket access and that the bucket has files before the response is started.
+        files = file_service.iter_files_in_bucket(bucket, prefix=prefix, delimiter=delimiter)
+        first_file = await anext(files)
+
+        async def json_stream() -> AsyncGenerator[bytes]:
+            count = 1
+            chunk = bytearray(b"[")
+            chunk += first_file.model_dump_json().encode("utf-8")
+            async for file in files:
+                count += 1
+                chunk += b","
+                chunk += file.model_dump_json().encode("utf-8")
+                if len(chunk) >= FILE_LIST_CHUNK_SIZE:
+                    yield bytes(chunk)
+                    chunk.clear()
+            chunk += b"]"
+            yield bytes(chunk)
+            LOG.info("Retrieved %d files in bucket %s.", count, bucket)
+
+        return StreamingResponse(json_stream(), media_type="application/json", status_code=200)
 
     async def grant_access_to_bucket(
         self,
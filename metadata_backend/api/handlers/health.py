@@ -2,15 +2,36 @@
 
 import asyncio
 
+from fastapi import Response
+
+from ...helpers import metrics
 from ...helpers.logger import LOG
 from ...services.service_handler import HealthHandler
 from ..models.health import Health, ServiceHealth
-from .restapi import RESTAPIHandler
+from ..services.ingest import SDAIngestService
+from .restapi import RESTAPIHandler, RESTAPIServiceHandlers, RESTAPIServices
 
 
 class HealthAPIHandler(RESTAPIHandler):
     """Health API handler."""
 
+    def __init__(
+        self,
+        services: RESTAPIServices,
+        handlers: RESTAPIServiceHandlers,
+        *,
+        ingest_service: SDAIngestService | None = None,
+    ) -> None:
+        """
+        Health API handler.
+
+        :param services: The services.
+        :param handlers: The service handlers.
+        :param ingest_service: The ingest scanner service providing the ingest metrics.
+        """
+        super().__init__(services, handlers)
+        self._ingest_service = ingest_service
+
     @staticmethod
     async def get_health(handler: HealthHandler) -> tuple[str, Health]:
         """
@@ -65,3 +86,14 @@ class HealthAPIHandler(RESTAPIHandler):
             status = Health.UP
 
         return ServiceHealth(status=status, services=services)
+
+    async def get_metrics(self) -> Response:
+        """
+        Get the metrics of this worker in the Prometheus text exposition format.
+
+        The ingest metrics are the ones published by the worker that runs the ingest scanner.
+        """
+        content = metrics.REGISTRY.render()
+        if self._ingest_service is not None:
+            content += await self._ingest_service.get_metrics()
+        return Response(content=content, media_type=metrics.CONTENT_TYPE)
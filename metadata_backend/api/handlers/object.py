@@ -12,7 +12,6 @@ from ...api.dependencies import (
     WorkflowDependency,
 )
 from ...database.postgres.services.submission import UnknownSubmissionUserException
-from ...helpers.logger import LOG
 from ..exceptions import SystemException, UserException
 from ..models.models import Object
 from ..models.submission import Submission, SubmissionWorkflow
@@ -34,6 +33,13 @@ ObjectNameFilterQueryParam = Annotated[str | None, Query(alias="objectName", des
 
 ProjectIdQueryParam = Annotated[str, Query(alias="projectId", description="The project ID")]
 
+PageSizeQueryParam = Annotated[
+    int | None, Query(ge=1, le=1000, alias="per_page", description="Number of metadata objects per page")
+]
+PageTokenQueryParam = Annotated[
+    str | None, Query(alias="page_token", description="The page token from the Link header of the previous page")
+]
+
 
 class ObjectAPIHandler(RESTAPIHandler):
     """Object API handler."""
@@ -190,13 +196,22 @@ class ObjectAPIHandler(RESTAPIHandler):
 
     async def list_objects(
         self,
+        request: Request,
+        response: Response,
         user: UserDependency,
         submission_id: SubmissionIdOrNamePathParam,
         project_id: ProjectIdQueryParam = None,
         object_type: ObjectTypeFilterQueryParam = None,
         schema_type: SchemaTypeFilterQueryParam = None,
+        page_size: PageSizeQueryParam = None,
+        page_token: PageTokenQueryParam = None,
     ) -> list[Object]:
-        """List the metadata documents in the submission."""
+        """
+        List the metadata documents in the submission.
+
+        All metadata documents are returned unless the page size is given. The next page
+        is returned in the RFC 5988 Link header.
+        """
 
         submission_service = self._services.submission
         object_service = self._services.object
@@ -232,7 +247,17 @@ class ObjectAPIHandler(RESTAPIHandler):
         object_types = self._get_xml_object_types(xml_config, object_type, schema_type)
 
         # Get objects.
-        objects = await object_service.get_objects(submission_id, object_types)
+        if page_size is None:
+            if page_token is not None:
+                raise UserException("Page token requires the page size.")
+            return await object_service.get_objects(submission_id, object_types)
+
+        objects, next_page_token = await object_service.get_objects_page(
+            submission_id, object_types, page_size=page_size, page_token=page_token
+        )
+        if next_page_token is not None:
+            next_url = request.url.include_query_params(page_token=next_page_token)
+            response.headers["Link"] = f'<{next_url}>; rel="next"'
         return objects
 
     async def get_objects(
@@ -282,19 +307,15 @@ class ObjectAPIHandler(RESTAPIHandler):
                 # Get object types.
                 object_types = self._get_xml_object_types(xml_config, object_type, schema_type)
 
-            # Get objects.
-            objects = await object_service.get_objects(
-                submission_id, object_types, object_id=object_id, name=object_name
-            )
-
             if object_type is not None and [object_type] != object_types:
                 raise SystemException(
                     f"Expecting only '{object_type}' object type. Actual object types: '{object_types}'"
                 )
 
-            # Get documents.
-            for obj in objects:
-                xml = await object_service.get_xml_document(obj.objectId)
+            # Stream documents.
+            async for xml in object_service.get_xml_documents(
+                submission_id, object_types, object_id=object_id, name=object_name
+            ):
                 yield xml
 
         async def xml_stream() -> AsyncGenerator[bytes]:
@@ -329,14 +350,9 @@ class ObjectAPIHandler(RESTAPIHandler):
 
         for file in files:
             if file.filename:
-                content = await file.read()
-                try:
-                    document = content.decode("utf-8")
-                except UnicodeDecodeError:
-                    LOG.error(f"Could not decode file '{file.filename}' as UTF-8")
-                    raise UserException(f"Could not decode file '{file.filename}' as UTF-8")
-
-                objects.append(ObjectSubmission(filename=file.filename, document=document))
+                # Large files are spooled to disk. The files are read by the submission
+                # services on demand instead of reading and decoding them into memory here.
+                objects.append(ObjectSubmission(filename=file.filename, file=file.file))
 
         if not objects:
             raise UserException("No files in the multipart request")
@@ -9,6 +9,7 @@ from ...api.dependencies import SubmissionIdPathParam, UserDependency
 from ...conf.conf import DEPLOYMENT_CSC
 from ...conf.deployment import deployment_config
 from ...conf.discovery import discovery_config
+from ...database.postgres.notifications import notify
 from ...helpers.logger import LOG
 from ..exceptions import SystemException, UserException
 from ..models.datacite import DataCiteMetadata
@@ -21,6 +22,7 @@ from ..processors.xml.bigpicture import (
 from ..processors.xml.processors import XmlObjectProcessor
 from ..services.bigpicture import upload_bp_metadata_xmls
 from ..services.datacite import DataciteService
+from ..services.ingest import SUBMISSION_PUBLISHED_CHANNEL
 from ..services.submission.bigpicture import is_clinical_policy
 from .restapi import RESTAPIHandler
 from .submission import SubmissionAPIHandler
@@ -284,6 +286,10 @@ class PublishAPIHandler(RESTAPIHandler):
         # Update submission status to published.
         await submission_service.publish(submission_id)
 
+        if workflow == SubmissionWorkflow.BP:
+            # Start the ingest without waiting for the next ingest scan.
+            await notify(SUBMISSION_PUBLISHED_CHANNEL, submission_id)
+
         LOG.info("Publishing submission with ID %r was successful.", submission_id)
         return SubmissionId(submissionId=submission_id)
 
@@ -380,16 +386,14 @@ class PublishAPIHandler(RESTAPIHandler):
         if not bucket:
             raise UserException(f"Submission '{submission_id}' is not linked to any bucket.")
 
-        files = await self._services.file_provider.list_files_in_bucket(bucket)
-        for file in files.root:
-            # Check that we have not added the file already.
-            # For now, accept that file bytes might have changed and some files
-            # might have been removed if a call to this endpoint has failed before.
-            if not await self._services.file.is_file_by_path(submission_id, file.path):
-                await self._services.file.add_file(
-                    File(submissionId=submission_id, path=file.path, bytes=file.bytes),
-                    SubmissionWorkflow.SD,
-                )
+        # Add the files that have not been added already while the bucket is listed.
+        # For now, accept that file bytes might have changed and some files
+        # might have been removed if a call to this endpoint has failed before.
+        files = (
+            File(submissionId=submission_id, path=file.path, bytes=file.bytes)
+            async for file in self._services.file_provider.iter_files_in_bucket(bucket)
+        )
+        await self._services.file.add_missing_files(submission_id, files, SubmissionWorkflow.SD)
 
         # Check that the submission has at least one file.
         if await self._services.file.count_files(submission_id) == 0:
@@ -436,15 +440,15 @@ class PublishAPIHandler(RESTAPIHandler):
 
         inbox_files = await file_provider_service.list_submission_inbox_files(user_id, submission_id)
 
-        for inbox_file in inbox_files:
-            file_path = inbox_file.inbox_path
-
-            # Skip adding files that may already be added to the submission.
-            if await file_service.is_file_by_path(submission_id, file_path):
-                continue
-
-            # Thumbnail files are expected to be in the LANDING_PAGE/THUMBNAILS directory AND have .jpg.c4gh extension
-            if file_path.startswith(thumbnails_prefix) and file_path.lower().endswith(".jpg.c4gh"):
-                submission_file = File(submissionId=submission_id, path=file_path)
-                await file_service.add_file(submission_file, SubmissionWorkflow.BP)
-                LOG.info("Added thumbnail file '%s' to submission '%s'", file_path, submission_id)
+        # Thumbnail files are expected to be in the LANDING_PAGE/THUMBNAILS directory AND have .jpg.c4gh extension
+        thumbnail_files = [
+            File(submissionId=submission_id, path=inbox_file.inbox_path)
+            for inbox_file in inbox_files
+            if inbox_file.inbox_path.startswith(thumbnails_prefix)
+            and inbox_file.inbox_path.lower().endswith(".jpg.c4gh")
+        ]
+
+        # Skip adding files that may already be added to the submission.
+        added = await file_service.add_missing_files(submission_id, thumbnail_files, SubmissionWorkflow.BP)
+        if added:
+            LOG.info("Added %d thumbnail files to submission '%s'", added, submission_id)
@@ -2,16 +2,24 @@
 
 from typing import Annotated
 
-from fastapi import Query
+from fastapi import Header, Query, Response, status
 
-from ..models.rems import Organization, OrganizationsMap, RemsLicense, RemsWorkflow
-from ..services.rems import RemsOrganisationsService
+from ..models.rems import Organization
 from .restapi import RESTAPIHandler
 
 RemsLanguageQueryParam = Annotated[str, Query(description="REMS language code (e.g. 'en', 'fi', 'sv')")]
 RemsOrganisationIdFilterQueryParam = Annotated[
     str | None, Query(alias="organisation", description="REMS organisation ID")
 ]
+IfNoneMatchHeader = Annotated[str | None, Header(description="Entity tags of the organisations cached by the client")]
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True if the If-None-Match header matches the entity tag using the weak comparison."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
 
 
 class RemsAPIHandler(RESTAPIHandler):
@@ -19,15 +27,23 @@ class RemsAPIHandler(RESTAPIHandler):
 
     async def get_organisations(
         self,
+        response: Response,
         language: RemsLanguageQueryParam = "en",
         organisation_id: RemsOrganisationIdFilterQueryParam = None,
-    ) -> list[Organization]:
-        """Get REMS organisations with workflows and licenses."""
+        if_none_match: IfNoneMatchHeader = None,
+    ) -> list[Organization] | Response:
+        """
+        Get REMS organisations with workflows and licenses.
+
+        The REMS workflows and licenses are cached. Returns 304 Not Modified if the
+        If-None-Match header matches the entity tag of the organisations.
+        """
+
+        reference_data = await self._handlers.rems.get_reference_data()
 
-        workflows: list[RemsWorkflow] = await self._handlers.rems.get_workflows()
-        licenses: list[RemsLicense] = await self._handlers.rems.get_licenses()
+        etag = reference_data.get_etag(language, organisation_id)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-        organizations: OrganizationsMap = await RemsOrganisationsService.get_organisations(
-            workflows, licenses, language, organisation_id
-        )
-        return list(organizations.values())
+        response.headers["ETag"] = etag
+        return await reference_data.get_organisations(language, organisation_id)
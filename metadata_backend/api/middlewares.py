@@ -3,7 +3,7 @@ from http.cookies import SimpleCookie
 from typing import Any, MutableMapping
 
 import jwt
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
 from starlette.datastructures import Headers
 from starlette.requests import Request
 from starlette.responses import Response
@@ -14,11 +14,15 @@ from ..api.exceptions import AppException, SystemException, UnauthorizedUserExce
 from ..api.models.models import User
 from ..api.services.auth import AuthService
 from ..conf.deployment import deployment_config
+from ..database.postgres.repository import ReadOnlySession
 from ..helpers.logger import LOG
 from .models.app import app_state
 
 AUTH_COOKIE = "access_token"
 
+# Requests with these methods do not change the database and use read-only transactions.
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 
 class SessionMiddleware:
     """
@@ -26,7 +30,14 @@ class SessionMiddleware:
     context variable.
 
     Starts the database transaction before the request processing begins, and ends it after
-    the request processing is completed but before the response is sent back.
+    the request processing is completed but before the response is sent back. Ending the
+    transaction returns the database connection to the connection pool.
+
+    Requests with read-only methods use the read-only session factory if it is available.
+    The read-only sessions return the database connection to the connection pool after
+    each query instead of holding it until the response starts, so the pool size does not
+    limit the number of concurrent read-only requests. The read-only transactions are
+    rejected by PostgreSQL if they try to change the database.
 
     Repositories retrieve the session from the task- and request-specific context variable
     to use the database. The repositories should not begin, commit or rollback the transaction.
@@ -54,7 +65,10 @@ class SessionMiddleware:
                 LOG.error("Session middleware context already set: method: %s, path: %s", method, path)
                 raise SystemException("Session context is already set")
 
-            session_factory = app_state(self.app).session_factory
+            state = app_state(self.app)
+            session_factory = state.session_factory
+            if method in READ_ONLY_METHODS:
+                session_factory = getattr(state, "read_only_session_factory", None) or session_factory
 
             if session_factory is None:
                 raise SystemException("Missing session factory")
@@ -89,7 +103,11 @@ class SessionMiddleware:
                 try:
                     token = self.session_context.set(session)
 
-                    transaction = await session.begin()
+                    # Read-only sessions end the transaction after each query. Committing or
+                    # rolling back the session ends the current transaction if there is one.
+                    transaction: AsyncSession | AsyncSessionTransaction = (
+                        session if isinstance(session, ReadOnlySession) else await session.begin()
+                    )
 
                     await self.app(scope, receive, transactional_send)
 
@@ -111,13 +129,23 @@ class SessionMiddleware:
 
 
 class AuthMiddleware:
-    """Authenticate API requests."""
+    """
+    Authenticate API requests.
+
+    API keys are validated using the request database session and must be
+    wrapped by the SessionMiddleware.
+    """
 
     def __init__(self, app: ASGIApp, auth_service: AuthService):
         self.app = app
         self.auth_service = auth_service
         self.api_prefix_v1 = deployment_config().API_PREFIX_V1
 
+    @property
+    def state(self) -> Any:
+        """Application state of the wrapped application used by the SessionMiddleware."""
+        return self.app.state  # type: ignore
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         path = scope.get("path", "")
 
@@ -10,9 +10,13 @@ from .models import User
 
 
 class AppState(Protocol):
-    """Application state for holding session factory."""
+    """Application state for holding session factories."""
 
     session_factory: SessionFactory
+    # Session factory for read-only requests.
+    read_only_session_factory: SessionFactory | None
+    # Session factory with a separate connection pool for the database cache backend.
+    cache_session_factory: SessionFactory | None
 
 
 class RequestState(Protocol):
@@ -116,3 +116,13 @@ class IngestFileState(StrictBaseModel):
     ingest_error: str | None = None
     ingest_error_type: IngestErrorType | None = None
     ingest_error_count: int | None = None
+    modified: datetime | None = None
+
+
+class IngestStatusUpdate(StrictBaseModel):
+    """File ingest status change saved by ingest orchestration."""
+
+    file_id: str
+    ingest_status: IngestStatus
+    ingest_error: str | None = None
+    ingest_error_type: IngestErrorType | None = None
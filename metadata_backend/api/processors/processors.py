@@ -1,7 +1,7 @@
 """Metadata object processor to inject accession numbers."""
 
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Iterator, Sequence
 
 from .models import ObjectIdentifier
 
@@ -42,6 +42,18 @@ class DocumentsProcessor(ABC):
         :return: metadata object processor.
         """
 
+    @abstractmethod
+    def iter_object_processors(
+        self, schema_type: str | None = None, root_path: str | None = None
+    ) -> Iterator[ObjectProcessor]:
+        """
+        Iterate the metadata object processors in document order.
+
+        :param schema_type: The optional schema type.
+        :param root_path: The optional metadata object root path.
+        :return: metadata object processors.
+        """
+
     @abstractmethod
     def get_object_identifiers(self, schema_type: str | None = None) -> Sequence[ObjectIdentifier]:
         """
@@ -1,6 +1,6 @@
 """Xml metadata object processor."""
 
-from typing import Sequence
+from typing import Mapping, Sequence
 
 from lxml.etree import _LogEntry  # noqa
 
@@ -8,12 +8,23 @@ from lxml.etree import _LogEntry  # noqa
 class SchemaValidationException(Exception):
     """Exception containing XML Schema validation errors."""
 
-    def __init__(self, schema_type: str, errors: Sequence[_LogEntry]) -> None:
+    def __init__(self, schema_type: str, errors: Sequence[_LogEntry], aliases: Mapping[int, str] | None = None) -> None:
         """
         Exception containing XML Schema validation errors.
 
+        :param schema_type: The schema type.
         :param errors: Sequence or XML Schema validation errors.
+        :param aliases: Optional metadata object aliases by error line number.
         """
+        self.schema_type = schema_type
         self.errors: Sequence[_LogEntry] = errors
-        messages: list[str] = [f"Line {err.line}: {err.message}" for err in errors]
+        self.aliases: Mapping[int, str] = aliases or {}
+
+        def _message(err: _LogEntry) -> str:
+            alias = self.aliases.get(err.line)
+            if alias is not None:
+                return f"Line {err.line} ('{alias}'): {err.message}"
+            return f"Line {err.line}: {err.message}"
+
+        messages: list[str] = [_message(err) for err in errors]
         super().__init__(f"XML Schema validation failed for '{schema_type}':\n" + "\n".join(messages))
@@ -1,7 +1,9 @@
 """XML metadata object models to inject accession numbers."""
 
-from typing import Callable, Type
+from functools import lru_cache
+from typing import Any, Callable, Type
 
+from lxml import etree
 from lxml.etree import _Element as Element  # noqa
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -37,6 +39,72 @@ def validate_relative_path(path: str) -> str:
     return path
 
 
+def normalise_xpath(path: str, prefix: str) -> str:
+    """
+    Normalise an XPath expression with the given prefix.
+
+    :param path: Original XPath.
+    :param prefix: Desired prefix for all steps (e.g., './' or '/').
+    :return: Normalise XPath starting with the prefix.
+    """
+    path = path.strip()
+
+    if not path.startswith("("):
+        # Single path
+        return prefix + path.lstrip(".").lstrip("/")
+
+    # Multiple paths
+    last = path.rfind(")")
+    if last == -1:
+        raise ValueError("Expected closing ')' in XPath")
+
+    inner = path[1:last]
+    post = path[last + 1 :]  # noqa
+
+    # split by | and normalize each part
+    parts = [prefix + p.strip().lstrip(".").lstrip("/") for p in inner.split("|")]
+    return "(" + " | ".join(parts) + ")" + post
+
+
+@lru_cache(maxsize=1024)
+def compile_xpath(path: str) -> etree.XPath:
+    """
+    Compile an absolute or relative XPath expression. Compiled expressions are cached.
+
+    Absolute XPaths are evaluated relative to the root element of the element tree. This
+    is consistent with ElementTree.xpath for element trees created from nested elements,
+    for example from metadata objects inside a set document.
+
+    :param path: Absolute XPath starting with '/' or relative XPath starting with '.'.
+    :return: The compiled XPath.
+    """
+    if path.startswith("/"):
+        expression = normalise_xpath(path, "self::")
+    else:
+        expression = validate_relative_path(path)
+
+    try:
+        return etree.XPath(expression)
+    except etree.XPathSyntaxError as e:
+        raise ValueError(f"Invalid XPath expression '{path}'") from e
+
+
+@lru_cache(maxsize=1024)
+def compile_config_xpath(path: str, absolute: bool) -> etree.XPath:
+    """
+    Compile a configured XPath expression. Compiled expressions are cached.
+
+    The XPath is normalised to start with '/' if absolute, or with './' if relative.
+
+    :param path: The configured XPath.
+    :param absolute: Is the XPath absolute or relative.
+    :return: The compiled XPath.
+    """
+    if absolute:
+        return compile_xpath(validate_absolute_path(normalise_xpath(path, "/")))
+    return compile_xpath(validate_relative_path(normalise_xpath(path, "./")))
+
+
 class XmlSchemaPath(BaseModel):
     """Xml metadata object schema given an identifying XPath."""
 
@@ -150,6 +218,45 @@ class XmlObjectConfig(BaseModel):
     schema_dir: str | None = None
     schema_file_resolver: Callable[[str], str] | None = None
 
+    def model_post_init(self, context: Any) -> None:
+        """
+        Compile all configured XPaths when the configuration is created.
+
+        :param context: The pydantic validation context.
+        """
+        _ = context  # silence vulture
+        for s in self.schema_paths:
+            if s.set_path is not None:
+                self.get_xpath(s.set_path, absolute=True)
+            for path in s.root_paths:
+                self.get_xpath(path, absolute=True)
+        for o in self.object_paths:
+            self.get_xpath(o.root_path, absolute=True)
+            for p in o.identifier_paths:
+                self.get_xpath(p.name_path, absolute=False)
+                self.get_xpath(p.id_path, absolute=False)
+            if o.title_path is not None:
+                self.get_xpath(o.title_path, absolute=False)
+            if o.description_path is not None:
+                self.get_xpath(o.description_path, absolute=False)
+        for r in self.reference_paths:
+            self.get_xpath(r.root_path, absolute=True)
+            for p in r.paths:
+                self.get_xpath(p.name_path, absolute=False)
+                self.get_xpath(p.id_path, absolute=False)
+
+    def get_xpath(self, path: str, *, absolute: bool) -> etree.XPath:
+        """
+        Get the compiled XPath for a configured XPath.
+
+        The XPath is normalised to start with '/' if absolute, or with './' if relative.
+
+        :param path: The configured XPath.
+        :param absolute: Is the XPath absolute or relative.
+        :return: The compiled XPath.
+        """
+        return compile_config_xpath(path, absolute)
+
     def get_root_path(self, object_type: str) -> str:
         """
         Get the root path for the metadata object.
@@ -1,10 +1,13 @@
 """XML metadata object processor to inject accession numbers."""
 
+import copy
 import os
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import Counter
 from itertools import chain
 from pathlib import Path
-from typing import IO, AsyncIterator, Callable, Iterable, Sequence, cast, override
+from typing import IO, Any, AsyncIterator, Callable, Iterable, Iterator, Sequence, cast, override
 
 import fsspec
 from lxml import etree
@@ -20,6 +23,7 @@ from .models import (
     XmlObjectConfig,
     XmlObjectPaths,
     XmlReferencePaths,
+    compile_xpath,
     validate_absolute_path,
     validate_relative_path,
 )
@@ -61,6 +65,67 @@ class XmlProcessor(ABC):
 
         return etree.ElementTree(etree.fromstring(xml, parser))
 
+    @staticmethod
+    def iter_xml_objects(
+        config: XmlObjectConfig, xml: IO[bytes], *, schema_type: str | None = None
+    ) -> Iterator[Element]:
+        """
+        Incrementally parse XML file and iterate the metadata object elements with normalized whitespace.
+
+        If the root element is a set element then its child elements are iterated. Otherwise,
+        the root element is iterated. The element tree is never fully built: each metadata object
+        element is cleared and removed from the set element after the iteration continues.
+
+        If the schema type is given then the XML file is validated against XML Schema while it is
+        parsed and SchemaValidationException is raised before an invalid metadata object is iterated.
+        The validation errors do not have line numbers.
+
+        :param config: Configuration object for XML processing.
+        :param xml: XML file to parse.
+        :param schema_type: The optional schema type used to validate the XML file.
+        :return: The metadata object elements.
+        """
+        set_paths = {p.set_path for p in config.schema_paths if p.set_path}
+
+        schema = None
+        if schema_type is not None and config.schema_dir is not None and config.schema_file_resolver is not None:
+            schema = XmlProcessor.get_xml_schema(config.schema_dir, schema_type, config.schema_file_resolver)
+
+        context = etree.iterparse(
+            xml, events=("start", "end"), schema=schema, remove_blank_text=True, remove_comments=True
+        )
+
+        def _check_errors() -> None:
+            if schema_type is not None and (errors := list(context.error_log.filter_from_errors())):
+                raise SchemaValidationException(schema_type, errors)
+
+        is_set = None
+        depth = 0
+        try:
+            for event, element in context:
+                if event == "start":
+                    if is_set is None:
+                        is_set = f"/{QName(element.tag).localname}" in set_paths
+                    depth += 1
+                    continue
+
+                depth -= 1
+                if is_set and depth == 1:
+                    # The element has been validated when it has been parsed.
+                    _check_errors()
+                    yield element
+                    # Release processed metadata objects.
+                    element.clear(keep_tail=False)
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+                elif not is_set and depth == 0:
+                    _check_errors()
+                    yield element
+        except etree.XMLSyntaxError as e:
+            if schema_type is None:
+                raise
+            raise SchemaValidationException(schema_type, list(e.error_log)) from e
+
     @staticmethod
     def write_xml(xml: ElementTree | Element) -> str:
         """
@@ -79,19 +144,18 @@ class XmlProcessor(ABC):
     _xml_schema_cache: dict[str, etree.XMLSchema] = {}
 
     @staticmethod
-    def validate_schema(
-        xml: ElementTree | Element,
+    def get_xml_schema(
         schema_dir: str,
         schema_type: str,
         schema_file_resolver: Callable[[str], str] = lambda schema_type: schema_type,
-    ) -> None:
+    ) -> etree.XMLSchema:
         """
-        Validate XML against XML Schema. Raise SchemaValidationException on failure.
+        Get the cached XML Schema.
 
-        :param xml: XML element or element tree.
         :param schema_dir: The directory for the XML schema files.
         :param schema_type: The schema type must resolve to the XML schema file using the schema type resolver
         :param schema_file_resolver: Resolves the XML schema file given the schema type.
+        :return: The XML Schema.
         """
         xml_schema_file = schema_file_resolver(schema_type)
         xml_schema_path = os.path.join(schema_dir, xml_schema_file)
@@ -99,7 +163,24 @@ class XmlProcessor(ABC):
         # Cache XML schemas.
         if xml_schema_path not in XmlProcessor._xml_schema_cache:
             XmlProcessor._xml_schema_cache[xml_schema_path] = etree.XMLSchema(etree.parse(xml_schema_path))
-        xml_schema = XmlProcessor._xml_schema_cache[xml_schema_path]
+        return XmlProcessor._xml_schema_cache[xml_schema_path]
+
+    @staticmethod
+    def validate_schema(
+        xml: ElementTree | Element,
+        schema_dir: str,
+        schema_type: str,
+        schema_file_resolver: Callable[[str], str] = lambda schema_type: schema_type,
+    ) -> None:
+        """
+        Validate XML against XML Schema. Raise SchemaValidationException on failure.
+
+        :param xml: XML element or element tree.
+        :param schema_dir: The directory for the XML schema files.
+        :param schema_type: The schema type must resolve to the XML schema file using the schema type resolver
+        :param schema_file_resolver: Resolves the XML schema file given the schema type.
+        """
+        xml_schema = XmlProcessor.get_xml_schema(schema_dir, schema_type, schema_file_resolver)
 
         if not xml_schema.validate(xml if isinstance(xml, ElementTree) else etree.ElementTree(xml)):
             raise SchemaValidationException(schema_type, xml_schema.error_log)
@@ -156,7 +237,9 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
     Automatically identifies the metadata type.
     """
 
-    def __init__(self, config: XmlObjectConfig, xml: ElementTree | str | bytes | Path | IO[bytes]) -> None:
+    def __init__(
+        self, config: XmlObjectConfig, xml: ElementTree | str | bytes | Path | IO[bytes], *, validate: bool = True
+    ) -> None:
         """
         Process one XML metadata object to inject accession numbers.
 
@@ -164,6 +247,8 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
 
         :param config: Configuration object for XML processing.
         :param xml: XML element tree, XML contents or XML file.
+        :param validate: If False, the XML schema validation is skipped. Used when the XML
+            has already been validated as part of the set document.
         """
         self.config = config
 
@@ -173,11 +258,11 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         self.xml = xml
 
         self.root_path = f"/{QName(xml.getroot().tag).localname}"
-        self.root_element = self.get_xml_element(self.root_path, self.xml)
+        self.root_element = self.get_xml_element(config.get_xpath(self.root_path, absolute=True), self.xml)
         self._object_type = config.get_object_type(self.root_path)
         self._schema_type = config.get_schema_type(self._object_type)
         # Validate XML schema.
-        if config.schema_dir is not None and config.schema_file_resolver is not None:
+        if validate and config.schema_dir is not None and config.schema_file_resolver is not None:
             self.validate_schema(xml, config.schema_dir, self._schema_type, self.config.schema_file_resolver)
 
         self.object_paths = self._get_object_paths()
@@ -198,8 +283,10 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
             unique_id = set()
 
             for p in self.object_paths.identifier_paths:
-                name = self._get_xml_node_value(self._get_relative_xpath(p.name_path), self.root_element, optional=True)
-                id_ = self._get_xml_node_value(self._get_relative_xpath(p.id_path), self.root_element, optional=True)
+                name_path = self.config.get_xpath(p.name_path, absolute=False)
+                id_path = self.config.get_xpath(p.id_path, absolute=False)
+                name = self._get_xml_node_value(name_path, self.root_element, optional=True)
+                id_ = self._get_xml_node_value(id_path, self.root_element, optional=True)
                 if name:
                     unique_name.add(name)
                 if id_:
@@ -225,15 +312,15 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         they are changed to contain the same name and id.
         """
         for r in self.reference_paths:
-            ref_path = self._get_absolute_xpath(r.root_path)
+            ref_path = self.config.get_xpath(r.root_path, absolute=True)
             ref_elements = self._get_xml_elements(ref_path, self.xml)
             for ref_element in ref_elements:
                 ref_cnt = 0
                 unique_name = set()
                 unique_id = set()
                 for p in r.paths:
-                    name_path = self._get_relative_xpath(p.name_path)
-                    id_path = self._get_relative_xpath(p.id_path)
+                    name_path = self.config.get_xpath(p.name_path, absolute=False)
+                    id_path = self.config.get_xpath(p.id_path, absolute=False)
                     name = self._get_xml_node_value(name_path, ref_element, optional=True)
                     id_ = self._get_xml_node_value(id_path, ref_element, optional=True)
                     if name or id_:
@@ -253,7 +340,7 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
 
                     for p in r.paths:
                         if unique_name:
-                            name_path = self._get_relative_xpath(p.name_path)
+                            name_path = self.config.get_xpath(p.name_path, absolute=False)
                             self._set_xml_node_value(
                                 name_path,
                                 ref_element,
@@ -261,82 +348,51 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
                                 insertion_callback=p.name_insertion_callback,
                             )
                         if unique_id:
-                            id_path = self._get_relative_xpath(p.id_path)
+                            id_path = self.config.get_xpath(p.id_path, absolute=False)
                             self._set_xml_node_value(
                                 id_path, ref_element, next(iter(unique_id)), insertion_callback=p.id_insertion_callback
                             )
 
     @staticmethod
-    def _normalise_xpath(path: str, prefix: str) -> str:
+    def _evaluate_xpath(path: str | etree.XPath, xml: ElementTree | Element) -> Any:
         """
-        Normalise an XPath expression with the given prefix.
-
-        :param path: Original XPath.
-        :param prefix: Desired prefix for all steps (e.g., './' or '/').
-        :return: Normalise XPath starting with the prefix.
-        """
-        path = path.strip()
-
-        if not path.startswith("("):
-            # Single path
-            return prefix + path.lstrip(".").lstrip("/")
+        Evaluate an XPath expression.
 
-        # Multiple paths
-        last = path.rfind(")")
-        if last == -1:
-            raise ValueError("Expected closing ')' in XPath")
-
-        inner = path[1:last]
-        post = path[last + 1 :]  # noqa
-
-        # split by | and normalize each part
-        parts = [prefix + p.strip().lstrip(".").lstrip("/") for p in inner.split("|")]
-        return "(" + " | ".join(parts) + ")" + post
-
-    @staticmethod
-    def _get_absolute_xpath(path: str) -> str:
-        """
-        Return an absolute XPath.
-
-        Ensures that paths in XPath start with '/'.
-
-        param path: XPath.
-        returns: Absolute XPath/
-        """
-        return XmlObjectProcessor._normalise_xpath(path, "/")
+        The XPath expression must be absolute when the xml is an element tree and must start with /.
+        The XPath expression must be relative when the xml is an element and must start with ./.
+        XPath expressions are compiled once and cached. Compiled XPaths are evaluated as is.
 
-    @staticmethod
-    def _get_relative_xpath(path: str) -> str:
+        :param path: XPath expression or compiled XPath.
+        :param xml: XML element or element tree.
+        :return: The XPath result.
         """
-        Return a relative XPath.
-
-        Ensures that paths in XPath start with './'.
+        if isinstance(path, str):
+            if isinstance(xml, ElementTree):
+                validate_absolute_path(path)
+            else:
+                validate_relative_path(path)
+            path = compile_xpath(path)
 
-        param path: XPath.
-        returns: Relative XPath/
-        """
-        return XmlObjectProcessor._normalise_xpath(path, "./")
+        try:
+            return path(xml)
+        except etree.XPathError as e:
+            raise ValueError(f"Invalid XPath expression '{path.path}'") from e
 
     @staticmethod
-    def get_xml_element(path: str, xml: ElementTree | Element, *, optional: bool = False) -> Element | None:
+    def get_xml_element(
+        path: str | etree.XPath, xml: ElementTree | Element, *, optional: bool = False
+    ) -> Element | None:
         """
         Retrieve the XML element using an XPath expression.
 
-        :param path: XPath expression to locate the element.
+        :param path: XPath expression or compiled XPath to locate the element.
         :param xml: XML element or element tree.
         :param optional: If True, return None instead of raising if the element is missing.
         :return: The XML element or None if optional and not found.
         """
 
-        if isinstance(xml, ElementTree):
-            validate_absolute_path(path)
-        else:
-            validate_relative_path(path)
-
-        try:
-            nodes = xml.xpath(path)
-        except Exception as e:
-            raise ValueError(f"Invalid XPath expression '{path}'") from e
+        nodes = XmlObjectProcessor._evaluate_xpath(path, xml)
+        path = path if isinstance(path, str) else path.path
 
         if nodes:
             if len(nodes) > 1:
@@ -348,24 +404,16 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         return None
 
     @staticmethod
-    def _get_xml_elements(path: str, xml: ElementTree | Element) -> list[Element]:
+    def _get_xml_elements(path: str | etree.XPath, xml: ElementTree | Element) -> list[Element]:
         """
         Retrieve XML elements using an XPath expression.
 
-        :param path: XPath expression to locate the elements.
+        :param path: XPath expression or compiled XPath to locate the elements.
         :param xml: XML element or element tree.
         :return: The XML elements.
         """
 
-        if isinstance(xml, ElementTree):
-            validate_absolute_path(path)
-        else:
-            validate_relative_path(path)
-
-        try:
-            nodes = xml.xpath(path)
-        except Exception as e:
-            raise ValueError(f"Invalid XPath expression '{path}'") from e
+        nodes = XmlObjectProcessor._evaluate_xpath(path, xml)
 
         if nodes:
             return cast(list[Element], nodes)
@@ -373,7 +421,7 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
 
     @staticmethod
     def _get_xml_node_value(
-        path: str, xml: ElementTree | Element, *, optional: bool = False, field_name: str | None = None
+        path: str | etree.XPath, xml: ElementTree | Element, *, optional: bool = False, field_name: str | None = None
     ) -> str | None:
         """
         Retrieve the value of an XML element or attribute using an XPath expression.
@@ -381,23 +429,15 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         The XPath expression must be absolute when the xml is an element tree and must start with /.
         The XPath expression must be relative when the xml is an element and must start with ./.
 
-        :param path: XPath expression to locate the element or attribute.
+        :param path: XPath expression or compiled XPath to locate the element or attribute.
         :param xml: XML element or element tree.
         :param optional: If True, return None instead of raising if the node or value is missing.
         :param field_name: If provided, used in error messages instead of the XPath expression.
         :return: The text or attribute value as a string, or None if optional and not found.
         """
-        if isinstance(xml, ElementTree):
-            validate_absolute_path(path)
-        else:
-            validate_relative_path(path)
-
-        try:
-            result = xml.xpath(path)
-        except Exception as e:
-            raise e
+        result = XmlObjectProcessor._evaluate_xpath(path, xml)
 
-        field_name = field_name or f"XPath '{path}'"
+        field_name = field_name or f"XPath '{path if isinstance(path, str) else path.path}'"
 
         if not result:
             if optional:
@@ -439,21 +479,27 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
 
     @staticmethod
     def _set_xml_node_value(
-        path: str, xml: Element, value: str, *, insertion_callback: XmlElementInsertionCallback | None = None
+        path: str | etree.XPath,
+        xml: Element,
+        value: str,
+        *,
+        insertion_callback: XmlElementInsertionCallback | None = None,
     ) -> None:
         """
         Set the value of an XML element or attribute specified by an XPath expression.
 
         Creates the element if it does not exist using an optional insertion callback.
 
-        :param path: XPath expression identifying the target element or attribute relative to the XML element.
+        :param path: XPath expression or compiled XPath identifying the target element or attribute
+                     relative to the XML element.
         :param xml: The XML element.
         :param value: Value to set on the target element or attribute.
         :param insertion_callback: Optional callback to insert a missing element when the XPath
                                    does not find the target node.
         """
 
-        validate_relative_path(path)
+        xpath = compile_xpath(validate_relative_path(path)) if isinstance(path, str) else path
+        path = xpath.path
 
         parts = path.removeprefix(".").removeprefix("/").split("/")
         if len(parts) == 0:
@@ -464,14 +510,11 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         is_attribute = last_part.startswith("@")
 
         def _get_node(
-            _node_path: str,
+            _node_path: etree.XPath,
             _parent_node: Element,
             _insertion_callback: XmlElementInsertionCallback | None,
         ) -> Element:
-            try:
-                _nodes = xml.xpath(_node_path)
-            except Exception as e:
-                raise ValueError(f"Invalid XPath expression '{path}'") from e
+            _nodes = XmlObjectProcessor._evaluate_xpath(_node_path, _parent_node)
             if not _nodes:
                 if _parent_node is not None and _insertion_callback is not None:
                     return _insertion_callback(_parent_node)
@@ -491,7 +534,7 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
             parent_element.set(attr_name, value)
         else:
             # Set element value. The element is expected to be created by the inserting callback if it is missing.
-            node = _get_node(path, xml, insertion_callback)
+            node = _get_node(xpath, xml, insertion_callback)
             node.text = value
 
     def _get_object_paths(self) -> XmlObjectPaths:
@@ -528,8 +571,8 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         # Extract the name and id from the first identifier path. If multiple identifier paths exist
         # they are guaranteed to contain the same information. This is done by synchronising the
         # identifiers when the XML metadata object processor is created, and always changing them together.
-        name_path = self._get_relative_xpath(self.object_paths.identifier_paths[0].name_path)
-        id_path = self._get_relative_xpath(self.object_paths.identifier_paths[0].id_path)
+        name_path = self.config.get_xpath(self.object_paths.identifier_paths[0].name_path, absolute=False)
+        id_path = self.config.get_xpath(self.object_paths.identifier_paths[0].id_path, absolute=False)
         return ObjectIdentifier(
             schema_type=self._schema_type,
             object_type=self._object_type,
@@ -545,7 +588,7 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         :param value: The metadata object name.
         """
         for p in self.object_paths.identifier_paths:
-            name_path = self._get_relative_xpath(p.name_path)
+            name_path = self.config.get_xpath(p.name_path, absolute=False)
             self._set_xml_node_value(name_path, self.root_element, value, insertion_callback=p.name_insertion_callback)
 
     def set_xml_object_id(self, value: str) -> None:
@@ -555,7 +598,7 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         :param value: The metadata object id.
         """
         for p in self.object_paths.identifier_paths:
-            id_path = self._get_relative_xpath(p.id_path)
+            id_path = self.config.get_xpath(p.id_path, absolute=False)
             self._set_xml_node_value(id_path, self.root_element, value, insertion_callback=p.id_insertion_callback)
 
     def set_xml_object_name(self, value: str) -> None:
@@ -565,7 +608,7 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         :param value: The metadata object name.
         """
         for p in self.object_paths.identifier_paths:
-            name_path = self._get_relative_xpath(p.name_path)
+            name_path = self.config.get_xpath(p.name_path, absolute=False)
             self._set_xml_node_value(name_path, self.root_element, value)
 
     @property
@@ -595,7 +638,7 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         """
         references = []
         for r in self.reference_paths:
-            ref_path = self._get_absolute_xpath(r.root_path)
+            ref_path = self.config.get_xpath(r.root_path, absolute=True)
             ref_elements = self._get_xml_elements(ref_path, self.xml)
             for ref_element in ref_elements:
                 # Extract the name and id from the first reference identifier path. If multiple
@@ -603,8 +646,8 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
                 # This is done by synchronising the reference identifiers when the XML metadata object
                 # processor is created, and always changing them together.
                 p = r.paths[0]
-                name_path = self._get_relative_xpath(p.name_path)
-                id_path = self._get_relative_xpath(p.id_path)
+                name_path = self.config.get_xpath(p.name_path, absolute=False)
+                id_path = self.config.get_xpath(p.id_path, absolute=False)
                 references.append(
                     ObjectIdentifier(
                         schema_type=r.ref_schema_type,
@@ -624,26 +667,28 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         :param references: The metadata object references.
         """
 
+        # Index input references by schema type, root path and name.
+        references_by_key: dict[tuple[str, str, str], ObjectIdentifier] = {}
+        for ref in references:
+            references_by_key.setdefault((ref.schema_type, ref.root_path, ref.name), ref)
+
         def _find_reference(schema_type_: str, root_path_: str, name_: str) -> ObjectIdentifier | None:
             # Find matching input reference.
-            for ref in references:
-                if ref.schema_type == schema_type_ and ref.root_path == root_path_ and ref.name == name_:
-                    return ref
-            return None
+            return references_by_key.get((schema_type_, root_path_, name_))
 
         # Extract all references from the XML.
         for r in self.reference_paths:
-            ref_path = self._get_absolute_xpath(r.root_path)
+            ref_path = self.config.get_xpath(r.root_path, absolute=True)
             ref_elements = self._get_xml_elements(ref_path, self.xml)
             for ref_element in ref_elements:
                 for p in r.paths:
                     # Extract reference name.
-                    name_path = self._get_relative_xpath(p.name_path)
+                    name_path = self.config.get_xpath(p.name_path, absolute=False)
                     name = self._get_xml_node_value(name_path, ref_element)
                     # Find matching input reference.
                     reference = _find_reference(r.ref_schema_type, r.ref_root_path, name)
                     if reference and reference.id:
-                        id_path = self._get_relative_xpath(p.id_path)
+                        id_path = self.config.get_xpath(p.id_path, absolute=False)
                         self._set_xml_node_value(
                             id_path, ref_element, reference.id, insertion_callback=p.id_insertion_callback
                         )
@@ -656,21 +701,23 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         :param references: The metadata object references.
         """
 
+        # Index input references by schema type, root path and name.
+        references_by_key: dict[tuple[str, str, str], ObjectIdentifier] = {}
+        for ref in references:
+            references_by_key.setdefault((ref.schema_type, ref.root_path, ref.name), ref)
+
         def _find_reference(schema_type_: str, root_path_: str, name_: str) -> ObjectIdentifier | None:
             # Find matching input reference.
-            for ref in references:
-                if ref.schema_type == schema_type_ and ref.root_path == root_path_ and ref.name == name_:
-                    return ref
-            return None
+            return references_by_key.get((schema_type_, root_path_, name_))
 
         # Extract all references from the XML.
         for r in self.reference_paths:
-            ref_path = self._get_absolute_xpath(r.root_path)
+            ref_path = self.config.get_xpath(r.root_path, absolute=True)
             ref_elements = self._get_xml_elements(ref_path, self.xml)
             for ref_element in ref_elements:
                 for p in r.paths:
                     # Extract reference name.
-                    name_path = self._get_relative_xpath(p.name_path)
+                    name_path = self.config.get_xpath(p.name_path, absolute=False)
                     name = self._get_xml_node_value(name_path, ref_element)
                     # Find matching input reference.
                     reference = _find_reference(r.ref_schema_type, r.ref_root_path, name)
@@ -704,9 +751,8 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         :return: metadata object title.
         """
 
-        title_path = self.object_paths.title_path
-        if title_path:
-            title_path = self._get_relative_xpath(self.object_paths.title_path)
+        if self.object_paths.title_path:
+            title_path = self.config.get_xpath(self.object_paths.title_path, absolute=False)
             return self._get_xml_node_value(title_path, self.root_element, optional=True)
         return None
 
@@ -718,9 +764,8 @@ class XmlObjectProcessor(XmlProcessor, ObjectProcessor):
         :return: metadata object description.
         """
 
-        description_path = self.object_paths.description_path
-        if description_path:
-            description_path = self._get_relative_xpath(self.object_paths.description_path)
+        if self.object_paths.description_path:
+            description_path = self.config.get_xpath(self.object_paths.description_path, absolute=False)
             return self._get_xml_node_value(description_path, self.root_element, optional=True)
         return None
 
@@ -749,13 +794,18 @@ class XmlDocumentProcessor(XmlProcessor):
         # Xml object processor by schema, root tag and name.
         self.xml_processor: dict[str, dict[str, dict[str, XmlObjectProcessor]]] = {}
 
-        found_set_path = next((p.set_path for p in config.schema_paths if xml.xpath(p.set_path)), None)
+        found_schema_path = next(
+            (p for p in config.schema_paths if p.set_path and config.get_xpath(p.set_path, absolute=True)(xml)), None
+        )
 
-        if found_set_path:
+        if found_schema_path:
             # Multiple objects.
-            for set_xml in xml.xpath(found_set_path):
+            set_xmls = config.get_xpath(found_schema_path.set_path, absolute=True)(xml)
+            # Validate the set document once instead of validating each metadata object separately.
+            is_validated = self._validate_set_schema(config, xml, found_schema_path.schema_type, set_xmls)
+            for set_xml in set_xmls:
                 for _xml in set_xml:
-                    self._add_xml_processor(config, etree.ElementTree(_xml))
+                    self._add_xml_processor(config, etree.ElementTree(_xml), validate=not is_validated)
         else:
             # Single object.
             self._add_xml_processor(config, xml)
@@ -766,14 +816,75 @@ class XmlDocumentProcessor(XmlProcessor):
                 raise ValueError("All metadata objects in a document must have the same schema type")
             self._schema_type = next(iter(schema_types))
 
-    def _add_xml_processor(self, config: XmlObjectConfig, xml: ElementTree) -> None:
+    @staticmethod
+    def _validate_set_schema(
+        config: XmlObjectConfig, xml: ElementTree, schema_type: str, set_xmls: list[Element]
+    ) -> bool:
+        """
+        Validate the set document against XML Schema. Raise SchemaValidationException on failure.
+
+        The validation error line numbers are mapped to the aliases of the metadata objects
+        containing the errors.
+
+        :param config: Configuration object for XML processing.
+        :param xml: XML element tree.
+        :param schema_type: The schema type.
+        :param set_xmls: The set elements.
+        :return: True if the set document was validated.
+        """
+        if config.schema_dir is None or config.schema_file_resolver is None:
+            return False
+
+        try:
+            XmlProcessor.validate_schema(xml, config.schema_dir, schema_type, config.schema_file_resolver)
+        except SchemaValidationException as e:
+            # Metadata object start lines in document order.
+            start_lines: list[int] = []
+            aliases: list[str | None] = []
+            for set_xml in set_xmls:
+                for _xml in set_xml:
+                    if _xml.sourceline is None:
+                        continue
+                    start_lines.append(_xml.sourceline)
+                    aliases.append(XmlDocumentProcessor._get_xml_object_alias(config, _xml))
+
+            error_aliases: dict[int, str] = {}
+            for err in e.errors:
+                i = bisect_right(start_lines, err.line) - 1
+                if i >= 0 and aliases[i] is not None:
+                    error_aliases[err.line] = aliases[i]
+            raise SchemaValidationException(schema_type, e.errors, error_aliases) from None
+
+        return True
+
+    @staticmethod
+    def _get_xml_object_alias(config: XmlObjectConfig, xml: Element) -> str | None:
+        """
+        Retrieve the metadata object alias without requiring the XML to be valid.
+
+        :param config: Configuration object for XML processing.
+        :param xml: The metadata object root element.
+        :return: The metadata object alias or None if it could not be found.
+        """
+        root_path = f"/{QName(xml.tag).localname}"
+        for p in config.object_paths:
+            if p.root_path == root_path:
+                name_path = config.get_xpath(p.identifier_paths[0].name_path, absolute=False)
+                try:
+                    return XmlObjectProcessor._get_xml_node_value(name_path, xml, optional=True)
+                except Exception:
+                    return None
+        return None
+
+    def _add_xml_processor(self, config: XmlObjectConfig, xml: ElementTree, *, validate: bool = True) -> None:
         """
         Add an XML processor.
 
         :param config: Configuration object for XML processing.
         :param xml: XML element tree.
+        :param validate: If False, the XML schema validation is skipped.
         """
-        p = XmlObjectProcessor(config, xml)
+        p = XmlObjectProcessor(config, xml, validate=validate)
         self.xml_processors.append(p)
 
         # Check if we already have metadata object processors for the same names.
@@ -1004,6 +1115,66 @@ class XmlDocumentProcessor(XmlProcessor):
         yield f"</{set_element}>\n".encode("utf-8")
 
 
+class XmlStreamingSchemaValidator:
+    """
+    Validate an XML document against XML Schema incrementally.
+
+    The XML document is given in chunks and the element tree is never fully built: elements
+    are released after they have been parsed and validated. The validator must not be used
+    from more than one thread.
+    """
+
+    def __init__(
+        self,
+        schema_dir: str,
+        schema_type: str,
+        schema_file_resolver: Callable[[str], str] = lambda schema_type: schema_type,
+    ) -> None:
+        """
+        Validate an XML document against XML Schema incrementally.
+
+        :param schema_dir: The directory for the XML schema files.
+        :param schema_type: The schema type must resolve to the XML schema file using the schema type resolver
+        :param schema_file_resolver: Resolves the XML schema file given the schema type.
+        """
+        self.schema_type = schema_type
+        self._parser = etree.XMLPullParser(
+            events=("end",),
+            schema=XmlProcessor.get_xml_schema(schema_dir, schema_type, schema_file_resolver),
+            remove_blank_text=True,
+            remove_comments=True,
+        )
+
+    def feed(self, data: bytes) -> None:
+        """
+        Validate the next chunk of the XML document. Raise SchemaValidationException on failure.
+
+        :param data: The next chunk of the XML document.
+        """
+        try:
+            self._parser.feed(data)
+        except etree.XMLSyntaxError as e:
+            raise SchemaValidationException(self.schema_type, list(e.error_log)) from e
+        self._release_elements()
+
+    def close(self) -> None:
+        """Complete the validation of the XML document. Raise SchemaValidationException on failure."""
+        try:
+            self._parser.close()
+        except etree.XMLSyntaxError as e:
+            raise SchemaValidationException(self.schema_type, list(e.error_log)) from e
+        self._release_elements()
+
+    def _release_elements(self) -> None:
+        """Release the parsed elements."""
+        for _, element in self._parser.read_events():
+            element.clear(keep_tail=False)
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+
 class XmlDocumentsProcessor(XmlProcessor, DocumentsProcessor):
     """Process one or more XML documents objects to inject accession numbers."""
 
@@ -1038,23 +1209,28 @@ class XmlDocumentsProcessor(XmlProcessor, DocumentsProcessor):
                     raise ValueError(f"Duplicate '{p.schema_type}' identifier '{name}'")
                 XmlDocumentProcessor.set_xml_object_processor(self.xml_processor, name, p)
 
+        self.check_object_counts(config, [i.schema_type for i in self.get_object_identifiers()])
+
+    @staticmethod
+    def check_object_counts(config: XmlObjectConfig, schema_types: Sequence[str]) -> None:
+        """
+        Check that the mandatory and single metadata objects have the expected number of objects.
+
+        :param config: Configuration object for XML processing.
+        :param schema_types: The schema types of all metadata objects.
+        """
+        counts = Counter(schema_types)
         for o in config.object_paths:
-            identifiers = self.get_object_identifiers(o.schema_type)
+            cnt = counts[o.schema_type]
             if o.is_single and o.is_mandatory:
-                if len(identifiers) != 1:
-                    raise ValueError(
-                        f"Expecting exactly one '{o.schema_type}' metadata object but found {len(identifiers)}."
-                    )
+                if cnt != 1:
+                    raise ValueError(f"Expecting exactly one '{o.schema_type}' metadata object but found {cnt}.")
             elif o.is_mandatory:
-                if len(identifiers) == 0:
-                    raise ValueError(
-                        f"Expecting at least one '{o.schema_type}' metadata object but found {len(identifiers)}."
-                    )
+                if cnt == 0:
+                    raise ValueError(f"Expecting at least one '{o.schema_type}' metadata object but found {cnt}.")
             elif o.is_single:
-                if len(identifiers) > 1:
-                    raise ValueError(
-                        f"Expecting at most one '{o.schema_type}' metadata object but found {len(identifiers)}."
-                    )
+                if cnt > 1:
+                    raise ValueError(f"Expecting at most one '{o.schema_type}' metadata object but found {cnt}.")
 
     def get_xml_object_identifier(self, schema_type: str, root_path: str, name: str) -> ObjectIdentifier:
         """
@@ -1083,6 +1259,25 @@ class XmlDocumentsProcessor(XmlProcessor, DocumentsProcessor):
 
         return XmlDocumentProcessor.get_xml_object_processor(self.xml_processor, schema_type, root_path, name)
 
+    @override
+    def iter_object_processors(
+        self, schema_type: str | None = None, root_path: str | None = None
+    ) -> Iterator[XmlObjectProcessor]:
+        """
+        Iterate the metadata object processors in document order.
+
+        :param schema_type: The optional schema type.
+        :param root_path: The optional metadata object root path.
+        :return: metadata object processors.
+        """
+        for document_processor in self.xml_processors:
+            for object_processor in document_processor.xml_processors:
+                if schema_type is not None and object_processor.schema_type != schema_type:
+                    continue
+                if root_path is not None and object_processor.root_path != root_path:
+                    continue
+                yield object_processor
+
     def get_xml_object_processors(self, schema_type: str, root_path: str) -> list[XmlObjectProcessor]:
         """
         Retrieve the metadata object processors.
@@ -1300,3 +1495,355 @@ class XmlFileDocumentsProcessor(XmlDocumentsProcessor):
                         xmls.append(XmlObjectProcessor.parse_xml(f.read()))
 
         super().__init__(config, xmls)
+
+
+class XmlStreamingDocumentsProcessor(DocumentsProcessor):
+    """
+    Process one or more XML files one metadata object at a time.
+
+    The XML files are parsed and validated incrementally and only the metadata object
+    identifiers, references and locations are kept in memory. Metadata objects that are single
+    in a submission (e.g. dataset or policy) are retained. Other metadata objects are parsed
+    again from the XML files when they are iterated, and are only valid until the next metadata
+    object is iterated. The XML files are parsed only up to the last requested metadata object.
+
+    The XML files must be seekable and must not be iterated concurrently.
+    """
+
+    def __init__(self, config: XmlObjectConfig, xmls: list[IO[bytes]]) -> None:
+        """
+        Process one or more XML files one metadata object at a time.
+
+        :param config: Configuration object for XML processing.
+        :param xmls: Seekable XML files.
+        """
+
+        self.config = config
+        self.xmls = xmls
+        # Schema type of each XML file.
+        self.schema_types: list[str | None] = []
+        # Metadata object type by schema and root path.
+        self.object_types: dict[tuple[str, str], str] = {}
+        # Metadata object id by schema, root path and name in document order.
+        self.ids: dict[tuple[str, str, str], str | None] = {}
+        # Metadata object references (schema, object type, root path, name, id) by schema,
+        # root path and name of the referencing metadata object.
+        self.references: dict[tuple[str, str, str], list[tuple[str, str, str, str, str | None]]] = {}
+        # Retained xml object processor by schema, root path and name.
+        self.xml_processor: dict[str, dict[str, dict[str, XmlObjectProcessor]]] = {}
+        # Metadata object XML file index and position in the XML file by schema, root path and name.
+        self.locations: dict[tuple[str, str, str], tuple[int, int]] = {}
+        # Position of the last metadata object in the XML file by root path for each XML file.
+        self.last_positions: list[dict[str, int]] = []
+
+        retained_paths = {(o.schema_type, o.root_path) for o in config.object_paths if o.is_single}
+
+        for index, xml in enumerate(self.xmls):
+            schema_types = set()
+            last_positions: dict[str, int] = {}
+            for position, p in enumerate(self._iter_xml_processors(xml, schema_type=self._get_schema_type(xml))):
+                schema_types.add(p.schema_type)
+                if len(schema_types) > 1:
+                    raise ValueError("All metadata objects in a document must have the same schema type")
+
+                # Check if we already have metadata objects for the same names.
+                identifier = p.get_xml_object_identifier()
+                key = (p.schema_type, p.root_path, identifier.name)
+                if key in self.ids:
+                    raise ValueError(f"Duplicate '{p.schema_type}' identifier '{identifier.name}'")
+                self.object_types[(p.schema_type, p.root_path)] = p.object_type
+                self.ids[key] = identifier.id
+                self.locations[key] = (index, position)
+                last_positions[p.root_path] = position
+
+                if (p.schema_type, p.root_path) not in retained_paths:
+                    self.references[key] = [
+                        (ref.schema_type, ref.object_type, ref.root_path, ref.name, ref.id)
+                        for ref in p.get_object_references()
+                    ]
+                else:
+                    # The references of retained metadata objects are read from the retained XML.
+                    self.references[key] = []
+                    # Copy the metadata object from the incrementally parsed XML.
+                    retained = XmlObjectProcessor(
+                        config, etree.ElementTree(copy.deepcopy(p.root_element)), validate=False
+                    )
+                    XmlDocumentProcessor.set_xml_object_processor(self.xml_processor, identifier.name, retained)
+
+            self.schema_types.append(next(iter(schema_types), None))
+            self.last_positions.append(last_positions)
+
+        XmlDocumentsProcessor.check_object_counts(config, [key[0] for key in self.ids])
+
+    def _get_schema_type(self, xml: IO[bytes]) -> str:
+        """
+        Get the schema type of the XML file from its root element.
+
+        :param xml: The XML file.
+        :return: The schema type.
+        """
+        xml.seek(0)
+        for _, element in etree.iterparse(xml, events=("start",)):
+            root_path = f"/{QName(element.tag).localname}"
+            for p in self.config.schema_paths:
+                if p.set_path == root_path:
+                    return p.schema_type
+            schema_type = self.config.get_schema_type(self.config.get_object_type(root_path))
+            if schema_type is not None:
+                return schema_type
+            break
+        raise ValueError("Unknown schema type for XML file")
+
+    def _iter_xml_elements(
+        self, xml: IO[bytes], *, schema_type: str | None = None, stop: int | None = None
+    ) -> Iterator[tuple[int, Element]]:
+        """
+        Incrementally parse the XML file and iterate the metadata object elements and their positions.
+
+        :param xml: The XML file.
+        :param schema_type: The optional schema type used to validate the XML file.
+        :param stop: The optional position of the last metadata object that is parsed.
+        :return: metadata object positions and elements.
+        """
+        xml.seek(0)
+        try:
+            for position, element in enumerate(
+                XmlProcessor.iter_xml_objects(self.config, xml, schema_type=schema_type)
+            ):
+                yield position, element
+                if stop is not None and position >= stop:
+                    return
+        except SchemaValidationException:
+            # The incremental validation errors do not have line numbers. Validate the metadata
+            # objects one at a time to report the errors with the metadata object aliases.
+            self._validate_xml_objects(xml)
+            raise
+
+    def _validate_xml_objects(self, xml: IO[bytes]) -> None:
+        """
+        Validate the metadata objects in the XML file one at a time against XML Schema.
+
+        Raise SchemaValidationException with the metadata object alias on failure.
+
+        :param xml: The XML file.
+        """
+        xml.seek(0)
+        for element in XmlProcessor.iter_xml_objects(self.config, xml):
+            try:
+                XmlObjectProcessor(self.config, etree.ElementTree(element))
+            except SchemaValidationException as e:
+                # All errors are in the same metadata object.
+                alias = XmlDocumentProcessor._get_xml_object_alias(self.config, element)
+                if alias is None:
+                    raise
+                raise SchemaValidationException(
+                    e.schema_type, e.errors, {err.line: alias for err in e.errors}
+                ) from None
+
+    def _iter_xml_processors(
+        self,
+        xml: IO[bytes],
+        *,
+        schema_type: str | None = None,
+        root_path: str | None = None,
+        stop: int | None = None,
+    ) -> Iterator[XmlObjectProcessor]:
+        """
+        Incrementally parse the XML file and iterate the metadata object processors.
+
+        :param xml: The XML file.
+        :param schema_type: The optional schema type used to validate the XML file.
+        :param root_path: The optional metadata object root path.
+        :param stop: The optional position of the last metadata object that is parsed.
+        :return: metadata object processors.
+        """
+        for _, element in self._iter_xml_elements(xml, schema_type=schema_type, stop=stop):
+            if root_path is not None and f"/{QName(element.tag).localname}" != root_path:
+                continue
+            # The XML file has been validated when it was first parsed.
+            yield XmlObjectProcessor(self.config, etree.ElementTree(element), validate=False)
+
+    def _set_xml_object_ids(self, processor: XmlObjectProcessor) -> None:
+        """
+        Set the metadata object id and reference ids.
+
+        :param processor: The metadata object processor.
+        """
+        identifier = processor.get_xml_object_identifier()
+        id_ = self.ids.get((identifier.schema_type, identifier.root_path, identifier.name))
+        if id_:
+            processor.set_xml_object_id(id_)
+
+        references = [self._get_reference(ref) for ref in processor.get_object_references()]
+        processor.set_object_reference_ids(references)
+
+    def _get_reference(self, reference: ObjectIdentifier) -> ObjectIdentifier:
+        """
+        Get the metadata object reference with the id of the referenced metadata object.
+
+        :param reference: The metadata object reference.
+        :return: The metadata object reference.
+        """
+        id_ = self.ids.get((reference.schema_type, reference.root_path, reference.name))
+        if id_:
+            reference.id = id_
+        return reference
+
+    @override
+    def get_object_processor(self, schema_type: str, root_path: str, name: str) -> XmlObjectProcessor:
+        """
+        Retrieve the metadata object processor.
+
+        Metadata objects that are not retained are parsed from the XML files.
+
+        :param schema_type: The schema type.
+        :param root_path: The metadata object root path.
+        :param name: The unique metadata object name.
+        :return: metadata object processor.
+        """
+
+        if XmlDocumentProcessor.is_xml_object_processor(self.xml_processor, schema_type, root_path, name):
+            processor = XmlDocumentProcessor.get_xml_object_processor(self.xml_processor, schema_type, root_path, name)
+            self._set_xml_object_ids(processor)
+            return processor
+
+        location = self.locations.get((schema_type, root_path, name))
+        if location is not None:
+            index, position = location
+            for p, element in self._iter_xml_elements(self.xmls[index], stop=position):
+                if p == position:
+                    # Copy the metadata object from the incrementally parsed XML.
+                    processor = XmlObjectProcessor(
+                        self.config, etree.ElementTree(copy.deepcopy(element)), validate=False
+                    )
+                    self._set_xml_object_ids(processor)
+                    return processor
+
+        raise ValueError(f"Unknown '{schema_type}' path '{root_path}' name '{name}'.")
+
+    @override
+    def iter_object_processors(
+        self, schema_type: str | None = None, root_path: str | None = None
+    ) -> Iterator[XmlObjectProcessor]:
+        """
+        Iterate the metadata object processors in document order.
+
+        The XML files are parsed again up to the last requested metadata object and each
+        metadata object processor is only valid until the next one is iterated.
+
+        :param schema_type: The optional schema type.
+        :param root_path: The optional metadata object root path.
+        :return: metadata object processors.
+        """
+        for xml, xml_schema_type, last_positions in zip(self.xmls, self.schema_types, self.last_positions, strict=True):
+            if xml_schema_type is None or (schema_type is not None and xml_schema_type != schema_type):
+                continue
+            stop = None
+            if root_path is not None:
+                if root_path not in last_positions:
+                    continue
+                stop = last_positions[root_path]
+            for processor in self._iter_xml_processors(xml, root_path=root_path, stop=stop):
+                name = processor.get_xml_object_identifier().name
+                if XmlDocumentProcessor.is_xml_object_processor(
+                    self.xml_processor, processor.schema_type, processor.root_path, name
+                ):
+                    # Use the retained metadata object that may have been changed.
+                    processor = XmlDocumentProcessor.get_xml_object_processor(
+                        self.xml_processor, processor.schema_type, processor.root_path, name
+                    )
+                self._set_xml_object_ids(processor)
+                yield processor
+
+    def get_xml_object_count(self, schema_type: str, root_path: str) -> int:
+        """
+        Get the number of metadata objects.
+
+        :param schema_type: The schema type.
+        :param root_path: The metadata object root path.
+        :return: the number of metadata objects.
+        """
+
+        return sum(1 for key in self.ids if key[0] == schema_type and key[1] == root_path)
+
+    @override
+    def get_object_identifiers(self, schema_type: str | None = None) -> Sequence[ObjectIdentifier]:
+        """
+        Retrieve the metadata object identifiers.
+
+        :param schema_type: The schema type.
+        :return: metadata object identifiers.
+        """
+
+        return [
+            ObjectIdentifier(
+                schema_type=key[0],
+                object_type=self.object_types[(key[0], key[1])],
+                root_path=key[1],
+                name=key[2],
+                id=id_,
+            )
+            for key, id_ in self.ids.items()
+            if schema_type is None or schema_type == key[0]
+        ]
+
+    @override
+    def get_object_references(self) -> Sequence[ObjectIdentifier]:
+        """
+        Retrieve the metadata object references.
+
+        :return: The metadata object references.
+        """
+        references: list[ObjectIdentifier] = []
+        for (schema_type, root_path, name), object_references in self.references.items():
+            if XmlDocumentProcessor.is_xml_object_processor(self.xml_processor, schema_type, root_path, name):
+                references.extend(
+                    self._get_reference(ref)
+                    for ref in XmlDocumentProcessor.get_xml_object_processor(
+                        self.xml_processor, schema_type, root_path, name
+                    ).get_object_references()
+                )
+            else:
+                references.extend(
+                    self._get_reference(
+                        ObjectIdentifier(
+                            schema_type=ref[0], object_type=ref[1], root_path=ref[2], name=ref[3], id=ref[4]
+                        )
+                    )
+                    for ref in object_references
+                )
+        return references
+
+    @override
+    def set_object_id(self, identifier: ObjectIdentifier) -> None:
+        """
+        Set the metadata object id.
+
+        The id is set to the metadata object and references when the metadata objects are iterated.
+
+        :param identifier: The metadata object identifier that must have the id. If the XML schema
+        supports multiple metadata object types then must also have the root path.
+        """
+        if not isinstance(identifier, ObjectIdentifier):
+            raise ValueError("Invalid identifier type")
+
+        schema_type = identifier.schema_type
+        root_path = identifier.root_path
+        name = identifier.name
+
+        if not identifier.id:
+            raise ValueError(f"Missing id for '{schema_type}' name '{name}'.")
+
+        key = (schema_type, root_path, name)
+        if key not in self.ids:
+            raise ValueError(f"Unknown '{schema_type}' path '{root_path}' name '{name}'.")
+        self.ids[key] = identifier.id
+
+    @override
+    def get_references_without_ids(self) -> Sequence[ObjectIdentifier]:
+        """
+        Return metadata object references without ids.
+
+        :return: metadata object references without ids.
+        """
+        return [ref for ref in self.get_object_references() if not ref.id]
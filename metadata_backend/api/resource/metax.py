@@ -3,6 +3,7 @@
 import asyncio
 import json
 from enum import Enum
+from functools import cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -114,6 +115,7 @@ async def fetch_metax_mapping_geo_locations() -> MetaxMappingGeoLocations:
     await asyncio.to_thread(lambda: g.parse(data=data, format="turtle"))
 
     locations: list[dict[str, Any]] = []
+    uris: set[str] = set()
 
     for subject in g.subjects(predicate=skos.prefLabel):
         uri_str = str(subject)
@@ -128,7 +130,8 @@ async def fetch_metax_mapping_geo_locations() -> MetaxMappingGeoLocations:
                 lang = cast(Literal, object).language
                 pref_labels[lang] = str(object)
 
-        if not any([loc["uri"] == uri_str for loc in locations]):
+        if uri_str not in uris:
+            uris.add(uri_str)
             locations.append({"pref_label": pref_labels, "uri": uri_str})
 
     return TypeAdapter(MetaxMappingGeoLocations).validate_python(locations)
@@ -142,18 +145,48 @@ def _read_resource_file(data_type: MetaxMappingResourceType) -> str:
     return _resource_file(data_type).read_text(encoding="utf-8")
 
 
-def _read_metax_mapping_languages() -> MetaxMappingLanguages:
-    data = _read_resource_file(MetaxMappingResourceType.METAX_MAPPING_LANGUAGES)
-    return TypeAdapter(MetaxMappingLanguages).validate_python(json.loads(data))
+def _read_json_resource_file(data_type: MetaxMappingResourceType) -> Any:
+    return json.loads(_read_resource_file(data_type))
 
 
-def _read_metax_mapping_geo_locations() -> MetaxMappingGeoLocations:
-    data = _read_resource_file(MetaxMappingResourceType.METAX_MAPPING_GEO_LOCATIONS)
-    return TypeAdapter(MetaxMappingGeoLocations).validate_python(json.loads(data))
+def _read_metax_mapping_languages() -> MetaxMappingLanguages:
+    """Read the languages for Metax mapping from the resource file."""
+    data = _read_json_resource_file(MetaxMappingResourceType.METAX_MAPPING_LANGUAGES)
+    return TypeAdapter(MetaxMappingLanguages).validate_python(data)
 
 
-METAX_MAPPING_LANGUAGES = _read_metax_mapping_languages()
-METAX_MAPPING_GEO_LOCATIONS = _read_metax_mapping_geo_locations()
+def _read_metax_mapping_geo_locations() -> MetaxMappingGeoLocations:
+    """Read the geolocations for Metax mapping from the resource file."""
+    data = _read_json_resource_file(MetaxMappingResourceType.METAX_MAPPING_GEO_LOCATIONS)
+    return TypeAdapter(MetaxMappingGeoLocations).validate_python(data)
+
+
+@cache
+def get_metax_language_uris() -> dict[str, str]:
+    """
+    Get Metax language URIs by language code.
+
+    The resource file is read when the URIs are first used.
+    """
+    data = _read_json_resource_file(MetaxMappingResourceType.METAX_MAPPING_LANGUAGES)
+    return {code: language["uri"] for code, language in data.items()}
+
+
+@cache
+def get_metax_geo_location_uris() -> dict[str, str]:
+    """
+    Get Metax geolocation URIs by English preferred label.
+
+    The first geolocation with the label is used. The resource file is read when the
+    URIs are first used.
+    """
+    data = _read_json_resource_file(MetaxMappingResourceType.METAX_MAPPING_GEO_LOCATIONS)
+    uris: dict[str, str] = {}
+    for location in data:
+        label = location["pref_label"].get("en")
+        if label is not None:
+            uris.setdefault(label, location["uri"])
+    return uris
 
 
 def _write_resource_file(data_type: MetaxMappingResourceType, data: Any) -> None:
@@ -8,12 +8,14 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import jwt
+from cachetools import TTLCache
 from fastapi import HTTPException
 from starlette import status
 from starlette.datastructures import Headers
 
 from ...conf.jwt import jwt_config
 from ...database.postgres.models import ApiKeyEntity
+from ...database.postgres.notifications import notify
 from ...database.postgres.repositories.api_key import ApiKeyRepository
 from ...helpers.logger import LOG
 from ..models.models import ApiKey
@@ -23,13 +25,31 @@ JWT_EXPIRATION = timedelta(days=7)
 API_KEY_ID_LENGTH = 12
 API_KEY_LENGTH = 32
 
+# Maximum number of validated API keys cached per worker.
+API_KEY_CACHE_SIZE = 1024
+# How long a validated API key is cached. Bounds how long a revoked API key remains valid
+# in other workers if the revocation notification is lost.
+API_KEY_CACHE_TTL = timedelta(minutes=5)
+# Database notification channel for the generated key ids of revoked API keys.
+API_KEY_REVOKED_CHANNEL = "api_key_revoked"
+
 
 class AuthService:
     """Service for issuing JWT tokens and API keys."""
 
-    def __init__(self, repository: ApiKeyRepository) -> None:
+    def __init__(
+        self,
+        repository: ApiKeyRepository,
+        *,
+        api_key_cache_size: int = API_KEY_CACHE_SIZE,
+        api_key_cache_ttl: timedelta = API_KEY_CACHE_TTL,
+    ) -> None:
         """Initialize the service."""
         self.__repository = repository
+        # Validated API keys: (generated key id, API key hash) -> user id.
+        self.__api_key_cache: TTLCache[tuple[str, str], str] = TTLCache(
+            maxsize=api_key_cache_size, ttl=api_key_cache_ttl.total_seconds()
+        )
 
     @staticmethod
     async def create_jwt_token_from_userinfo(userinfo: dict[str, Any]) -> str:
@@ -188,6 +208,12 @@ class AuthService:
             return None
         key_id, api_key = parts
 
+        # The cache key contains a hash of the API key and not the API key itself.
+        cache_key = (key_id, hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+        user_id = self.__api_key_cache.get(cache_key)
+        if user_id is not None:
+            return user_id
+
         key = await self.__repository.get_api_key(key_id)
 
         if key is None:
@@ -195,6 +221,7 @@ class AuthService:
 
         # Compare the API key hash.
         if hmac.compare_digest(key.api_key, self._hash_api_key(api_key, key.salt)):
+            self.__api_key_cache[cache_key] = key.user_id
             return key.user_id
 
         return None
@@ -202,12 +229,30 @@ class AuthService:
     async def revoke_api_key(self, user_id: str, key_id: str) -> None:
         """Revoke an API key by removing it.
 
+        The revoked API key is removed from the API key cache of this worker and other
+        workers are notified when the transaction is committed.
+
         Args:
             user_id: The ID of the user whose API key is being revoked.
             key_id: The unique key id assigned by the user.
         """
 
-        await self.__repository.delete_api_key(user_id, key_id)
+        for generated_key_id in await self.__repository.delete_api_key(user_id, key_id):
+            self.invalidate_api_key(generated_key_id)
+            await notify(API_KEY_REVOKED_CHANNEL, generated_key_id)
+
+    def invalidate_api_key(self, key_id: str) -> None:
+        """Remove an API key from the API key cache.
+
+        Args:
+            key_id: The generated unique key id.
+        """
+        for cache_key in [k for k in self.__api_key_cache.keys() if k[0] == key_id]:
+            self.__api_key_cache.pop(cache_key, None)
+
+    def clear_api_key_cache(self) -> None:
+        """Remove all API keys from the API key cache."""
+        self.__api_key_cache.clear()
 
     async def list_api_keys(self, user_id: str) -> list[ApiKey]:
         """List API keys for a given user.
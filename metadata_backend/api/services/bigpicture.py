@@ -1,9 +1,14 @@
 """Bigpicture API services."""
 
-from typing import Literal
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from functools import partial
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Literal
 
 from pydantic import BaseModel
 
+from ...conf.bigpicture import bp_config
 from ...helpers.logger import LOG
 from ..exceptions import SystemException
 from ..handlers.restapi import RESTAPIServices
@@ -20,11 +25,11 @@ from ..processors.xml.bigpicture import (
     BP_SAMPLE_OBJECT_TYPES,
     BP_STAINING_OBJECT_TYPE,
     BP_XML_OBJECT_CONFIG,
-    as_xml_set_document,
     update_landing_page_xml,
 )
 from ..processors.xml.datacite import DATACITE_OBJECT_TYPE, DATACITE_XML_SCHEMA_DIR
-from ..processors.xml.processors import XmlProcessor
+from ..processors.xml.exceptions import SchemaValidationException
+from ..processors.xml.processors import XmlDocumentProcessor, XmlStreamingSchemaValidator
 from .file import S3InboxSDAService
 
 
@@ -53,6 +58,9 @@ class XmlOutputDir(BaseModel):
         return f"DATASET_{submission_id}/{self.dir}"
 
 
+# Bytes of the generated XML documents validated at a time.
+XML_VALIDATION_BUFFER_SIZE = 64 * 1024
+
 # XML output files written to the METADATA, LANDING_PAGE and PRIVATE directories.
 XML_OUTPUT_FILES: list[XmlOutputDir] = [
     XmlOutputDir(
@@ -80,6 +88,10 @@ XML_OUTPUT_FILES: list[XmlOutputDir] = [
 async def upload_bp_metadata_xmls(services: RESTAPIServices, submission_id: str, user_id: str, jwt: str) -> None:
     """Upload encrypted Bigpicture metadata XML files to SDA inbox.
 
+    The XML files are uploaded concurrently using one S3 client, and at most
+    BP_METADATA_UPLOAD_CONCURRENCY files are uploaded at a time. The uploaded XML files
+    are added to the submission files after all XML files have been uploaded.
+
     :param services: REST API services.
     :param submission_id: Submission ID.
     :param user_id: User ID.
@@ -94,79 +106,179 @@ async def upload_bp_metadata_xmls(services: RESTAPIServices, submission_id: str,
     bucket = user_id.replace("@", "_")  # SDA inbox bucket name is the user id with @ replaced by underscore
     registration = await services.registration.get_registration(submission_id)  # For landing page XML update
 
-    for xml_output_dir in XML_OUTPUT_FILES:
-        for file in xml_output_dir.files:
-            # Get all XML documents for the schema type of the file.
-            xml_docs = [
-                xml_doc async for xml_doc in services.object.get_xml_documents(submission_id, tuple(file.object_types))
-            ]
-            if not xml_docs:
-                if file.mandatory:
-                    reason = f"No XML objects found for: {file.name}"
-                    LOG.error(reason)
-                    raise SystemException(reason)
-                continue
-
-            # For landing page XML, update the REMS and DOI URL value from the registration.
-            if BP_LANDING_PAGE_OBJECT_TYPE in file.object_types:
-                xml_docs = [
-                    await update_landing_page_xml(
-                        xml_doc,
+    # The database session must not be used by more than one upload at a time.
+    db_lock = asyncio.Lock()
+    semaphore = asyncio.Semaphore(bp_config().BP_METADATA_UPLOAD_CONCURRENCY)
+    sizes: dict[str, int] = {}
+
+    async def _upload(s3: Any, xml_output_dir: XmlOutputDir, file: XmlOutputFile) -> None:
+        async with semaphore:
+            # Stream all XML documents for the schema type of the file.
+            async with aclosing(
+                _iter_locked(services.object.get_xml_documents(submission_id, tuple(file.object_types)), db_lock)
+            ) as locked_xml_docs:
+                first_xml_doc = await anext(locked_xml_docs, None)
+                if first_xml_doc is None:
+                    if file.mandatory:
+                        reason = f"No XML objects found for: {file.name}"
+                        LOG.error(reason)
+                        raise SystemException(reason)
+                    return
+                xml_docs = _chain_xml_documents(first_xml_doc, locked_xml_docs)
+
+                # For landing page XML, update the REMS and DOI URL value from the registration.
+                if BP_LANDING_PAGE_OBJECT_TYPE in file.object_types:
+                    xml_docs = _update_landing_page_xmls(
+                        xml_docs,
                         datacite_url=registration.dataciteUrl if registration else None,
                         rems_url=registration.remsUrl if registration else None,
                     )
-                    for xml_doc in xml_docs
-                ]
-
-            # Compile and validate the XML document.
-            if DATACITE_OBJECT_TYPE in file.object_types:
-                # DataCite XML is a single standalone namespaced document and is handled differently.
-                if len(xml_docs) != 1:
-                    reason = f"Expected exactly one DataCite XML document but found {len(xml_docs)}"
-                    LOG.error(reason)
-                    raise SystemException(reason)
-                xml = xml_docs[0]
-                try:
-                    parsed_xml = XmlProcessor.parse_xml(xml)
-                    XmlProcessor.validate_schema(parsed_xml, str(DATACITE_XML_SCHEMA_DIR), "metadata.xsd")
-                except Exception as ex:
-                    reason = f"Generated XML document is not valid for {file.name}"
-                    LOG.error(f"reason: {str(ex)}")
-                    raise SystemException(reason)
-            else:
-                # BP XML types are wrapped in a set element and validated via BP_XML_OBJECT_CONFIG.
-                schema_type = BP_XML_OBJECT_CONFIG.get_schema_type(file.object_types[0])
-                xml = await as_xml_set_document(xml_docs, schema_type)
-                try:
-                    parsed_xml = XmlProcessor.parse_xml(xml)
-                    XmlProcessor.validate_schema(
-                        parsed_xml,
+
+                # Compile the XML document and validate it while it is uploaded.
+                xml: AsyncIterator[bytes]
+                validator: Callable[[], XmlStreamingSchemaValidator]
+                if DATACITE_OBJECT_TYPE in file.object_types:
+                    # DataCite XML is a single standalone namespaced document and is handled differently.
+                    xml = _single_xml_document(xml_docs)
+                    validator = partial(XmlStreamingSchemaValidator, str(DATACITE_XML_SCHEMA_DIR), "metadata.xsd")
+                else:
+                    # BP XML types are wrapped in a set element and validated via BP_XML_OBJECT_CONFIG.
+                    schema_type = BP_XML_OBJECT_CONFIG.get_schema_type(file.object_types[0])
+                    xml = XmlDocumentProcessor.iter_xml_document(
+                        BP_XML_OBJECT_CONFIG, xml_docs, schema_type=schema_type
+                    )
+                    validator = partial(
+                        XmlStreamingSchemaValidator,
                         BP_XML_OBJECT_CONFIG.schema_dir,
                         schema_type,
                         BP_XML_OBJECT_CONFIG.schema_file_resolver,
                     )
-                except Exception as ex:
-                    reason = f"Generated XML document is not valid for {file.name}"
-                    LOG.error(f"reason: {str(ex)}")
-                    raise SystemException(reason)
-
-            # Upload the XML document to SDA inbox.
-            LOG.info(f"Uploading XML document for {file.name} in submission {submission_id} to SDA inbox.")
-            prefix = xml_output_dir.get_full_dir(submission_id)
-            object_key = f"{prefix}/{file.name}"
-            xml_bytes = xml.encode("utf-8")
-            await file_provider._add_file_to_bucket(
-                bucket_name=bucket,
-                object_key=object_key,
-                access_key=bucket,
-                secret_key=bucket,
-                session_token=jwt,
-                body=xml_bytes,
-            )
-
-            # Add uploaded XML artifacts to submission file records for ingestion workflow.
-            if not await services.file.is_file_by_path(submission_id, object_key):
-                await services.file.add_file(
-                    File(submissionId=submission_id, path=object_key, bytes=len(xml_bytes)),
-                    SubmissionWorkflow.BP,
+
+                # Upload the XML document to SDA inbox.
+                LOG.info(f"Uploading XML document for {file.name} in submission {submission_id} to SDA inbox.")
+                object_key = f"{xml_output_dir.get_full_dir(submission_id)}/{file.name}"
+                sizes[object_key] = await file_provider._add_file_to_bucket(
+                    bucket_name=bucket,
+                    object_key=object_key,
+                    access_key=bucket,
+                    secret_key=bucket,
+                    session_token=jwt,
+                    body=_validate_xml_document(xml, validator, file.name),
+                    s3_client=s3,
                 )
+
+    async with file_provider.s3_client(bucket, bucket, jwt) as s3:
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for xml_output_dir in XML_OUTPUT_FILES:
+                    for file in xml_output_dir.files:
+                        tg.create_task(_upload(s3, xml_output_dir, file))
+        except ExceptionGroup as ex:
+            # Raise the first failure. The remaining uploads have been cancelled.
+            raise ex.exceptions[0] from None
+
+    # Add uploaded XML artifacts to submission file records for ingestion workflow.
+    await services.file.add_missing_files(
+        submission_id,
+        [File(submissionId=submission_id, path=path, bytes=size) for path, size in sizes.items()],
+        SubmissionWorkflow.BP,
+    )
+
+
+async def _iter_locked(xml_docs: AsyncIterator[str], lock: asyncio.Lock) -> AsyncGenerator[str, None]:
+    """Iterate the XML documents while holding the lock when the XML documents are read.
+
+    :param xml_docs: The XML documents streamed from the database.
+    :param lock: The lock for the database session.
+    :returns: The XML documents.
+    """
+    try:
+        while True:
+            async with lock:
+                xml_doc = await anext(xml_docs, None)
+            if xml_doc is None:
+                return
+            yield xml_doc
+    finally:
+        if isinstance(xml_docs, AsyncGenerator):
+            async with lock:
+                await xml_docs.aclose()
+
+
+async def _chain_xml_documents(first_xml_doc: str, xml_docs: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Iterate the first XML document followed by the remaining XML documents.
+
+    :param first_xml_doc: The first XML document.
+    :param xml_docs: The remaining XML documents.
+    :returns: The XML documents.
+    """
+    yield first_xml_doc
+    async for xml_doc in xml_docs:
+        yield xml_doc
+
+
+async def _update_landing_page_xmls(
+    xml_docs: AsyncIterator[str], *, datacite_url: str | None, rems_url: str | None
+) -> AsyncIterator[str]:
+    """Update the landing page XML documents.
+
+    :param xml_docs: The landing page XML documents.
+    :param datacite_url: The DataCite URL.
+    :param rems_url: The REMS URL.
+    :returns: The updated landing page XML documents.
+    """
+    async for xml_doc in xml_docs:
+        yield await update_landing_page_xml(xml_doc, datacite_url=datacite_url, rems_url=rems_url)
+
+
+async def _single_xml_document(xml_docs: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Iterate the only XML document.
+
+    :param xml_docs: The XML documents.
+    :returns: The encoded XML document.
+    """
+    count = 0
+    async for xml_doc in xml_docs:
+        count += 1
+        if count > 1:
+            reason = "Expected exactly one DataCite XML document but found more than one"
+            LOG.error(reason)
+            raise SystemException(reason)
+        yield xml_doc.encode("utf-8")
+
+
+async def _validate_xml_document(
+    xml: AsyncIterator[bytes], validator_factory: Callable[[], XmlStreamingSchemaValidator], name: str
+) -> AsyncIterator[bytes]:
+    """Validate the XML document incrementally while it is iterated.
+
+    The XML document is validated in a dedicated worker thread in chunks of at least
+    XML_VALIDATION_BUFFER_SIZE bytes. The XML document is invalid if the validation
+    fails before the iteration is completed.
+
+    :param xml: The XML document chunks.
+    :param validator_factory: Creates the XML Schema validator.
+    :param name: The XML file name.
+    :returns: The XML document chunks.
+    """
+    loop = asyncio.get_running_loop()
+    # The XML parser used by the validator must not be used from more than one thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        try:
+            validator = await loop.run_in_executor(executor, validator_factory)
+            buffer = bytearray()
+            async for chunk in xml:
+                buffer += chunk
+                if len(buffer) >= XML_VALIDATION_BUFFER_SIZE:
+                    data = bytes(buffer)
+                    buffer.clear()
+                    await loop.run_in_executor(executor, validator.feed, data)
+                    yield data
+            data = bytes(buffer)
+            await loop.run_in_executor(executor, validator.feed, data)
+            await loop.run_in_executor(executor, validator.close)
+            yield data
+        except SchemaValidationException as ex:
+            reason = f"Generated XML document is not valid for {name}"
+            LOG.error(f"reason: {str(ex)}")
+            raise SystemException(reason) from ex
@@ -1,25 +1,112 @@
 """Service to retrieve file and bucket information from a file provider."""
 
+import asyncio
 import base64
 import binascii
+import os
+import time
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager, suppress
 from io import BytesIO
+from typing import Any, AsyncIterator
 
-import aioboto3
 import botocore.exceptions
 import ujson
+from crypt4gh import CIPHER_SEGMENT_SIZE, SEGMENT_SIZE, header, sodium
 from crypt4gh.keys import c4gh
-from crypt4gh.lib import encrypt
 from pydantic import BaseModel, RootModel
 
 from ...conf.c4gh import c4gh_config
 from ...conf.s3 import s3_config
+from ...helpers import metrics
 from ...helpers.logger import LOG
 from ...services.admin_service import AdminServiceHandler
 from ...services.keystone_service import KeystoneServiceHandler
 from ..exceptions import SystemException, UserException
 from ..models.models import File as SubmissionFile
 from ..models.sda import FileItem
+from .s3 import create_s3_client_pool
+
+# Unencrypted bytes encrypted at a time in a worker thread. Must be a multiple of the Crypt4GH segment size.
+ENCRYPTION_BUFFER_SIZE = 16 * SEGMENT_SIZE
+# Encrypted objects larger than this are uploaded using multipart upload in parts of at least
+# this size. S3 requires that all parts except the last one are at least 5 MiB.
+MULTIPART_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+# Number of objects listed from an S3 bucket at a time. S3 returns at most 1000 objects per request.
+S3_LIST_PAGE_SIZE = 1000
+
+# Crypt4GH key parsing time. The passphrase key derivation function is deliberately slow.
+CRYPT4GH_KEY_PARSE_SECONDS = metrics.Histogram(
+    "crypt4gh_key_parse_seconds",
+    "Seconds spent parsing the Crypt4GH keys.",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+
+class Crypt4GHEncryptor:
+    """
+    Encrypt data incrementally in Crypt4GH format.
+
+    The data is encrypted in 64 KiB segments using a random session key, and the output is
+    identical in format to crypt4gh.lib.encrypt without an edit list.
+    """
+
+    def __init__(self, sender_secret_key: object, recipient_public_key: object) -> None:
+        """
+        Encrypt data incrementally in Crypt4GH format.
+
+        Args:
+            sender_secret_key: Crypt4GH sender secret key.
+            recipient_public_key: Crypt4GH recipient public key.
+        """
+        encryption_method = 0  # chacha20_ietf_poly1305
+        self._session_key = os.urandom(32)
+        header_content = header.make_packet_data_enc(encryption_method, self._session_key)
+        header_packets = header.encrypt(header_content, [(0, sender_secret_key, recipient_public_key)])
+        self._header: bytes | None = header.serialize(header_packets)
+        self._buffer = bytearray()
+        self._ciphersegment = bytearray(CIPHER_SEGMENT_SIZE)
+
+    def _encrypt_segment(self, segment: bytes | bytearray) -> bytes:
+        """Encrypt one segment."""
+        length = sodium.chacha20poly1305_encrypt(self._ciphersegment, bytes(segment), self._session_key)
+        return bytes(self._ciphersegment[:length])
+
+    def _take_header(self) -> bytes:
+        """Return the header the first time it is called."""
+        header_bytes, self._header = self._header or b"", None
+        return header_bytes
+
+    def update(self, data: bytes) -> bytes:
+        """
+        Encrypt data and return the encrypted complete segments.
+
+        Args:
+            data: Unencrypted data.
+
+        Returns:
+            Encrypted data, starting with the header the first time.
+        """
+        self._buffer += data
+        output = bytearray(self._take_header())
+        complete = len(self._buffer) - len(self._buffer) % SEGMENT_SIZE
+        for offset in range(0, complete, SEGMENT_SIZE):
+            output += self._encrypt_segment(self._buffer[offset : offset + SEGMENT_SIZE])
+        del self._buffer[:complete]
+        return bytes(output)
+
+    def finalize(self) -> bytes:
+        """
+        Encrypt the last incomplete segment.
+
+        Returns:
+            Encrypted data.
+        """
+        output = bytearray(self._take_header())
+        if self._buffer:
+            output += self._encrypt_segment(self._buffer)
+            self._buffer.clear()
+        return bytes(output)
 
 
 class FileProviderService(ABC):
@@ -34,6 +121,10 @@ class FileProviderService(ABC):
     class Files(RootModel[list[File]]):
         """Model for a list of file metadata."""
 
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the resources held by the file provider."""
+
     async def verify_user_file(self, bucket: str, file: str) -> int | None:
         """
         Verify that the file exists in the specified bucket and return its size.
@@ -84,24 +175,48 @@ class FileProviderService(ABC):
         """
         List files in the specified bucket.
 
+        All files are kept in memory. Use iter_files_in_bucket for large buckets.
+
         Args:
             bucket: The name of the bucket.
 
         Returns:
             A list of files (objects) found.
         """
+        return self.Files([file async for file in self.iter_files_in_bucket(bucket)])
+
+    async def iter_files_in_bucket(
+        self, bucket: str, *, prefix: str | None = None, delimiter: str | None = None
+    ) -> AsyncIterator[File]:
+        """
+        Iterate files in the specified bucket.
+
+        The files are listed one page at a time. The bucket access and the existence of
+        at least one file are checked before the first file is returned.
+
+        Args:
+            bucket: The name of the bucket.
+            prefix: Only list files whose path starts with the prefix.
+            delimiter: Only list files whose path does not contain the delimiter after the prefix.
+
+        Returns:
+            The files (objects) found.
+        """
         # Bucket must have been assigned the correct policy first
         if not await self._verify_bucket_policy(bucket):
             reason = f"Bucket '{bucket}' has not been made accessible to SD Submit."
             LOG.error(reason)
             raise UserException(reason)
 
-        files = await self._list_files_in_bucket(bucket)
-        if not files.root:
+        files = self._iter_files_in_bucket(bucket, prefix=prefix, delimiter=delimiter)
+        first_file = await anext(files, None)
+        if first_file is None:
             reason = f"No files found in bucket '{bucket}'."
             LOG.error(reason)
             raise UserException(reason)
-        return files
+        yield first_file
+        async for file in files:
+            yield file
 
     async def update_bucket_policy(self, bucket: str, creds: KeystoneServiceHandler.EC2Credentials) -> None:
         """
@@ -191,15 +306,19 @@ class FileProviderService(ABC):
         """
 
     @abstractmethod
-    async def _list_files_in_bucket(self, bucket: str) -> Files:
+    def _iter_files_in_bucket(
+        self, bucket: str, *, prefix: str | None = None, delimiter: str | None = None
+    ) -> AsyncIterator[File]:
         """
-        List all files in the specified bucket.
+        Iterate all files in the specified bucket.
 
         Args:
             bucket: The name of the bucket.
+            prefix: Only list files whose path starts with the prefix.
+            delimiter: Only list files whose path does not contain the delimiter after the prefix.
 
         Returns:
-            A list of files (objects) found.
+            The files found.
         """
 
     @abstractmethod
@@ -232,15 +351,24 @@ class S3FileProviderService(FileProviderService, ABC):
         """Create S3 file service."""
 
         self._config = s3_config()
-
-        # Initialize the base S3 session with static credentials when available.
-        session_kwargs: dict[str, str] = {"region_name": self._config.S3_REGION}
-        if self._config.STATIC_S3_ACCESS_KEY_ID and self._config.STATIC_S3_SECRET_ACCESS_KEY:
-            session_kwargs["aws_access_key_id"] = self._config.STATIC_S3_ACCESS_KEY_ID
-            session_kwargs["aws_secret_access_key"] = self._config.STATIC_S3_SECRET_ACCESS_KEY
-        self._session = aioboto3.Session(**session_kwargs)
         self.region = self._config.S3_REGION
         self.endpoint = self._config.S3_ENDPOINT
+        self._s3_clients = create_s3_client_pool(self._config)
+
+    async def close(self) -> None:
+        """Close the pooled S3 clients."""
+        await self._s3_clients.close()
+
+    def _static_s3_client(self) -> AbstractAsyncContextManager[Any]:
+        """Use a pooled S3 client with the static credentials when available."""
+        if self._config.STATIC_S3_ACCESS_KEY_ID and self._config.STATIC_S3_SECRET_ACCESS_KEY:
+            return self._s3_clients.client(
+                endpoint_url=self.endpoint,
+                region_name=self.region,
+                access_key=self._config.STATIC_S3_ACCESS_KEY_ID,
+                secret_key=self._config.STATIC_S3_SECRET_ACCESS_KEY,
+            )
+        return self._s3_clients.client(endpoint_url=self.endpoint, region_name=self.region)
 
     async def _verify_user_file(self, bucket: str, file: str) -> int | None:
         """
@@ -253,7 +381,7 @@ class S3FileProviderService(FileProviderService, ABC):
         Returns:
             The file size in bytes if the file exists, otherwise None.
         """
-        async with self._session.client("s3", endpoint_url=self.endpoint) as s3:
+        async with self._static_s3_client() as s3:
             try:
                 resp = await s3.head_object(
                     Bucket=bucket,
@@ -277,13 +405,8 @@ class S3FileProviderService(FileProviderService, ABC):
         Returns:
             A list of bucket names.
         """
-        session = aioboto3.Session()
-        async with session.client(
-            "s3",
-            endpoint_url=self.endpoint,
-            aws_access_key_id=creds.access,
-            aws_secret_access_key=creds.secret,
-            region_name=self.region,
+        async with self._s3_clients.client(
+            endpoint_url=self.endpoint, region_name=self.region, access_key=creds.access, secret_key=creds.secret
         ) as s3:
             try:
                 response = await s3.list_buckets()
@@ -294,22 +417,36 @@ class S3FileProviderService(FileProviderService, ABC):
                     return []
                 raise e
 
-    async def _list_files_in_bucket(self, bucket: str) -> FileProviderService.Files:
+    async def _iter_files_in_bucket(
+        self, bucket: str, *, prefix: str | None = None, delimiter: str | None = None
+    ) -> AsyncIterator[FileProviderService.File]:
         """
-        List all files in the specified S3 bucket.
+        Iterate all files in the specified S3 bucket.
+
+        The objects are listed using the list_objects_v2 paginator one page at a time.
 
         Args:
             bucket: The name of the S3 bucket.
+            prefix: Only list files whose key starts with the prefix.
+            delimiter: Only list files whose key does not contain the delimiter after the prefix.
 
         Returns:
-            A list of files found.
+            The files found.
         """
-        async with self._session.client("s3", endpoint_url=self.endpoint) as s3:
+        params = {"Bucket": bucket}
+        if prefix:
+            params["Prefix"] = prefix
+        if delimiter:
+            params["Delimiter"] = delimiter
+
+        async with self._static_s3_client() as s3:
             try:
-                response = await s3.list_objects_v2(Bucket=bucket)
-                contents = response.get("Contents", [])
-                files = [self.File(path=f"S3://{bucket}/{obj['Key']}", bytes=int(obj["Size"])) for obj in contents]
-                return self.Files(files)
+                pages = s3.get_paginator("list_objects_v2").paginate(
+                    **params, PaginationConfig={"PageSize": S3_LIST_PAGE_SIZE}
+                )
+                async for page in pages:
+                    for obj in page.get("Contents", []):
+                        yield self.File(path=f"S3://{bucket}/{obj['Key']}", bytes=int(obj["Size"]))
             except botocore.exceptions.ClientError as e:
                 err = e.response.get("Error", {})
                 code = err.get("Code")
@@ -345,13 +482,8 @@ class S3AllasFileProviderService(S3FileProviderService):
             bucket: The name of the S3 bucket.
             creds: EC2 credentials for the project.
         """
-        session = aioboto3.Session()
-        async with session.client(
-            "s3",
-            endpoint_url=self.endpoint,
-            aws_access_key_id=creds.access,
-            aws_secret_access_key=creds.secret,
-            region_name=self.region,
+        async with self._s3_clients.client(
+            endpoint_url=self.endpoint, region_name=self.region, access_key=creds.access, secret_key=creds.secret
         ) as s3:
             try:
                 resp = await s3.get_bucket_policy(
@@ -366,38 +498,38 @@ class S3AllasFileProviderService(S3FileProviderService):
             except Exception:
                 statements = []
 
-        api_project_id = self._require_api_project_id()
-
-        policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "GrantSDSubmitReadAccess",
-                    "Effect": "Allow",
-                    "Principal": {
-                        "AWS": f"arn:aws:iam::{api_project_id}:root",
+            api_project_id = self._require_api_project_id()
+
+            policy = {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Sid": "GrantSDSubmitReadAccess",
+                        "Effect": "Allow",
+                        "Principal": {
+                            "AWS": f"arn:aws:iam::{api_project_id}:root",
+                        },
+                        "Action": ["s3:GetObject", "s3:ListBucket", "s3:GetBucketPolicy"],
+                        "Resource": [f"arn:aws:s3:::{bucket}", f"arn:aws:s3:::{bucket}/*"],
                     },
-                    "Action": ["s3:GetObject", "s3:ListBucket", "s3:GetBucketPolicy"],
-                    "Resource": [f"arn:aws:s3:::{bucket}", f"arn:aws:s3:::{bucket}/*"],
-                },
-            ]
-            + statements,
-        }
-        try:
-            await s3.put_bucket_policy(
-                Bucket=bucket,
-                Policy=ujson.dumps(policy),
-            )
-        except botocore.exceptions.ClientError as e:
-            err = e.response.get("Error", {})
-            code = err.get("Code")
-            msg = err.get("Message")
+                ]
+                + statements,
+            }
+            try:
+                await s3.put_bucket_policy(
+                    Bucket=bucket,
+                    Policy=ujson.dumps(policy),
+                )
+            except botocore.exceptions.ClientError as e:
+                err = e.response.get("Error", {})
+                code = err.get("Code")
+                msg = err.get("Message")
 
-            if code == "NoSuchBucket":
-                raise UserException("Bucket does not exist") from e
+                if code == "NoSuchBucket":
+                    raise UserException("Bucket does not exist") from e
 
-            LOG.exception("Failed to update bucket policy: %s — %s", code, msg)
-            raise SystemException("Failed to update bucket policy") from e
+                LOG.exception("Failed to update bucket policy: %s — %s", code, msg)
+                raise SystemException("Failed to update bucket policy") from e
 
     async def _verify_bucket_policy(self, bucket: str) -> bool:
         """Verify that the read access policy has been assigned to a bucket.
@@ -408,7 +540,7 @@ class S3AllasFileProviderService(S3FileProviderService):
         Returns:
             True if the policy is assigned, False otherwise.
         """
-        async with self._session.client("s3", endpoint_url=self.endpoint) as s3:
+        async with self._static_s3_client() as s3:
             try:
                 resp = await s3.get_bucket_policy(
                     Bucket=bucket,
@@ -441,6 +573,14 @@ class S3InboxSDAService(FileProviderService):
         self.region = self._config.S3_REGION
         self.endpoint = self._config.S3_ENDPOINT
         self._admin_handler = admin_handler
+        self._s3_clients = create_s3_client_pool(self._config)
+        # Crypt4GH keys are loaded once per worker.
+        self._crypt4gh_keys: tuple[object, object] | None = None
+        self._crypt4gh_keys_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """Close the pooled S3 clients."""
+        await self._s3_clients.close()
 
     async def _verify_user_file(self, bucket: str, file: str) -> int | None:
         """Verify that the file exists in the specified S3 bucket and return its size."""
@@ -453,9 +593,14 @@ class S3InboxSDAService(FileProviderService):
         """
         return []
 
-    async def _list_files_in_bucket(self, bucket: str) -> FileProviderService.Files:
-        """List all files in the specified bucket."""
-        return self.Files([])
+    async def _iter_files_in_bucket(
+        self, bucket: str, *, prefix: str | None = None, delimiter: str | None = None
+    ) -> AsyncIterator[FileProviderService.File]:
+        """Iterate all files in the specified bucket."""
+        # NBIS submissions have no bucket files.
+        files: tuple[FileProviderService.File, ...] = ()
+        for file in files:
+            yield file
 
     async def _update_bucket_policy(self, bucket: str, creds: KeystoneServiceHandler.EC2Credentials) -> None:
         """Assign a read access policy to the specified bucket."""
@@ -535,8 +680,37 @@ class S3InboxSDAService(FileProviderService):
         """
         return [f for f in inbox_file_paths if f not in file_paths]
 
+    async def load_crypt4gh_keys(self, *, reload: bool = False) -> tuple[object, object]:
+        """Load and cache the Crypt4GH sender secret and recipient public keys.
+
+        The keys are parsed once per worker because parsing the private key runs the
+        deliberately slow passphrase key derivation function. The parsing is done in a
+        worker thread.
+
+        Args:
+            reload: Parse the keys again, for example after key rotation.
+
+        Returns:
+            The sender secret key and the recipient public key.
+        """
+        async with self._crypt4gh_keys_lock:
+            if self._crypt4gh_keys is None or reload:
+                start = time.perf_counter()
+                self._crypt4gh_keys = await asyncio.to_thread(self._parse_crypt4gh_keys)
+                seconds = time.perf_counter() - start
+                CRYPT4GH_KEY_PARSE_SECONDS.observe(seconds)
+                LOG.info("Loaded Crypt4GH keys in %.3f seconds", seconds)
+            return self._crypt4gh_keys
+
     async def _load_crypt4gh_keys(self) -> tuple[object, object]:
-        """Load Crypt4GH sender secret and recipient public keys from env variables."""
+        """Return the cached Crypt4GH sender secret and recipient public keys."""
+        if self._crypt4gh_keys is not None:
+            return self._crypt4gh_keys
+        return await self.load_crypt4gh_keys()
+
+    @staticmethod
+    def _parse_crypt4gh_keys() -> tuple[object, object]:
+        """Parse Crypt4GH sender secret and recipient public keys from env variables or secret files."""
         conf = c4gh_config()
         try:
             sender_key_pem = base64.b64decode(conf.CRYPT4GH_PRIVATE_KEY).decode("utf-8")
@@ -569,12 +743,28 @@ class S3InboxSDAService(FileProviderService):
             )
             raise SystemException("Service configuration error.") from ex
 
-    async def _encrypt_file(self, file: bytes, sender_secret_key: object, recipient_public_key: object) -> bytes:
-        """Encrypt file bytes using crypt4gh and return encrypted payload bytes."""
-        infile = BytesIO(file)
-        outfile = BytesIO()
-        encrypt([(0, sender_secret_key, recipient_public_key)], infile, outfile)
-        return outfile.getvalue()
+    @asynccontextmanager
+    async def s3_client(self, access_key: str, secret_key: str, session_token: str) -> AsyncIterator[Any]:
+        """Use a pooled S3 client using provided credentials.
+
+        The client can be shared by concurrent uploads using the same credentials.
+
+        Args:
+            access_key: S3 access key ID.
+            secret_key: S3 secret access key.
+            session_token: S3 session token.
+
+        Returns:
+            The S3 client.
+        """
+        async with self._s3_clients.client(
+            endpoint_url=self.endpoint,
+            region_name=self.region,
+            access_key=access_key,
+            secret_key=secret_key,
+            session_token=session_token,  # equivalent to s3cmd access_token
+        ) as s3:
+            yield s3
 
     async def _add_file_to_bucket(
         self,
@@ -583,37 +773,95 @@ class S3InboxSDAService(FileProviderService):
         access_key: str,
         secret_key: str,
         session_token: str,
-        body: bytes = b"",
-    ) -> None:
+        body: bytes | AsyncIterator[bytes] = b"",
+        s3_client: Any | None = None,
+    ) -> int:
         """Upload a C4GH encrypted object to S3 bucket using provided credentials.
 
+        The object is encrypted incrementally in a worker thread. Objects larger than the
+        multipart upload part size are uploaded using a multipart upload, and at most one
+        part is kept in memory.
+
         Args:
             bucket_name: Name of the bucket.
             object_key: Key for the object to be added.
             access_key: S3 access key ID.
             secret_key: S3 secret access key.
             session_token: S3 session token.
-            body: Unencrypted object bytes.
+            body: Unencrypted object bytes or chunks.
+            s3_client: Optional S3 client opened using s3_client. If not given, a new client
+                is opened using the provided credentials.
+
+        Returns:
+            The size of the unencrypted object in bytes.
         """
         sender_secret_key, recipient_public_key = await self._load_crypt4gh_keys()
-        encrypted_file = await self._encrypt_file(body, sender_secret_key, recipient_public_key)
+        encryptor = Crypt4GHEncryptor(sender_secret_key, recipient_public_key)
+
+        async def _iter_body() -> AsyncIterator[bytes]:
+            if isinstance(body, bytes):
+                yield body
+            else:
+                async for chunk in body:
+                    yield chunk
+
+        size = 0
+        plaintext = bytearray()
+        part = bytearray()
+        upload_id: str | None = None
+        parts: list[dict[str, Any]] = []
 
         try:
-            session = aioboto3.Session()
-            async with session.client(
-                "s3",
-                endpoint_url=self.endpoint,
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                aws_session_token=session_token,  # equivalent to s3cmd access_token
-                region_name=self.region,
-            ) as s3:
-                await s3.put_object(
-                    Bucket=bucket_name,
-                    Key=object_key,
-                    Body=encrypted_file,
-                    ContentType="application/octet-stream",
-                )
+            async with AsyncExitStack() as stack:
+                s3 = s3_client
+                if s3 is None:
+                    s3 = await stack.enter_async_context(self.s3_client(access_key, secret_key, session_token))
+
+                async def _upload_part() -> None:
+                    nonlocal upload_id
+                    if upload_id is None:
+                        response = await s3.create_multipart_upload(
+                            Bucket=bucket_name, Key=object_key, ContentType="application/octet-stream"
+                        )
+                        upload_id = response["UploadId"]
+                    part_number = len(parts) + 1
+                    response = await s3.upload_part(
+                        Bucket=bucket_name, Key=object_key, UploadId=upload_id, PartNumber=part_number, Body=bytes(part)
+                    )
+                    parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                    part.clear()
+
+                try:
+                    async for chunk in _iter_body():
+                        size += len(chunk)
+                        plaintext += chunk
+                        if len(plaintext) >= ENCRYPTION_BUFFER_SIZE:
+                            part += await asyncio.to_thread(encryptor.update, bytes(plaintext))
+                            plaintext.clear()
+                        if len(part) >= MULTIPART_UPLOAD_PART_SIZE:
+                            await _upload_part()
+
+                    part += await asyncio.to_thread(encryptor.update, bytes(plaintext))
+                    part += encryptor.finalize()
+
+                    if upload_id is None:
+                        await s3.put_object(
+                            Bucket=bucket_name,
+                            Key=object_key,
+                            Body=bytes(part),
+                            ContentType="application/octet-stream",
+                        )
+                    else:
+                        if part:
+                            await _upload_part()
+                        await s3.complete_multipart_upload(
+                            Bucket=bucket_name, Key=object_key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+                        )
+                except BaseException:
+                    if upload_id is not None:
+                        with suppress(Exception):
+                            await s3.abort_multipart_upload(Bucket=bucket_name, Key=object_key, UploadId=upload_id)
+                    raise
         except botocore.exceptions.ClientError as ex:
             err = ex.response.get("Error", {})
             code = err.get("Code")
@@ -626,3 +874,5 @@ class S3InboxSDAService(FileProviderService):
                 msg,
             )
             raise SystemException("Failed to upload encrypted file to SDA inbox.") from ex
+
+        return size
@@ -1,20 +1,102 @@
 """Ingest service."""
 
 import asyncio
+import enum
+import time
+from collections import Counter
 from collections.abc import Awaitable, Callable
 from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ...api.exceptions import ServiceHandlerSystemException
 from ...conf.admin import admin_config
+from ...database.postgres.leader import LeaderElection
 from ...database.postgres.repository import _session_context
+from ...helpers import metrics
+from ...helpers.cache import CacheBackend, CacheEntry
 from ...helpers.logger import LOG
 from ..handlers.restapi import RESTAPIServiceHandlers, RESTAPIServices
-from ..models.models import IngestErrorType, IngestFileState, IngestStatus
+from ..models.models import IngestErrorType, IngestFileState, IngestStatus, IngestStatusUpdate
 from ..models.sda import CreateDatasetRequest, FileItem, IngestFileRequest, PostAccessionIdRequest
 from ..models.submission import SubmissionWorkflow
 
+# Notification channel for published submissions. The payload is the submission id.
+SUBMISSION_PUBLISHED_CHANNEL = "submission_published"
+
+# Leader election name of the ingest scanner.
+INGEST_SCANNER_LEADER = "ingest_scanner"
+
+# Cache namespace and key of the ingest metrics published by the ingest scanner.
+INGEST_METRICS_CACHE_NAMESPACE = "metrics"
+INGEST_METRICS_CACHE_KEY = "ingest"
+
+# Minimum seconds between publishing the ingest metrics.
+INGEST_METRICS_PUBLISH_INTERVAL = 15
+
+# Ingest metrics. Only the worker that runs the ingest scanner records them, and it publishes
+# them to the other workers.
+INGEST_METRICS = metrics.MetricsRegistry()
+INGEST_SCANNER_LEADER_GAUGE = metrics.Gauge("ingest_scanner_leader", "1 if this worker runs the ingest scanner.")
+INGEST_SCAN_SECONDS = metrics.Histogram(
+    "ingest_scan_duration_seconds", "Duration of ingest scan cycles.", registry=INGEST_METRICS
+)
+INGEST_SYNC_SECONDS = metrics.Histogram(
+    "ingest_sync_duration_seconds",
+    "Duration of syncing submission file ingest statuses with the Admin API.",
+    registry=INGEST_METRICS,
+)
+INGEST_ATTEMPTS = metrics.Counter(
+    "ingest_submission_attempts_total", "Submission ingest attempts.", ("result",), registry=INGEST_METRICS
+)
+ADMIN_REQUEST_SECONDS = metrics.Histogram(
+    "ingest_admin_request_duration_seconds", "Duration of Admin API requests.", ("endpoint",), registry=INGEST_METRICS
+)
+ADMIN_REQUEST_ERRORS = metrics.Counter(
+    "ingest_admin_request_errors_total", "Failed Admin API requests.", ("endpoint",), registry=INGEST_METRICS
+)
+FILE_STATUS_CHANGES = metrics.Counter(
+    "ingest_file_status_changes_total",
+    "File ingest status changes reported by the Admin API.",
+    ("status",),
+    registry=INGEST_METRICS,
+)
+FILE_STATUS_SECONDS = metrics.Histogram(
+    "ingest_file_status_duration_seconds",
+    "Time files spent in an ingest status before the Admin API reported a new status.",
+    ("status",),
+    buckets=(60.0, 300.0, 900.0, 3600.0, 4 * 3600.0, 24 * 3600.0, 7 * 24 * 3600.0),
+    registry=INGEST_METRICS,
+)
+BACKLOG_SUBMISSIONS = metrics.Gauge(
+    "ingest_backlog_submissions", "Published submissions that are not ingested.", registry=INGEST_METRICS
+)
+BACKLOG_FILES = metrics.Gauge(
+    "ingest_backlog_files",
+    "Files of published submissions that are not ingested by ingest status when the submissions were last checked.",
+    ("status",),
+    registry=INGEST_METRICS,
+)
+
+
+class IngestResult(enum.Enum):
+    """Result of a submission ingest attempt."""
+
+    COMPLETED = "completed"  # The submission was ingested.
+    PROGRESSED = "progressed"  # File ingest statuses reported by the Admin API changed.
+    UNCHANGED = "unchanged"  # The submission was not claimed or the file ingest statuses did not change.
+
+
+@dataclass
+class _IngestSchedule:
+    """Next ingest check of a submission."""
+
+    next_check: float  # Monotonic time of the next check.
+    delay: float  # Seconds until the check after the next check if the submission does not progress.
+    notified: bool = False  # The submission was published after it was last checked.
+
 
 class IngestService:
     """Background service to ingest files."""
@@ -33,6 +115,10 @@ class SDAIngestService(IngestService):
         session_factory_provider: Callable[[], async_sessionmaker[AsyncSession]],
         scan_interval_seconds: int | None = None,
         max_workers: int | None = None,
+        max_backoff_seconds: int | None = None,
+        file_concurrency: int | None = None,
+        claim_timeout_seconds: int | None = None,
+        metrics_backend: CacheBackend | None = None,
     ) -> None:
         """Initialise the NeIC SDA ingest service.
 
@@ -41,6 +127,10 @@ class SDAIngestService(IngestService):
         :param session_factory_provider: Factory to create database sessions.
         :param scan_interval_seconds: Background ingest scanner interval in seconds.
         :param max_workers: Maximum number of concurrent background ingest workers.
+        :param max_backoff_seconds: Maximum seconds between checks of a submission that is not progressing.
+        :param file_concurrency: Maximum number of concurrent Admin API file requests per submission.
+        :param claim_timeout_seconds: Seconds after which a claimed submission can be claimed again.
+        :param metrics_backend: The cache backend used to publish the ingest metrics to the other workers.
         """
         admin_handler = handlers.admin
         if admin_handler is None:
@@ -52,136 +142,344 @@ class SDAIngestService(IngestService):
         self._session_factory_provider = session_factory_provider
         self._scan_interval_seconds = scan_interval_seconds or conf.INGEST_SCAN_INTERVAL
         self._max_workers = max_workers or conf.INGEST_WORKERS
+        self._file_concurrency = file_concurrency or conf.INGEST_FILE_CONCURRENCY
+        self._claim_timeout_seconds = claim_timeout_seconds or conf.INGEST_CLAIM_TIMEOUT
+        self._max_backoff_seconds = max(max_backoff_seconds or conf.INGEST_MAX_BACKOFF, self._scan_interval_seconds)
+
+        # Next check of each candidate submission and the next time the candidates are collected.
+        self._schedule: dict[str, _IngestSchedule] = {}
+        self._next_collect = 0.0
+        self._wake_up = asyncio.Event()
+        # Only the worker that runs the scan loop schedules published submissions.
+        self._leading = False
+
+        # File ingest status counts of the candidate submissions when they were last checked.
+        self._file_status_counts: dict[str, Counter[IngestStatus]] = {}
+        BACKLOG_SUBMISSIONS.set_function(lambda: {(): float(len(self._schedule))})
+        BACKLOG_FILES.set_function(self._backlog_files)
+
+        # The published ingest metrics expire if the ingest scanner stops publishing them.
+        self._metrics_backend = metrics_backend
+        self._metrics_publish_interval = max(self._scan_interval_seconds, INGEST_METRICS_PUBLISH_INTERVAL)
+        self._next_metrics_publish = 0.0
+
+    async def run_forever(self, *, leader: LeaderElection | None = None) -> None:
+        """Run the scan loop until the task is cancelled.
 
-    async def run_forever(self) -> None:
-        """Run the periodic scan loop until the task is cancelled."""
+        If the leader election is given, the submissions are scanned only by the leader worker.
+
+        :param leader: Optional leader election between workers.
+        """
         LOG.info(
             "Starting background ingest scanner (scan_interval_seconds=%s, max_workers=%s)",
             self._scan_interval_seconds,
             self._max_workers,
         )
-        while True:
-            try:
-                await self.scan_once()
-            except Exception:
-                LOG.exception("Background ingest scan failed")
-            await asyncio.sleep(self._scan_interval_seconds)
+        if leader is None:
+            await self._scan_forever()
+        else:
+            await leader.run_forever(self._scan_forever)
+
+    async def _scan_forever(self) -> None:
+        """Run scan cycles until the task is cancelled."""
+        # Collect the candidates immediately, for example after this worker has become the leader.
+        self._next_collect = 0.0
+        self._leading = True
+        INGEST_SCANNER_LEADER_GAUGE.set(1)
+        try:
+            while True:
+                try:
+                    await self.scan_once()
+                except Exception:
+                    LOG.exception("Background ingest scan failed")
+                    await asyncio.sleep(self._scan_interval_seconds)
+                if time.monotonic() >= self._next_metrics_publish:
+                    self._next_metrics_publish = time.monotonic() + self._metrics_publish_interval
+                    await self.publish_metrics()
+                await self._wait_for_next_check()
+        finally:
+            # Another worker checks the submissions while this worker is not the leader.
+            self._leading = False
+            self._schedule.clear()
+            self._file_status_counts.clear()
+            INGEST_SCANNER_LEADER_GAUGE.set(0)
+
+    async def publish_metrics(self) -> None:
+        """Publish the ingest metrics of this worker to the other workers using the metrics backend."""
+        if self._metrics_backend is None:
+            return
+        expires = time.time() + 3 * self._metrics_publish_interval
+        entry = CacheEntry(INGEST_METRICS.render(), expires, expires)
+        try:
+            await self._metrics_backend.set(INGEST_METRICS_CACHE_NAMESPACE, INGEST_METRICS_CACHE_KEY, entry, 1)
+        except Exception as ex:
+            LOG.warning("Failed to publish ingest metrics: %r", ex)
+
+    async def get_metrics(self) -> str:
+        """Get the ingest metrics published by the worker that runs the ingest scanner.
+
+        The ingest metrics of this worker are returned if the metrics backend is not configured.
+
+        :returns: The ingest metrics in the Prometheus text exposition format, or an empty string.
+        """
+        if self._metrics_backend is None:
+            return INGEST_METRICS.render()
+        try:
+            entry = await self._metrics_backend.get(INGEST_METRICS_CACHE_NAMESPACE, INGEST_METRICS_CACHE_KEY)
+        except Exception as ex:
+            LOG.warning("Failed to get ingest metrics: %r", ex)
+            return ""
+        return entry.value if entry is not None else ""
+
+    def submission_published(self, submission_id: str) -> None:
+        """Check the published submission without waiting for the next scan.
+
+        Called when a submission published notification is received. The notification is ignored
+        if this worker does not run the scan loop.
+
+        :param submission_id: ID of the published submission.
+        """
+        if not self._leading:
+            return
+        self._schedule[submission_id] = _IngestSchedule(
+            next_check=0.0, delay=self._scan_interval_seconds, notified=True
+        )
+        self._wake_up.set()
+
+    def collect_submissions(self) -> None:
+        """Collect the candidate submissions without waiting for the next scan.
+
+        Called when the notification listener has connected, because notifications sent while the
+        listener was disconnected are lost.
+        """
+        self._next_collect = 0.0
+        self._wake_up.set()
 
     async def scan_once(self) -> None:
         """Run one scan cycle.
 
-        This will collect Bigpicture workflow submissions that are published but not yet ingested
-        and process them concurrently.
+        Bigpicture workflow submissions that are published but not yet ingested are collected once per
+        scan interval. The submissions whose next check time has passed are processed concurrently.
+        Submissions that are not ingested are checked again after the scan interval if their file
+        ingest statuses changed, and otherwise after a delay that doubles after each check up to
+        the maximum backoff.
         """
+        with INGEST_SCAN_SECONDS.time():
+            await self._scan_once()
+
+    async def _scan_once(self) -> None:
+        """Run one scan cycle."""
         LOG.info("Starting ingest scan cycle")
-        submission_ids: list[str] = await self._with_session(self._get_submission_ids_for_ingest)
-        LOG.info("Ingest scan found %s candidate submission(s)", len(submission_ids))
-        if not submission_ids:
-            LOG.info("Ingest scan cycle finished (no candidates)")
+        self._wake_up.clear()
+        now = time.monotonic()
+        if now >= self._next_collect:
+            submission_ids: list[str] = await self._with_session(self._get_submission_ids_for_ingest)
+            LOG.info("Ingest scan found %s candidate submission(s)", len(submission_ids))
+            self._next_collect = now + self._scan_interval_seconds
+            self._collect_schedule(submission_ids, now)
+
+        due = [submission_id for submission_id, s in self._schedule.items() if s.next_check <= now]
+        if not due:
+            LOG.info("Ingest scan cycle finished (no submissions to check)")
             return
 
         # Use a semaphore to limit the number of concurrent workers processing submissions.
         sem = asyncio.Semaphore(self._max_workers)
 
+        for submission_id in due:
+            self._schedule[submission_id].notified = False
+
         async def _start(submission_id: str) -> None:
             async with sem:
-                await self.ingest_submission_with_session(submission_id)
+                result = IngestResult.UNCHANGED
+                try:
+                    result = await self._ingest_submission_with_session(submission_id)
+                finally:
+                    self._reschedule(submission_id, result)
 
-        await asyncio.gather(*(_start(submission_id) for submission_id in submission_ids))
+        await asyncio.gather(*(_start(submission_id) for submission_id in due))
         LOG.info("Ingest scan cycle finished")
 
+    def _collect_schedule(self, submission_ids: list[str], now: float) -> None:
+        """Schedule new candidate submissions for an immediate check and remove the other submissions.
+
+        Submissions notified while the candidates were collected are kept.
+
+        :param submission_ids: IDs of the candidate submissions.
+        :param now: monotonic time when the candidates were collected.
+        """
+        candidates = set(submission_ids)
+        for submission_id in [s for s in self._schedule if s not in candidates]:
+            if not self._schedule[submission_id].notified:
+                del self._schedule[submission_id]
+                self._file_status_counts.pop(submission_id, None)
+        for submission_id in submission_ids:
+            self._schedule.setdefault(submission_id, _IngestSchedule(next_check=now, delay=self._scan_interval_seconds))
+
+    def _reschedule(self, submission_id: str, result: IngestResult) -> None:
+        """Schedule the next check of the submission after an ingest attempt.
+
+        :param submission_id: ID of the processed submission.
+        :param result: the result of the ingest attempt.
+        """
+        schedule = self._schedule.get(submission_id)
+        if result == IngestResult.COMPLETED:
+            self._schedule.pop(submission_id, None)
+            self._file_status_counts.pop(submission_id, None)
+            return
+        if schedule is None or schedule.notified:
+            # The submission was published again during the attempt.
+            return
+        if result == IngestResult.PROGRESSED:
+            schedule.delay = self._scan_interval_seconds
+        schedule.next_check = time.monotonic() + schedule.delay
+        schedule.delay = min(schedule.delay * 2, self._max_backoff_seconds)
+
+    def _backlog_files(self) -> dict[tuple[str, ...], float]:
+        """Return the file ingest status counts of the candidate submissions."""
+        total: Counter[IngestStatus] = Counter()
+        for counts in self._file_status_counts.values():
+            total.update(counts)
+        return {(status.value,): float(count) for status, count in total.items()}
+
+    async def _wait_for_next_check(self) -> None:
+        """Wait until the next submission check or candidate collection, or until woken up."""
+        next_check = min((s.next_check for s in self._schedule.values()), default=self._next_collect)
+        timeout = max(0.0, min(next_check, self._next_collect) - time.monotonic())
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self._wake_up.wait(), timeout)
+
     async def ingest_submission_with_session(self, submission_id: str) -> bool:
         """Attempt to claim and fully process one submission.
 
         :param submission_id: ID of the submission to process.
         :returns: ``True`` when ingest completed successfully, ``False`` when the submission
-            could not be claimed (already processed or locked by another worker) or when ingest
+            could not be claimed (already processed or claimed by another worker) or when ingest
             is still in progress.
         """
+        return await self._ingest_submission_with_session(submission_id) == IngestResult.COMPLETED
+
+    async def _ingest_submission_with_session(self, submission_id: str) -> IngestResult:
+        """Attempt to claim and fully process one submission.
+
+        :param submission_id: ID of the submission to process.
+        :returns: the result of the ingest attempt.
+        """
         LOG.info("Starting ingest attempt for submission %s", submission_id)
-        completed = await self._with_session(lambda: self.ingest_submission(submission_id))
-        LOG.info("Finished ingest attempt for submission %s (completed=%s)", submission_id, completed)
-        return completed
+        result = await self.ingest_submission(submission_id)
+        LOG.info("Finished ingest attempt for submission %s (result=%s)", submission_id, result.value)
+        INGEST_ATTEMPTS.inc(result=result.value)
+        return result
+
+    async def ingest_submission(self, submission_id: str) -> IngestResult:
+        """Drive a single submission through its full ingest lifecycle.
 
-    async def ingest_submission(self, submission_id: str) -> bool:
-        """Drive a single submission through its full ingest lifecycle within an open session.
+        The submission is claimed in a short transaction and remains claimed until it is
+        released at the end, or until the claim times out if the worker stops. No database
+        transaction is open while the Admin API is called, and the file status changes are
+        saved in bulk.
 
         Steps performed:
-        1. Claim the submission row.
+        1. Claim the submission and load the file ingest statuses.
         2. Sync local file statuses with the Admin API to pick up any progress made by a previous run.
         3. Advance each file that is still in progress by issuing the appropriate Admin API call.
         4. If all files have reached ``READY`` status, release the dataset and mark the submission as ingested.
 
         :param submission_id: ID of the submission to process.
-        :returns: ``True`` when ingestion fully completed, ``False`` otherwise.
+        :returns: the result of the ingest attempt.
+        """
+        # 1. Claim the submission and load the file ingest statuses.
+        claim = await self._with_session(lambda: self._claim_submission(submission_id))
+        if claim is None:
+            LOG.info("Submission %s not claimable for ingest (already ingested or claimed)", submission_id)
+            return IngestResult.UNCHANGED
+
+        user_id, files = claim
+        try:
+            if not files:
+                LOG.info("No files to ingest for submission %s", submission_id)
+                return IngestResult.UNCHANGED
+
+            LOG.info("Submission %s has %s file(s) tracked for ingest", submission_id, len(files))
+
+            # 2. Sync local file statuses with the Admin API to pick up any progress made by a previous run.
+            with INGEST_SYNC_SECONDS.time():
+                updates = await self._sync_file_ingest_states(
+                    user_id=user_id, submission_id=submission_id, file_states=files
+                )
+            await self._save_ingest_statuses(submission_id, updates)
+            statuses = {update.file_id: update.ingest_status for update in updates}
+            files = [
+                file.model_copy(update={"ingest_status": statuses.get(file.file_id, file.ingest_status)})
+                for file in files
+            ]
+            self._file_status_counts[submission_id] = Counter(file.ingest_status for file in files)
+
+            # 3. Advance each file that is still in progress by issuing the appropriate Admin API call.
+            errors = await self._ingest_files(user_id=user_id, submission_id=submission_id, file_states=files)
+            await self._save_ingest_statuses(submission_id, errors)
+
+            # 4. If all files have reached READY status, create & release the dataset and mark the submission as
+            # ingested.
+            all_ready = all(file.ingest_status == IngestStatus.READY for file in files)
+            if not all_ready:
+                return IngestResult.PROGRESSED if updates else IngestResult.UNCHANGED
+
+            file_ids = [file.file_id for file in files]
+            LOG.info("Creating dataset for submission %s with %s accession id(s)", submission_id, len(file_ids))
+            await self._admin_request(
+                "create_dataset",
+                self._admin_handler.create_dataset(
+                    CreateDatasetRequest(user=user_id, accession_ids=file_ids, dataset_id=submission_id)
+                ),
+            )
+            LOG.info("Releasing dataset for submission %s", submission_id)
+            await self._admin_request("release_dataset", self._admin_handler.release_dataset(submission_id))
+            await self._with_session(lambda: self._services.submission.update_ingested(submission_id))
+            LOG.info("Ingest complete for submission %s", submission_id)
+            return IngestResult.COMPLETED
+        finally:
+            await self._release_claim(submission_id)
+
+    async def _claim_submission(self, submission_id: str) -> tuple[str, list[IngestFileState]] | None:
+        """Claim the submission for ingest and load the file ingest states.
+
+        :param submission_id: ID of the submission to claim.
+        :returns: the user who owns the submission inbox and the file ingest states, or ``None``
+            when the submission could not be claimed.
         """
-        # 1. Claim the submission row.
         submission = await self._services.submission.claim_submission_for_ingest(
             submission_id,
             workflow=SubmissionWorkflow.BP,
+            claim_seconds=self._claim_timeout_seconds,
         )
         if submission is None:
-            LOG.info("Submission %s not claimable for ingest (already ingested or locked)", submission_id)
-            return False
-
+            return None
         files = await self._services.file.get_ingest_file_states(submission_id)
-        if not files:
-            LOG.info("No files to ingest for submission %s", submission_id)
-            return False
+        return submission.projectId, files
 
-        LOG.info("Submission %s has %s file(s) tracked for ingest", submission_id, len(files))
+    async def _release_claim(self, submission_id: str) -> None:
+        """Release the submission ingest claim. If this fails, the claim times out."""
+        try:
+            await self._with_session(lambda: self._services.submission.release_ingest_claim(submission_id))
+        except Exception:
+            LOG.exception("Failed to release ingest claim for submission %s", submission_id)
 
-        # 2. Sync local file statuses with the Admin API to pick up any progress made by a previous run.
-        user_id = submission.projectId
-        await self._sync_file_ingest_states(user_id=user_id, submission_id=submission_id, file_states=files)
+    async def _save_ingest_statuses(self, submission_id: str, updates: list[IngestStatusUpdate]) -> None:
+        """Save file ingest status changes in bulk and extend the submission claim.
 
-        # 3. Advance each file that is still in progress by issuing the appropriate Admin API call.
-        files = await self._services.file.get_ingest_file_states(submission_id)
-        for file in files:
-            try:
-                await self._ingest_file(
-                    user_id=user_id,
-                    submission_id=submission_id,
-                    file_path=file.path,
-                    file_id=file.file_id,
-                    ingest_status=file.ingest_status,
-                )
-            except Exception as e:
-                LOG.exception(
-                    "File ingest step failed for submission %s, file_id=%s, path=%s",
-                    submission_id,
-                    file.file_id,
-                    file.path,
-                )
-                ingest_error_type = self._classify_admin_error(e)
-                await self._services.file.update_ingest_status(
-                    file.file_id,
-                    IngestStatus.ERROR,
-                    ingest_error=str(e),
-                    ingest_error_type=ingest_error_type,
-                )
-                LOG.info(
-                    "Marked file as error for submission %s, file_id=%s, error_type=%s",
-                    submission_id,
-                    file.file_id,
-                    ingest_error_type,
-                )
+        :param submission_id: the submission the files belong to.
+        :param updates: the file ingest status changes.
+        """
+        if not updates:
+            return
 
-        # 4. If all files have reached READY status, create & release the dataset and mark the submission as ingested.
-        all_ready = all(file.ingest_status == IngestStatus.READY for file in files)
-        if not all_ready:
-            return False
+        async def _save() -> None:
+            await self._services.file.update_ingest_statuses(updates)
+            await self._services.submission.extend_ingest_claim(submission_id, self._claim_timeout_seconds)
 
-        file_ids = [file.file_id for file in files]
-        LOG.info("Creating dataset for submission %s with %s accession id(s)", submission_id, len(file_ids))
-        await self._admin_handler.create_dataset(
-            CreateDatasetRequest(user=user_id, accession_ids=file_ids, dataset_id=submission_id)
-        )
-        LOG.info("Releasing dataset for submission %s", submission_id)
-        await self._admin_handler.release_dataset(submission_id)
-        await self._services.submission.update_ingested(submission_id)
-        LOG.info("Ingest complete for submission %s", submission_id)
-        return True
+        await self._with_session(_save)
+        LOG.info("Saved %s file ingest status change(s) for submission %s", len(updates), submission_id)
 
     async def _sync_file_ingest_states(
         self,
@@ -189,22 +487,27 @@ class SDAIngestService(IngestService):
         user_id: str,
         submission_id: str,
         file_states: list[IngestFileState],
-    ) -> None:
-        """Sync file ingest statuses in the DB with the current state reported by the Admin API.
+    ) -> list[IngestStatusUpdate]:
+        """Compare file ingest statuses in the DB with the current state reported by the Admin API.
 
         :param user_id: the user who owns the submission inbox.
         :param submission_id: the submission whose files should be reconciled.
         :param file_states: current file ingest states.
+        :returns: the file ingest status changes to save.
         """
         # Fetch all submission specific files from user's SDA inbox
-        inbox_files: list[FileItem] = await self._admin_handler.get_user_files(user_id, submission_id)
+        inbox_files: list[FileItem] = await self._admin_request(
+            "get_user_files", self._admin_handler.get_user_files(user_id, submission_id)
+        )
         LOG.info(
             "Fetched %s file status(es) from Admin API for submission %s",
             len(inbox_files),
             submission_id,
         )
         admin_status_by_path = {file.inbox_path: file.file_status for file in inbox_files}
+        now = datetime.now(timezone.utc)
 
+        updates: list[IngestStatusUpdate] = []
         for file in file_states:
             # This is in case the Admin API doesn't have any record of the file yet.
             # In that case we want to keep the existing status in the DB and avoid overwriting it with None.
@@ -241,18 +544,81 @@ class SDAIngestService(IngestService):
                 file.ingest_status.value,
                 parsed_status.value,
             )
+            FILE_STATUS_CHANGES.inc(status=parsed_status.value)
+            if file.modified is not None:
+                # The file is modified when its ingest status is updated.
+                modified = file.modified if file.modified.tzinfo else file.modified.replace(tzinfo=timezone.utc)
+                FILE_STATUS_SECONDS.observe((now - modified).total_seconds(), status=file.ingest_status.value)
 
             # Admin-reported error statuses are persisted with a user-error classification.
             if parsed_status == IngestStatus.ERROR:
-                await self._services.file.update_ingest_status(
-                    file.file_id,
-                    IngestStatus.ERROR,
-                    ingest_error="Admin API reported fileStatus=error",
-                    ingest_error_type=IngestErrorType.USER_ERROR,
+                updates.append(
+                    IngestStatusUpdate(
+                        file_id=file.file_id,
+                        ingest_status=IngestStatus.ERROR,
+                        ingest_error="Admin API reported fileStatus=error",
+                        ingest_error_type=IngestErrorType.USER_ERROR,
+                    )
                 )
             else:
                 # Non-error statuses clear any prior ingest error metadata in FileService.
-                await self._services.file.update_ingest_status(file.file_id, parsed_status)
+                updates.append(IngestStatusUpdate(file_id=file.file_id, ingest_status=parsed_status))
+
+        return updates
+
+    async def _ingest_files(
+        self,
+        *,
+        user_id: str,
+        submission_id: str,
+        file_states: list[IngestFileState],
+    ) -> list[IngestStatusUpdate]:
+        """Advance the files concurrently by one step along the ingest pipeline.
+
+        :param user_id: the user who owns the submission inbox.
+        :param submission_id: the submission the files belong to.
+        :param file_states: current file ingest states.
+        :returns: the file ingest errors to save.
+        """
+        # Use a semaphore to limit the number of concurrent Admin API requests for the submission.
+        sem = asyncio.Semaphore(self._file_concurrency)
+
+        async def _start(file: IngestFileState) -> IngestStatusUpdate | None:
+            async with sem:
+                try:
+                    await self._ingest_file(
+                        user_id=user_id,
+                        submission_id=submission_id,
+                        file_path=file.path,
+                        file_id=file.file_id,
+                        ingest_status=file.ingest_status,
+                    )
+                    return None
+                except Exception as e:
+                    LOG.exception(
+                        "File ingest step failed for submission %s, file_id=%s, path=%s",
+                        submission_id,
+                        file.file_id,
+                        file.path,
+                    )
+                    ingest_error_type = self._classify_admin_error(e)
+                    LOG.info(
+                        "Marking file as error for submission %s, file_id=%s, error_type=%s",
+                        submission_id,
+                        file.file_id,
+                        ingest_error_type,
+                    )
+                    return IngestStatusUpdate(
+                        file_id=file.file_id,
+                        ingest_status=IngestStatus.ERROR,
+                        ingest_error=str(e),
+                        ingest_error_type=ingest_error_type,
+                    )
+
+        # Only files waiting for an Admin API call are started.
+        in_progress = [f for f in file_states if f.ingest_status in (IngestStatus.UPLOADED, IngestStatus.VERIFIED)]
+        results = await asyncio.gather(*(_start(file) for file in in_progress))
+        return [error for error in results if error is not None]
 
     async def _ingest_file(
         self,
@@ -279,7 +645,9 @@ class SDAIngestService(IngestService):
                 file_id,
                 file_path,
             )
-            await self._admin_handler.ingest_file(data=IngestFileRequest(user=user_id, filepath=file_path))
+            await self._admin_request(
+                "ingest_file", self._admin_handler.ingest_file(data=IngestFileRequest(user=user_id, filepath=file_path))
+            )
             return
 
         # File status: VERIFIED -> assign the accession ID (file moves toward READY).
@@ -290,11 +658,29 @@ class SDAIngestService(IngestService):
                 file_id,
                 file_path,
             )
-            await self._admin_handler.post_accession_id(
-                data=PostAccessionIdRequest(user=user_id, filepath=file_path, accession_id=file_id)
+            await self._admin_request(
+                "post_accession_id",
+                self._admin_handler.post_accession_id(
+                    data=PostAccessionIdRequest(user=user_id, filepath=file_path, accession_id=file_id)
+                ),
             )
             return
 
+    @staticmethod
+    async def _admin_request[T](endpoint: str, request: Awaitable[T]) -> T:
+        """Send an Admin API request and record its duration and failure.
+
+        :param endpoint: the Admin API endpoint name used as the metric label.
+        :param request: the Admin API request.
+        :returns: the Admin API response.
+        """
+        with ADMIN_REQUEST_SECONDS.time(endpoint=endpoint):
+            try:
+                return await request
+            except Exception:
+                ADMIN_REQUEST_ERRORS.inc(endpoint=endpoint)
+                raise
+
     async def _get_submission_ids_for_ingest(self) -> list[str]:
         """Return IDs of all published-but-not-ingested BP submissions."""
         return await self._services.submission.get_submission_ids_for_ingest(workflow=SubmissionWorkflow.BP)
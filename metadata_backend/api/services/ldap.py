@@ -0,0 +1,117 @@
+"""Shared LDAP connections."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from ldap3 import Connection
+from ldap3.core.exceptions import LDAPBindError, LDAPCommunicationError
+
+from ...helpers.logger import LOG
+
+
+class LdapConnectionPool:
+    """
+    Pool of bound LDAP connections shared by requests in one worker.
+
+    Opening an LDAP connection opens a new TCP and TLS connection and binds the LDAP user.
+    The pool keeps the bound connections open and reuses them.
+
+    ldap3 connections are blocking, and the LDAP operations are run in the pool threads
+    outside the event loop. Each thread uses one connection at a time, and the number of
+    threads limits the number of open connections. Idle connections are closed after the
+    idle timeout. If a reused connection has been closed by the server then the operation
+    is retried once with a new connection. The pool must be closed when the worker stops.
+    """
+
+    def __init__(self, connect: Callable[[], Connection], *, pool_size: int, idle_timeout: float) -> None:
+        """
+        Create the LDAP connection pool.
+
+        Args:
+            connect: Creates a new LDAP connection that is not bound.
+            pool_size: The maximum number of open connections.
+            idle_timeout: Seconds after which connections that are not in use are closed.
+        """
+        self._connect = connect
+        self._idle_timeout = idle_timeout
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="ldap")
+        # Connections that are not in use with their last use times. The most recently used is last.
+        self._idle: list[tuple[Connection, float]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of idle connections."""
+        return len(self._idle)
+
+    async def run[T](self, operation: Callable[[Connection], T]) -> T:
+        """
+        Run a blocking LDAP operation using a pooled connection.
+
+        Args:
+            operation: The LDAP operation using a bound connection.
+
+        Returns:
+            The operation result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run, operation)
+
+    def _run[T](self, operation: Callable[[Connection], T]) -> T:
+        """Run the LDAP operation in a pool thread."""
+        conn = self._acquire()
+        if conn is not None:
+            try:
+                return self._use(conn, operation)
+            except LDAPCommunicationError as ex:
+                # The server may have closed the idle connection.
+                LOG.debug("Pooled LDAP connection failed, retrying with a new connection: %r", ex)
+        return self._use(self._open(), operation)
+
+    def _use[T](self, conn: Connection, operation: Callable[[Connection], T]) -> T:
+        """Run the LDAP operation and return the connection to the pool."""
+        try:
+            result = operation(conn)
+        except BaseException:
+            self._close(conn)
+            raise
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+        return result
+
+    def _open(self) -> Connection:
+        """Open and bind a new LDAP connection."""
+        conn = self._connect()
+        if not conn.bind():
+            self._close(conn)
+            raise LDAPBindError(f"LDAP bind failed: {conn.result}")
+        return conn
+
+    def _acquire(self) -> Connection | None:
+        """Return the most recently used idle connection, and close the expired idle connections."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [conn for conn, last_used in self._idle if now - last_used > self._idle_timeout]
+            self._idle = [(conn, last_used) for conn, last_used in self._idle if now - last_used <= self._idle_timeout]
+            conn = self._idle.pop()[0] if self._idle else None
+        for expired_conn in expired:
+            self._close(expired_conn)
+        return conn
+
+    @staticmethod
+    def _close(conn: Connection) -> None:
+        """Close the LDAP connection."""
+        try:
+            conn.unbind()
+        except Exception:
+            LOG.debug("Failed to close LDAP connection", exc_info=True)
+
+    def close(self) -> None:
+        """Close all LDAP connections."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._close(conn)
@@ -3,6 +3,7 @@
 import re
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Iterable
 
 from pydantic_string_url import AnyUrl
 from yarl import URL
@@ -35,13 +36,23 @@ from ..models.metax import (
     Temporal,
     Url,
 )
-from ..resource.metax import METAX_MAPPING_GEO_LOCATIONS, METAX_MAPPING_LANGUAGES
+from ..resource.metax import get_metax_geo_location_uris, get_metax_language_uris
 from .ror import RorService
 
+# DataCite subject format used in the user interface (e.g. '111 - Mathematics').
+_UI_LABEL_PATTERN = re.compile(r"^\s*(\d+)\s*-\s*(.+)$")
+
+
+def _normalize(value: str) -> str:
+    """Normalize text for case- and punctuation-insensitive comparison."""
+    return re.sub(r"[^\w]", "", value.lower())
+
 
 class MetaxService(ABC):
     """Metax service."""
 
+    _field_of_science_index: "FieldOfScienceIndex | None" = None
+
     @abstractmethod
     async def get_fields_of_science(self) -> list[FieldOfScience]:
         """
@@ -54,103 +65,123 @@ class MetaxService(ABC):
         """
         Get Metax fields of science from DataCite subject.
 
+        The fields of science are indexed once per retrieved list of fields of science.
+
         :param subject: DataCite subject.
         :return: The Metax fields of science or None if not found.
         """
 
         fields = await self.get_fields_of_science()
+        index = self._field_of_science_index
+        if index is None or index.fields is not fields:
+            index = FieldOfScienceIndex(fields)
+            self._field_of_science_index = index
+        return index.get(subject)
 
-        # Search field of science url from subject.valueUrl and subject.subject.
-        for field in fields:
-            field_of_science = None
-            if subject.valueUri is not None:
-                field_of_science = self._get_field_of_science_from_url(str(subject.valueUri), field)
-            if not field_of_science:
-                if subject.subject is not None:
-                    field_of_science = self._get_field_of_science_from_url(str(subject.subject), field)
-            if field_of_science:
-                return field
 
-        # Search field of science code from DataCite subject.subject.
-        for field in fields:
-            field_of_science = self._get_field_of_science_from_code(subject.subject, field)
-            if field_of_science:
-                return field
+class FieldOfScienceIndex:
+    """
+    Metax fields of science indexed by URL, code and label.
 
-        # Search field of science label from DataCite subject.subject.
-        for field in fields:
-            field_of_science = self._get_field_of_science_from_label(subject.subject, field)
-            if field_of_science:
-                return field
+    A DataCite subject is matched using the first matching search:
 
-        # Search field of science format (e.g '111 - Mathematics') from DataCite subject.subject.
-        for field in fields:
-            field_of_science = self._get_field_of_science_from_ui(subject.subject, field)
-            if field_of_science:
-                return field
+    - the field of science URL in subject.valueUri or subject.subject
+    - the field of science code in subject.subject (e.g. 'ta111' or '111')
+    - the field of science label in subject.subject
+    - the field of science code or label in subject.subject (e.g. '111 - Mathematics')
 
-        return None
+    If several fields of science match a search then the first field of science is used.
+    """
 
-    @staticmethod
-    def _get_field_of_science_from_url(text: str, field: FieldOfScience) -> FieldOfScience | None:
-        try:
-            url = URL(text)
-            field_url = URL(str(field.url))
-        except ValueError:
-            return None
+    def __init__(self, fields: list[FieldOfScience]) -> None:
+        """
+        Index the fields of science.
 
-        if (
-            url.host
-            and field_url.host
-            and url.path
-            and field_url.path
-            and url.host.lower() == field_url.host.lower()
-            and url.path.lower().rstrip("/") == field_url.path.lower().rstrip("/")
-        ):
-            return field
-        return None
+        :param fields: The Metax fields of science.
+        """
 
-    @staticmethod
-    def _get_field_of_science_from_code(text: str, field: FieldOfScience) -> FieldOfScience | None:
-        normalized_text = MetaxService._normalize(text)
-        normalized_code = MetaxService._normalize(field.code)
+        self.fields = fields
+        # Field positions by lowercase URL host and path without the trailing slash.
+        self._urls: dict[tuple[str, str], int] = {}
+        # Field positions by normalized code.
+        self._codes: dict[str, int] = {}
+        # Field positions by numeric suffixes of the normalized code (e.g. '111', '11' and '1' for 'ta111').
+        self._numeric_codes: dict[str, int] = {}
+        # Field positions by normalized label.
+        self._labels: dict[str, int] = {}
+
+        for position, field in enumerate(fields):
+            url_key = self._url_key(str(field.url))
+            if url_key is not None:
+                self._urls.setdefault(url_key, position)
+
+            code = _normalize(field.code)
+            self._codes.setdefault(code, position)
+            for i in reversed(range(len(code))):
+                if not code[i:].isdigit():
+                    break
+                self._numeric_codes.setdefault(code[i:], position)
+
+            for label in field.pref_label.values():
+                self._labels.setdefault(_normalize(label), position)
+
+    def get(self, subject: Subject) -> FieldOfScience | None:
+        """
+        Get Metax fields of science from DataCite subject.
 
-        # Exact match (e.g. "ta111").
-        if normalized_code == normalized_text:
-            return field
-        # Numeric match (e.g. "111" -> "ta111").
-        if normalized_text.isdigit() and normalized_code.endswith(normalized_text):
-            return field
+        :param subject: DataCite subject.
+        :return: The Metax fields of science or None if not found.
+        """
 
-        return None
+        # Search field of science url from subject.valueUrl and subject.subject.
+        url_keys = [str(subject.valueUri)] if subject.valueUri is not None else []
+        url_keys.append(subject.subject)
+        position = self._first(self._urls.get(key) for key in map(self._url_key, url_keys) if key is not None)
+        if position is not None:
+            return self.fields[position]
 
-    @staticmethod
-    def _get_field_of_science_from_label(text: str, field: FieldOfScience) -> FieldOfScience | None:
-        normalized_text = MetaxService._normalize(text)
-        for label in field.pref_label.values():
-            if MetaxService._normalize(label) == normalized_text:
-                return field
+        # Search field of science code from DataCite subject.subject.
+        position = self._get_code(subject.subject)
+        if position is not None:
+            return self.fields[position]
 
-        return None
+        # Search field of science label from DataCite subject.subject.
+        position = self._labels.get(_normalize(subject.subject))
+        if position is not None:
+            return self.fields[position]
 
-    @staticmethod
-    def _get_field_of_science_from_ui(text: str, field: FieldOfScience) -> FieldOfScience | None:
-        match = re.match(r"^\s*(\d+)\s*-\s*(.+)$", text)
+        # Search field of science format (e.g '111 - Mathematics') from DataCite subject.subject.
+        match = _UI_LABEL_PATTERN.match(subject.subject)
         if match:
-            field_of_science = MetaxService._get_field_of_science_from_code(match.group(1), field)
-            if field_of_science:
-                return field
-
-            field_of_science = MetaxService._get_field_of_science_from_label(match.group(2), field)
-            if field_of_science:
-                return field
+            position = self._first([self._get_code(match.group(1)), self._labels.get(_normalize(match.group(2)))])
+            if position is not None:
+                return self.fields[position]
 
         return None
 
+    def _get_code(self, text: str) -> int | None:
+        """Return the position of the first field of science with the code, or with the numeric code suffix."""
+        normalized_text = _normalize(text)
+        if normalized_text.isdigit():
+            # Exact numeric codes are also numeric code suffixes.
+            return self._numeric_codes.get(normalized_text)
+        return self._codes.get(normalized_text)
+
+    @staticmethod
+    def _url_key(text: str) -> tuple[str, str] | None:
+        """Return the lowercase URL host and path without the trailing slash, or None if the URL has no host."""
+        try:
+            url = URL(text)
+        except ValueError:
+            return None
+        if not url.host or not url.path:
+            return None
+        return url.host.lower(), url.path.lower().rstrip("/")
+
     @staticmethod
-    def _normalize(value: str) -> str:
-        """Normalize text for case- and punctuation-insensitive comparison."""
-        return re.sub(r"[^\w]", "", value.lower())
+    def _first(positions: Iterable[int | None]) -> int | None:
+        """Return the first position of the found fields of science."""
+        return min((position for position in positions if position is not None), default=None)
 
 
 class MetaxMapper:
@@ -305,10 +336,11 @@ class MetaxMapper:
         :param metax_metadata: Metax metadata.
         """
 
-        if language not in METAX_MAPPING_LANGUAGES:
+        uri = get_metax_language_uris().get(language)
+        if uri is None:
             raise UserException(f"Invalid language: {language}")
 
-        metax_metadata.language = [Language(url=METAX_MAPPING_LANGUAGES[language].uri)]
+        metax_metadata.language = [Language(url=uri)]
 
     async def _map_projects(
         self, publisher: Publisher, funding_references: list[FundingReference] | None, metax_metadata: MetaxFields
@@ -356,16 +388,13 @@ class MetaxMapper:
         :param metax_metadata: Metax metadata.
         """
 
+        geo_location_uris = get_metax_geo_location_uris()
         for location in locations:
             geographic_name = location.geoLocationPlace
 
             # geoLocationPlace is mapped to YSO ontology URL.
-            reference_url = [
-                loc.uri
-                for loc in METAX_MAPPING_GEO_LOCATIONS
-                if "en" in loc.pref_label and loc.pref_label["en"] == geographic_name
-            ]
-            reference = ReferenceLocation(url=reference_url[0]) if reference_url[0] else None
+            reference_url = geo_location_uris.get(geographic_name) if geographic_name is not None else None
+            reference = ReferenceLocation(url=reference_url) if reference_url else None
             custom_wkt = []
 
             #  geoLocationPoint, geoLocationBox and geolocationPolygon are mapped to custom_wkt.
@@ -2,34 +2,58 @@
 
 import json
 from abc import ABC, abstractmethod
+from functools import partial
 from typing import override
 from urllib.parse import urlparse
 
-from aiocache import SimpleMemoryCache, cached
 from fastapi import HTTPException
 from ldap3 import Connection, Server
 from ldap3.core.exceptions import LDAPExceptionError
 from starlette import status
 
+from ...conf.cache import cache_config
 from ...conf.ldap import csc_ldap_config
+from ...helpers.cache import Cache, CacheBackend
 from ...helpers.logger import LOG
 from ..exceptions import LdapSystemException, SystemException, UserException
 from ..models.models import Project
+from .ldap import LdapConnectionPool
 
 CSC_LDAP_DN = "ou=idm,dc=csc,dc=fi"
 CSC_LDAP_PROJECT_ATTRIBUTE = "CSCPrjNum"
 CSC_LDAP_SERVICE_PROFILE = "SP_SD-SUBMIT"
 CSC_LDAP_FILTER = "(&(objectClass=applicationProcess)(CSCSPCommonStatus=ready)(CSCUserName={username}))"
 
+# Cache namespace for user's projects.
+USER_PROJECTS_CACHE_NAMESPACE = "projects"
+
 
 class ProjectService(ABC):
     """Service to verify that the user has access to the given projects."""
 
-    @cached(ttl=3600, cache=SimpleMemoryCache)  # type: ignore
+    def __init__(self, *, cache_backend: CacheBackend | None = None) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            cache_backend: The cache backend shared by the workers.
+        """
+        config = cache_config()
+        self._user_projects: Cache[list[Project]] = Cache(
+            USER_PROJECTS_CACHE_NAMESPACE,
+            list[Project],
+            maxsize=config.CACHE_MAX_SIZE,
+            ttl=config.CACHE_PROJECTS_TTL,
+            stale_ttl=config.CACHE_PROJECTS_STALE_TTL,
+            backend=cache_backend,
+        )
+
     async def verify_user_project(self, user_id: str, project_id: str) -> None:
         """
         Verify that the user has access to the given project.
 
+        The user's projects are cached.
+
         Args:
             user_id: The user ID.
             project_id: The project ID.
@@ -40,15 +64,22 @@ class ProjectService(ABC):
                 detail=f"User {user_id} is not affiliated with project {project_id}.",
             )
 
-    @cached(ttl=3600, cache=SimpleMemoryCache)  # type: ignore
     async def get_user_projects(self, user_id: str) -> list[Project]:
         """
         Return user's projects.
 
+        The projects are cached and shared between workers if the cache backend is given.
+        Concurrent requests for the same user share one lookup, and expired projects are
+        returned while they are retrieved again.
+
         Args:
             user_id: The user ID.
         """
-        return await self._get_user_projects(user_id)
+        return await self._user_projects.get(user_id, partial(self._get_user_projects, user_id))
+
+    async def close(self) -> None:
+        """Close the service."""
+        self._user_projects.clear()
 
     @abstractmethod
     async def _verify_user_project(self, user_id: str, project_id: str) -> bool:
@@ -93,6 +124,16 @@ class ProjectService(ABC):
 
 
 class LdapProjectService(ProjectService):
+    def __init__(self, *, cache_backend: CacheBackend | None = None) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            cache_backend: The cache backend shared by the workers.
+        """
+        super().__init__(cache_backend=cache_backend)
+        self._connection_pool: LdapConnectionPool | None = None
+
     @abstractmethod
     def _search_user_projects(self, conn: Connection, user_id: str) -> list[Project]:
         """
@@ -142,11 +183,16 @@ class LdapProjectService(ProjectService):
         else:
             raise RuntimeError(f"Unsupported LDAP protocol: {scheme}")
 
-        try:
+        if self._connection_pool is None:
             LOG.info("Connecting to LDAP server '%s' using port '%s' with ssl '%s'", host, port, use_ssl)
+            self._connection_pool = LdapConnectionPool(
+                partial(self._get_connection, host, port, user, password, use_ssl),
+                pool_size=config.CSC_LDAP_POOL_SIZE,
+                idle_timeout=config.CSC_LDAP_IDLE_TIMEOUT,
+            )
 
-            with self._get_connection(host, port, user, password, use_ssl) as conn:
-                return self._search_user_projects(conn, user_id)
+        try:
+            return await self._connection_pool.run(lambda conn: self._search_user_projects(conn, user_id))
         except LDAPExceptionError as ex:
             LOG.warning("LDAP request failed for user '%s' against '%s:%s': %s", user_id, host, port, ex)
             raise LdapSystemException("Failed to retrieve user projects: upstream LDAP error.", ex) from ex
@@ -154,6 +200,13 @@ class LdapProjectService(ProjectService):
             LOG.exception("Unexpected error retrieving projects for user '%s'.", user_id)
             raise SystemException("Failed to retrieve user projects.") from ex
 
+    @override
+    async def close(self) -> None:
+        """Close the service and the LDAP connections."""
+        await super().close()
+        if self._connection_pool is not None:
+            self._connection_pool.close()
+
     @override
     async def _verify_user_project(self, user_id: str, project_id: str) -> bool:
         """
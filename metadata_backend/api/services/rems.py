@@ -1,8 +1,13 @@
 """REMS Services."""
 
+import hashlib
+
+from pydantic import BaseModel, PrivateAttr
+
 from ..models.rems import (
     License,
     Organization,
+    Organizations,
     OrganizationsMap,
     RemsLicense,
     RemsLicenseLocalization,
@@ -200,3 +205,50 @@ class RemsOrganisationsService:
             RemsOrganisationsService._add_workflow(organizations, workflow, language, filter_organisation_id)
 
         return organizations
+
+
+class RemsReferenceData(BaseModel):
+    """
+    Active REMS workflows and licenses.
+
+    The organisations with their workflows and licenses are built once per language.
+    """
+
+    workflows: list[RemsWorkflow]
+    licenses: list[RemsLicense]
+
+    _organisations: dict[str, OrganizationsMap] = PrivateAttr(default_factory=dict)
+    _version: str | None = PrivateAttr(default=None)
+
+    async def get_organisations(self, language: str = "en", filter_organisation_id: str | None = None) -> Organizations:
+        """
+        Get organizations with their workflows and licenses.
+
+        :param language: Preferred language code (e.g. "en").
+        :param filter_organisation_id: Optional organization ID filter.
+        :return: REMS organizations with their workflows and licenses.
+        """
+
+        organisations = self._organisations.get(language)
+        if organisations is None:
+            organisations = await RemsOrganisationsService.get_organisations(self.workflows, self.licenses, language)
+            self._organisations[language] = organisations
+
+        if filter_organisation_id:
+            organisation = organisations.get(filter_organisation_id)
+            return [organisation] if organisation is not None else []
+        return list(organisations.values())
+
+    def get_etag(self, language: str = "en", filter_organisation_id: str | None = None) -> str:
+        """
+        Get the entity tag of the organisations returned for the language and organization ID filter.
+
+        :param language: Preferred language code (e.g. "en").
+        :param filter_organisation_id: Optional organization ID filter.
+        :return: The quoted entity tag.
+        """
+
+        if self._version is None:
+            self._version = hashlib.sha256(self.model_dump_json().encode("utf-8")).hexdigest()
+        tag = hashlib.sha256(f"{self._version}:{language}:{filter_organisation_id or ''}".encode("utf-8"))
+        return f'"{tag.hexdigest()[:32]}"'
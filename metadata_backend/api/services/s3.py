@@ -0,0 +1,175 @@
+"""Shared S3 clients."""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+import aioboto3
+from aiobotocore.config import AioConfig
+
+from ...conf.s3 import S3Config
+from ...helpers.logger import LOG
+
+# Pooled S3 client key: endpoint, region and a hash of the credentials.
+S3ClientKey = tuple[str, str | None, str]
+
+
+@dataclass
+class _PooledS3Client:
+    """S3 client in the pool."""
+
+    client: Any
+    exit_stack: AsyncExitStack
+    in_use: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class S3ClientPool:
+    """
+    Pool of S3 clients shared by requests in one worker.
+
+    Creating an S3 client creates a new botocore client and HTTP connection pool, and
+    the first request of each client opens a new TLS connection. The pool keeps the
+    clients open and reuses them for the same endpoint, region and credentials.
+
+    Idle clients are closed after the idle timeout, and the least recently used idle
+    clients are closed when there are more clients than the pool size. Clients in use
+    are never closed before the pool is closed. The pool must be closed when the worker
+    stops.
+    """
+
+    def __init__(self, *, pool_size: int, idle_timeout: float, max_pool_connections: int) -> None:
+        """
+        Create the S3 client pool.
+
+        Args:
+            pool_size: The maximum number of open clients that are not in use.
+            idle_timeout: Seconds after which clients that are not in use are closed.
+            max_pool_connections: The maximum number of HTTP connections per client.
+        """
+        self._pool_size = pool_size
+        self._idle_timeout = idle_timeout
+        self._config = AioConfig(max_pool_connections=max_pool_connections)
+        self._clients: OrderedDict[S3ClientKey, _PooledS3Client] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of open clients."""
+        return len(self._clients)
+
+    @staticmethod
+    def _client_key(
+        endpoint_url: str,
+        region_name: str | None,
+        access_key: str | None,
+        secret_key: str | None,
+        session_token: str | None,
+    ) -> S3ClientKey:
+        """Return the pool key without keeping the credentials in memory."""
+        credentials = "\0".join(value or "" for value in (access_key, secret_key, session_token))
+        return endpoint_url, region_name, hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+
+    @asynccontextmanager
+    async def client(
+        self,
+        *,
+        endpoint_url: str,
+        region_name: str | None = None,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+        session_token: str | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Use a pooled S3 client.
+
+        If the access key and secret key are not given, the default credentials
+        are used.
+
+        Args:
+            endpoint_url: The S3 endpoint URL.
+            region_name: The S3 region.
+            access_key: S3 access key ID.
+            secret_key: S3 secret access key.
+            session_token: S3 session token.
+
+        Returns:
+            The S3 client.
+        """
+        key = self._client_key(endpoint_url, region_name, access_key, secret_key, session_token)
+        async with self._lock:
+            pooled = self._clients.get(key)
+            if pooled is None:
+                exit_stack = AsyncExitStack()
+                client = await exit_stack.enter_async_context(
+                    aioboto3.Session().client(
+                        "s3",
+                        endpoint_url=endpoint_url,
+                        region_name=region_name,
+                        aws_access_key_id=access_key,
+                        aws_secret_access_key=secret_key,
+                        aws_session_token=session_token,
+                        config=self._config,
+                    )
+                )
+                pooled = _PooledS3Client(client=client, exit_stack=exit_stack)
+                self._clients[key] = pooled
+            self._clients.move_to_end(key)
+            pooled.in_use += 1
+            evicted = self._evict()
+
+        await self._close_clients(evicted)
+        try:
+            yield pooled.client
+        finally:
+            pooled.in_use -= 1
+            pooled.last_used = time.monotonic()
+            await self._close_clients(self._evict())
+
+    def _evict(self) -> list[_PooledS3Client]:
+        """Remove the expired and the least recently used idle clients from the pool."""
+        now = time.monotonic()
+        idle = [(key, pooled) for key, pooled in self._clients.items() if pooled.in_use == 0]
+        excess = max(0, len(idle) - self._pool_size)
+        evicted = []
+        for i, (key, pooled) in enumerate(idle):
+            if i < excess or now - pooled.last_used > self._idle_timeout:
+                del self._clients[key]
+                evicted.append(pooled)
+        return evicted
+
+    @staticmethod
+    async def _close_clients(clients: list[_PooledS3Client]) -> None:
+        """Close the S3 clients."""
+        for pooled in clients:
+            try:
+                await pooled.exit_stack.aclose()
+            except Exception:
+                LOG.exception("Failed to close S3 client")
+
+    async def close(self) -> None:
+        """Close all S3 clients."""
+        async with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        await self._close_clients(clients)
+
+
+def create_s3_client_pool(config: S3Config) -> S3ClientPool:
+    """
+    Create the S3 client pool using the S3 configuration.
+
+    Args:
+        config: The S3 configuration.
+
+    Returns:
+        The S3 client pool.
+    """
+    return S3ClientPool(
+        pool_size=config.S3_CLIENT_POOL_SIZE,
+        idle_timeout=config.S3_CLIENT_IDLE_TIMEOUT,
+        max_pool_connections=config.S3_MAX_POOL_CONNECTIONS,
+    )
@@ -48,7 +48,12 @@ from ...processors.xml.bigpicture import (
     BP_XML_OBJECT_CONFIG,
 )
 from ...processors.xml.datacite import DATACITE_OBJECT_TYPE, read_datacite_xml
-from ...processors.xml.processors import XmlDocumentsProcessor, XmlObjectProcessor, XmlStringDocumentsProcessor
+from ...processors.xml.processors import (
+    XmlDocumentsProcessor,
+    XmlObjectProcessor,
+    XmlStreamingDocumentsProcessor,
+    XmlStringDocumentsProcessor,
+)
 from ..accession import generate_bp_accession
 from ..project import ProjectService
 from .submission import ObjectSubmission, ObjectSubmissionService
@@ -74,8 +79,11 @@ BP_FILES = [
 DATACITE_OBJECT_TITLE = "DataCite"
 DATACITE_OBJECT_DESCRIPTION = "DataCite"
 
+# Bigpicture XML documents processor.
+BigpictureDocumentsProcessor = XmlDocumentsProcessor | XmlStreamingDocumentsProcessor
+
 
-def is_clinical_policy(processor: XmlDocumentsProcessor | XmlObjectProcessor) -> bool:
+def is_clinical_policy(processor: BigpictureDocumentsProcessor | XmlObjectProcessor) -> bool:
     """
     Check if the policy is clinical. Raises a ValueError if the 'type of dataset' attribute value
     is missing or invalid.
@@ -111,7 +119,7 @@ def is_clinical_policy(processor: XmlDocumentsProcessor | XmlObjectProcessor) ->
     raise UserException(f"{field_name} must start with 'Clinical' or 'Non-Clinical' before '/', got: '{value}'")
 
 
-def check_mandatory_constraints(processor: XmlDocumentsProcessor) -> None:
+def check_mandatory_constraints(processor: BigpictureDocumentsProcessor) -> None:
     """
     Check mandatory constraints specified in the Bigpicture metadata
     standard document v2.0.0-2 not enforced by the XML Schemas.
@@ -127,7 +135,7 @@ def check_mandatory_constraints(processor: XmlDocumentsProcessor) -> None:
     _check_mandatory_constraint_7(processor, max_reported_objects)
 
 
-def _check_mandatory_constraint_1(processor: XmlDocumentsProcessor) -> None:
+def _check_mandatory_constraint_1(processor: BigpictureDocumentsProcessor) -> None:
     """
     Check mandatory constraint 1.
 
@@ -200,7 +208,7 @@ def _check_mandatory_constraint_1(processor: XmlDocumentsProcessor) -> None:
         f"Expected one or more observation objects in submission but found {cnt}."
 
 
-def _check_mandatory_constraint_5(processor: XmlDocumentsProcessor) -> None:
+def _check_mandatory_constraint_5(processor: BigpictureDocumentsProcessor) -> None:
     """
     Check mandatory constraint 5.
 
@@ -209,23 +217,17 @@ def _check_mandatory_constraint_5(processor: XmlDocumentsProcessor) -> None:
     :param processor: The XML documents processor.
     """
 
+    def _get_names(schema_type: str, root_path: str) -> set[str]:
+        return {i.name for i in processor.get_object_identifiers(schema_type) if i.root_path == root_path}
+
     # Get images.
-    images = {}
-    for image_processor in processor.get_xml_object_processors(BP_IMAGE_SCHEMA, BP_IMAGE_PATH):
-        identifier = image_processor.get_xml_object_identifier()
-        images[identifier.name] = identifier.id
+    images = _get_names(BP_IMAGE_SCHEMA, BP_IMAGE_PATH)
 
     # Get annotations.
-    annotations = {}
-    for annotation_processor in processor.get_xml_object_processors(BP_ANNOTATION_SCHEMA, BP_ANNOTATION_PATH):
-        identifier = annotation_processor.get_xml_object_identifier()
-        annotations[identifier.name] = identifier.id
+    annotations = _get_names(BP_ANNOTATION_SCHEMA, BP_ANNOTATION_PATH)
 
     # Get observations.
-    observations = {}
-    for observation_processor in processor.get_xml_object_processors(BP_OBSERVATION_SCHEMA, BP_OBSERVATION_PATH):
-        identifier = observation_processor.get_xml_object_identifier()
-        observations[identifier.name] = identifier.id
+    observations = _get_names(BP_OBSERVATION_SCHEMA, BP_OBSERVATION_PATH)
 
     # Get image, annotation, observation references in dataset.
     image_refs = set()
@@ -288,15 +290,15 @@ def _check_mandatory_constraint_5(processor: XmlDocumentsProcessor) -> None:
         )
 
     # Add missing references
-    for name in images.keys() - image_refs:
+    for name in images - image_refs:
         add_image_ref(name)
-    for name in annotations.keys() - annotation_refs:
+    for name in annotations - annotation_refs:
         add_annotation_ref(name)
-    for name in observations.keys() - observation_refs:
+    for name in observations - observation_refs:
         add_observation_ref(name)
 
 
-def _check_mandatory_constraint_7(processor: XmlDocumentsProcessor, max_reported_objects: int) -> None:
+def _check_mandatory_constraint_7(processor: BigpictureDocumentsProcessor, max_reported_objects: int) -> None:
     """
     Check mandatory constraint 7.
 
@@ -306,7 +308,7 @@ def _check_mandatory_constraint_7(processor: XmlDocumentsProcessor, max_reported
     """
 
     observer = set()
-    for observation_processor in processor.get_xml_object_processors(BP_OBSERVATION_SCHEMA, BP_OBSERVATION_PATH):
+    for observation_processor in processor.iter_object_processors(BP_OBSERVATION_SCHEMA, BP_OBSERVATION_PATH):
         for ref in observation_processor.get_object_references():
             if ref.object_type == BP_OBSERVER_OBJECT_TYPE:
                 observer.add(ref.name)
@@ -315,9 +317,9 @@ def _check_mandatory_constraint_7(processor: XmlDocumentsProcessor, max_reported
 
     observer_no_observation = set()
 
-    for observer_processor in processor.get_xml_object_processors(BP_OBSERVER_SCHEMA, BP_OBSERVER_PATH):
-        observer_name = observer_processor.get_xml_object_identifier().name
-        if observer_name not in observer:
+    for observer_identifier in processor.get_object_identifiers(BP_OBSERVER_SCHEMA):
+        observer_name = observer_identifier.name
+        if observer_identifier.root_path == BP_OBSERVER_PATH and observer_name not in observer:
             observer_no_observation.add(observer_name)
 
     if observer_no_observation:
@@ -348,7 +350,7 @@ class BigpictureObjectSubmissionService(ObjectSubmissionService):
 
         self._datacite: DataCiteMetadata | None = None
         self._datacite_xml: ElementTree | None = None
-        self._processor: XmlStringDocumentsProcessor | None = None
+        self._processor: BigpictureDocumentsProcessor | None = None
 
         super().__init__(
             project_service=project_service,
@@ -361,7 +363,7 @@ class BigpictureObjectSubmissionService(ObjectSubmissionService):
         )
 
     @override
-    def create_processor(self, objects: list[ObjectSubmission]) -> XmlStringDocumentsProcessor | None:
+    def create_processor(self, objects: list[ObjectSubmission]) -> BigpictureDocumentsProcessor | None:
         """
         Create XML documents processor.
 
@@ -369,7 +371,7 @@ class BigpictureObjectSubmissionService(ObjectSubmissionService):
         :return: the XML documents processor.
         """
 
-        processor, datacite, datacite_xml = BigpictureObjectSubmissionService._create_processor(objects)
+        processor, datacite, datacite_xml = BigpictureObjectSubmissionService._create_processor(objects, streaming=True)
         self._processor = processor
         self._datacite = datacite
         self._datacite_xml = datacite_xml
@@ -377,13 +379,15 @@ class BigpictureObjectSubmissionService(ObjectSubmissionService):
 
     @staticmethod
     def _create_processor(
-        objects: list[ObjectSubmission],
-    ) -> tuple[XmlStringDocumentsProcessor, DataCiteMetadata | None, ElementTree | None]:
+        objects: list[ObjectSubmission], *, streaming: bool = False
+    ) -> tuple[BigpictureDocumentsProcessor, DataCiteMetadata | None, ElementTree | None]:
         """
         Return XML documents processor for Bigpicture XMLs (excl. DataCite XML),
         datacite metadata, and the DataCite XML.
 
         :param objects: The metadata object documents.
+        :param streaming: If True, the Bigpicture XMLs are parsed incrementally one metadata
+        object at a time instead of keeping all XMLs in memory.
         :return: a tuple containing the XML documents processor (excl. DataCite XML),
         datacite metadata, and the DataCite XML.
         """
@@ -394,10 +398,14 @@ class BigpictureObjectSubmissionService(ObjectSubmissionService):
         datacite = None
         datacite_xml = None
         if datacite_object:
-            datacite, datacite_xml = read_datacite_xml(datacite_object.document)
+            datacite, datacite_xml = read_datacite_xml(datacite_object.read_document())
 
         # Create processor for Bigpicture XMLs.
-        processor = XmlStringDocumentsProcessor(BP_XML_OBJECT_CONFIG, [o.document for o in bp_objects])
+        processor: BigpictureDocumentsProcessor
+        if streaming:
+            processor = XmlStreamingDocumentsProcessor(BP_XML_OBJECT_CONFIG, [o.open() for o in bp_objects])
+        else:
+            processor = XmlStringDocumentsProcessor(BP_XML_OBJECT_CONFIG, [o.read_document() for o in bp_objects])
         return processor, datacite, datacite_xml
 
     @override
@@ -510,10 +518,7 @@ class BigpictureObjectSubmissionService(ObjectSubmissionService):
 
         files = []
 
-        image_processors = self._processor.get_xml_object_processors(BP_IMAGE_SCHEMA, BP_IMAGE_PATH)
-        annotation_processors = self._processor.get_xml_object_processors(BP_ANNOTATION_SCHEMA, BP_ANNOTATION_PATH)
-
-        for image_processor in image_processors:
+        for image_processor in self._processor.iter_object_processors(BP_IMAGE_SCHEMA, BP_IMAGE_PATH):
             object_id = image_processor.get_xml_object_identifier().id
             xml = image_processor.xml
             root = xml.getroot()
@@ -541,7 +546,7 @@ class BigpictureObjectSubmissionService(ObjectSubmissionService):
                     )
                 )
 
-        for annotation_processor in annotation_processors:
+        for annotation_processor in self._processor.iter_object_processors(BP_ANNOTATION_SCHEMA, BP_ANNOTATION_PATH):
             object_id = annotation_processor.get_xml_object_identifier().id
             xml = annotation_processor.xml
 
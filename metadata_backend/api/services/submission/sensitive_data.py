@@ -60,7 +60,7 @@ class SensitiveDataObjectSubmissionService(ObjectSubmissionService):
         :return: the XML documents processor.
         """
 
-        self._submission_document = self._get_object(objects).document
+        self._submission_document = self._get_object(objects).read_document()
 
         return None
 
@@ -2,34 +2,74 @@
 
 # mypy: disable_error_code = misc
 
+import io
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Sequence, cast
+from typing import IO, Self, Sequence, cast
 
 from lxml.etree import _ElementTree as ElementTree  # noqa
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, SkipValidation, ValidationError, model_validator
 
 from ....database.postgres.services.file import FileService
-from ....database.postgres.services.object import ObjectService, UnknownObjectException
+from ....database.postgres.services.object import NewObject, ObjectService, UnknownObjectException
 from ....database.postgres.services.submission import SubmissionService
 from ...exceptions import SystemException, UserException, UserExceptions
 from ...json import to_json_dict
 from ...models.models import File
 from ...models.submission import Submission, SubmissionWorkflow
 from ...processors.models import ObjectIdentifier
-from ...processors.processors import DocumentsProcessor, ObjectProcessor
+from ...processors.processors import DocumentsProcessor
 from ...processors.xml.processors import XmlObjectProcessor, XmlProcessor
 from ..accession import generate_accession
 from ..project import ProjectService
 
+# The number of metadata objects saved using one multi-row insert.
+OBJECT_BATCH_SIZE = 1000
+
 
 class ObjectSubmission(BaseModel):
     """Metadata object submission file."""
 
     filename: str
-    document: str
+    document: str | None = None
+    # Uploaded file that is read on demand instead of keeping the document in memory.
+    file: SkipValidation[IO[bytes] | None] = None
+
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}
+
+    @model_validator(mode="after")
+    def check_document_or_file(self) -> Self:
+        """Check that either the document or the file is provided."""
+        if (self.document is None) == (self.file is None):
+            raise ValueError("Either document or file must be provided")
+        return self
+
+    def read_document(self) -> str:
+        """
+        Read the document.
 
-    model_config = {"frozen": True}
+        :return: The document.
+        """
+        if self.document is not None:
+            return self.document
+
+        self.file.seek(0)
+        try:
+            return self.file.read().decode("utf-8")
+        except UnicodeDecodeError:
+            raise UserException(f"Could not decode file '{self.filename}' as UTF-8")
+
+    def open(self) -> IO[bytes]:
+        """
+        Open the document for reading from the start.
+
+        :return: The document file.
+        """
+        if self.file is None:
+            return io.BytesIO(self.document.encode("utf-8"))
+
+        self.file.seek(0)
+        return self.file
 
 
 class ObjectSubmissionService(ABC):
@@ -200,25 +240,19 @@ class ObjectSubmissionService(ABC):
 
             if processor:
                 # Add metadata objects.
-                for identifier in object_identifiers:
-                    # Get the object processor for each object identifier retrieved
-                    # earlier from the documents processor. One object processor contains
-                    # the XML for one individual accessioned object within an XML document.
-                    object_processor = cast(XmlObjectProcessor, await self._get_object_processor(identifier, processor))
-
-                    await self._add_object(
-                        project_id,
-                        submission_id,
-                        identifier.name,
-                        identifier.object_type,
-                        identifier.id,
-                        object_processor.get_object_title(),
-                        object_processor.get_object_description(),
-                        object_processor.xml,
-                    )
+                new_objects: list[NewObject] = []
+                for object_processor in processor.iter_object_processors():
+                    # One object processor contains the XML for one individual accessioned object
+                    # within an XML document. The metadata objects are saved in batches so that
+                    # the documents processor does not need to keep all XMLs in memory.
+                    new_objects.append(self._new_object(cast(XmlObjectProcessor, object_processor)))
+                    if len(new_objects) >= OBJECT_BATCH_SIZE:
+                        await self._add_objects(project_id, submission_id, new_objects)
+                        new_objects = []
+                await self._add_objects(project_id, submission_id, new_objects)
+
             # Save files.
-            for file in files:
-                await self._file_service.add_file(file, self._workflow)
+            await self._file_service.add_files(files, self._workflow)
 
         except ValidationError as e:
             # Preserve Pydantic validation error.
@@ -375,29 +409,33 @@ class ObjectSubmissionService(ABC):
             submission = Submission.model_validate(await self._submission_service.get_submission_by_id(submission_id))
 
             if processor:
-                # Add new metadata objects.
-                for identifier in new_object_identifiers:
-                    object_processor = cast(XmlObjectProcessor, await self._get_object_processor(identifier, processor))
-                    await self._add_object(
-                        project_id,
-                        submission_id,
-                        identifier.name,
-                        identifier.object_type,
-                        identifier.id,
-                        object_processor.get_object_title(),
-                        object_processor.get_object_description(),
-                        object_processor.xml,
-                    )
-
-                # Update existing metadata objects.
-                for identifier in updated_object_identifiers:
-                    object_processor = cast(XmlObjectProcessor, await self._get_object_processor(identifier, processor))
-                    await self._update_object(
-                        identifier.id,
-                        object_processor.get_object_title(),
-                        object_processor.get_object_description(),
-                        object_processor.xml,
-                    )
+
+                def _get_key(_identifier: ObjectIdentifier) -> tuple[str, str, str]:
+                    return _identifier.schema_type, _identifier.root_path, _identifier.name
+
+                new_object_keys = {_get_key(identifier) for identifier in new_object_identifiers}
+                updated_object_keys = {_get_key(identifier) for identifier in updated_object_identifiers}
+
+                # Add new metadata objects in batches and update existing metadata objects.
+                new_objects = []
+                for object_processor in processor.iter_object_processors():
+                    object_processor = cast(XmlObjectProcessor, object_processor)
+                    identifier = object_processor.get_xml_object_identifier()
+
+                    if _get_key(identifier) in new_object_keys:
+                        new_objects.append(self._new_object(object_processor))
+                        if len(new_objects) >= OBJECT_BATCH_SIZE:
+                            await self._add_objects(project_id, submission_id, new_objects)
+                            new_objects = []
+                    elif _get_key(identifier) in updated_object_keys:
+                        await self._update_object(
+                            identifier.id,
+                            object_processor.get_object_title(),
+                            object_processor.get_object_description(),
+                            object_processor.xml,
+                        )
+                await self._add_objects(project_id, submission_id, new_objects)
+
                 # Delete removed metadata objects.
                 for obj in deleted_objects:
                     await self._object_service.delete_object_by_id(obj.objectId)
@@ -405,8 +443,7 @@ class ObjectSubmissionService(ABC):
             # Replace files.
             async for file in self._file_service.get_files(submission_id=submission_id):
                 await self._file_service.delete_file_by_id(file.fileId)
-            for file in files:
-                await self._file_service.add_file(file, self._workflow)
+            await self._file_service.add_files(files, self._workflow)
 
         except ValidationError as e:
             # Preserve Pydantic validation error.
@@ -418,17 +455,39 @@ class ObjectSubmissionService(ABC):
         return submission
 
     @staticmethod
-    async def _get_object_processor(identifier: ObjectIdentifier, processor: DocumentsProcessor) -> ObjectProcessor:
+    def _new_object(object_processor: XmlObjectProcessor) -> NewObject:
+        """
+        Create the metadata object to be added to the database.
+
+        :param object_processor: The metadata object processor.
+        :return: The metadata object.
+        """
+
+        identifier = object_processor.get_xml_object_identifier()
+        return NewObject(
+            name=identifier.name,
+            object_type=identifier.object_type,
+            object_id=identifier.id,
+            title=object_processor.get_object_title(),
+            description=object_processor.get_object_description(),
+            xml_document=XmlProcessor.write_xml(object_processor.xml),
+        )
+
+    async def _add_objects(self, project_id: str, submission_id: str, objects: list[NewObject]) -> None:
         """
-        Get object processor.
+        Add metadata objects to the database.
 
-        :param identifier: The metadata object identifier.
-        :param processor: The metadata documents processor.
-        :return: The object processor.
+        :param project_id: The project id.
+        :param submission_id: The submission id.
+        :param objects: The metadata objects.
         """
 
-        object_processor = processor.get_object_processor(identifier.schema_type, identifier.root_path, identifier.name)
-        return object_processor
+        if not objects:
+            return
+
+        saved_object_ids = await self._object_service.add_objects(project_id, submission_id, objects, self._workflow)
+        if saved_object_ids != [obj.object_id for obj in objects]:
+            raise SystemException("Failed to save generated object id")
 
     async def _add_object(
         self,
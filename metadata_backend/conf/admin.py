@@ -16,6 +16,21 @@ class AdminConfig(BaseSettings):
         description="Background ingest scanner interval in seconds.",
     )
     INGEST_WORKERS: int = Field(4, description="Maximum number of concurrent background ingest workers.")
+    INGEST_MAX_BACKOFF: int = Field(
+        3600,
+        ge=1,
+        description="Maximum seconds between ingest checks of a submission whose files are not progressing.",
+    )
+    INGEST_FILE_CONCURRENCY: int = Field(
+        16,
+        ge=1,
+        description="Maximum number of concurrent Admin API file requests per submission.",
+    )
+    INGEST_CLAIM_TIMEOUT: int = Field(
+        3600,
+        ge=1,
+        description="Seconds after which a submission claimed by an ingest worker can be claimed by another worker.",
+    )
 
 
 def admin_config() -> AdminConfig:
@@ -10,6 +10,9 @@ class BigpictureConfig(BaseSettings):
     model_config = {"extra": "allow"}  # Allow creation using the constructor.
 
     BP_CENTER_ID: str = Field(description="Accession prefix")
+    BP_METADATA_UPLOAD_CONCURRENCY: int = Field(
+        default=4, ge=1, description="Number of metadata XML files uploaded concurrently to SDA inbox"
+    )
 
 
 def bp_config() -> BigpictureConfig:
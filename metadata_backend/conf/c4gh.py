@@ -1,8 +1,13 @@
 """Crypt4GH configuration."""
 
+import os
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+# Environment variable with the directory of the mounted Crypt4GH secret files.
+CRYPT4GH_SECRETS_DIR = "CRYPT4GH_SECRETS_DIR"
+
 
 class Crypt4GHConfig(BaseSettings):
     """Crypt4GH configuration."""
@@ -15,7 +20,12 @@ class Crypt4GHConfig(BaseSettings):
 
 
 def c4gh_config() -> Crypt4GHConfig:
-    """Get Crypt4GH configuration."""
+    """Get Crypt4GH configuration.
+
+    The values are read from files named after the variables in the CRYPT4GH_SECRETS_DIR
+    directory if it is set and the environment variables are not. The files are read
+    again every time, so rotated keys are used after they are reloaded.
+    """
 
     # Avoid loading environment variables when module is imported.
-    return Crypt4GHConfig()
+    return Crypt4GHConfig(_secrets_dir=os.getenv(CRYPT4GH_SECRETS_DIR))
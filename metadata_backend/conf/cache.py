@@ -0,0 +1,48 @@
+"""Cache configuration."""
+
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+CACHE_BACKEND_DATABASE = "database"
+
+
+class CacheConfig(BaseSettings):
+    """Cache configuration."""
+
+    model_config = {"extra": "allow"}  # Allow creation using the constructor.
+
+    CACHE_BACKEND: Literal["memory", "database"] = Field(
+        default="memory",
+        description="Cache backend. The database cache backend shares the cached values between workers.",
+    )
+    CACHE_DATABASE_POOL_SIZE: int = Field(
+        2, ge=1, description="Number of pooled database connections per worker used by the database cache backend."
+    )
+    CACHE_MAX_SIZE: int = Field(10000, ge=1, description="Maximum number of cached values per cache namespace.")
+    CACHE_PRUNE_INTERVAL: int = Field(
+        100,
+        ge=1,
+        description="Number of values cached in a namespace between removing expired and excess database cache values.",
+    )
+    CACHE_PROJECTS_TTL: int = Field(3600, ge=0, description="Seconds user's projects are cached.")
+    CACHE_PROJECTS_STALE_TTL: int = Field(
+        3600, ge=0, description="Seconds expired user's projects are used while they are retrieved again."
+    )
+    CACHE_ROR_TTL: int = Field(604800, ge=0, description="Seconds ROR organisations are cached.")
+    CACHE_ROR_NOT_FOUND_TTL: int = Field(
+        86400, ge=0, description="Seconds organisations that are not found in ROR are cached."
+    )
+    CACHE_REMS_TTL: int = Field(300, ge=0, description="Seconds REMS workflows and licenses are cached.")
+    CACHE_REMS_STALE_TTL: int = Field(
+        3600, ge=0, description="Seconds expired REMS workflows and licenses are used while they are retrieved again."
+    )
+    CACHE_METAX_TTL: int = Field(604800, ge=0, description="Seconds Metax reference data is cached.")
+
+
+def cache_config() -> CacheConfig:
+    """Get cache configuration."""
+
+    # Avoid loading environment variables when module is imported.
+    return CacheConfig()
@@ -10,6 +10,26 @@ class DatabaseConfig(BaseSettings):
     model_config = {"extra": "allow"}  # Allow creation using the constructor.
 
     DATABASE_URL: str = Field(description="Database URL")
+    DATABASE_POOL_SIZE: int = Field(default=10, ge=1, description="Number of pooled connections per worker.")
+    DATABASE_MAX_OVERFLOW: int = Field(
+        default=20, ge=0, description="Number of connections per worker allowed in addition to the pool size."
+    )
+    DATABASE_POOL_TIMEOUT: float = Field(
+        default=30, gt=0, description="Seconds to wait for a pooled connection before giving up."
+    )
+    DATABASE_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are replaced. Negative value disables recycling.",
+    )
+    DATABASE_STATEMENT_CACHE_SIZE: int = Field(
+        default=100, ge=0, description="Number of prepared statements cached per asyncpg connection."
+    )
+    DATABASE_STATEMENT_TIMEOUT: int | None = Field(
+        default=None, ge=0, description="PostgreSQL statement timeout in milliseconds."
+    )
+    DATABASE_CREATE_SCHEMA: bool = Field(
+        default=False, description="Create the database schema when the application starts if it does not exist."
+    )
 
 
 def database_config() -> DatabaseConfig:
@@ -12,6 +12,10 @@ class CscLdapConfig(BaseSettings):
     CSC_LDAP_HOST: str = Field(description="CSC LDAP host")
     CSC_LDAP_USER: str = Field(description="CSC LDAP user")
     CSC_LDAP_PASSWORD: str = Field(description="CSC LDAP password")
+    CSC_LDAP_POOL_SIZE: int = Field(default=4, ge=1, description="Maximum number of open CSC LDAP connections.")
+    CSC_LDAP_IDLE_TIMEOUT: int = Field(
+        default=300, ge=0, description="Seconds after which idle CSC LDAP connections are closed."
+    )
 
 
 def csc_ldap_config() -> CscLdapConfig:
@@ -29,6 +29,10 @@ class OIDCConfig(BaseSettings):
         default=False, description="Enables DPoP (Demonstration of Proof-of-Possession) for OIDC requests."
     )
 
+    OIDC_MAX_WORKERS: int = Field(
+        default=8, ge=1, description="Maximum number of threads for the blocking OIDC login requests."
+    )
+
     OIDC_VERIFY_ID_TOKEN: bool = Field(
         default=True, description="Allow unsigned ID tokens. NEVER disable in production."
     )
@@ -22,6 +22,11 @@ class S3Config(BaseSettings):
     )
     S3_REGION: str = Field(description="S3 region")
     S3_ENDPOINT: str = Field(description="S3 endpoint URL")
+    S3_CLIENT_POOL_SIZE: int = Field(default=32, ge=1, description="Number of idle S3 clients kept open per worker")
+    S3_CLIENT_IDLE_TIMEOUT: int = Field(default=300, ge=0, description="Seconds after which idle S3 clients are closed")
+    S3_MAX_POOL_CONNECTIONS: int = Field(
+        default=10, ge=1, description="Maximum number of HTTP connections per S3 client"
+    )
 
 
 def s3_config() -> S3Config:
@@ -0,0 +1,24 @@
+"""Add objects index for keyset pagination within a submission.
+
+Revision ID: 20261016_01
+Revises: 20260520_01
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "20261016_01"
+down_revision = "20260520_01"
+branch_labels = None
+depends_on = None
+
+
+_INDEX = "ix_objects_submission_id_created_object_id"
+
+
+def upgrade() -> None:
+    op.execute(f"CREATE INDEX IF NOT EXISTS {_INDEX} ON objects (submission_id, created, object_id)")
+
+
+def downgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {_INDEX}")
@@ -0,0 +1,21 @@
+"""Add submissions ingest claim time.
+
+Revision ID: 20261016_02
+Revises: 20261016_01
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "20261016_02"
+down_revision = "20261016_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE submissions ADD COLUMN IF NOT EXISTS ingest_claimed_until TIMESTAMP WITH TIME ZONE")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE submissions DROP COLUMN IF EXISTS ingest_claimed_until")
@@ -0,0 +1,33 @@
+"""Add cache entries table.
+
+Revision ID: 20261016_03
+Revises: 20261016_02
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "20261016_03"
+down_revision = "20261016_02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            namespace VARCHAR(64) NOT NULL,
+            key VARCHAR NOT NULL,
+            value TEXT NOT NULL,
+            fresh_until TIMESTAMP WITH TIME ZONE NOT NULL,
+            expires TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (namespace, key)
+        )
+        """
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_cache_entries_expires ON cache_entries (expires)")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS cache_entries")
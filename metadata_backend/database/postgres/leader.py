@@ -0,0 +1,108 @@
+"""PostgreSQL leader election between application workers."""
+
+import asyncio
+from typing import Any, Callable, Coroutine
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ...helpers.logger import LOG
+
+# Seconds to wait before trying to become the leader again.
+LEADER_RETRY_INTERVAL = 30
+
+
+class LeaderElection:
+    """
+    Elect one application worker as the leader using a PostgreSQL advisory lock.
+
+    The leader holds a session-level advisory lock on one connection from the engine
+    connection pool. If the connection is lost then the database releases the lock, the
+    leader stops, and another worker can become the leader. Other workers try to become
+    the leader after the retry interval.
+
+    Databases other than PostgreSQL do not support advisory locks, and every worker is
+    the leader.
+    """
+
+    def __init__(self, engine: AsyncEngine, name: str, *, retry_interval: float = LEADER_RETRY_INTERVAL) -> None:
+        """
+        Initialize the leader election.
+
+        Args:
+            engine: Asynchronous SQLAlchemy 2.0 engine.
+            name: The name of the advisory lock.
+            retry_interval: Seconds to wait before trying to become the leader again.
+        """
+        self._engine = engine
+        self._name = name
+        self._retry_interval = retry_interval
+
+    @property
+    def is_supported(self) -> bool:
+        """Return True if the database driver supports advisory locks."""
+        return self._engine.dialect.name == "postgresql" and self._engine.dialect.driver == "asyncpg"
+
+    async def run_forever(self, action: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        """
+        Run the action while this worker is the leader until the task is cancelled.
+
+        The action is started again after the retry interval if it returns or fails.
+
+        Args:
+            action: The coroutine function run by the leader.
+        """
+        while True:
+            try:
+                if self.is_supported:
+                    await self._lead(action)
+                else:
+                    await action()
+            except Exception as exc:
+                LOG.warning("Leader failed: name: %s, error: %s", self._name, exc)
+            await asyncio.sleep(self._retry_interval)
+
+    async def _lead(self, action: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        """Run the action if this worker becomes the leader until the action ends or the connection is lost."""
+        lock_id = func.hashtext(self._name)
+        async with self._engine.connect() as conn:
+            if not (await conn.execute(select(func.pg_try_advisory_lock(lock_id)))).scalar_one():
+                return
+            # The session-level lock is kept after the transaction ends.
+            await conn.commit()
+
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            if driver_connection is None:
+                await self._unlock(conn)
+                raise RuntimeError("Missing database driver connection")
+
+            closed = asyncio.Event()
+            driver_connection.add_termination_listener(lambda _connection: closed.set())
+            LOG.info("Elected as the leader: name: %s", self._name)
+
+            action_task = asyncio.create_task(action())
+            closed_task = asyncio.create_task(closed.wait())
+            try:
+                await asyncio.wait([action_task, closed_task], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in (action_task, closed_task):
+                    task.cancel()
+                await asyncio.gather(action_task, closed_task, return_exceptions=True)
+                if not driver_connection.is_closed():
+                    await self._unlock(conn)
+
+            if closed.is_set():
+                LOG.warning("Leader disconnected: name: %s", self._name)
+            elif not action_task.cancelled():
+                action_task.result()
+
+    async def _unlock(self, conn: AsyncConnection) -> None:
+        """Release the advisory lock, or close the connection if the lock can't be released."""
+        try:
+            await conn.execute(select(func.pg_advisory_unlock(func.hashtext(self._name))))
+            await conn.commit()
+        except Exception:
+            # The lock must not remain held by a pooled connection.
+            await conn.invalidate()
+            raise
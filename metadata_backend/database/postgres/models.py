@@ -13,6 +13,7 @@ from sqlalchemy import (
     Dialect,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -131,6 +132,18 @@ class ApiKeyEntity(Base):
     )
 
 
+class CacheEntryEntity(Base):
+    """Table for cached values shared by the workers."""
+
+    __tablename__ = "cache_entries"
+
+    namespace: Mapped[str] = mapped_column(String(64), primary_key=True)
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[str] = mapped_column(Text, nullable=False)  # JSON encoded value.
+    fresh_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+
 class SubmissionEntity(Base):
     """Table for submissions."""
 
@@ -172,6 +185,7 @@ class SubmissionEntity(Base):
     is_ingested: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=false(), index=True)
     published: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
     ingested: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    ingest_claimed_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     document: Mapped[dict[str, Any]] = mapped_column(MutableDict.as_mutable(TypeJSON), nullable=False)
 
@@ -196,6 +210,10 @@ class ObjectEntity(Base):
     """Table for submitted metadata objects."""
 
     __tablename__ = OBJECTS_TABLE
+    __table_args__ = (
+        # Keyset pagination of metadata objects within a submission.
+        Index("ix_objects_submission_id_created_object_id", "submission_id", "created", "object_id"),
+    )
 
     object_id: Mapped[str] = mapped_column(String(128), primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=True)  # User provided name for the object
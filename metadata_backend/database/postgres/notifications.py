@@ -0,0 +1,153 @@
+"""PostgreSQL notifications between application workers."""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Callable
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from ...helpers.logger import LOG
+from .repository import session
+
+# Seconds to wait before reconnecting a notification listener.
+LISTENER_RETRY_INTERVAL = 5
+
+# Session info key for in-process notifications sent in the current transaction.
+_PENDING_NOTIFICATIONS = "pending_notifications"
+
+# In-process notification callbacks by channel.
+_local_listeners: defaultdict[str, list[Callable[[str], None]]] = defaultdict(list)
+
+
+async def notify(channel: str, payload: str) -> None:
+    """
+    Send a notification to all listeners of the channel.
+
+    The notification is delivered when the current transaction is committed, and it is
+    discarded if the transaction is rolled back. Databases other than PostgreSQL do not
+    support notifications, and the notification is delivered only to the listeners in
+    this worker.
+
+    Args:
+        channel: The notification channel.
+        payload: The notification payload.
+    """
+    if session().bind.dialect.name != "postgresql":
+        session().info.setdefault(_PENDING_NOTIFICATIONS, []).append((channel, payload))
+        return
+    await session().execute(select(func.pg_notify(channel, payload)))
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_local_notifications(committed_session: Session) -> None:
+    """Deliver the in-process notifications when the transaction is committed."""
+    for channel, payload in committed_session.info.pop(_PENDING_NOTIFICATIONS, []):
+        for callback in list(_local_listeners[channel]):
+            try:
+                callback(payload)
+            except Exception:
+                LOG.exception("Database notification callback failed: channel: %s", channel)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_local_notifications(rolled_back_session: Session) -> None:
+    """Discard the in-process notifications when the transaction is rolled back."""
+    rolled_back_session.info.pop(_PENDING_NOTIFICATIONS, None)
+
+
+class NotificationListener:
+    """
+    Listen to PostgreSQL notifications on a channel.
+
+    The listener holds one connection from the engine connection pool. If the connection is
+    lost then the listener reconnects and calls the on_connect callback, because notifications
+    sent while the listener was disconnected are lost.
+
+    Databases other than PostgreSQL do not support notifications, and the listener receives
+    only the notifications sent in this worker.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        channel: str,
+        callback: Callable[[str], None],
+        *,
+        on_connect: Callable[[], None] | None = None,
+        retry_interval: float = LISTENER_RETRY_INTERVAL,
+    ) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            engine: Asynchronous SQLAlchemy 2.0 engine.
+            channel: The notification channel.
+            callback: Called with the payload of each notification.
+            on_connect: Called when the listener has connected or reconnected.
+            retry_interval: Seconds to wait before reconnecting.
+        """
+        self._engine = engine
+        self._channel = channel
+        self._callback = callback
+        self._on_connect = on_connect
+        self._retry_interval = retry_interval
+
+    @property
+    def is_supported(self) -> bool:
+        """Return True if the database driver supports notifications."""
+        return self._engine.dialect.name == "postgresql" and self._engine.dialect.driver == "asyncpg"
+
+    async def run_forever(self) -> None:
+        """Listen to notifications until the task is cancelled."""
+        if not self.is_supported:
+            await self._listen_local()
+            return
+
+        while True:
+            try:
+                await self._listen()
+            except Exception as exc:
+                LOG.warning("Database notification listener failed: channel: %s, error: %s", self._channel, exc)
+            await asyncio.sleep(self._retry_interval)
+
+    async def _listen_local(self) -> None:
+        """Listen to notifications sent in this worker until the task is cancelled."""
+        _local_listeners[self._channel].append(self._callback)
+        LOG.info("Listening to in-process notifications: channel: %s", self._channel)
+        if self._on_connect is not None:
+            self._on_connect()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            _local_listeners[self._channel].remove(self._callback)
+
+    async def _listen(self) -> None:
+        """Listen to notifications until the connection is lost."""
+
+        def _notification(_connection: Any, _pid: int, _channel: str, payload: str) -> None:
+            try:
+                self._callback(payload)
+            except Exception:
+                LOG.exception("Database notification callback failed: channel: %s", self._channel)
+
+        async with self._engine.connect() as conn:
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            if driver_connection is None:
+                raise RuntimeError("Missing database driver connection")
+
+            closed = asyncio.Event()
+            driver_connection.add_termination_listener(lambda _connection: closed.set())
+            await driver_connection.add_listener(self._channel, _notification)
+            LOG.info("Listening to database notifications: channel: %s", self._channel)
+            if self._on_connect is not None:
+                self._on_connect()
+            try:
+                await closed.wait()
+            finally:
+                if not driver_connection.is_closed():
+                    await driver_connection.remove_listener(self._channel, _notification)
+
+        LOG.warning("Database notification listener disconnected: channel: %s", self._channel)
@@ -53,13 +53,21 @@ class ApiKeyRepository:
             api_keys.append(ApiKey(key_id=row.user_key_id, created_at=row.created_at))
         return api_keys
 
-    async def delete_api_key(self, user_id: str, user_key_id: str) -> None:
+    async def delete_api_key(self, user_id: str, user_key_id: str) -> list[str]:
         """
         Delete an API key row matching the given user ID and hashed API key.
 
         Args:
             user_id: The user id whose API key should be deleted.
             user_key_id: The unique key id assigned by the user.
+
+        Returns:
+            The generated unique key ids of the deleted API keys.
         """
-        stmt = delete(ApiKeyEntity).where(ApiKeyEntity.user_id == user_id, ApiKeyEntity.user_key_id == user_key_id)
-        await session().execute(stmt)
+        stmt = (
+            delete(ApiKeyEntity)
+            .where(ApiKeyEntity.user_id == user_id, ApiKeyEntity.user_key_id == user_key_id)
+            .returning(ApiKeyEntity.key_id)
+        )
+        result = await session().execute(stmt)
+        return list(result.scalars().all())
@@ -0,0 +1,87 @@
+"""Repository for the cache_entries table."""
+
+from datetime import datetime
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from ..models import CacheEntryEntity
+from ..repository import session
+
+
+class CacheRepository:
+    """Repository for the cache_entries table."""
+
+    async def get_entry(self, namespace: str, key: str, now: datetime) -> CacheEntryEntity | None:
+        """
+        Get the cached value if it has not expired.
+
+        Args:
+            namespace: The cache namespace.
+            key: The cache key.
+            now: The current time.
+
+        Returns:
+            The cache entry row, or None.
+        """
+        stmt = select(CacheEntryEntity).where(
+            CacheEntryEntity.namespace == namespace,
+            CacheEntryEntity.key == key,
+            CacheEntryEntity.expires > now,
+        )
+        return (await session().execute(stmt)).scalar_one_or_none()
+
+    async def set_entry(self, entry: CacheEntryEntity) -> None:
+        """
+        Add or replace the cached value using INSERT ... ON CONFLICT DO UPDATE.
+
+        Args:
+            entry: The cache entry row. The entity is not added to the session.
+        """
+        dialect_insert = postgresql_insert if session().bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(CacheEntryEntity).values(
+            namespace=entry.namespace,
+            key=entry.key,
+            value=entry.value,
+            fresh_until=entry.fresh_until,
+            expires=entry.expires,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CacheEntryEntity.namespace, CacheEntryEntity.key],
+            set_={
+                "value": stmt.excluded.value,
+                "fresh_until": stmt.excluded.fresh_until,
+                "expires": stmt.excluded.expires,
+            },
+        )
+        await session().execute(stmt)
+
+    async def prune(self, namespace: str, maxsize: int, now: datetime) -> int:
+        """
+        Delete the expired cached values and the values that expire first if there are too many values.
+
+        Args:
+            namespace: The cache namespace.
+            maxsize: The maximum number of cached values in the namespace.
+            now: The current time.
+
+        Returns:
+            The number of deleted values.
+        """
+        kept = (
+            select(CacheEntryEntity.key)
+            .where(CacheEntryEntity.namespace == namespace)
+            .order_by(CacheEntryEntity.expires.desc())
+            .limit(maxsize)
+        )
+        stmt = (
+            delete(CacheEntryEntity)
+            .where(
+                CacheEntryEntity.namespace == namespace,
+                or_(CacheEntryEntity.expires <= now, CacheEntryEntity.key.not_in(kept)),
+            )
+            .returning(CacheEntryEntity.key)
+        )
+        result = await session().execute(stmt)
+        return len(result.all())
@@ -1,10 +1,12 @@
 """Repository for the files table."""
 
-from typing import AsyncIterator, Callable, Sequence
+from typing import Any, AsyncIterator, Callable, Iterable, Sequence
 
-from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy import String, and_, case, column, delete, func, insert, inspect, or_, select, update, values
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from metadata_backend.api.models.models import IngestStatus
+from metadata_backend.api.models.models import IngestStatus, IngestStatusUpdate
 from metadata_backend.api.models.submission import SubmissionWorkflow
 from metadata_backend.api.services.accession import generate_file_accession
 
@@ -33,6 +35,70 @@ class FileRepository:
         await session().flush()
         return entity.file_id
 
+    async def add_files(self, entities: Sequence[FileEntity], workflow: SubmissionWorkflow) -> list[str]:
+        """
+        Add new metadata file entities to the database using a multi-row INSERT.
+
+        The entities are not added to the session.
+
+        Args:
+            entities: The file entities.
+            workflow: the submission workflow.
+        Returns:
+            The file ids used as the primary key values in the given order.
+        """
+        if not entities:
+            return []
+
+        stmt = insert(FileEntity).returning(FileEntity.file_id, sort_by_parameter_order=True)
+        result = await session().execute(stmt, self._insert_rows(entities, workflow))
+        return list(result.scalars())
+
+    async def add_missing_files(self, entities: Sequence[FileEntity], workflow: SubmissionWorkflow) -> int:
+        """
+        Add new metadata file entities to the database using a multi-row INSERT ... ON CONFLICT DO NOTHING.
+
+        Entities whose path already exists in the submission are not added, also if the
+        path has been added concurrently. The entities are not added to the session.
+
+        Args:
+            entities: The file entities.
+            workflow: the submission workflow.
+        Returns:
+            The number of added file entities.
+        """
+        if not entities:
+            return 0
+
+        dialect_insert = postgresql_insert if session().bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = (
+            dialect_insert(FileEntity)
+            .on_conflict_do_nothing(index_elements=[FileEntity.submission_id, FileEntity.path])
+            .returning(FileEntity.file_id)
+        )
+        result = await session().execute(stmt, self._insert_rows(entities, workflow))
+        return len(result.all())
+
+    @staticmethod
+    def _insert_rows(entities: Sequence[FileEntity], workflow: SubmissionWorkflow) -> list[dict[str, Any]]:
+        """
+        Get the multi-row INSERT values for the file entities.
+
+        Args:
+            entities: The file entities.
+            workflow: the submission workflow.
+        Returns:
+            The column values of the file entities.
+        """
+        # Generate accessions.
+        for entity in entities:
+            if entity.file_id is None:
+                entity.file_id = generate_file_accession(workflow)
+
+        # Unset columns are omitted to use the column defaults.
+        columns = [c.key for c in inspect(FileEntity).column_attrs]
+        return [{c: getattr(e, c) for c in columns if getattr(e, c) is not None} for e in entities]
+
     async def get_file_by_id(self, file_id: str) -> FileEntity | None:
         """
         Get the file entity using file id.
@@ -62,6 +128,23 @@ class FileRepository:
         result = await session().execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_file_paths(self, submission_id: str, paths: Iterable[str] | None = None) -> set[str]:
+        """
+        Get the existing file paths using a single query.
+
+        Args:
+            submission_id: The submission id.
+            paths: Optional file paths. If not given, all file paths of the submission are returned.
+
+        Returns:
+            The matching file paths.
+        """
+        stmt = select(FileEntity.path).where(FileEntity.submission_id == submission_id)
+        if paths is not None:
+            stmt = stmt.where(FileEntity.path.in_(set(paths)))
+        result = await session().execute(stmt)
+        return set(result.scalars())
+
     async def get_files(
         self, *, submission_id: str | None = None, ingest_statuses: Sequence[IngestStatus] | None = None
     ) -> AsyncIterator[FileEntity]:
@@ -153,6 +236,55 @@ class FileRepository:
         update_callback(file)
         return file
 
+    async def update_ingest_statuses(self, updates: Sequence[IngestStatusUpdate]) -> int:
+        """
+        Update file ingest statuses using a single UPDATE ... FROM (VALUES ...) statement.
+
+        The ingest error count is incremented if the file already has an error of the
+        same type, set to one for other errors, and cleared for other statuses.
+
+        Args:
+            updates: The ingest status updates. Each file id must be given at most once.
+
+        Returns:
+            The number of updated file entities.
+        """
+        if not updates:
+            return 0
+
+        # The VALUES list is used as a common table expression, which is also supported by SQLite.
+        rows = values(
+            column("file_id", String),
+            column("ingest_status", FileEntity.ingest_status.type),
+            column("ingest_error", String),
+            column("ingest_error_type", FileEntity.ingest_error_type.type),
+            name="ingest_updates",
+        ).data([(u.file_id, u.ingest_status, u.ingest_error, u.ingest_error_type) for u in updates])
+        source = rows.cte("ingest_updates")
+
+        error_count = case(
+            (source.c.ingest_status != IngestStatus.ERROR, None),
+            (
+                FileEntity.ingest_error_type.is_not_distinct_from(source.c.ingest_error_type),
+                func.coalesce(FileEntity.ingest_error_count, 0) + 1,
+            ),
+            else_=1,
+        )
+        stmt = (
+            update(FileEntity)
+            .where(FileEntity.file_id == source.c.file_id)
+            .values(
+                ingest_status=source.c.ingest_status,
+                ingest_error=source.c.ingest_error,
+                ingest_error_type=source.c.ingest_error_type,
+                ingest_error_count=error_count,
+            )
+            .returning(FileEntity.file_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session().execute(stmt)
+        return len(result.all())
+
     async def delete_file_by_id(self, file_id: str) -> bool:
         """
         Get the file entity using file id.
@@ -1,8 +1,10 @@
 """Repository for the objects table."""
 
-from typing import AsyncIterator, Callable, Sequence
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Iterable, Sequence
 
-from sqlalchemy import and_, case, delete, func, select
+from sqlalchemy import Case, Select, and_, case, delete, func, insert, inspect, or_, select
+from sqlalchemy.orm import defer
 
 from metadata_backend.api.models.submission import SubmissionWorkflow
 from metadata_backend.api.services.accession import generate_accession
@@ -10,6 +12,12 @@ from metadata_backend.api.services.accession import generate_accession
 from ..models import ObjectEntity
 from ..repository import session
 
+# The number of metadata object XML documents fetched at a time from the server-side cursor.
+XML_DOCUMENT_BATCH_SIZE = 100
+
+# The object type, created date and object id used to return objects after the given object.
+ObjectKey = tuple[str, datetime, str]
+
 
 class ObjectRepository:
     """Repository for the objects table."""
@@ -33,6 +41,35 @@ class ObjectRepository:
         await session().flush()
         return entity.object_id
 
+    async def add_objects(self, entities: Sequence[ObjectEntity], workflow: SubmissionWorkflow) -> list[str]:
+        """
+        Add new metadata object entities to the database using a multi-row INSERT.
+
+        The entities are not added to the session.
+
+        Args:
+            entities: The metadata object entities.
+            workflow: The submission workflow.
+
+        Returns:
+            The object ids used as the primary key values in the given order.
+        """
+        if not entities:
+            return []
+
+        # Generate accessions.
+        for entity in entities:
+            if entity.object_id is None:
+                entity.object_id = generate_accession(workflow, entity.object_type)
+
+        # Unset columns are omitted to use the column defaults.
+        columns = [c.key for c in inspect(ObjectEntity).column_attrs]
+        rows = [{c: getattr(e, c) for c in columns if getattr(e, c) is not None} for e in entities]
+
+        stmt = insert(ObjectEntity).returning(ObjectEntity.object_id, sort_by_parameter_order=True)
+        result = await session().execute(stmt, rows)
+        return list(result.scalars())
+
     async def get_object_by_id(self, object_id: str) -> ObjectEntity | None:
         """
         Get the object entity using object id.
@@ -67,6 +104,28 @@ class ObjectRepository:
         result = await session().execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_object_names(
+        self, project_id: str, names: Iterable[str], object_types: Iterable[str]
+    ) -> set[tuple[str, str]]:
+        """
+        Get the existing object names using a single query.
+
+        Args:
+            project_id: The project id.
+            names: The names of the objects.
+            object_types: The types of the objects.
+
+        Returns:
+            The object type and name pairs of the matching objects.
+        """
+        stmt = select(ObjectEntity.object_type, ObjectEntity.name).where(
+            ObjectEntity.project_id == project_id,
+            ObjectEntity.name.in_(set(names)),
+            ObjectEntity.object_type.in_(set(object_types)),
+        )
+        result = await session().execute(stmt)
+        return {(row.object_type, row.name) for row in result}
+
     async def get_objects(
         self,
         submission_id: str,
@@ -74,22 +133,141 @@ class ObjectRepository:
         *,
         object_id: str | None = None,
         name: str | None = None,
+        documents: bool = True,
+        after: ObjectKey | None = None,
+        limit: int | None = None,
     ) -> AsyncIterator[ObjectEntity]:
         """
         Get metadata object entities associated with the given submission.
 
-        The objects are ordered by object type(s) in the given order and by created date.
+        The objects are ordered by object type(s) in the given order, by created date
+        and by object id.
 
         Args:
             submission_id: the submission id.
             object_type: filter by object type(s).
             object_id: Object id.
             name: Object name.
+            documents: Load the JSON and XML documents. If False, accessing the documents raises an error.
+            after: Return objects after the object with the given key.
+            limit: The maximum number of objects.
 
         Returns:
             An asynchronous iterator of ordered metadata object entities.
         """
 
+        stmt = self._filter_objects(select(ObjectEntity), submission_id, object_type, object_id, name)
+
+        if not documents:
+            stmt = stmt.options(
+                defer(ObjectEntity.document, raiseload=True), defer(ObjectEntity.xml_document, raiseload=True)
+            )
+
+        if after is not None:
+            after_object_type, after_created, after_object_id = after
+            after_filter = or_(
+                ObjectEntity.created > after_created,
+                and_(ObjectEntity.created == after_created, ObjectEntity.object_id > after_object_id),
+            )
+            if object_type is not None and not isinstance(object_type, str):
+                # Objects are ordered first by the object type.
+                after_order = list(object_type).index(after_object_type)
+                order = self._object_type_order(object_type)
+                after_filter = or_(order > after_order, and_(order == after_order, after_filter))
+            stmt = stmt.where(after_filter)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await session().execute(stmt)
+        for row in result.scalars():
+            yield row
+
+    @staticmethod
+    def get_object_key(entity: ObjectEntity) -> ObjectKey:
+        """
+        Get the key used to return objects after the given object.
+
+        Args:
+            entity: The metadata object entity.
+
+        Returns:
+            The object type, created date and object id.
+        """
+        return entity.object_type, entity.created, entity.object_id
+
+    async def get_xml_documents(
+        self,
+        submission_id: str,
+        object_type: str | Sequence[str] | None = None,
+        *,
+        object_id: str | None = None,
+        name: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Get metadata object XML documents associated with the given submission.
+
+        Only the XML documents are selected, and they are fetched from a server-side
+        cursor in batches of XML_DOCUMENT_BATCH_SIZE.
+
+        The XML documents are ordered by object type(s) in the given order and by created date.
+
+        Args:
+            submission_id: the submission id.
+            object_type: filter by object type(s).
+            object_id: Object id.
+            name: Object name.
+
+        Returns:
+            An asynchronous iterator of ordered metadata object XML documents.
+        """
+
+        stmt = self._filter_objects(select(ObjectEntity.xml_document), submission_id, object_type, object_id, name)
+        result = await session().stream_scalars(stmt.execution_options(yield_per=XML_DOCUMENT_BATCH_SIZE))
+        try:
+            async for xml_document in result:
+                yield xml_document
+        finally:
+            await result.close()
+
+    @staticmethod
+    def _object_type_order(object_types: Sequence[str]) -> Case[int]:
+        """
+        Get the position of the metadata object type in the given object types.
+
+        Args:
+            object_types: The object types.
+
+        Returns:
+            The SQL expression for the position of the object type.
+        """
+        return case({val: idx for idx, val in enumerate(object_types)}, value=ObjectEntity.object_type)
+
+    @staticmethod
+    def _filter_objects(
+        stmt: Select[Any],
+        submission_id: str,
+        object_type: str | Sequence[str] | None,
+        object_id: str | None,
+        name: str | None,
+    ) -> Select[Any]:
+        """
+        Filter and order the metadata object select statement.
+
+        The objects are ordered by object type(s) in the given order, by created date
+        and by object id.
+
+        Args:
+            stmt: The select statement.
+            submission_id: the submission id.
+            object_type: filter by object type(s).
+            object_id: Object id.
+            name: Object name.
+
+        Returns:
+            The filtered and ordered select statement.
+        """
+
         filters = [ObjectEntity.submission_id == submission_id]
         if object_id is not None:
             filters.append(ObjectEntity.object_id == object_id)
@@ -102,21 +280,13 @@ class ObjectRepository:
                 filters.append(ObjectEntity.object_type == object_type)
             else:
                 filters.append(ObjectEntity.object_type.in_(object_type))
-                order_by = case(
-                    {val: idx for idx, val in enumerate(object_type)},
-                    value=ObjectEntity.object_type,
-                )
+                order_by = ObjectRepository._object_type_order(object_type)
 
-        stmt = select(ObjectEntity).where(and_(*filters))
+        stmt = stmt.where(and_(*filters))
 
         if order_by is not None:
-            stmt = stmt.order_by(order_by, ObjectEntity.created.asc())
-        else:
-            stmt = stmt.order_by(ObjectEntity.created.asc())
-
-        result = await session().execute(stmt)
-        for row in result.scalars():
-            yield row
+            return stmt.order_by(order_by, ObjectEntity.created.asc(), ObjectEntity.object_id.asc())
+        return stmt.order_by(ObjectEntity.created.asc(), ObjectEntity.object_id.asc())
 
     async def count_objects(self, submission_id: str, object_type: str | None = None) -> int:
         """
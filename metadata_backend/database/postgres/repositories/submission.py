@@ -4,7 +4,8 @@ import datetime
 import enum
 from typing import Awaitable, Callable, Sequence
 
-from sqlalchemy import and_, delete, func, select
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import and_, delete, func, or_, select, update
 
 from metadata_backend.api.models.submission import Submission, SubmissionWorkflow
 from metadata_backend.api.services.accession import generate_submission_accession
@@ -22,6 +23,29 @@ class SubmissionSort(enum.Enum):
     CREATED_DESC = SubmissionEntity.created.desc()
 
 
+class SubmissionHeader(BaseModel):
+    """Submission columns needed to check access to the submission without the submission document."""
+
+    model_config = ConfigDict(frozen=True)
+
+    submission_id: str
+    name: str
+    project_id: str
+    workflow: SubmissionWorkflow
+    is_published: bool
+    bucket: str | None = None
+
+
+_SUBMISSION_HEADER_COLUMNS = (
+    SubmissionEntity.submission_id,
+    SubmissionEntity.name,
+    SubmissionEntity.project_id,
+    SubmissionEntity.workflow,
+    SubmissionEntity.is_published,
+    SubmissionEntity.bucket,
+)
+
+
 class SubmissionRepository:
     """Repository for the submissions table."""
 
@@ -56,10 +80,42 @@ class SubmissionRepository:
         Returns:
             The submission entity.
         """
-        stmt = select(SubmissionEntity).where(SubmissionEntity.submission_id == submission_id)
+        # Returns the submission entity from the session identity map without a query
+        # if it has already been loaded in the session.
+        return await session().get(SubmissionEntity, submission_id)
+
+    async def get_submission_header(self, submission_id: str) -> SubmissionHeader | None:
+        """
+        Get the submission header using submission id without the submission document.
+
+        Args:
+            submission_id: The submission id.
+
+        Returns:
+            The submission header.
+        """
+        stmt = select(*_SUBMISSION_HEADER_COLUMNS).where(SubmissionEntity.submission_id == submission_id)
         result = await session().execute(stmt)
+        row = result.one_or_none()
+        return SubmissionHeader.model_validate(row._asdict()) if row is not None else None
 
-        return result.scalar_one_or_none()
+    async def get_submission_header_by_name(self, project_id: str, name: str) -> SubmissionHeader | None:
+        """
+        Get the submission header using project id and submission name without the submission document.
+
+        Args:
+            project_id: The project_id.
+            name: The name of the submission.
+
+        Returns:
+            The submission header.
+        """
+        stmt = select(*_SUBMISSION_HEADER_COLUMNS).where(
+            SubmissionEntity.name == name, SubmissionEntity.project_id == project_id
+        )
+        result = await session().execute(stmt)
+        row = result.one_or_none()
+        return SubmissionHeader.model_validate(row._asdict()) if row is not None else None
 
     async def get_submission_by_name(self, project_id: str, name: str) -> SubmissionEntity | None:
         """
@@ -200,20 +256,34 @@ class SubmissionRepository:
         return list(result.scalars().all())
 
     async def claim_submission_for_ingest(
-        self, submission_id: str, *, workflow: SubmissionWorkflow | None = None
+        self,
+        submission_id: str,
+        *,
+        workflow: SubmissionWorkflow | None = None,
+        claim_until: datetime.datetime | None = None,
     ) -> SubmissionEntity | None:
         """Claim submission row for ingest using row lock and skip-locked semantics.
 
+        Submissions that have been claimed until a later time are not claimable. If the
+        claim time is given, the submission remains claimed after the transaction ends
+        until the claim time or until the claim is released.
+
         :param submission_id: The submission id.
         :param workflow: optional workflow filter.
+        :param claim_until: optional time until which the submission remains claimed.
         :returns: claimed submission or None when not claimable.
         """
+        now = datetime.datetime.now(datetime.timezone.utc)
         stmt = (
             select(SubmissionEntity)
             .where(
                 SubmissionEntity.submission_id == submission_id,
                 SubmissionEntity.is_published.is_(True),
                 SubmissionEntity.is_ingested.is_(False),
+                or_(
+                    SubmissionEntity.ingest_claimed_until.is_(None),
+                    SubmissionEntity.ingest_claimed_until <= now,
+                ),
             )
             .with_for_update(skip_locked=True)
         )
@@ -222,7 +292,27 @@ class SubmissionRepository:
             stmt = stmt.where(SubmissionEntity.workflow == workflow)
 
         result = await session().execute(stmt)
-        return result.scalar_one_or_none()
+        submission = result.scalar_one_or_none()
+        if submission is not None and claim_until is not None:
+            await self.update_ingest_claim(submission_id, claim_until)
+        return submission
+
+    async def update_ingest_claim(self, submission_id: str, claim_until: datetime.datetime | None) -> bool:
+        """Update the time until which the submission remains claimed for ingest.
+
+        The submission modification time is not changed.
+
+        :param submission_id: The submission id.
+        :param claim_until: the claim time, or None to release the claim.
+        :returns: True if the submission was updated, False otherwise.
+        """
+        stmt = (
+            update(SubmissionEntity)
+            .where(SubmissionEntity.submission_id == submission_id)
+            .values(ingest_claimed_until=claim_until, modified=SubmissionEntity.modified)
+        )
+        result = await session().execute(stmt)
+        return result.rowcount > 0  # type: ignore
 
     async def delete_submission_by_id(self, submission_id: str) -> bool:
         """
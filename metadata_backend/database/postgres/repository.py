@@ -4,46 +4,99 @@ import os
 import re
 import sqlite3
 from contextvars import ContextVar
-from typing import Callable
+from typing import Any, Callable, override
 
-from sqlalchemy import create_mock_engine, event, text
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import create_mock_engine, event, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncResult, AsyncSession, async_sessionmaker, create_async_engine
 
 from ...api.exceptions import SystemException
-from ...conf.database import database_config
+from ...conf.database import DatabaseConfig, database_config
 from .models import Base
 
 SessionFactory = async_sessionmaker[AsyncSession]
 
 
+# PostgreSQL advisory lock key used to serialise schema creation between workers.
+SCHEMA_LOCK_KEY = 7_340_215_031
+
+
 async def _create_schema(engine: AsyncEngine) -> None:
     """
     Create database schema if it does not already exist.
 
+    Workers starting at the same time create the PostgreSQL schema one at a time.
+
     Args:
         engine: Asynchronous SQLAlchemy 2.0 engine.
     """
     async with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
         await conn.run_sync(Base.metadata.create_all)
 
 
-async def create_engine(db_url: str | None = None) -> AsyncEngine:
+def _engine_options(config: DatabaseConfig, *, pool_size: int | None = None) -> dict[str, Any]:
+    """
+    Get the engine connection pool and driver options.
+
+    Args:
+        config: The database configuration.
+        pool_size: The number of pooled connections without overflow connections. The
+            configured pool size and overflow are used by default.
+
+    Returns:
+        The keyword arguments for create_async_engine.
+    """
+    url = make_url(config.DATABASE_URL)
+    if url.get_backend_name() == "sqlite":
+        return {}
+
+    # Connections closed by the server are detected when they are used and invalidated
+    # by the pool. Recycling replaces connections before they are dropped as idle.
+    # The last used connection is reused first to keep the number of open connections low.
+    options: dict[str, Any] = {
+        "pool_size": config.DATABASE_POOL_SIZE,
+        "max_overflow": config.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": config.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": config.DATABASE_POOL_RECYCLE,
+        "pool_use_lifo": True,
+    }
+    if pool_size is not None:
+        options["pool_size"] = pool_size
+        options["max_overflow"] = 0
+
+    if url.get_driver_name() == "asyncpg":
+        connect_args: dict[str, Any] = {"prepared_statement_cache_size": config.DATABASE_STATEMENT_CACHE_SIZE}
+        if config.DATABASE_STATEMENT_TIMEOUT is not None:
+            connect_args["server_settings"] = {"statement_timeout": str(config.DATABASE_STATEMENT_TIMEOUT)}
+        options["connect_args"] = connect_args
+
+    return options
+
+
+async def create_engine(
+    db_url: str | None = None, *, create_schema: bool | None = None, pool_size: int | None = None
+) -> AsyncEngine:
     """
     Create and return an asynchronous SQLAlchemy 2.0 engine.
 
     If the db_url is not provided, the DATABASE_URL environment variable will be used.
+    The connection pool and statement options are read from the database configuration.
 
     Args:
         db_url: The database URL.
+        create_schema: Create the database schema if it does not exist. If not provided,
+            the DATABASE_CREATE_SCHEMA environment variable will be used.
+        pool_size: The number of pooled connections without overflow connections. If not
+            provided, the configured pool size and overflow will be used.
 
     Returns:
          Asynchronous SQLAlchemy 2.0 engine.
     """
 
-    if db_url is None:
-        db_url = database_config().DATABASE_URL
+    config = database_config() if db_url is None else DatabaseConfig(DATABASE_URL=db_url)
 
-    engine = create_async_engine(db_url, pool_pre_ping=True, echo=False)
+    engine = create_async_engine(config.DATABASE_URL, echo=False, **_engine_options(config, pool_size=pool_size))
 
     # Enable foreign keys in SQLite.
     if engine.dialect.name == "sqlite":
@@ -54,7 +107,10 @@ async def create_engine(db_url: str | None = None) -> AsyncEngine:
             cursor.execute("PRAGMA foreign_keys=ON")
             cursor.close()
 
-    await _create_schema(engine)
+    if create_schema is None:
+        create_schema = config.DATABASE_CREATE_SCHEMA
+    if create_schema:
+        await _create_schema(engine)
     return engine
 
 
@@ -107,17 +163,77 @@ def get_sqllite_db_url(file: str) -> str:
     return f"sqlite+aiosqlite:///{file}?cache=shared"
 
 
-def create_session_factory(engine: AsyncEngine) -> SessionFactory:
+class ReadOnlySession(AsyncSession):
+    """
+    Session for read-only requests that returns the database connection to the connection
+    pool after each query.
+
+    The results of execute, scalar, scalars and get are buffered, and the transaction is
+    ended when the query returns. The next query starts a new transaction. Streamed results
+    keep the connection until all streams are closed. The loaded objects are not expired.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create the session."""
+        super().__init__(*args, **kwargs)
+        self._streams: list[AsyncResult[Any]] = []
+
+    async def _release(self) -> None:
+        """End the transaction and return the connection to the pool if no results are streamed."""
+        self._streams = [stream for stream in self._streams if not stream.closed]
+        if not self._streams and self.in_transaction():
+            await self.commit()
+
+    @override
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute the statement and return the connection to the pool."""
+        try:
+            return await super().execute(*args, **kwargs)
+        finally:
+            await self._release()
+
+    @override
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute the statement, return the first column of the first row, and return the connection to the pool."""
+        try:
+            return await super().scalar(*args, **kwargs)
+        finally:
+            await self._release()
+
+    @override
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        """Get the object by primary key and return the connection to the pool."""
+        try:
+            return await super().get(*args, **kwargs)
+        finally:
+            await self._release()
+
+    @override
+    async def stream(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute the statement and stream the results using the connection until the results are closed."""
+        result = await super().stream(*args, **kwargs)
+        self._streams.append(result)
+        return result
+
+
+def create_session_factory(engine: AsyncEngine, *, read_only: bool = False) -> SessionFactory:
     """
     Create session factory.
 
     Args:
         engine: Asynchronous SQLAlchemy 2.0 engine.
+        read_only: Create read-only sessions that return the connection to the connection
+            pool after each query, and start PostgreSQL transactions as READ ONLY. The
+            sessions share the connection pool of the engine.
 
     Returns:
          Session factory.
     """
-    return async_sessionmaker(bind=engine, expire_on_commit=False)
+    if not read_only:
+        return async_sessionmaker(bind=engine, expire_on_commit=False)
+    if engine.dialect.name == "postgresql":
+        engine = engine.execution_options(postgresql_readonly=True)
+    return async_sessionmaker(bind=engine, class_=ReadOnlySession, expire_on_commit=False)
 
 
 # Holds the database AsyncSession for each request in a task-local context variable. The
@@ -10,6 +10,16 @@ CREATE TABLE api_keys (
 	UNIQUE (user_id, user_key_id)
 );
 
+CREATE TABLE cache_entries (
+	namespace VARCHAR(64) NOT NULL,
+	key VARCHAR NOT NULL,
+	value TEXT NOT NULL,
+	fresh_until TIMESTAMP WITH TIME ZONE NOT NULL,
+	expires TIMESTAMP WITH TIME ZONE NOT NULL,
+	PRIMARY KEY (namespace, key)
+);
+CREATE INDEX ix_cache_entries_expires ON cache_entries (expires);
+
 CREATE TABLE submissions (
 	submission_id VARCHAR(128) NOT NULL,
 	name VARCHAR NOT NULL,
@@ -24,6 +34,7 @@ CREATE TABLE submissions (
 	is_ingested BOOLEAN DEFAULT false NOT NULL,
 	published TIMESTAMP WITH TIME ZONE,
 	ingested TIMESTAMP WITH TIME ZONE,
+	ingest_claimed_until TIMESTAMP WITH TIME ZONE,
 	document JSONB NOT NULL,
 	PRIMARY KEY (submission_id),
 	CONSTRAINT ck_workflow CHECK (workflow IN ('SD', 'FEGA', 'Bigpicture'))
@@ -51,6 +62,7 @@ CREATE TABLE objects (
 CREATE INDEX ix_objects_created ON objects (created);
 CREATE INDEX ix_objects_submission_id ON objects (submission_id);
 CREATE INDEX ix_objects_modified ON objects (modified);
+CREATE INDEX ix_objects_submission_id_created_object_id ON objects (submission_id, created, object_id);
 
 CREATE TABLE files (
 	file_id VARCHAR(128) NOT NULL,
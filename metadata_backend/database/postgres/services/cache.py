@@ -0,0 +1,102 @@
+"""Cache backend using the database."""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from ....helpers.cache import CacheBackend, CacheEntry
+from ..models import CacheEntryEntity
+from ..repositories.cache import CacheRepository
+from ..repository import SessionFactory, _session_context
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    """Convert Unix time to a datetime."""
+    return datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+def _to_timestamp(value: datetime) -> float:
+    """Convert a datetime to Unix time. SQLite returns datetimes without a time zone."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class DatabaseCacheBackend(CacheBackend):
+    """
+    Cache backend shared by the workers using the cache_entries table.
+
+    The cached values are read and written in their own transactions. Expired values and
+    the values that expire first in namespaces with too many values are deleted after a
+    number of values have been cached in the namespace.
+    """
+
+    def __init__(
+        self,
+        repository: CacheRepository,
+        session_factory_provider: Callable[[], SessionFactory],
+        *,
+        prune_interval: int,
+    ) -> None:
+        """
+        Initialize the cache backend.
+
+        :param repository: The cache entries repository.
+        :param session_factory_provider: Returns the database session factory.
+        :param prune_interval: Number of values cached in a namespace between pruning the namespace.
+        """
+        self._repository = repository
+        self._session_factory_provider = session_factory_provider
+        self._prune_interval = prune_interval
+        self._set_counts: defaultdict[str, int] = defaultdict(int)
+
+    async def _with_session[T](self, action: Callable[[], Awaitable[T]]) -> T:
+        """Open a new database session and run action inside a transaction."""
+        session_factory = self._session_factory_provider()
+        async with session_factory() as db_session:
+            token = _session_context.set(db_session)
+            try:
+                async with db_session.begin():
+                    return await action()
+            finally:
+                _session_context.reset(token)
+
+    async def get(self, namespace: str, key: str) -> CacheEntry[str] | None:
+        """
+        Get the cached value if it has not expired.
+
+        :param namespace: The cache namespace.
+        :param key: The cache key.
+        :returns: The JSON encoded value, or None.
+        """
+        now = datetime.now(timezone.utc)
+        row = await self._with_session(lambda: self._repository.get_entry(namespace, key, now))
+        if row is None:
+            return None
+        return CacheEntry(row.value, _to_timestamp(row.fresh_until), _to_timestamp(row.expires))
+
+    async def set(self, namespace: str, key: str, entry: CacheEntry[str], maxsize: int) -> None:
+        """
+        Cache the value.
+
+        :param namespace: The cache namespace.
+        :param key: The cache key.
+        :param entry: The JSON encoded value.
+        :param maxsize: The maximum number of cached values in the namespace.
+        """
+        row = CacheEntryEntity(
+            namespace=namespace,
+            key=key,
+            value=entry.value,
+            fresh_until=_to_datetime(entry.fresh_until),
+            expires=_to_datetime(entry.expires),
+        )
+        self._set_counts[namespace] += 1
+        prune = self._set_counts[namespace] % self._prune_interval == 0
+
+        async def _set() -> None:
+            await self._repository.set_entry(row)
+            if prune:
+                await self._repository.prune(namespace, maxsize, datetime.now(timezone.utc))
+
+        await self._with_session(_set)
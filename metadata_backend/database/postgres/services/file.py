@@ -1,13 +1,26 @@
 """Service for submission files."""
 
-from typing import AsyncIterator, Sequence
+from typing import AsyncIterable, AsyncIterator, Iterable, Sequence
 
 from ....api.exceptions import NotFoundUserException
-from ....api.models.models import File, IngestErrorType, IngestFileState, IngestStatus
+from ....api.models.models import File, IngestErrorType, IngestFileState, IngestStatus, IngestStatusUpdate
 from ....api.models.submission import SubmissionWorkflow
 from ..models import FileEntity
 from ..repositories.file import FileRepository
 
+# Number of files added or updated at a time.
+FILE_BATCH_SIZE = 1000
+
+
+async def _iter_files(files: Iterable[File] | AsyncIterable[File]) -> AsyncIterator[File]:
+    """Iterate synchronous or asynchronous files."""
+    if isinstance(files, AsyncIterable):
+        async for file in files:
+            yield file
+    else:
+        for file in files:
+            yield file
+
 
 class UnknownFileException(NotFoundUserException):
     """Raised when a file cannot be found."""
@@ -79,6 +92,15 @@ class FileService:
         """
         return await self.__repository.add_file(self.convert_to_entity(file), workflow)
 
+    async def add_files(self, files: Sequence[File], workflow: SubmissionWorkflow) -> list[str]:
+        """Add new submission files using one multi-row insert.
+
+        :param files: the submission files
+        :param workflow: the submission workflow
+        :returns: the automatically assigned file ids in the given order
+        """
+        return await self.__repository.add_files([self.convert_to_entity(file) for file in files], workflow)
+
     async def is_file_by_path(self, submission_id: str, path: str) -> bool:
         """
         Check if the file exists.
@@ -93,6 +115,39 @@ class FileService:
         file = await self.__repository.get_file_by_path(submission_id, path)
         return file is not None
 
+    async def add_missing_files(
+        self, submission_id: str, files: Iterable[File] | AsyncIterable[File], workflow: SubmissionWorkflow
+    ) -> int:
+        """Add the files whose path does not exist in the submission.
+
+        The existing file paths are read using one query and compared in memory. The
+        missing files are added in batches of FILE_BATCH_SIZE using multi-row inserts
+        that skip paths added concurrently.
+
+        :param submission_id: the submission id
+        :param files: the submission files
+        :param workflow: the submission workflow
+        :returns: the number of added files
+        """
+        existing_paths = await self.__repository.get_file_paths(submission_id)
+        added = 0
+        batch: list[FileEntity] = []
+
+        async def _add_batch() -> int:
+            count = await self.__repository.add_missing_files(batch, workflow)
+            batch.clear()
+            return count
+
+        async for file in _iter_files(files):
+            if file.path in existing_paths:
+                continue
+            existing_paths.add(file.path)
+            batch.append(self.convert_to_entity(file))
+            if len(batch) >= FILE_BATCH_SIZE:
+                added += await _add_batch()
+        added += await _add_batch()
+        return added
+
     async def get_file_by_id(self, file_id: str) -> File:
         """
         Get submission file with the given file id.
@@ -197,6 +252,31 @@ class FileService:
         if await self.__repository.update_file(file_id, update_callback) is None:
             raise UnknownFileException(file_id)
 
+    async def update_ingest_statuses(self, updates: Iterable[IngestStatusUpdate]) -> int:
+        """Update file ingest statuses in bulk.
+
+        The statuses are updated in batches of FILE_BATCH_SIZE using one UPDATE statement
+        per batch. The ingest error fields are updated the same way as in update_ingest_status.
+        Unknown files are ignored. If a file id is given more than once then the last update
+        is used.
+
+        :param updates: The ingest status updates.
+        :returns: The number of updated files.
+        """
+        latest: dict[str, IngestStatusUpdate] = {}
+        for status_update in updates:
+            if status_update.ingest_status != IngestStatus.ERROR:
+                status_update = IngestStatusUpdate(
+                    file_id=status_update.file_id, ingest_status=status_update.ingest_status
+                )
+            latest[status_update.file_id] = status_update
+
+        batch = list(latest.values())
+        updated = 0
+        for i in range(0, len(batch), FILE_BATCH_SIZE):
+            updated += await self.__repository.update_ingest_statuses(batch[i : i + FILE_BATCH_SIZE])
+        return updated
+
     async def get_ingest_file_states(self, submission_id: str) -> list[IngestFileState]:
         """
         Get ingest states for files in a submission.
@@ -213,6 +293,7 @@ class FileService:
                 ingest_error=entity.ingest_error,
                 ingest_error_type=entity.ingest_error_type,
                 ingest_error_count=entity.ingest_error_count,
+                modified=entity.modified,
             )
             for entity in entities
         ]
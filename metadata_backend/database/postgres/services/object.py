@@ -1,13 +1,17 @@
 """Service for metadata objects."""
 
+import base64
+import json
 from datetime import datetime
 from typing import Any, AsyncIterator, Sequence
 
+from pydantic import BaseModel
+
 from ....api.exceptions import NotFoundUserException, UserException
 from ....api.models.models import Object
 from ....api.models.submission import SubmissionWorkflow
 from ..models import ObjectEntity
-from ..repositories.object import ObjectRepository
+from ..repositories.object import ObjectKey, ObjectRepository
 
 
 class UnknownObjectException(NotFoundUserException):
@@ -24,6 +28,18 @@ class UnknownObjectException(NotFoundUserException):
         super().__init__(message)
 
 
+class NewObject(BaseModel):
+    """Metadata object to be added to the database."""
+
+    name: str
+    object_type: str
+    object_id: str | None = None
+    document: dict[str, Any] | None = None
+    xml_document: str | None = None
+    title: str | None = None
+    description: str | None = None
+
+
 class ObjectService:
     """Service for metadata objects."""
 
@@ -83,6 +99,55 @@ class ObjectService:
 
         return await self.repository.add_object(obj, workflow)
 
+    async def add_objects(
+        self,
+        project_id: str,
+        submission_id: str,
+        objects: Sequence[NewObject],
+        workflow: SubmissionWorkflow,
+    ) -> list[str]:
+        """Add new metadata objects to the database.
+
+        The object names are checked using one query and the objects are added using
+        one multi-row insert.
+
+        :param project_id: the project id
+        :param submission_id: the submission id
+        :param objects: the metadata objects
+        :param workflow: the submission workflow
+        :returns: the metadata object ids in the given order
+        """
+
+        # Check that the object names do not already exist in the project.
+        existing = await self.repository.get_object_names(
+            project_id, (o.name for o in objects), (o.object_type for o in objects)
+        )
+        for obj in objects:
+            key = (obj.object_type, obj.name)
+            if key in existing:
+                raise UserException(
+                    f"Metadata object of type {obj.object_type} with name {obj.name} "
+                    f"already exists in project {project_id}"
+                )
+            existing.add(key)
+
+        entities = [
+            ObjectEntity(
+                project_id=project_id,
+                submission_id=submission_id,
+                object_type=obj.object_type,
+                name=obj.name,
+                object_id=obj.object_id,
+                document=obj.document,
+                xml_document=obj.xml_document,
+                title=obj.title,
+                description=obj.description,
+            )
+            for obj in objects
+        ]
+
+        return await self.repository.add_objects(entities, workflow)
+
     async def update_object(
         self,
         object_id: str,
@@ -162,33 +227,112 @@ class ObjectService:
         :return: The metadata objects.
         """
 
-        def _object(entity_: ObjectEntity) -> Object:
-            return Object(
-                name=entity_.name,
-                objectId=entity_.object_id,
-                submissionId=entity_.submission_id,
-                objectType=entity_.object_type,
-                title=entity_.title,
-                description=entity_.description,
-                created=entity_.created,
-                modified=entity_.modified,
-            )
-
         objects = []
 
         if object_id is None and name is None:
-            async for entity in self.repository.get_objects(submission_id, object_type):
-                objects.append(_object(entity))
+            async for entity in self.repository.get_objects(submission_id, object_type, documents=False):
+                objects.append(self.convert_from_entity(entity))
         else:
             if object_id is not None:
-                async for entity in self.repository.get_objects(submission_id, object_type, object_id=object_id):
-                    objects.append(_object(entity))
+                async for entity in self.repository.get_objects(
+                    submission_id, object_type, object_id=object_id, documents=False
+                ):
+                    objects.append(self.convert_from_entity(entity))
             if not objects and name is not None:
-                async for entity in self.repository.get_objects(submission_id, object_type, name=name):
-                    objects.append(_object(entity))
+                async for entity in self.repository.get_objects(submission_id, object_type, name=name, documents=False):
+                    objects.append(self.convert_from_entity(entity))
 
         return objects
 
+    async def get_objects_page(
+        self,
+        submission_id: str,
+        object_type: str | Sequence[str] | None = None,
+        *,
+        page_size: int,
+        page_token: str | None = None,
+    ) -> tuple[list[Object], str | None]:
+        """
+        Retrieve one page of metadata objects associated with the given submission.
+
+        The pages are read after the last object of the previous page identified by
+        the page token.
+
+        :param submission_id: The submission id.
+        :param object_type: The metadata object type(s).
+        :param page_size: The maximum number of metadata objects.
+        :param page_token: The page token returned for the previous page.
+        :return: The metadata objects and the page token for the next page if there are more metadata objects.
+        """
+
+        after = self.decode_page_token(page_token) if page_token is not None else None
+        if after is not None and object_type is not None and not isinstance(object_type, str):
+            if after[0] not in object_type:
+                raise UserException(f"Invalid page token: {page_token}")
+
+        # Read one extra object to know if there is a next page.
+        entities = [
+            entity
+            async for entity in self.repository.get_objects(
+                submission_id, object_type, documents=False, after=after, limit=page_size + 1
+            )
+        ]
+
+        next_page_token = None
+        if len(entities) > page_size:
+            entities = entities[:page_size]
+            next_page_token = self.encode_page_token(self.repository.get_object_key(entities[-1]))
+
+        return [self.convert_from_entity(entity) for entity in entities], next_page_token
+
+    @staticmethod
+    def convert_from_entity(entity: ObjectEntity) -> Object:
+        """
+        Convert metadata object entity to metadata object.
+
+        :param entity: the metadata object entity
+        :returns: the metadata object
+        """
+
+        return Object(
+            name=entity.name,
+            objectId=entity.object_id,
+            submissionId=entity.submission_id,
+            objectType=entity.object_type,
+            title=entity.title,
+            description=entity.description,
+            created=entity.created,
+            modified=entity.modified,
+        )
+
+    @staticmethod
+    def encode_page_token(key: ObjectKey) -> str:
+        """
+        Encode the page token.
+
+        :param key: the object type, created date and object id of the last object in the page
+        :returns: the page token
+        """
+
+        object_type, created, object_id = key
+        token = json.dumps([object_type, created.isoformat(), object_id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(token.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_page_token(page_token: str) -> ObjectKey:
+        """
+        Decode the page token.
+
+        :param page_token: the page token
+        :returns: the object type, created date and object id of the last object in the previous page
+        """
+
+        try:
+            object_type, created, object_id = json.loads(base64.urlsafe_b64decode(page_token.encode("ascii")))
+            return str(object_type), datetime.fromisoformat(created), str(object_id)
+        except (ValueError, TypeError) as e:
+            raise UserException(f"Invalid page token: {page_token}") from e
+
     async def get_xml_document(self, object_id: str) -> str:
         """
         Retrieve metadata object XML document with the given object id.
@@ -203,17 +347,39 @@ class ObjectService:
         return obj.xml_document
 
     async def get_xml_documents(
-        self, submission_id: str, object_type: str | Sequence[str] | None = None
+        self,
+        submission_id: str,
+        object_type: str | Sequence[str] | None = None,
+        *,
+        object_id: str | None = None,
+        name: str | None = None,
     ) -> AsyncIterator[str]:
         """
         Retrieve metadata object XML documents associated with the given submission.
 
+        The XML documents are streamed from the database using one query.
+
         :param submission_id: The submission id.
         :param object_type: The metadata object type(s).
-        :return: An asynchronous iterator of dictionaries representing the metadata object XML documents.
+        :param object_id: Optional object id.
+        :param name: Optional object name.
+        :return: An asynchronous iterator of the metadata object XML documents.
         """
-        async for obj in self.repository.get_objects(submission_id, object_type):
-            yield obj.xml_document
+        if object_id is None and name is None:
+            async for xml_document in self.repository.get_xml_documents(submission_id, object_type):
+                yield xml_document
+            return
+
+        found = False
+        if object_id is not None:
+            async for xml_document in self.repository.get_xml_documents(
+                submission_id, object_type, object_id=object_id
+            ):
+                found = True
+                yield xml_document
+        if not found and name is not None:
+            async for xml_document in self.repository.get_xml_documents(submission_id, object_type, name=name):
+                yield xml_document
 
     async def delete_object_by_id(self, object_id: str) -> None:
         """Delete metadata object.
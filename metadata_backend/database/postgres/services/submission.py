@@ -1,14 +1,18 @@
 """Service for submissions."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
+from weakref import WeakKeyDictionary
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....api.exceptions import NotFoundUserException, UserException
 from ....api.json import to_json_dict
 from ....api.models.submission import Submission, Submissions, SubmissionWorkflow
 from ..models import SubmissionEntity
 from ..repositories.registration import RegistrationRepository
-from ..repositories.submission import SubmissionRepository, SubmissionSort
+from ..repositories.submission import SubmissionHeader, SubmissionRepository, SubmissionSort
+from ..repository import session
 
 
 class UnknownSubmissionUserException(NotFoundUserException):
@@ -44,6 +48,47 @@ class SubmissionService:
         """Initialize the service."""
         self.repository = repository
         self.registration_repository = registration_repository
+        # Request-scoped submission header cache for the database session of the request.
+        self._headers: WeakKeyDictionary[AsyncSession, dict[str, SubmissionHeader | None]] = WeakKeyDictionary()
+
+    async def get_submission_header(self, submission_id: str) -> SubmissionHeader:
+        """Get the submission header without the submission document.
+
+        The submission header is read from the database once per request. If the submission
+        entity has been loaded in the request, the header is read from the entity instead
+        to include changes that have not been flushed.
+
+        :param submission_id: the submission id
+        :returns: the submission header
+        """
+        entity = None
+        if submission_id:
+            entity = session().identity_map.get(session().identity_key(SubmissionEntity, submission_id))
+        if isinstance(entity, SubmissionEntity):
+            return SubmissionHeader(
+                submission_id=entity.submission_id,
+                name=entity.name,
+                project_id=entity.project_id,
+                workflow=entity.workflow,
+                is_published=entity.is_published is True,
+                bucket=entity.bucket,
+            )
+
+        headers = self._headers.setdefault(session(), {})
+        if submission_id not in headers:
+            headers[submission_id] = await self.repository.get_submission_header(submission_id)
+
+        header = headers[submission_id]
+        if header is None:
+            raise UnknownSubmissionUserException(submission_id)
+        return header
+
+    def _clear_submission_header(self, submission_id: str) -> None:
+        """Remove the submission header from the request-scoped cache after the submission has changed.
+
+        :param submission_id: the submission id
+        """
+        self._headers.get(session(), {}).pop(submission_id, None)
 
     @staticmethod
     def ignore_fields(submission: Submission) -> None:
@@ -169,7 +214,9 @@ class SubmissionService:
         entity = self.convert_to_new_entity(submission)
         entity.submission_id = submission_id
 
-        return await self.repository.add_submission(entity)
+        submission_id = await self.repository.add_submission(entity)
+        self._clear_submission_header(submission_id)
+        return submission_id
 
     async def get_submission_by_id(self, submission_id: str) -> Submission | None:
         """Get the submission using submission id.
@@ -245,16 +292,18 @@ class SubmissionService:
         :param submission_id: the submission id
         :returns: True if the submission exists
         """
-        submission = await self.repository.get_submission_by_id(submission_id)
-        return submission is not None
+        try:
+            await self.get_submission_header(submission_id)
+            return True
+        except UnknownSubmissionUserException:
+            return False
 
     async def check_submission_by_id(self, submission_id: str) -> None:
         """Raise an exception if the submission does not exist.
 
         :param submission_id: the submission id
         """
-        if not await self.is_submission_by_id(submission_id):
-            raise UnknownSubmissionUserException(submission_id)
+        await self.get_submission_header(submission_id)
 
     async def is_submission_by_name(self, project_id: str, name: str) -> bool:
         """Check if the submission exists.
@@ -263,7 +312,7 @@ class SubmissionService:
         :param name: the submission name
         :returns: True if the submission exists
         """
-        submission = await self.repository.get_submission_by_name(project_id, name)
+        submission = await self.repository.get_submission_header_by_name(project_id, name)
         return submission is not None
 
     async def check_submission_by_id_or_name(self, project_id: str, submission_id_or_name: str) -> str:
@@ -276,9 +325,10 @@ class SubmissionService:
         if await self.is_submission_by_id(submission_id_or_name):
             return submission_id_or_name
 
-        submission = await self.repository.get_submission_by_name(project_id, submission_id_or_name)
-        if submission:
-            return submission.submission_id
+        header = await self.repository.get_submission_header_by_name(project_id, submission_id_or_name)
+        if header:
+            self._headers.setdefault(session(), {})[header.submission_id] = header
+            return header.submission_id
 
         raise UnknownSubmissionUserException(submission_id_or_name)
 
@@ -288,11 +338,7 @@ class SubmissionService:
         :param submission_id: the submission id
         :returns: True if the submission has been published
         """
-        submission = await self.repository.get_submission_by_id(submission_id)
-        if submission is None:
-            raise UnknownSubmissionUserException(submission_id)
-
-        return submission.is_published is True
+        return (await self.get_submission_header(submission_id)).is_published is True
 
     async def check_not_published(self, submission_id: str) -> None:
         """Raise an exception if the submission has been published.
@@ -308,11 +354,7 @@ class SubmissionService:
         :param submission_id: the submission id
         :returns: The project id.
         """
-        submission = await self.repository.get_submission_by_id(submission_id)
-        if submission is None:
-            raise UnknownSubmissionUserException(submission_id)
-
-        return submission.project_id
+        return (await self.get_submission_header(submission_id)).project_id
 
     async def get_workflow(self, submission_id: str) -> SubmissionWorkflow:
         """Get the workflow for the submission.
@@ -320,11 +362,7 @@ class SubmissionService:
         :param submission_id: the submission id
         :returns: The submission workflow.
         """
-        submission = await self.repository.get_submission_by_id(submission_id)
-        if submission is None:
-            raise UnknownSubmissionUserException(submission_id)
-
-        return submission.workflow
+        return (await self.get_submission_header(submission_id)).workflow
 
     async def get_bucket(self, submission_id: str) -> str | None:
         """Get the name of the bucket linked to the submission.
@@ -332,11 +370,7 @@ class SubmissionService:
         :param submission_id: the submission id
         :returns: The bucket name
         """
-        submission = await self.repository.get_submission_by_id(submission_id)
-        if submission is None:
-            raise UnknownSubmissionUserException(submission_id)
-
-        return submission.bucket
+        return (await self.get_submission_header(submission_id)).bucket
 
     async def update_submission(self, submission_id: str, document: dict[str, Any]) -> None:
         """Update the existing submission document.
@@ -348,6 +382,7 @@ class SubmissionService:
         async def update_callback(submission: SubmissionEntity) -> None:
             await self.convert_to_updated_entity(document, submission)
 
+        self._clear_submission_header(submission_id)
         if await self.repository.update_submission(submission_id, update_callback) is None:
             raise UnknownSubmissionUserException(submission_id)
 
@@ -361,6 +396,7 @@ class SubmissionService:
             if not submission.is_published:
                 submission.is_published = True
 
+        self._clear_submission_header(submission_id)
         if await self.repository.update_submission(submission_id, update_callback) is None:
             raise UnknownSubmissionUserException(submission_id)
 
@@ -386,20 +422,50 @@ class SubmissionService:
         return await self.repository.get_submission_ids_for_ingest(workflow=workflow)
 
     async def claim_submission_for_ingest(
-        self, submission_id: str, *, workflow: SubmissionWorkflow | None = None
+        self,
+        submission_id: str,
+        *,
+        workflow: SubmissionWorkflow | None = None,
+        claim_seconds: int | None = None,
     ) -> Submission | None:
         """Claim a submission row for ingest processing using lock+skip-locked semantics.
 
+        If the claim duration is given, the submission remains claimed for the given number
+        of seconds after the transaction ends, or until the claim is released.
+
         :param submission_id: the submission id
         :param workflow: optional workflow filter.
+        :param claim_seconds: optional claim duration in seconds.
         :returns: claimed submission or None.
         """
-        entity = await self.repository.claim_submission_for_ingest(submission_id, workflow=workflow)
+        claim_until = None if claim_seconds is None else datetime.now(timezone.utc) + timedelta(seconds=claim_seconds)
+        entity = await self.repository.claim_submission_for_ingest(
+            submission_id, workflow=workflow, claim_until=claim_until
+        )
         return await self.convert_from_entity(entity)
 
+    async def extend_ingest_claim(self, submission_id: str, claim_seconds: int) -> None:
+        """Keep the submission claimed for ingest for the given number of seconds from now.
+
+        :param submission_id: the submission id
+        :param claim_seconds: the claim duration in seconds.
+        """
+        claim_until = datetime.now(timezone.utc) + timedelta(seconds=claim_seconds)
+        if not await self.repository.update_ingest_claim(submission_id, claim_until):
+            raise UnknownSubmissionUserException(submission_id)
+
+    async def release_ingest_claim(self, submission_id: str) -> None:
+        """Release the ingest claim so that the submission can be claimed again.
+
+        :param submission_id: the submission id
+        """
+        if not await self.repository.update_ingest_claim(submission_id, None):
+            raise UnknownSubmissionUserException(submission_id)
+
     async def delete_submission(self, submission_id: str) -> None:
         """Delete submission.
 
         :param submission_id: the submission id
         """
+        self._clear_submission_header(submission_id)
         await self.repository.delete_submission_by_id(submission_id)
@@ -0,0 +1,194 @@
+"""Caches of asynchronously loaded values."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from cachetools import TLRUCache
+from pydantic import TypeAdapter
+
+from .logger import LOG
+from .metrics import Counter
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by namespace and result: hit in worker memory, hit in the shared cache backend, or miss.",
+    ("namespace", "result"),
+)
+
+
+@dataclass(frozen=True)
+class CacheEntry[V]:
+    """Cached value."""
+
+    value: V
+    # Unix time until which the value is fresh.
+    fresh_until: float
+    # Unix time after which the value is not used.
+    expires: float
+
+
+class CacheBackend(ABC):
+    """Cache backend shared by the workers. The values are JSON encoded."""
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> CacheEntry[str] | None:
+        """
+        Get the cached value if it has not expired.
+
+        Args:
+            namespace: The cache namespace.
+            key: The cache key.
+
+        Returns:
+            The JSON encoded value, or None.
+        """
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, entry: CacheEntry[str], maxsize: int) -> None:
+        """
+        Cache the value.
+
+        Args:
+            namespace: The cache namespace.
+            key: The cache key.
+            entry: The JSON encoded value.
+            maxsize: The maximum number of cached values in the namespace.
+        """
+
+
+class Cache[V]:
+    """
+    Cache of asynchronously loaded values in one namespace.
+
+    Values are cached in the memory of the worker and, if the cache backend is given, in
+    the cache backend shared by the workers. Cached values are fresh for the TTL. After
+    the TTL the stale value is returned for at most the stale TTL while the value is
+    loaded again in the background, and the value is kept if the background load fails.
+    Concurrent requests for a value that is not cached wait for the same load.
+
+    If the negative TTL is given then it is used for None values, for example for values
+    that were not found.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        value_type: Any,
+        *,
+        maxsize: int,
+        ttl: float,
+        stale_ttl: float = 0,
+        negative_ttl: float | None = None,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        """
+        Create the cache.
+
+        Args:
+            namespace: The cache namespace.
+            value_type: The value type used to encode the values in the cache backend.
+            maxsize: The maximum number of cached values.
+            ttl: Seconds the cached values are fresh.
+            stale_ttl: Seconds the cached values are returned after the TTL while they are loaded again.
+            negative_ttl: Seconds None values are fresh. The TTL is used by default.
+            backend: The cache backend shared by the workers.
+        """
+        self._namespace = namespace
+        self._adapter: TypeAdapter[V] = TypeAdapter(value_type)
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self._backend = backend
+        self._values: TLRUCache[str, CacheEntry[V]] = TLRUCache(
+            maxsize=maxsize, ttu=lambda _key, entry, _now: entry.expires, timer=time.time
+        )
+        self._loading: dict[str, asyncio.Task[CacheEntry[V]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of values cached in the worker memory."""
+        return len(self._values)
+
+    async def get(self, key: str, load: Callable[[], Awaitable[V]]) -> V:
+        """
+        Get the cached value, or load it if it is not cached.
+
+        Args:
+            key: The cache key.
+            load: Loads the value.
+
+        Returns:
+            The value.
+        """
+        entry = self._values.get(key)
+        if entry is not None:
+            CACHE_REQUESTS.inc(namespace=self._namespace, result="hit")
+        else:
+            task = self._loading.get(key)
+            if task is None:
+                task = self._start(key, self._fetch(key, load))
+            # A cancelled request does not cancel the load shared with other requests.
+            entry = await asyncio.shield(task)
+
+        if time.time() > entry.fresh_until and key not in self._loading:
+            self._start(key, self._load(key, load)).add_done_callback(self._log_refresh_error)
+        return entry.value
+
+    def clear(self) -> None:
+        """Remove all values cached in the worker memory."""
+        self._values.clear()
+
+    def _start(self, key: str, load: Awaitable[CacheEntry[V]]) -> asyncio.Task[CacheEntry[V]]:
+        """Start loading the value."""
+
+        async def _run() -> CacheEntry[V]:
+            try:
+                return await load
+            finally:
+                self._loading.pop(key, None)
+
+        task = asyncio.create_task(_run())
+        self._loading[key] = task
+        return task
+
+    async def _fetch(self, key: str, load: Callable[[], Awaitable[V]]) -> CacheEntry[V]:
+        """Get the value from the cache backend, or load it if it is not cached."""
+        if self._backend is not None:
+            try:
+                cached = await self._backend.get(self._namespace, key)
+            except Exception as ex:
+                LOG.warning("Failed to get cached value: namespace: %s, error: %r", self._namespace, ex)
+                cached = None
+            if cached is not None:
+                CACHE_REQUESTS.inc(namespace=self._namespace, result="shared")
+                entry = CacheEntry(self._adapter.validate_json(cached.value), cached.fresh_until, cached.expires)
+                self._values[key] = entry
+                return entry
+
+        CACHE_REQUESTS.inc(namespace=self._namespace, result="miss")
+        return await self._load(key, load)
+
+    async def _load(self, key: str, load: Callable[[], Awaitable[V]]) -> CacheEntry[V]:
+        """Load the value and cache it."""
+        value = await load()
+        now = time.time()
+        fresh_until = now + (self._negative_ttl if value is None else self._ttl)
+        entry = CacheEntry(value, fresh_until, fresh_until + self._stale_ttl)
+        self._values[key] = entry
+
+        if self._backend is not None:
+            encoded = CacheEntry(self._adapter.dump_json(value).decode("utf-8"), entry.fresh_until, entry.expires)
+            try:
+                await self._backend.set(self._namespace, key, encoded, self._maxsize)
+            except Exception as ex:
+                LOG.warning("Failed to cache value: namespace: %s, error: %r", self._namespace, ex)
+        return entry
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task[Any]) -> None:
+        """Log a failed background load of a stale value."""
+        if not task.cancelled() and (ex := task.exception()) is not None:
+            LOG.warning("Failed to refresh cached value: %r", ex)
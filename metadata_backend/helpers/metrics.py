@@ -0,0 +1,254 @@
+"""Application metrics in the Prometheus text exposition format."""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+# Content type of the Prometheus text exposition format.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default histogram buckets in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues) -> str:
+    """Format sample labels."""
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)) + "}"
+
+
+class MetricsRegistry:
+    """
+    Metrics of one application worker.
+
+    The metrics are updated and rendered in the event loop of the worker.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._metrics: dict[str, "_Metric"] = {}
+
+    def register(self, metric: "_Metric") -> None:
+        """
+        Register a metric.
+
+        Args:
+            metric: The metric.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """
+        Render all metrics.
+
+        Returns:
+            The metrics in the Prometheus text exposition format.
+        """
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+# Default registry exposed by the metrics endpoint.
+REGISTRY = MetricsRegistry()
+
+
+class _Metric(ABC):
+    """Metric with optional labels."""
+
+    type = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        *,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        """
+        Create and register the metric.
+
+        Args:
+            name: The metric name.
+            documentation: The metric description.
+            labelnames: The label names.
+            registry: The metrics registry.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[LabelValues, float] = {}
+        registry.register(self)
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        """Return the label values in label name order."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} requires labels: {', '.join(self.labelnames)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterator[str]:
+        """Return the metric samples in the Prometheus text exposition format."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            amount: The non-negative increment.
+            labels: The label values.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+        key = self._label_values(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the counter value."""
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        """Return the counter samples."""
+        for key, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or is computed when the metrics are rendered."""
+
+    type = "gauge"
+    _function: Callable[[], dict[LabelValues, float]] | None = None
+
+    def set(self, value: float, **labels: str) -> None:
+        """
+        Set the gauge value.
+
+        Args:
+            value: The value.
+            labels: The label values.
+        """
+        self._values[self._label_values(labels)] = value
+
+    def set_function(self, function: Callable[[], dict[LabelValues, float]]) -> None:
+        """
+        Compute the gauge values when the metrics are rendered.
+
+        Args:
+            function: Returns the values by label values in label name order.
+        """
+        self._function = function
+
+    def value(self, **labels: str) -> float:
+        """Return the gauge value."""
+        values = self._function() if self._function is not None else self._values
+        return values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        """Return the gauge samples."""
+        values = self._function() if self._function is not None else self._values
+        for key, value in values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        """
+        Create and register the histogram.
+
+        Args:
+            name: The metric name.
+            documentation: The metric description.
+            labelnames: The label names.
+            buckets: The upper bounds of the buckets.
+            registry: The metrics registry.
+        """
+        super().__init__(name, documentation, labelnames, registry=registry)
+        self._buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Observe a value.
+
+        Args:
+            value: The observed value.
+            labels: The label values.
+        """
+        key = self._label_values(labels)
+        counts = self._counts.setdefault(key, [0] * len(self._buckets))
+        for i, bound in enumerate(self._buckets):
+            if value <= bound:
+                counts[i] += 1
+        self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """
+        Observe the duration of the block in seconds.
+
+        Args:
+            labels: The label values.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observed values."""
+        counts = self._counts.get(self._label_values(labels))
+        return counts[-1] if counts else 0
+
+    def samples(self) -> Iterator[str]:
+        """Return the histogram samples."""
+        names = self.labelnames + ("le",)
+        for key, bucket_counts in self._counts.items():
+            for bound, count in zip(self._buckets, bucket_counts, strict=True):
+                labels = _format_labels(names, key + (_format_value(bound),))
+                yield f"{self.name}_bucket{labels} {count}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(self._sums[key])}"
+            yield f"{self.name}_count{labels} {bucket_counts[-1]}"
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+import signal
+from contextlib import asynccontextmanager, suppress
 from enum import Enum
 from typing import Any, AsyncGenerator, Final, TypeVar, override
 
@@ -10,13 +11,14 @@ import uvicorn
 from fastapi import APIRouter, FastAPI, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, Response
 from fastapi.routing import APIRoute
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from starlette.types import ASGIApp
 
 from . import __version__
 from .api.errors import register_exception_handlers
+from .api.exceptions import SystemException
 from .api.handlers.auth import AuthAPIHandler
 from .api.handlers.files import FilesAPIHandler
 from .api.handlers.health import HealthAPIHandler
@@ -29,31 +31,39 @@ from .api.handlers.submission import SubmissionAPIHandler
 from .api.handlers.user import UserAPIHandler
 from .api.middlewares import AuthMiddleware, SessionMiddleware
 from .api.models.app import app_state
+from .api.models.rems import Organization
 from .api.models.submission import PaginatedSubmissions
-from .api.services.auth import AuthService
-from .api.services.file import S3AllasFileProviderService, S3InboxSDAService
-from .api.services.ingest import SDAIngestService
+from .api.services.auth import API_KEY_REVOKED_CHANNEL, AuthService
+from .api.services.file import FileProviderService, S3AllasFileProviderService, S3InboxSDAService
+from .api.services.ingest import INGEST_SCANNER_LEADER, SUBMISSION_PUBLISHED_CHANNEL, SDAIngestService
 from .api.services.project import CscProjectService, NbisProjectService, ProjectService
+from .conf.cache import CACHE_BACKEND_DATABASE, cache_config
 from .conf.conf import (
     DEPLOYMENT_CSC,
     DEPLOYMENT_NBIS,
 )
 from .conf.deployment import deployment_config
+from .database.postgres.leader import LeaderElection
+from .database.postgres.notifications import NotificationListener
 from .database.postgres.repositories.api_key import ApiKeyRepository
+from .database.postgres.repositories.cache import CacheRepository
 from .database.postgres.repositories.file import FileRepository
 from .database.postgres.repositories.object import ObjectRepository
 from .database.postgres.repositories.registration import RegistrationRepository
 from .database.postgres.repositories.submission import SubmissionRepository
 from .database.postgres.repository import (
+    SessionFactory,
     _session_context,
     create_engine,
     create_session_factory,
 )
+from .database.postgres.services.cache import DatabaseCacheBackend
 from .database.postgres.services.file import FileService
 from .database.postgres.services.object import ObjectService
 from .database.postgres.services.registration import RegistrationService
 from .database.postgres.services.submission import SubmissionService
 from .health import DatabaseHealthHandler
+from .helpers.cache import CacheBackend
 from .helpers.logger import LOG
 from .services.admin_service import AdminServiceHandler
 from .services.auth_service import AuthServiceHandler
@@ -99,26 +109,112 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Create database engine.
     engine = await create_engine()
 
-    # Create database session factory.
+    # Create database session factories.
     state.session_factory = create_session_factory(engine)
+    state.read_only_session_factory = create_session_factory(engine, read_only=True)
+
+    # Create a separate small connection pool for the database cache backend and the shared
+    # ingest metrics. Cache queries made by requests must not wait for connections held by
+    # other requests.
+    cache_engine: AsyncEngine | None = None
+    if any(getattr(app.state, name, None) is not None for name in ("cache_backend", "ingest_scanner_service")):
+        cache_engine = await create_engine(create_schema=False, pool_size=cache_config().CACHE_DATABASE_POOL_SIZE)
+        state.cache_session_factory = create_session_factory(cache_engine)
+
+    # Load Crypt4GH keys once per worker for NBIS deployment. The keys are reloaded
+    # when the worker receives SIGHUP. Rotated keys are only used if they are read from
+    # the CRYPT4GH_SECRETS_DIR files, because the environment of a worker can't change.
+    sda_inbox_service = getattr(app.state, "sda_inbox_service", None)
+    reload_signal = getattr(signal, "SIGHUP", None)
+    reload_signal_handler = False
+    if sda_inbox_service is not None:
+        try:
+            await sda_inbox_service.load_crypt4gh_keys()
+        except Exception:
+            LOG.exception("Failed to load Crypt4GH keys on startup")
+
+        reload_tasks: set[asyncio.Task[None]] = set()
+
+        async def _reload_crypt4gh_keys() -> None:
+            try:
+                await sda_inbox_service.load_crypt4gh_keys(reload=True)
+            except Exception:
+                LOG.exception("Failed to reload Crypt4GH keys")
+
+        def _on_reload_signal() -> None:
+            task = asyncio.create_task(_reload_crypt4gh_keys())
+            reload_tasks.add(task)
+            task.add_done_callback(reload_tasks.discard)
+
+        if reload_signal is not None:
+            # Signal handlers can only be added in the main thread.
+            with suppress(NotImplementedError, RuntimeError, ValueError):
+                asyncio.get_running_loop().add_signal_handler(reload_signal, _on_reload_signal)
+                reload_signal_handler = True
+
+    # Start background task to remove API keys revoked in other workers from the API key cache.
+    api_key_listener_task: asyncio.Task[None] | None = None
+    auth_service = getattr(app.state, "auth_service", None)
+    if auth_service is not None:
+        api_key_listener = NotificationListener(
+            engine,
+            API_KEY_REVOKED_CHANNEL,
+            auth_service.invalidate_api_key,
+            on_connect=auth_service.clear_api_key_cache,
+        )
+        api_key_listener_task = asyncio.create_task(api_key_listener.run_forever())
 
-    # Start background ingest scanner task for NBIS deployment.
+    # Start background ingest scanner task for NBIS deployment. Only one worker scans the
+    # submissions, and published submissions are scanned immediately.
     ingest_scanner_task: asyncio.Task[None] | None = None
+    ingest_listener_task: asyncio.Task[None] | None = None
     ingest_scanner_service = getattr(app.state, "ingest_scanner_service", None)
     if ingest_scanner_service is not None:
         LOG.info("Starting background ingest scanner task")
-        ingest_scanner_task = asyncio.create_task(ingest_scanner_service.run_forever())
+        ingest_listener = NotificationListener(
+            engine,
+            SUBMISSION_PUBLISHED_CHANNEL,
+            ingest_scanner_service.submission_published,
+            on_connect=ingest_scanner_service.collect_submissions,
+        )
+        ingest_listener_task = asyncio.create_task(ingest_listener.run_forever())
+        ingest_scanner_task = asyncio.create_task(
+            ingest_scanner_service.run_forever(leader=LeaderElection(engine, INGEST_SCANNER_LEADER))
+        )
 
     yield
 
-    if ingest_scanner_task is not None:
-        ingest_scanner_task.cancel()
+    for task in (ingest_scanner_task, ingest_listener_task):
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    if api_key_listener_task is not None:
+        api_key_listener_task.cancel()
         try:
-            await ingest_scanner_task
+            await api_key_listener_task
         except asyncio.CancelledError:
             pass
 
-    # Dispose database engine.
+    if reload_signal_handler and reload_signal is not None:
+        asyncio.get_running_loop().remove_signal_handler(reload_signal)
+
+    # Close pooled S3 clients.
+    file_provider_service = getattr(app.state, "file_provider_service", None)
+    if file_provider_service is not None:
+        await file_provider_service.close()
+
+    # Close pooled LDAP connections.
+    project_service = getattr(app.state, "project_service", None)
+    if project_service is not None:
+        await project_service.close()
+
+    # Dispose database engines.
+    if cache_engine is not None:
+        await cache_engine.dispose()
     await engine.dispose()
 
     # CLose health check client.
@@ -172,13 +268,29 @@ def create_app(session: AsyncSession | None = None) -> ASGIApp:
     file_service = FileService(file_repository)
     auth_service = AuthService(api_key_repository)
 
+    # Create cache backend shared by the workers.
+    def _cache_session_factory() -> SessionFactory:
+        session_factory: SessionFactory | None = getattr(app.state, "cache_session_factory", None)
+        if session_factory is None:
+            raise SystemException("Missing cache session factory")
+        return session_factory
+
+    cache = cache_config()
+    cache_backend: CacheBackend | None = None
+    if cache.CACHE_BACKEND == CACHE_BACKEND_DATABASE:
+        cache_backend = DatabaseCacheBackend(
+            CacheRepository(),
+            session_factory_provider=_cache_session_factory,
+            prune_interval=cache.CACHE_PRUNE_INTERVAL,
+        )
+
     # Create project service.
     project_service: ProjectService | None = None
 
     if config.DEPLOYMENT == DEPLOYMENT_NBIS:
         project_service = NbisProjectService()
     elif config.DEPLOYMENT == DEPLOYMENT_CSC:
-        project_service = CscProjectService()
+        project_service = CscProjectService(cache_backend=cache_backend)
 
     # Create service handlers.
     def _create_handler(handler: ServiceHandlerType) -> ServiceHandlerType:
@@ -197,8 +309,8 @@ def create_app(session: AsyncSession | None = None) -> ASGIApp:
     auth_handler = None
 
     if config.DEPLOYMENT == DEPLOYMENT_CSC:
-        metax_handler = _create_handler(MetaxServiceHandler())
-        ror_handler = _create_handler(RorServiceHandler())
+        metax_handler = _create_handler(MetaxServiceHandler(cache_backend=cache_backend))
+        ror_handler = _create_handler(RorServiceHandler(cache_backend=cache_backend))
         pid_handler = _create_handler(PIDServiceHandler(metax_handler))
         keystone_handler = _create_handler(KeystoneServiceHandler())
         auth_handler = _create_handler(AuthServiceHandler())
@@ -212,7 +324,7 @@ def create_app(session: AsyncSession | None = None) -> ASGIApp:
         S3AllasFileProviderService() if config.DEPLOYMENT == DEPLOYMENT_CSC else S3InboxSDAService(admin_handler)
     )
 
-    rems_handler = _create_handler(RemsServiceHandler())
+    rems_handler = _create_handler(RemsServiceHandler(cache_backend=cache_backend))
 
     # Provide services for FastAPI routes.
     services = RESTAPIServices(
@@ -240,6 +352,23 @@ def create_app(session: AsyncSession | None = None) -> ASGIApp:
         database=DatabaseHealthHandler(lambda: state.session_factory),
     )
 
+    # Provide file provider service for closing the pooled S3 clients.
+    app.state.file_provider_service = file_provider_service
+
+    # Provide project service for closing the pooled LDAP connections.
+    app.state.project_service = project_service
+
+    # Provide cache backend for creating its database connection pool.
+    app.state.cache_backend = cache_backend
+
+    # Provide SDA inbox service for loading the Crypt4GH keys.
+    app.state.sda_inbox_service = (
+        file_provider_service if isinstance(file_provider_service, S3InboxSDAService) else None
+    )
+
+    # Provide auth service for the API key cache invalidation.
+    app.state.auth_service = auth_service if not session else None
+
     # Provide ingest scanner service for NBIS deployment.
     app.state.ingest_scanner_service = None
     if config.DEPLOYMENT == DEPLOYMENT_NBIS and admin_handler is not None and not session:
@@ -247,6 +376,16 @@ def create_app(session: AsyncSession | None = None) -> ASGIApp:
             services,
             handlers,
             session_factory_provider=lambda: app_state(app).session_factory,
+            # Publish the ingest metrics to all workers using the cache connection pool.
+            metrics_backend=(
+                cache_backend
+                if cache_backend is not None
+                else DatabaseCacheBackend(
+                    CacheRepository(),
+                    session_factory_provider=_cache_session_factory,
+                    prune_interval=cache.CACHE_PRUNE_INTERVAL,
+                )
+            ),
         )
 
     _object = ObjectAPIHandler(services, handlers)
@@ -254,7 +393,7 @@ def create_app(session: AsyncSession | None = None) -> ASGIApp:
     _publish_submission = PublishAPIHandler(services, handlers)
     _rems = RemsAPIHandler(services, handlers)
     _file = FilesAPIHandler(services, handlers)
-    _health = HealthAPIHandler(services, handlers)
+    _health = HealthAPIHandler(services, handlers, ingest_service=app.state.ingest_scanner_service)
     _key = KeyAPIHandler(services, handlers)
     _user = UserAPIHandler(services, handlers)
     _auth = AuthAPIHandler(auth_handler)
@@ -359,12 +498,20 @@ def create_app(session: AsyncSession | None = None) -> ASGIApp:
 
     # File routes.
     api_router.add_api_route("/buckets", _file.get_project_buckets, methods=GET, tags=bucket_tag)
-    api_router.add_api_route("/buckets/{bucket}/files", _file.get_files_in_bucket, methods=GET, tags=bucket_tag)
+    api_router.add_api_route(
+        "/buckets/{bucket}/files",
+        _file.get_files_in_bucket,
+        methods=GET,
+        tags=bucket_tag,
+        response_model=FileProviderService.Files,
+    )
     api_router.add_api_route("/buckets/{bucket}", _file.grant_access_to_bucket, methods=["PUT"], tags=bucket_tag)
     api_router.add_api_route("/buckets/{bucket}", _file.check_bucket_access, methods=HEAD, tags=bucket_tag)
 
     # REMS routes.
-    api_router.add_api_route("/rems", _rems.get_organisations, methods=GET, tags=rems_tag)
+    api_router.add_api_route(
+        "/rems", _rems.get_organisations, methods=GET, tags=rems_tag, response_model=list[Organization]
+    )
 
     # Auth router (authorization not required).
     #
@@ -381,6 +528,7 @@ def create_app(session: AsyncSession | None = None) -> ASGIApp:
 
     health_router = APIRouter(prefix=config.API_PREFIX, tags=["Health"])
     health_router.add_api_route("/health", _health.get_health_status, methods=GET)
+    health_router.add_api_route("/metrics", _health.get_metrics, methods=GET, response_class=Response)
 
     # OpenAPI router (authorization not required).
     #
@@ -444,11 +592,12 @@ def create_app(session: AsyncSession | None = None) -> ASGIApp:
     # ASGI middleware is used to handle authentication and sessions,
     # before any FastAPI/Starlette route is processed.
     asgi_app: ASGIApp = app
+    # Authenticate users with ASGI middleware. API keys that are not
+    # cached are validated using the request database session.
+    asgi_app = AuthMiddleware(asgi_app, auth_service)
     if not session:
         # Create SQLAlchemy sessions with ASGI middleware.
         asgi_app = SessionMiddleware(asgi_app, _session_context)
-    # Authenticate users with ASGI middleware.
-    asgi_app = AuthMiddleware(asgi_app, auth_service)
     return asgi_app
 
 
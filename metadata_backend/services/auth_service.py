@@ -1,16 +1,22 @@
 """OIDC service."""
 
+import asyncio
+import copy
 import hashlib
 import os
+import threading
 import time
 import uuid
 from base64 import urlsafe_b64encode
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
 from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import httpx
 import jwt
+import requests
 import ujson
 from fastapi import HTTPException
 from fastapi.responses import RedirectResponse
@@ -19,7 +25,6 @@ from idpyoidc.client.rp_handler import RPHandler
 from idpyoidc.exception import OidcMsgError
 from idpyoidc.message import oidc
 from jwt import decode as jwt_decode
-from requests import Session
 from starlette import status
 from yarl import URL
 
@@ -28,6 +33,23 @@ from ..conf.oidc import oidc_config
 from ..helpers.logger import LOG
 from .service_handler import ServiceHandler
 
+# DPoP handler of the OIDC flow that is run in the current context.
+_oidc_dpop: ContextVar["DPoPHandler | None"] = ContextVar("oidc_dpop", default=None)
+
+
+def _oidc_http_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Send an idpyoidc HTTP request with DPoP proofs if the current OIDC flow uses DPoP.
+
+    :param method: HTTP method.
+    :param url: Request URL.
+    :param kwargs: Additional request arguments.
+    :returns: HTTP response.
+    """
+    dpop = _oidc_dpop.get()
+    if dpop is None:
+        return requests.request(method, url, **kwargs)
+    return dpop.request(method, url, **kwargs)
+
 
 class AuthServiceHandler(ServiceHandler):
     """OIDC service."""
@@ -52,6 +74,9 @@ class AuthServiceHandler(ServiceHandler):
         self.iss = self._config.OIDC_URL
         self.scope = self._config.OIDC_SCOPE
         self._rph: RPHandler | None = None
+        self._rph_lock = threading.Lock()
+        # idpyoidc uses blocking HTTP requests that are run in threads outside the event loop.
+        self._executor = ThreadPoolExecutor(max_workers=self._config.OIDC_MAX_WORKERS, thread_name_prefix="oidc")
 
         LOG.info("Using OIDC issuer: %s", self.iss)
 
@@ -77,9 +102,25 @@ class AuthServiceHandler(ServiceHandler):
     @property
     def rph(self) -> RPHandler:
         if self._rph is None:
-            self._rph = RPHandler(self.oidc_url, client_configs=self.get_client_configs())
+            self._rph = RPHandler(self.oidc_url, client_configs=self.get_client_configs(), httpc=_oidc_http_request)
         return self._rph
 
+    async def close(self) -> None:
+        """Close service handler HTTP client and OIDC threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        await super().close()
+
+    async def _run_blocking[T](self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking idpyoidc call in the OIDC threads.
+
+        :param func: The blocking function.
+        :param args: The function arguments.
+        :returns: The function return value.
+        """
+        loop = asyncio.get_running_loop()
+        # Context variables set by the function are not shared with other calls in the same thread.
+        return await loop.run_in_executor(self._executor, partial(copy_context().run, func, *args))
+
     def get_client_configs(self) -> dict[str, dict[str, Any]]:
         """Create OIDC client configuration.
 
@@ -116,7 +157,7 @@ class AuthServiceHandler(ServiceHandler):
 
         # Generate authentication payload
         try:
-            authorization_url = self.rph.begin("aai")
+            authorization_url = await self._run_blocking(self._begin)
         except Exception as e:
             # This can be caused if config is improperly configured, and
             # idpyoidc is unable to fetch oidc configuration from the given URL
@@ -125,6 +166,18 @@ class AuthServiceHandler(ServiceHandler):
 
         return str(authorization_url)
 
+    def _begin(self) -> str:
+        """Create the OIDC authorization request.
+
+        The OIDC provider configuration is fetched with a blocking request when the OIDC
+        client is first used. The lock prevents concurrent requests from creating several
+        clients.
+
+        :returns: The OIDC authorization endpoint URL.
+        """
+        with self._rph_lock:
+            return str(self.rph.begin("aai"))
+
     async def callback(self, state: str, code: str) -> tuple[str, str, int]:
         """Handle the OIDC callback and return application-specific JWT.
 
@@ -137,6 +190,29 @@ class AuthServiceHandler(ServiceHandler):
         :returns: Application JWT, OIDC access token, and OIDC token expiration Unix timestamp
         """
 
+        # The blocking token and userinfo requests are run outside the event loop.
+        dpop = self.dpop.new_flow() if self.dpop is not None else None
+        userinfo, access_token, exp_time = await self._run_blocking(self._finalize, state, code, dpop)
+
+        # Generate a JWT token for application authentication
+        jwt_token = await AuthService.create_jwt_token_from_userinfo(userinfo)
+
+        return jwt_token, access_token, exp_time
+
+    def _finalize(self, state: str, code: str, dpop: DPoPHandler | None) -> tuple[dict[str, Any], str, int]:
+        """Exchange the OIDC authorization code for tokens and request userinfo.
+
+        Uses blocking HTTP requests.
+
+        :param state: The OIDC Authorization Code flow `state` parameter.
+        :param code: The OIDC Authorization Code flow `code` parameter.
+        :param dpop: DPoP handler of this OIDC flow, or None if DPoP is not used.
+        :returns: OIDC userinfo, OIDC access token, and OIDC token expiration Unix timestamp
+        """
+
+        # Token endpoint and userinfo requests of this flow include DPoP proofs.
+        _oidc_dpop.set(dpop)
+
         # Verify oidc_state and retrieve auth session
         try:
             session_info = self.rph.get_session_information(state)
@@ -148,20 +224,15 @@ class AuthServiceHandler(ServiceHandler):
         # Place authorization_code to session for finalize step
         session_info["code"] = code
 
-        # Setup HTTP interception for DPoP before RPHandler.finalize()
-        if self.use_dpop:
-            self.dpop.setup_http_interception()
-
         try:
             # finalize requests id_token and access_token with code, validates them and requests userinfo data
-            # With DPoP interception enabled, token endpoint requests will include DPoP proofs
             session = self.rph.finalize(self.iss, session_info)
         except KeyError as e:
             LOG.exception("Issuer: %s not found, failed with: %r.", session_info["iss"], e)
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
         except (OidcMsgError, OidcServiceError) as e:
             # Check if this is a "use_dpop_nonce" error
-            if self.use_dpop and "use_dpop_nonce" in str(e):
+            if dpop is not None and "use_dpop_nonce" in str(e):
                 LOG.debug("Received use_dpop_nonce error, retrying token request with server nonce")
                 try:
                     # Remove the failed state from rph to allow retry
@@ -176,13 +247,6 @@ class AuthServiceHandler(ServiceHandler):
                 # This exception is raised if RPHandler encounters other errors with OIDC flow:
                 LOG.exception("OIDC Callback failed with: %r", e)
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-        finally:
-            # Clean up HTTP interception
-            if self.use_dpop:
-                self.dpop.teardown_http_interception()
-
-        # Generate a JWT token for application authentication
-        jwt_token = await AuthService.create_jwt_token_from_userinfo(session["userinfo"])
 
         # Get OIDC access token and expiration time
         try:
@@ -191,7 +255,7 @@ class AuthServiceHandler(ServiceHandler):
             LOG.exception("OIDC access token missing from callback session data")
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-        return jwt_token, access_token, exp_time
+        return session["userinfo"], access_token, exp_time
 
     async def initiate_web_session(
         self, jwt_token: str, oidc_access_token: str, oidc_exp_time: int
@@ -410,77 +474,58 @@ class DPoPHandler:
         except Exception as e:
             raise ValueError(f"Failed to sign DPoP proof: {e}") from e
 
-    def setup_http_interception(self) -> None:
-        """Patch requests.Session.request to inject DPoP headers before each request."""
+    def new_flow(self) -> "DPoPHandler":
+        """Create a DPoP handler for a new authentication attempt.
 
-        self._original_request = Session.request
+        The handler shares the private key and has no nonce. Auth server will provide
+        nonce in response for subsequent requests.
 
-        # Reset nonce to None before each authentication attempt
-        # Auth server will provide nonce in response for subsequent requests
-        self.nonce = None
-        LOG.debug("Reset DPoP nonce to None for new authentication attempt")
-
-        # Apply patch using functools.partial to bind self to the instance method
-        Session.request = partial(self._patched_request)  # type: ignore[method-assign]
+        :returns: DPoP handler without a nonce
+        """
+        dpop = copy.copy(self)
+        dpop.nonce = None
+        return dpop
 
-    def _patched_request(
-        self,
-        session_self: Session,
-        method: str,
-        url: str,
-        **kwargs: Any,
-    ) -> Any:
-        """Patched request method that injects DPoP header and modifies Authorization scheme.
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send an HTTP request with a DPoP header and the DPoP Authorization scheme.
 
         For RFC 9449 DPoP compliance:
         - Token endpoint: Add DPoP proof header
         - Protected resources (userinfo, etc): Add DPoP proof + change Authorization to "DPoP"
 
-        :param session_self: The requests.Session instance (when called via partial binding)
         :param method: HTTP method (GET, POST, etc.)
         :param url: Request URL
         :param kwargs: Additional request arguments
-        :returns: HTTP response from original request method
+        :returns: HTTP response
         """
-        if "headers" not in kwargs:
-            kwargs["headers"] = {}
+        headers = kwargs["headers"] = dict(kwargs.get("headers") or {})
 
         # Add DPoP proof to token endpoint requests
         if "/token" in url:
             # Generate DPoP proof for token endpoint (without access token binding)
-            proof = self.generate_proof(method, url)
-            kwargs["headers"]["DPoP"] = proof
+            headers["DPoP"] = self.generate_proof(method, url)
             LOG.debug("Added DPoP proof to %s %s", method, url)
 
         # Add DPoP proof to protected resource requests (userinfo, etc.)
-        elif "/userinfo" in url or "Authorization" in kwargs["headers"]:
+        elif "/userinfo" in url or "Authorization" in headers:
             # Extract access token from Authorization header if present
             access_token = None
-            auth_header = kwargs["headers"].get("Authorization", "")
+            auth_header = headers.get("Authorization", "")
 
             if auth_header.startswith("Bearer "):
                 # Extract token and change scheme from Bearer to DPoP
                 access_token = auth_header[7:]  # Remove "Bearer " prefix
-                kwargs["headers"]["Authorization"] = f"DPoP {access_token}"
+                headers["Authorization"] = f"DPoP {access_token}"
                 LOG.debug("Changed Authorization scheme from Bearer to DPoP for %s", url)
 
             # Generate DPoP proof with access token binding (ath claim)
-            proof = self.generate_proof(method, url, access_token=access_token)
-            kwargs["headers"]["DPoP"] = proof
+            headers["DPoP"] = self.generate_proof(method, url, access_token=access_token)
             LOG.debug("Added DPoP proof with token binding to %s %s", method, url)
 
-        # Make the original request
-        response = self._original_request(session_self, method, url, **kwargs)
+        response = requests.request(method, url, **kwargs)
 
         # Extract nonce from DPoP-Nonce response header for next request (RFC 9449 Section 8)
         if "DPoP-Nonce" in response.headers:
             self.update_nonce(response.headers["DPoP-Nonce"])
 
         return response
-
-    def teardown_http_interception(self) -> None:
-        """Restore original requests.Session.request method."""
-
-        if hasattr(self, "_original_request"):
-            Session.request = self._original_request  # type: ignore[method-assign]
-            delattr(self, "_original_request")
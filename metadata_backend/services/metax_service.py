@@ -1,26 +1,32 @@
 """Metax Service."""
 
-from datetime import timedelta
 from typing import Any, override
 
 import httpx
-from aiocache import SimpleMemoryCache, cached
 from yarl import URL
 
 from ..api.models.metax import DraftMetax, FieldOfScience, MetaxFields
 from ..api.models.submission import SubmissionMetadata
 from ..api.services.metax import MetaxMapper, MetaxService
 from ..api.services.ror import RorService
+from ..conf.cache import cache_config
 from ..conf.metax import metax_config
+from ..helpers.cache import Cache, CacheBackend
 from ..helpers.logger import LOG
 from .service_handler import ServiceHandler
 
+# Cache namespace for Metax reference data.
+METAX_CACHE_NAMESPACE = "metax"
+
 
 class MetaxServiceHandler(MetaxService, ServiceHandler):
     """Metax Service."""
 
-    def __init__(self) -> None:
-        """Metax Service."""
+    def __init__(self, *, cache_backend: CacheBackend | None = None) -> None:
+        """Metax Service.
+
+        :param cache_backend: The cache backend shared by the workers.
+        """
 
         # Deferred import to avoid loading environment variables when module is imported.
 
@@ -34,12 +40,30 @@ class MetaxServiceHandler(MetaxService, ServiceHandler):
             healthcheck_callback=self.healthcheck_callback,
         )
 
+        config = cache_config()
+        self._fields_of_science: Cache[list[FieldOfScience]] = Cache(
+            METAX_CACHE_NAMESPACE,
+            list[FieldOfScience],
+            maxsize=config.CACHE_MAX_SIZE,
+            ttl=config.CACHE_METAX_TTL,
+            backend=cache_backend,
+        )
+
     @override
-    @cached(ttl=int(timedelta(weeks=1).total_seconds()), cache=SimpleMemoryCache)  # type: ignore
     async def get_fields_of_science(self) -> list[FieldOfScience]:
         """
         Get Metax fields of science.
 
+        The fields of science are cached.
+
+        :return: The Metax fields of science.
+        """
+        return await self._fields_of_science.get("fields-of-science", self._get_fields_of_science)
+
+    async def _get_fields_of_science(self) -> list[FieldOfScience]:
+        """
+        Get Metax fields of science from Metax.
+
         :return: The Metax fields of science.
         """
 
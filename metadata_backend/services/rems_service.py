@@ -1,5 +1,6 @@
 """REMS service."""
 
+import asyncio
 from typing import Any
 from urllib.parse import quote
 
@@ -8,15 +9,24 @@ from yarl import URL
 
 from ..api.exceptions import UserException
 from ..api.models.rems import RemsCatalogueItem, RemsLicense, RemsResource, RemsWorkflow
+from ..api.services.rems import RemsReferenceData
+from ..conf.cache import cache_config
 from ..conf.rems import rems_config
+from ..helpers.cache import Cache, CacheBackend
 from .service_handler import ServiceHandler
 
+# Cache namespace for REMS workflows and licenses.
+REMS_CACHE_NAMESPACE = "rems"
+
 
 class RemsServiceHandler(ServiceHandler):
     """REMS service."""
 
-    def __init__(self) -> None:
-        """REMS service."""
+    def __init__(self, *, cache_backend: CacheBackend | None = None) -> None:
+        """REMS service.
+
+        :param cache_backend: The cache backend shared by the workers.
+        """
 
         config = rems_config()
 
@@ -31,6 +41,16 @@ class RemsServiceHandler(ServiceHandler):
             healthcheck_url=URL(config.REMS_URL) / "api" / "health",
         )
 
+        cache = cache_config()
+        self._reference_data: Cache[RemsReferenceData] = Cache(
+            REMS_CACHE_NAMESPACE,
+            RemsReferenceData,
+            maxsize=1,
+            ttl=cache.CACHE_REMS_TTL,
+            stale_ttl=cache.CACHE_REMS_STALE_TTL,
+            backend=cache_backend,
+        )
+
     @staticmethod
     def get_application_url(catalogue_id: str) -> str:
         """
@@ -42,6 +62,27 @@ class RemsServiceHandler(ServiceHandler):
 
         return f"{rems_config().REMS_URL.rstrip('/')}/application?items={quote(catalogue_id)}"
 
+    async def get_reference_data(self) -> RemsReferenceData:
+        """
+        Get cached active REMS workflows and licenses.
+
+        Expired workflows and licenses are returned while they are retrieved again.
+
+        :returns: The active REMS workflows and licenses.
+        """
+
+        return await self._reference_data.get("reference-data", self._get_reference_data)
+
+    async def _get_reference_data(self) -> RemsReferenceData:
+        """
+        Get active REMS workflows and licenses.
+
+        :returns: The active REMS workflows and licenses.
+        """
+
+        workflows, licenses = await asyncio.gather(self.get_workflows(), self.get_licenses())
+        return RemsReferenceData(workflows=workflows, licenses=licenses)
+
     async def get_workflows(self) -> list[RemsWorkflow]:
         """
         Get active REMS workflows.
@@ -58,6 +99,8 @@ class RemsServiceHandler(ServiceHandler):
         """
         Get active REMS workflow.
 
+        The workflow is not cached because it is used to validate the publish request.
+
         :param organization_id: The REMS organisation id.
         :param workflow_id: The REMS workflow id.
         :returns: The active REMS workflow.
@@ -94,10 +137,12 @@ class RemsServiceHandler(ServiceHandler):
         )
         return [RemsLicense.model_validate(license) for license in response]
 
-    async def get_license(self, organization_id: str | None, license_id: int) -> RemsWorkflow:
+    async def get_license(self, organization_id: str | None, license_id: int) -> RemsLicense:
         """
         Get active REMS license.
 
+        The license is not cached because it is used to validate the publish request.
+
         :param organization_id: The REMS organisation id.
         :param license_id: The REMS license id.
         :returns: The active REMS license.
@@ -113,7 +158,7 @@ class RemsServiceHandler(ServiceHandler):
             if ex.response.status_code == 404:
                 raise UserException(f"Unknown REMS license '{license_id}''")
             raise ex
-        license = RemsWorkflow.model_validate(response)
+        license = RemsLicense.model_validate(response)
         if organization_id and license.organization.id != organization_id:
             raise UserException(f"REMS license '{license_id}' does not belong to REMS organization '{organization_id}'")
         return license
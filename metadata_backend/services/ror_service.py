@@ -1,26 +1,33 @@
 """ROR Service."""
 
 import re
-from datetime import timedelta
+from functools import partial
 from typing import Any, override
 
 import httpx
-from aiocache import SimpleMemoryCache, cached
 from pydantic_string_url import AnyUrl
 from yarl import URL
 
 from ..api.services.ror import RorService
+from ..conf.cache import cache_config
 from ..conf.ror import ror_config
+from ..helpers.cache import Cache, CacheBackend
 from .service_handler import ServiceHandler
 
+# Cache namespace for ROR organisations.
+ROR_CACHE_NAMESPACE = "ror"
+
 
 class RorServiceHandler(RorService, ServiceHandler):
     """ROR Service."""
 
     service_name = "ror"
 
-    def __init__(self) -> None:
-        """ROR Service."""
+    def __init__(self, *, cache_backend: CacheBackend | None = None) -> None:
+        """ROR Service.
+
+        :param cache_backend: The cache backend shared by the workers.
+        """
 
         ror_url = URL(ror_config().ROR_URL)
 
@@ -31,12 +38,32 @@ class RorServiceHandler(RorService, ServiceHandler):
             healthcheck_callback=self.healthcheck_callback,
         )
 
+        config = cache_config()
+        self._organisations: Cache[tuple[AnyUrl, str] | None] = Cache(
+            ROR_CACHE_NAMESPACE,
+            tuple[AnyUrl, str] | None,
+            maxsize=config.CACHE_MAX_SIZE,
+            ttl=config.CACHE_ROR_TTL,
+            negative_ttl=config.CACHE_ROR_NOT_FOUND_TTL,
+            backend=cache_backend,
+        )
+
     @override
-    @cached(ttl=int(timedelta(weeks=1).total_seconds()), cache=SimpleMemoryCache)  # type: ignore
     async def get_organisation(self, organisation: str) -> tuple[AnyUrl, str] | None:
         """
         Get the ROR organisation if it exists and return the ROR identifier and preferred name.
 
+        Organisations are cached, and organisations that are not found are cached for a shorter time.
+
+        :param organisation: the organisation name
+        :return: The ROR identifier and preferred name, or None.
+        """
+        return await self._organisations.get(organisation, partial(self._get_organisation, organisation))
+
+    async def _get_organisation(self, organisation: str) -> tuple[AnyUrl, str] | None:
+        """
+        Get the ROR organisation from ROR.
+
         :param organisation: the organisation name
         :return: The ROR identifier and preferred name, or None.
         """
@@ -0,0 +1,135 @@
+"""Metax field of science mapping benchmark.
+
+Compares matching DataCite subjects to Metax fields of science using linear scans over
+the fields of science against the field of science index used by the Metax mapping.
+
+python -m tests.performance.benchmark_metax_field_of_science --subjects 500
+"""
+
+import argparse
+import re
+import time
+
+from pydantic_string_url import AnyUrl
+from yarl import URL
+
+from metadata_backend.api.models.datacite import Subject
+from metadata_backend.api.models.metax import FieldOfScience
+from metadata_backend.api.services.metax import FieldOfScienceIndex
+
+FIELD_OF_SCIENCE_URL = "http://www.yso.fi/onto/okm-tieteenala/ta{code}"
+
+
+def _create_fields() -> list[FieldOfScience]:
+    """Create fields of science similar to the Metax reference data."""
+    return [
+        FieldOfScience(
+            id=str(code),
+            url=AnyUrl(FIELD_OF_SCIENCE_URL.format(code=code)),
+            pref_label={"en": f"Field of science {code}", "fi": f"Tieteenala {code}", "sv": f"Vetenskapsområde {code}"},
+        )
+        for major in range(1, 7)
+        for code in range(major * 100 + 11, major * 100 + 25)
+    ]
+
+
+def _create_subjects(fields: list[FieldOfScience], count: int) -> list[Subject]:
+    """Create DataCite subjects using the supported formats."""
+    formats = [
+        lambda f: Subject(subject="unknown", valueUri=AnyUrl(str(f.url))),
+        lambda f: Subject(subject=str(f.url).replace("http:", "https:") + "/"),
+        lambda f: Subject(subject=f.code.upper()),
+        lambda f: Subject(subject=f.code.removeprefix("ta")),
+        lambda f: Subject(subject=f.pref_label["fi"].upper()),
+        lambda f: Subject(subject=f"{f.code.removeprefix('ta')} - {f.pref_label['en']}"),
+        lambda f: Subject(subject=f"Unknown subject {f.id}"),
+    ]
+    return [formats[i % len(formats)](fields[(i * 7) % len(fields)]) for i in range(count)]
+
+
+def _normalize(value: str) -> str:
+    return re.sub(r"[^\w]", "", value.lower())
+
+
+def _scan_url(text: str, field: FieldOfScience) -> bool:
+    try:
+        url = URL(text)
+        field_url = URL(str(field.url))
+    except ValueError:
+        return False
+    return bool(
+        url.host
+        and field_url.host
+        and url.path
+        and field_url.path
+        and url.host.lower() == field_url.host.lower()
+        and url.path.lower().rstrip("/") == field_url.path.lower().rstrip("/")
+    )
+
+
+def _scan_code(text: str, field: FieldOfScience) -> bool:
+    normalized_text = _normalize(text)
+    normalized_code = _normalize(field.code)
+    return normalized_code == normalized_text or (
+        normalized_text.isdigit() and normalized_code.endswith(normalized_text)
+    )
+
+
+def _scan_label(text: str, field: FieldOfScience) -> bool:
+    return any(_normalize(label) == _normalize(text) for label in field.pref_label.values())
+
+
+def _scan(fields: list[FieldOfScience], subject: Subject) -> FieldOfScience | None:
+    """Match the subject using linear scans over the fields of science."""
+    for field in fields:
+        if (subject.valueUri is not None and _scan_url(str(subject.valueUri), field)) or _scan_url(
+            subject.subject, field
+        ):
+            return field
+    for field in fields:
+        if _scan_code(subject.subject, field):
+            return field
+    for field in fields:
+        if _scan_label(subject.subject, field):
+            return field
+    for field in fields:
+        match = re.match(r"^\s*(\d+)\s*-\s*(.+)$", subject.subject)
+        if match and (_scan_code(match.group(1), field) or _scan_label(match.group(2), field)):
+            return field
+    return None
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subjects", type=int, default=500, help="Number of DataCite subjects.")
+    args = parser.parse_args()
+
+    fields = _create_fields()
+    subjects = _create_subjects(fields, args.subjects)
+
+    start = time.perf_counter()
+    scanned = [_scan(fields, subject) for subject in subjects]
+    scan_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = FieldOfScienceIndex(fields)
+    build_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [index.get(subject) for subject in subjects]
+    index_elapsed = time.perf_counter() - start
+
+    if scanned != indexed:
+        raise AssertionError("The index and the linear scans matched different fields of science")
+
+    print(f"{'index':>6} build: {build_elapsed * 1000:.2f}ms ({len(fields)} fields of science)")
+    for name, elapsed in (("scan", scan_elapsed), ("index", index_elapsed)):
+        print(
+            f"{name:>6} lookup: {elapsed:.3f}s total, "
+            f"{elapsed / args.subjects * 1_000_000:.1f}us per subject ({args.subjects} subjects)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Metax mapping resource benchmark.
+
+Compares reading the Metax language and geolocation resource files into pydantic models
+and mapping geolocations with a linear scan against building the lookup maps used by
+the Metax mapping.
+
+python -m tests.performance.benchmark_metax_mapping --lookups 1000
+"""
+
+import argparse
+import time
+
+from metadata_backend.api.resource.metax import (
+    _read_metax_mapping_geo_locations,
+    _read_metax_mapping_languages,
+    get_metax_geo_location_uris,
+    get_metax_language_uris,
+)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=1000, help="Number of geolocation lookups.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    languages = _read_metax_mapping_languages()
+    locations = _read_metax_mapping_geo_locations()
+    models_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    language_uris = get_metax_language_uris()
+    location_uris = get_metax_geo_location_uris()
+    maps_elapsed = time.perf_counter() - start
+
+    print(f"{'models':>6} load: {models_elapsed:.3f}s ({len(languages)} languages, {len(locations)} geolocations)")
+    print(f"{'maps':>6} load: {maps_elapsed:.3f}s ({len(language_uris)} languages, {len(location_uris)} geolocations)")
+
+    names = list(location_uris)
+    names = [names[i % len(names)] for i in range(args.lookups)]
+
+    start = time.perf_counter()
+    for name in names:
+        [loc.uri for loc in locations if "en" in loc.pref_label and loc.pref_label["en"] == name]
+    scan_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in names:
+        location_uris.get(name)
+    map_elapsed = time.perf_counter() - start
+
+    for name, elapsed in (("scan", scan_elapsed), ("map", map_elapsed)):
+        print(
+            f"{name:>6} lookup: {elapsed:.3f}s total, "
+            f"{elapsed / args.lookups * 1_000_000:.1f}us per lookup ({args.lookups} lookups)"
+        )
+
+
+if __name__ == "__main__":
+    main()
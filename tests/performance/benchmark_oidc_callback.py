@@ -0,0 +1,97 @@
+"""OIDC login storm benchmark.
+
+Simulates concurrent OIDC callbacks whose blocking token and userinfo requests take the
+given IdP latency. Compares finalizing the OIDC flow in the event loop against the OIDC
+threads, and reports the event loop delay seen by other requests of the worker.
+
+python -m tests.performance.benchmark_oidc_callback --logins 50 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from unittest.mock import MagicMock
+
+from metadata_backend.services.auth_service import AuthServiceHandler
+
+# Interval of the coroutine that measures the event loop delay.
+PROBE_INTERVAL = 0.005
+
+
+def create_handler(latency: float, workers: int) -> AuthServiceHandler:
+    """Create an OIDC service with blocking IdP requests."""
+    os.environ.setdefault("OIDC_URL", "http://localhost/oidc")
+    os.environ.setdefault("OIDC_REDIRECT_URL", "http://localhost")
+    os.environ.setdefault("OIDC_CLIENT_ID", "client")
+    os.environ.setdefault("OIDC_CLIENT_SECRET", "secret")
+    os.environ.setdefault("BASE_URL", "http://localhost")
+    os.environ.setdefault("JWT_KEY", "bW9jay1zZWNyZXQtd2hpY2gtaXMtYXQtbGVhc3QtMzItYnl0ZXM=")
+    os.environ["OIDC_MAX_WORKERS"] = str(workers)
+
+    def finalize(_issuer: str, session_info: dict[str, str]) -> dict[str, dict[str, str]]:
+        # Token and userinfo requests.
+        time.sleep(latency)
+        time.sleep(latency)
+        return {"userinfo": {"sub": session_info["code"]}}
+
+    handler = AuthServiceHandler()
+    rph = MagicMock()
+    rph.get_session_information.side_effect = lambda state: {"iss": handler.iss}
+    rph.finalize.side_effect = finalize
+    rph.get_valid_access_token.return_value = ("oidc-access-token", 0)
+    handler._rph = rph
+    return handler
+
+
+async def probe(stop: asyncio.Event) -> float:
+    """Return the maximum event loop delay until stopped."""
+    max_delay = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        max_delay = max(max_delay, time.perf_counter() - start - PROBE_INTERVAL)
+    return max_delay
+
+
+async def inline_callback(handler: AuthServiceHandler, state: str, code: str) -> None:
+    """Finalize the OIDC flow in the event loop."""
+    handler._finalize(state, code, None)
+
+
+async def login_storm(handler: AuthServiceHandler, logins: int, inline: bool) -> tuple[float, float]:
+    """Run concurrent logins and return the elapsed time and maximum event loop delay."""
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(stop))
+    await asyncio.sleep(PROBE_INTERVAL)
+    start = time.perf_counter()
+    callback = inline_callback if inline else AuthServiceHandler.callback
+    await asyncio.gather(*(callback(handler, f"state-{i}", f"user-{i}") for i in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return elapsed, await probe_task
+
+
+async def run(logins: int, latency: float, workers: int) -> None:
+    """Run the benchmark."""
+    handler = create_handler(latency, workers)
+    try:
+        for name, inline in (("event loop", True), ("threads", False)):
+            elapsed, max_delay = await login_storm(handler, logins, inline)
+            print(f"{name:>10}: {elapsed:.3f}s for {logins} logins, {max_delay * 1000:.1f}ms maximum event loop delay")
+    finally:
+        await handler.close()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=50, help="Number of concurrent logins.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per IdP request.")
+    parser.add_argument("--workers", type=int, default=8, help="Number of OIDC threads.")
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.latency, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Bigpicture XML submission memory benchmark.
+
+Compares the peak resident set size of processing a Bigpicture submission with a large
+image.xml when the XML files are read into memory against incrementally parsing the XML
+files one metadata object at a time. Each mode is run in a separate process.
+
+The metadata object accessions are not assigned to keep the in-memory mode runtime
+reasonable for large submissions.
+
+python -m tests.performance.benchmark_xml_streaming --objects 50000
+"""
+
+import argparse
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from metadata_backend.api.processors.xml.bigpicture import BP_XML_OBJECT_CONFIG
+from metadata_backend.api.processors.xml.processors import (
+    XmlProcessor,
+    XmlStreamingDocumentsProcessor,
+    XmlStringDocumentsProcessor,
+)
+from tests.performance.benchmark_xml_validation import IMAGE_XML
+from tests.utils import BP_SUBMISSION_DIR
+
+
+def write_submission(path: Path, count: int) -> list[Path]:
+    """Write the Bigpicture submission XML files with the given number of images."""
+    files = []
+    for file in sorted(BP_SUBMISSION_DIR.glob("*.xml")):
+        if file.name == "datacite.xml":
+            continue
+        target = path / file.name
+        if file.name == "image.xml":
+            # Write one image at a time to keep the parent process small. The child
+            # processes start with the resident set size of the parent process.
+            with target.open("w", encoding="utf-8") as f:
+                f.write("<IMAGE_SET>\n")
+                for i in range(count):
+                    f.write(IMAGE_XML.format(alias=i))
+                f.write("</IMAGE_SET>\n")
+        else:
+            target.write_bytes(file.read_bytes())
+        files.append(target)
+    return files
+
+
+def peak_rss() -> float:
+    """Return the peak RSS of the current process in MB."""
+    # Linux reports the maximum resident set size in kilobytes.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def current_rss() -> float:
+    """Return the current RSS of the current process in MB."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize() / 1024 / 1024
+
+
+def process(mode: str, files: list[Path]) -> tuple[float, float, float]:
+    """Process the submission and return the elapsed time, the RSS before processing and the peak RSS in MB."""
+    baseline_rss = current_rss()
+    start = time.perf_counter()
+
+    if mode == "in-memory":
+        processor = XmlStringDocumentsProcessor(
+            BP_XML_OBJECT_CONFIG, [file.read_bytes().decode("utf-8") for file in files]
+        )
+        for object_processor in processor.iter_object_processors():
+            XmlProcessor.write_xml(object_processor.xml)
+    else:
+        xmls = [file.open("rb") for file in files]
+        try:
+            streaming_processor = XmlStreamingDocumentsProcessor(BP_XML_OBJECT_CONFIG, xmls)
+            for object_processor in streaming_processor.iter_object_processors():
+                XmlProcessor.write_xml(object_processor.xml)
+        finally:
+            for xml in xmls:
+                xml.close()
+
+    return time.perf_counter() - start, baseline_rss, peak_rss()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=50000, help="Number of IMAGE objects.")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = write_submission(Path(tmp), args.objects)
+        size = sum(file.stat().st_size for file in files) / 1024 / 1024
+
+        for mode in ("in-memory", "streaming"):
+            with ctx.Pool(1) as pool:
+                elapsed, baseline_rss, processing_rss = pool.apply(process, (mode, files))
+            print(
+                f"{mode:>10}: {elapsed:.2f}s, peak RSS {processing_rss:.0f} MB "
+                f"(+{processing_rss - baseline_rss:.0f} MB, {args.objects} objects, {size:.0f} MB XML)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""XML set document validation benchmark.
+
+Compares the per-object cost of validating every metadata object in a set document
+separately against validating the whole set document once.
+
+python -m tests.performance.benchmark_xml_validation --objects 10000
+"""
+
+import argparse
+import time
+
+from lxml import etree
+
+from metadata_backend.api.processors.xml.bigpicture import BP_IMAGE_SCHEMA, BP_XML_OBJECT_CONFIG
+from metadata_backend.api.processors.xml.processors import XmlDocumentProcessor, XmlProcessor
+
+IMAGE_XML = """  <IMAGE alias="{alias}">
+    <IMAGE_OF alias="1"/>
+    <IMAGE_TYPE>
+      <WSI_IMAGE>test</WSI_IMAGE>
+    </IMAGE_TYPE>
+    <FILES>
+      <FILE filename="IMAGES/IMAGE_{alias}/test.dcm" checksum_method="SHA256"
+            checksum="8c3a51adf8f8b1b7a2625d7ac9c12a08dcf9e6a10e87a1f8a215e67f87e7d2a4"
+            unencrypted_checksum="8c3a51adf8f8b1b7a2625d7ac9c12a08dcf9e6a10e87a1f8a215e67f87e7d2a4"
+            filetype="dcm"/>
+    </FILES>
+    <ATTRIBUTES>
+      <STRING_ATTRIBUTE>
+        <TAG>test</TAG>
+        <VALUE>test</VALUE>
+      </STRING_ATTRIBUTE>
+    </ATTRIBUTES>
+  </IMAGE>
+"""
+
+
+def image_set_xml(count: int) -> str:
+    """Return an IMAGE_SET document with the given number of images."""
+    return "<IMAGE_SET>\n" + "".join(IMAGE_XML.format(alias=i) for i in range(count)) + "</IMAGE_SET>\n"
+
+
+def validate_per_object(xml: str) -> float:
+    """Validate each metadata object separately and return the elapsed time."""
+    tree = XmlProcessor.parse_xml(xml)
+    start = time.perf_counter()
+    for element in tree.getroot():
+        XmlProcessor.validate_schema(
+            etree.ElementTree(element),
+            BP_XML_OBJECT_CONFIG.schema_dir,
+            BP_IMAGE_SCHEMA,
+            BP_XML_OBJECT_CONFIG.schema_file_resolver,
+        )
+    return time.perf_counter() - start
+
+
+def validate_set(xml: str) -> float:
+    """Validate the set document once and return the elapsed time."""
+    tree = XmlProcessor.parse_xml(xml)
+    start = time.perf_counter()
+    XmlDocumentProcessor._validate_set_schema(BP_XML_OBJECT_CONFIG, tree, BP_IMAGE_SCHEMA, [tree.getroot()])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=10000, help="Number of IMAGE objects.")
+    args = parser.parse_args()
+
+    xml = image_set_xml(args.objects)
+
+    # Load the XML schema into the cache before timing.
+    validate_set(image_set_xml(1))
+
+    for name, func in (("per-object", validate_per_object), ("set", validate_set)):
+        elapsed = func(xml)
+        print(
+            f"{name:>10} validation: {elapsed:.3f}s total, "
+            f"{elapsed / args.objects * 1_000_000:.1f}us per object ({args.objects} objects)"
+        )
+
+
+if __name__ == "__main__":
+    main()
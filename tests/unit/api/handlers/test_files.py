@@ -53,6 +53,10 @@ async def test_get_files_in_bucket(csc_client) -> None:
     file1 = FileProviderService.File(path="S3://bucket1/file1.txt", bytes=100)
     file2 = FileProviderService.File(path="S3://bucket1/file2.txt", bytes=101)
 
+    async def iter_files(*_args, **_kwargs):
+        for file in (file1, file2):
+            yield file
+
     with (
         patch_verify_authorization,
         patch_verify_user_project,
@@ -68,12 +72,14 @@ async def test_get_files_in_bucket(csc_client) -> None:
         patch_verify_authorization,
         patch_verify_user_project,
         patch(
-            "metadata_backend.api.services.file.FileProviderService.list_files_in_bucket",
-            return_value=FileProviderService.Files([file1, file2]),
-        ),
+            "metadata_backend.api.services.file.FileProviderService.iter_files_in_bucket",
+            side_effect=iter_files,
+        ) as mock_iter_files,
     ):
-        response = csc_client.get(f"{api_prefix_v1}/buckets/{bucket_name}/files?projectId={project_id}")
+        response = csc_client.get(f"{api_prefix_v1}/buckets/{bucket_name}/files?projectId={project_id}&prefix=file")
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        mock_iter_files.assert_called_once_with(bucket_name, prefix="file", delimiter=None)
 
         files = response.json()
         assert len(files) == 2
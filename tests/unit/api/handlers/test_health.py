@@ -43,3 +43,13 @@ async def test_get_health(csc_client):
     health = ServiceHealth.model_validate(result)
     # The database must be UP during unit tests.
     assert health.services["database"] == Health.UP
+
+
+async def test_get_metrics(csc_client):
+    """Test metrics endpoint."""
+    api_prefix = deployment_config().API_PREFIX
+
+    response = csc_client.get(f"{api_prefix}/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE ingest_scanner_leader gauge" in response.text
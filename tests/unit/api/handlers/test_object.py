@@ -777,5 +777,21 @@ async def list_metadata_objects(client, project_id, is_submission_name, submissi
         objects_url = f"{api_prefix_v1}/submissions/{submission_id_or_name}/objects"
     response = client.get(objects_url)
     assert response.status_code == 200
+    assert "Link" not in response.headers
     objects = Objects.model_validate(response.json()).root
+
+    # Test that the pages contain all metadata objects in the same order.
+    paged_objects = []
+    separator = "&" if "?" in objects_url else "?"
+    response = client.get(f"{objects_url}{separator}per_page=2")
+    while True:
+        assert response.status_code == 200
+        page = Objects.model_validate(response.json()).root
+        assert len(page) <= 2
+        paged_objects.extend(page)
+        if "next" not in response.links:
+            break
+        response = client.get(response.links["next"]["url"])
+    assert [o.objectId for o in paged_objects] == [o.objectId for o in objects]
+
     return objects
@@ -48,6 +48,12 @@ from ...patches.rems_service import (
 from .common import SUBMISSION_METADATA
 
 
+async def iter_files(files: list[FileProviderService.File]):
+    """Iterate the bucket files."""
+    for file in files:
+        yield file
+
+
 async def test_publish_submission_sd(csc_client, submission_repository, object_repository, file_repository):
     """Test publishing of CSC submission."""
     api_prefix_v1 = deployment_config().API_PREFIX_V1
@@ -92,7 +98,7 @@ async def test_publish_submission_sd(csc_client, submission_repository, object_r
             new_callable=AsyncMock,
         ) as mock_upload_bp_metadata,
         # File provider
-        patch(f"{file_provider_cls}.list_files_in_bucket", new_callable=AsyncMock) as mock_file_provider,
+        patch(f"{file_provider_cls}.iter_files_in_bucket") as mock_file_provider,
         patch_pid_create_draft_doi(doi) as mock_pid_create_draft_doi,
         patch_pid_publish() as mock_pid_publish,
         # Metax
@@ -115,14 +121,14 @@ async def test_publish_submission_sd(csc_client, submission_repository, object_r
 
         # Test edge case where file service has not received any files.
         submission_id = await submission_repository.add_submission(submission_entity)
-        mock_file_provider.return_value = FileProviderService.Files(root=[])
+        mock_file_provider.side_effect = lambda _bucket: iter_files([])
         response = csc_client.patch(f"{api_prefix_v1}/publish/{submission_id}")
         data = response.json()
         assert response.status_code == 400
         assert data["detail"] == f"Submission '{submission_id}' does not have any data files."
 
         # Mock file provider
-        mock_file_provider.return_value = FileProviderService.Files(
+        mock_file_provider.side_effect = lambda _bucket: iter_files(
             [FileProviderService.File(path=file_path, bytes=file_bytes)]
         )
 
@@ -31,3 +31,41 @@ async def test_rems(csc_client):
 
         organisations = [Organization.model_validate(o) for o in result]
         assert_organisation(organisations)
+
+
+async def test_rems_etag(csc_client):
+    """Test that /rems returns 304 if the organisations have not changed."""
+    api_prefix_v1 = deployment_config().API_PREFIX_V1
+
+    rems_workflows, rems_licenses = create_workflow_and_license()
+
+    with (
+        patch_verify_user_project,
+        patch_verify_authorization,
+        patch_rems_get_workflows(rems_workflows) as get_workflows,
+        patch_rems_get_licenses(rems_licenses),
+    ):
+        response = csc_client.get(f"{api_prefix_v1}/rems")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = csc_client.get(f"{api_prefix_v1}/rems", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        response = csc_client.get(f"{api_prefix_v1}/rems", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert response.status_code == 304
+
+        # The entity tag depends on the language and organisation filter.
+        response = csc_client.get(f"{api_prefix_v1}/rems?language=fi", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert_organisation([Organization.model_validate(o) for o in response.json()])
+
+        response = csc_client.get(f"{api_prefix_v1}/rems?organisation=other", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == []
+
+        # The REMS workflows and licenses are cached.
+        get_workflows.assert_awaited_once()
@@ -1,4 +1,8 @@
 import uuid
+from collections.abc import AsyncIterator
+from unittest.mock import patch
+
+import pytest
 
 from metadata_backend.api.processors.models import ObjectIdentifier
 from metadata_backend.api.processors.xml.bigpicture import (
@@ -47,10 +51,16 @@ from metadata_backend.api.processors.xml.bigpicture import (
     BP_STAINING_SCHEMA_AND_PATH,
     BP_XML_OBJECT_CONFIG,
     _get_xml_object_type_bp,
-    as_xml_set_document,
     update_landing_page_xml,
 )
-from metadata_backend.api.processors.xml.processors import XmlFileDocumentsProcessor, XmlObjectProcessor
+from metadata_backend.api.processors.xml.exceptions import SchemaValidationException
+from metadata_backend.api.processors.xml.models import compile_xpath
+from metadata_backend.api.processors.xml.processors import (
+    XmlDocumentProcessor,
+    XmlFileDocumentsProcessor,
+    XmlObjectProcessor,
+    XmlProcessor,
+)
 from metadata_backend.api.services.submission.bigpicture import is_clinical_policy
 
 from .test_utils import TEST_FILES_DIR, assert_object, assert_ref, assert_ref_length
@@ -517,7 +527,21 @@ async def test_update_landing_page_xml():
     assert expected_xml == await update_landing_page_xml(xml, datacite_url=datacite_url, rems_url=rems_url)
 
 
-async def test_as_xml_set_document_single_document():
+async def _as_xml_set_document(xml_docs: list[str], schema_type: str) -> str:
+    async def _iter_xml_docs() -> AsyncIterator[str]:
+        for xml_doc in xml_docs:
+            yield xml_doc
+
+    chunks = [
+        chunk
+        async for chunk in XmlDocumentProcessor.iter_xml_document(
+            BP_XML_OBJECT_CONFIG, _iter_xml_docs(), schema_type=schema_type
+        )
+    ]
+    return b"".join(chunks).decode("utf-8")
+
+
+async def test_iter_xml_document_single_document():
     """Test aggregating a single XML document into a set element."""
     xml = """<DATASET alias="dataset_1" accession="BPDST001">
   <TITLE>Test Dataset</TITLE>
@@ -533,10 +557,10 @@ async def test_as_xml_set_document_single_document():
 </DATASET_SET>
 """
 
-    assert expected_xml == await as_xml_set_document([xml], BP_DATASET_SCHEMA)
+    assert expected_xml == await _as_xml_set_document([xml], BP_DATASET_SCHEMA)
 
 
-async def test_as_xml_set_document_single_object_type():
+async def test_iter_xml_document_single_object_type():
     """Test aggregating XML documents with a single object type into a set element."""
     xml1 = """<ANNOTATION alias="ann_1" accession="BPANN001">
   <DESCRIPTION>Annotation 1</DESCRIPTION>
@@ -556,10 +580,10 @@ async def test_as_xml_set_document_single_object_type():
 </ANNOTATION_SET>
 """
 
-    assert expected_xml == await as_xml_set_document([xml1, xml2], BP_ANNOTATION_SCHEMA)
+    assert expected_xml == await _as_xml_set_document([xml1, xml2], BP_ANNOTATION_SCHEMA)
 
 
-async def test_as_xml_set_document_tuple_object_type():
+async def test_iter_xml_document_tuple_object_type():
     """Test aggregating XML documents with tuple object type (sample types) into a set element."""
     xml1 = """<BIOLOGICAL_BEING alias="bb_1" accession="BPBB001">
   <DESCRIPTION>Biological Being 1</DESCRIPTION>
@@ -579,4 +603,46 @@ async def test_as_xml_set_document_tuple_object_type():
 </SAMPLE_SET>
 """
 
-    assert expected_xml == await as_xml_set_document([xml1, xml2], BP_SAMPLE_SCHEMA)
+    assert expected_xml == await _as_xml_set_document([xml1, xml2], BP_SAMPLE_SCHEMA)
+
+
+def test_set_document_validated_once():
+    """Test that a set document is validated once instead of once per metadata object."""
+    xml = XmlProcessor.parse_xml(SUBMISSION_DIR / "image.xml")
+
+    with patch.object(XmlProcessor, "validate_schema", wraps=XmlProcessor.validate_schema) as mock_validate:
+        processor = XmlDocumentProcessor(BP_XML_OBJECT_CONFIG, xml)
+
+    assert len(processor.xml_processors) == 2
+    assert mock_validate.call_count == 1
+    assert mock_validate.call_args.args[0] is xml
+
+
+def test_set_document_validation_error_alias():
+    """Test that set document validation errors are mapped to metadata object aliases."""
+    xml = (SUBMISSION_DIR / "image.xml").read_text()
+    # Remove the FILES element from the second image.
+    second = xml.index('<IMAGE alias="2">')
+    start = xml.index("<FILES>", second)
+    end = xml.index("</FILES>", second) + len("</FILES>")
+    xml = xml[:start] + xml[end:]
+
+    with pytest.raises(SchemaValidationException) as e:
+        XmlDocumentProcessor(BP_XML_OBJECT_CONFIG, XmlProcessor.parse_xml(xml))
+
+    assert set(e.value.aliases.values()) == {"2"}
+    assert "('2')" in str(e.value)
+
+
+def test_xpaths_compiled_with_config():
+    """Test that processing metadata objects does not compile XPaths."""
+    files = ["image.xml", "sample.xml", "observation.xml"]
+
+    misses = compile_xpath.cache_info().misses
+    for file in files:
+        processor = XmlDocumentProcessor(BP_XML_OBJECT_CONFIG, XmlProcessor.parse_xml(SUBMISSION_DIR / file))
+        processor.get_object_references()
+        for object_processor in processor.xml_processors:
+            object_processor.get_xml_object_identifier()
+
+    assert compile_xpath.cache_info().misses == misses
@@ -1,14 +1,30 @@
 import uuid
 from io import BytesIO
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from metadata_backend.api.processors.models import ObjectIdentifier
-from metadata_backend.api.processors.xml.bigpicture import BP_IMAGE_OBJECT_TYPE, BP_IMAGE_PATH, BP_IMAGE_SCHEMA
-from metadata_backend.api.processors.xml.processors import XmlObjectProcessor
-from metadata_backend.api.services.submission.bigpicture import BigpictureObjectSubmissionService
-from tests.utils import bp_objects
+from metadata_backend.api.processors.xml.bigpicture import (
+    BP_IMAGE_OBJECT_TYPE,
+    BP_IMAGE_PATH,
+    BP_IMAGE_SCHEMA,
+    BP_XML_OBJECT_CONFIG,
+)
+from metadata_backend.api.processors.xml.exceptions import SchemaValidationException
+from metadata_backend.api.processors.xml.processors import (
+    XmlObjectProcessor,
+    XmlProcessor,
+    XmlStreamingDocumentsProcessor,
+    XmlStreamingSchemaValidator,
+)
+from metadata_backend.api.services.submission.bigpicture import (
+    BigpictureObjectSubmissionService,
+    check_mandatory_constraints,
+)
+from metadata_backend.api.services.submission.submission import ObjectSubmission
+from tests.utils import BP_SUBMISSION_DIR, bp_objects
 
 
 def test_parse_xml_with_string():
@@ -90,3 +106,133 @@ async def test_object_name():
     identifier2.name = identifier1.new_name
     assert docs_processor.is_object_name(identifier1)
     assert docs_processor.is_object_name(identifier2)
+
+
+def test_streaming_documents_processor():
+    """Test that the streaming documents processor produces the same metadata objects."""
+    objects, _ = bp_objects(is_update=False, is_fix=False)
+    processor, _, _ = BigpictureObjectSubmissionService._create_processor(objects)
+    streaming_processor, _, _ = BigpictureObjectSubmissionService._create_processor(objects, streaming=True)
+    assert isinstance(streaming_processor, XmlStreamingDocumentsProcessor)
+
+    for p in (processor, streaming_processor):
+        check_mandatory_constraints(p)
+        for identifier in p.get_object_identifiers():
+            identifier.id = f"{identifier.object_type}_{identifier.name}"
+            p.set_object_id(identifier)
+        assert p.get_references_without_ids() == []
+
+    def _documents(p) -> list[str]:
+        return [XmlObjectProcessor.write_xml(object_processor.xml) for object_processor in p.iter_object_processors()]
+
+    assert streaming_processor.get_object_identifiers() == processor.get_object_identifiers()
+    assert streaming_processor.get_object_references() == processor.get_object_references()
+    assert _documents(streaming_processor) == _documents(processor)
+    assert streaming_processor.get_xml_object_count(BP_IMAGE_SCHEMA, BP_IMAGE_PATH) == 2
+
+    # Metadata objects that are not retained are parsed from the XML files.
+    image_processor = streaming_processor.get_object_processor(BP_IMAGE_SCHEMA, BP_IMAGE_PATH, "2")
+    assert image_processor.get_xml_object_identifier().id == f"{BP_IMAGE_OBJECT_TYPE}_2"
+    with pytest.raises(ValueError, match=f"Unknown '{BP_IMAGE_SCHEMA}' path '{BP_IMAGE_PATH}' name '3'."):
+        streaming_processor.get_object_processor(BP_IMAGE_SCHEMA, BP_IMAGE_PATH, "3")
+
+
+def test_streaming_documents_processor_validates_and_parses_once():
+    """Test that the XML files are validated once and parsed only up to the requested metadata object."""
+
+    class _CountingBytesIO(BytesIO):
+        def __init__(self, data: bytes) -> None:
+            super().__init__(data)
+            self.read_bytes = 0
+
+        def read(self, size: int | None = -1) -> bytes:
+            data = super().read(size)
+            self.read_bytes += len(data)
+            return data
+
+    objects, _ = bp_objects(is_update=False, is_fix=False)
+    _, objects = BigpictureObjectSubmissionService._get_objects(objects)
+    image_xml = (BP_SUBMISSION_DIR / "image.xml").read_text()
+    start = image_xml.index('<IMAGE alias="2">')
+    end = image_xml.index("</IMAGE_SET>")
+    image_xml = (
+        image_xml[:end]
+        + "".join(image_xml[start:end].replace('<IMAGE alias="2">', f'<IMAGE alias="{i}">') for i in range(3, 1000))
+        + image_xml[end:]
+    )
+
+    xmls = [
+        _CountingBytesIO(image_xml.encode() if o.filename == "image.xml" else o.read_document().encode())
+        for o in objects
+    ]
+    image = next(xml for xml, o in zip(xmls, objects, strict=True) if o.filename == "image.xml")
+
+    with patch.object(XmlProcessor, "validate_schema", side_effect=AssertionError("validated per object")):
+        processor = XmlStreamingDocumentsProcessor(BP_XML_OBJECT_CONFIG, xmls)
+        assert processor.get_xml_object_count(BP_IMAGE_SCHEMA, BP_IMAGE_PATH) == 999
+        # The root element is read before the XML file is parsed and validated.
+        assert len(image_xml) <= image.read_bytes < 2 * len(image_xml)
+
+        image.read_bytes = 0
+        assert (
+            processor.get_object_processor(BP_IMAGE_SCHEMA, BP_IMAGE_PATH, "1").get_xml_object_identifier().name == "1"
+        )
+        assert image.read_bytes < len(image_xml) / 2
+
+        # XML files without the requested metadata objects are not parsed.
+        for xml in xmls:
+            xml.read_bytes = 0
+        assert len(list(processor.iter_object_processors(BP_IMAGE_SCHEMA, BP_IMAGE_PATH))) == 999
+        assert [xml.read_bytes > 0 for xml in xmls] == [xml is image for xml in xmls]
+
+
+def test_iter_xml_objects_releases_objects():
+    """Test that the incrementally parsed metadata objects are cleared."""
+    xml = b"<IMAGE_SET>" + b"".join(f'<IMAGE alias="{i}"><FILES/></IMAGE>'.encode() for i in range(3)) + b"</IMAGE_SET>"
+
+    elements = []
+    for element in XmlProcessor.iter_xml_objects(BP_XML_OBJECT_CONFIG, BytesIO(xml)):
+        assert element.get("alias") == str(len(elements))
+        assert len(element) == 1
+        elements.append(element)
+
+    assert all(len(element) == 0 and element.get("alias") is None for element in elements[:-1])
+    assert len(elements[-1].getparent()) == 1
+
+
+def test_streaming_documents_processor_validation_error_alias():
+    """Test that schema validation errors contain the metadata object alias."""
+    objects, _ = bp_objects(is_update=False, is_fix=False)
+    objects = [
+        ObjectSubmission(filename=o.filename, document=o.document.replace("<FILES>", "<UNKNOWN/><FILES>", 1))
+        if o.filename == "image.xml"
+        else o
+        for o in objects
+    ]
+
+    with pytest.raises(SchemaValidationException) as e:
+        BigpictureObjectSubmissionService._create_processor(objects, streaming=True)
+
+    assert set(e.value.aliases.values()) == {"1"}
+    assert "('1')" in str(e.value)
+
+
+def test_streaming_schema_validator():
+    """Test that XML documents are validated incrementally in chunks."""
+    xml = (BP_SUBMISSION_DIR / "image.xml").read_bytes()
+
+    def _validate(xml_: bytes) -> None:
+        validator = XmlStreamingSchemaValidator(
+            BP_XML_OBJECT_CONFIG.schema_dir, BP_IMAGE_SCHEMA, BP_XML_OBJECT_CONFIG.schema_file_resolver
+        )
+        for i in range(0, len(xml_), 10):
+            validator.feed(xml_[i : i + 10])
+        validator.close()
+
+    _validate(xml)
+
+    with pytest.raises(SchemaValidationException, match="UNKNOWN"):
+        _validate(xml.replace(b"<FILES>", b"<UNKNOWN/><FILES>", 1))
+
+    with pytest.raises(SchemaValidationException):
+        _validate(xml[:-20])
@@ -5,33 +5,37 @@ from unittest.mock import patch
 from pydantic import TypeAdapter
 
 from metadata_backend.api.resource.metax import (
-    METAX_MAPPING_GEO_LOCATIONS,
-    METAX_MAPPING_LANGUAGES,
     MetaxMappingGeoLocations,
     MetaxMappingLanguages,
     MetaxMappingResourceType,
+    _read_metax_mapping_geo_locations,
+    _read_metax_mapping_languages,
+    get_metax_geo_location_uris,
+    get_metax_language_uris,
     write_metax_mapping_geo_locations,
     write_metax_mapping_languages,
 )
 
 
 def test_read_write_metax_mapping_languages(tmp_path):
+    metax_mapping_languages = _read_metax_mapping_languages()
     with patch("metadata_backend.api.resource.metax._resource_file") as mock_resource_file:
         tmp_file = tmp_path / "languages.json"
 
         mock_resource_file.return_value = tmp_file
 
         # Write existing data to a tmp file.
-        write_metax_mapping_languages(MetaxMappingResourceType.METAX_MAPPING_LANGUAGES, METAX_MAPPING_LANGUAGES)
+        write_metax_mapping_languages(MetaxMappingResourceType.METAX_MAPPING_LANGUAGES, metax_mapping_languages)
 
         assert tmp_file.exists()
 
         # Read data from tmp file.
         languages = TypeAdapter(MetaxMappingLanguages).validate_json(tmp_file.read_text(encoding="utf-8"))
-        assert languages == METAX_MAPPING_LANGUAGES
+        assert languages == metax_mapping_languages
 
 
 def test_read_write_metax_mapping_geo_locations(tmp_path):
+    metax_mapping_geo_locations = _read_metax_mapping_geo_locations()
     with patch("metadata_backend.api.resource.metax._resource_file") as mock_resource_file:
         tmp_file = tmp_path / "geo_locations.json"
 
@@ -39,7 +43,7 @@ def test_read_write_metax_mapping_geo_locations(tmp_path):
 
         # Write existing data to a tmp file.
         write_metax_mapping_geo_locations(
-            MetaxMappingResourceType.METAX_MAPPING_GEO_LOCATIONS, METAX_MAPPING_GEO_LOCATIONS
+            MetaxMappingResourceType.METAX_MAPPING_GEO_LOCATIONS, metax_mapping_geo_locations
         )
 
         assert tmp_file.exists()
@@ -47,4 +51,25 @@ def test_read_write_metax_mapping_geo_locations(tmp_path):
         # Read data from tmp file.
         json = tmp_file.read_text(encoding="utf-8")
         locations = TypeAdapter(MetaxMappingGeoLocations).validate_json(json)
-        assert locations == METAX_MAPPING_GEO_LOCATIONS
+        assert locations == metax_mapping_geo_locations
+
+
+def test_get_metax_language_uris():
+    languages = _read_metax_mapping_languages()
+    uris = get_metax_language_uris()
+    assert uris == {code: language.uri for code, language in languages.items()}
+    assert uris["fi"] == "http://lexvo.org/id/iso639-3/fin"
+    assert get_metax_language_uris() is uris
+
+
+def test_get_metax_geo_location_uris():
+    locations = _read_metax_mapping_geo_locations()
+    uris = get_metax_geo_location_uris()
+    expected: dict[str, str] = {}
+    for location in reversed(locations):
+        if "en" in location.pref_label:
+            # The first location with the English label is used.
+            expected[location.pref_label["en"]] = location.uri
+    assert uris == expected
+    assert uris["Helsinki"].startswith("http://www.yso.fi/onto/yso/")
+    assert get_metax_geo_location_uris() is uris
@@ -34,10 +34,10 @@ def _replace_object_document(
     return updated
 
 
-def _prepare_files(objects: list[ObjectSubmission], submission_id: str = "SUB_1"):
+def _prepare_files(objects: list[ObjectSubmission], submission_id: str = "SUB_1", streaming: bool = False):
     """Create processor from full BP object set and run prepare_files."""
 
-    processor, _, _ = BigpictureObjectSubmissionService._create_processor(objects)
+    processor, _, _ = BigpictureObjectSubmissionService._create_processor(objects, streaming=streaming)
     service = object.__new__(BigpictureObjectSubmissionService)
     service._processor = processor
     return service.prepare_files(submission_id)
@@ -56,11 +56,12 @@ def test_prepare_create_submission_uses_dataset_alias_as_name():
     assert submission.name == "1"
 
 
-def test_prepare_files_valid_image_and_annotation():
+@pytest.mark.parametrize("streaming", [False, True])
+def test_prepare_files_valid_image_and_annotation(streaming: bool):
     """Valid BP objects should produce dataset-prefixed image and annotation file paths."""
 
     objects, _ = bp_objects(is_update=False)
-    files = _prepare_files(objects, "SUB_1")
+    files = _prepare_files(objects, "SUB_1", streaming=streaming)
 
     paths = {f.path for f in files}
     expected_paths = {
@@ -233,6 +233,38 @@ async def test_revoke_api_key_by_key_id(jwt_config, service) -> None:
     assert all(api_key.key_id != key_id for api_key in await service.list_api_keys(user_id))
 
 
+async def test_validate_api_key_cache(jwt_config, service) -> None:
+    """Test that validated API keys are cached until they are revoked."""
+    user_id = "test-user"
+    key_id = "test-key"
+
+    api_key = await service.create_api_key(user_id, key_id)
+    other_api_key = await service.create_api_key(user_id, "other-test-key")
+
+    with patch.object(ApiKeyRepository, "get_api_key", autospec=True, wraps=ApiKeyRepository.get_api_key) as mock:
+        assert await service.validate_api_key(api_key) == user_id
+        assert await service.validate_api_key(api_key) == user_id
+        assert mock.await_count == 1
+
+        # Wrong API key with a valid key id is not cached.
+        wrong_api_key = f"{api_key.split('.', 1)[0]}.{'x' * API_KEY_LENGTH}"
+        assert await service.validate_api_key(wrong_api_key) is None
+        assert await service.validate_api_key(wrong_api_key) is None
+        assert mock.await_count == 3
+
+        # Revoking the API key removes it from the cache.
+        assert await service.validate_api_key(other_api_key) == user_id
+        await service.revoke_api_key(user_id, key_id)
+        assert await service.validate_api_key(api_key) is None
+        assert await service.validate_api_key(other_api_key) == user_id
+        assert mock.await_count == 5
+
+        # API keys revoked in other workers are removed using the generated key id.
+        service.invalidate_api_key(other_api_key.split(".", 1)[0])
+        assert await service.validate_api_key(other_api_key) == user_id
+        assert mock.await_count == 6
+
+
 async def test_list_api_keys(jwt_config, service) -> None:
     """Test that we can list API keys for a given user."""
     user_id = "user123"
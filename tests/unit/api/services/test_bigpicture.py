@@ -1,7 +1,9 @@
 """Tests for Bigpicture API service."""
 
+import asyncio
+import os
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -11,12 +13,28 @@ from metadata_backend.api.services.bigpicture import upload_bp_metadata_xmls
 from metadata_backend.api.services.file import S3InboxSDAService
 
 
+def mock_add_file_to_bucket() -> AsyncMock:
+    """Mock S3 upload that reads the streamed body and returns its size."""
+
+    async def _add_file_to_bucket(**kwargs):
+        body = b"".join([chunk async for chunk in kwargs["body"]])
+        kwargs["body"] = body
+        uploaded.append(kwargs)
+        return len(body)
+
+    uploaded: list[dict] = []
+    mock = AsyncMock(side_effect=_add_file_to_bucket)
+    mock.uploaded = uploaded
+    return mock
+
+
 async def test_upload_bp_metadata_xmls_uses_expected_object_keys_and_payloads():
     """BP metadata upload helper should upload plaintext XML to expected DATASET_{id}/METADATA keys."""
 
     submission_id = "123"
     file_provider = S3InboxSDAService(AsyncMock())
-    file_provider._add_file_to_bucket = AsyncMock()  # type: ignore[method-assign]
+    file_provider.s3_client = MagicMock()  # type: ignore[method-assign]
+    file_provider._add_file_to_bucket = mock_add_file_to_bucket()  # type: ignore[method-assign]
 
     object_docs: dict[str, list[str]] = {
         "dataset": ["<DATASET/>"],
@@ -55,7 +73,7 @@ async def test_upload_bp_metadata_xmls_uses_expected_object_keys_and_payloads():
 
     services = SimpleNamespace(
         file_provider=file_provider,
-        file=SimpleNamespace(is_file_by_path=AsyncMock(return_value=False), add_file=AsyncMock()),
+        file=SimpleNamespace(add_missing_files=AsyncMock()),
         submission=SimpleNamespace(get_bucket=AsyncMock(return_value="test-bucket")),
         registration=SimpleNamespace(
             get_registration=AsyncMock(
@@ -65,7 +83,7 @@ async def test_upload_bp_metadata_xmls_uses_expected_object_keys_and_payloads():
         object=SimpleNamespace(get_xml_documents=get_xml_documents),
     )
 
-    with patch("metadata_backend.api.services.bigpicture.XmlProcessor.validate_schema"):
+    with patch("metadata_backend.api.services.bigpicture.XmlStreamingSchemaValidator", MagicMock()):
         await upload_bp_metadata_xmls(services, submission_id, "request-user", "oidc-token")
 
     expected_keys = {
@@ -85,15 +103,18 @@ async def test_upload_bp_metadata_xmls_uses_expected_object_keys_and_payloads():
     uploaded_keys = {call.kwargs["object_key"] for call in file_provider._add_file_to_bucket.await_args_list}
     assert uploaded_keys == expected_keys
 
-    assert services.file.add_file.await_count == len(expected_keys)
-    added_paths = {call.args[0].path for call in services.file.add_file.await_args_list}
-    assert added_paths == expected_keys
-
     uploaded_by_key = {
-        call.kwargs["object_key"]: call.kwargs["body"].decode("utf-8")
-        for call in file_provider._add_file_to_bucket.await_args_list
+        upload["object_key"]: upload["body"].decode("utf-8") for upload in file_provider._add_file_to_bucket.uploaded
     }
 
+    file_provider.s3_client.assert_called_once_with("request-user", "request-user", "oidc-token")
+    s3 = file_provider.s3_client.return_value.__aenter__.return_value
+    assert all(call.kwargs["s3_client"] is s3 for call in file_provider._add_file_to_bucket.await_args_list)
+
+    services.file.add_missing_files.assert_awaited_once()
+    added_files = {file.path: file.bytes for file in services.file.add_missing_files.await_args.args[1]}
+    assert added_files == {key: len(xml.encode("utf-8")) for key, xml in uploaded_by_key.items()}
+
     assert "<DATASET_SET>" in uploaded_by_key["DATASET_123/METADATA/dataset.xml.c4gh"]
     assert "<SAMPLE_SET>" in uploaded_by_key["DATASET_123/METADATA/sample.xml.c4gh"]
     assert '<BIOLOGICAL_BEING alias="1"/>' in uploaded_by_key["DATASET_123/METADATA/sample.xml.c4gh"]
@@ -110,6 +131,7 @@ async def test_upload_bp_metadata_xmls_raises_on_upload_error():
     """Upload errors in BP metadata upload helper should fail publish flow."""
 
     file_provider = S3InboxSDAService(AsyncMock())
+    file_provider.s3_client = MagicMock()  # type: ignore[method-assign]
     file_provider._add_file_to_bucket = AsyncMock()  # type: ignore[method-assign]
 
     def get_xml_documents(_submission_id: str, object_type: str | tuple[str, ...]):
@@ -121,7 +143,7 @@ async def test_upload_bp_metadata_xmls_raises_on_upload_error():
 
     services = SimpleNamespace(
         file_provider=file_provider,
-        file=SimpleNamespace(is_file_by_path=AsyncMock(return_value=False), add_file=AsyncMock()),
+        file=SimpleNamespace(add_missing_files=AsyncMock()),
         submission=SimpleNamespace(get_bucket=AsyncMock(return_value="test-bucket")),
         registration=SimpleNamespace(get_registration=AsyncMock(return_value=None)),
         object=SimpleNamespace(get_xml_documents=get_xml_documents),
@@ -129,8 +151,95 @@ async def test_upload_bp_metadata_xmls_raises_on_upload_error():
 
     file_provider._add_file_to_bucket.side_effect = SystemException("upload failed")  # type: ignore[method-assign]
 
-    with patch("metadata_backend.api.services.bigpicture.XmlProcessor.validate_schema"):
+    with (
+        patch.dict(os.environ, {"BP_METADATA_UPLOAD_CONCURRENCY": "1"}),
+        patch("metadata_backend.api.services.bigpicture.XmlStreamingSchemaValidator", MagicMock()),
+    ):
         with pytest.raises(SystemException, match="upload failed"):
             await upload_bp_metadata_xmls(services, "123", "request-user", "oidc-token")
 
-    services.file.add_file.assert_not_awaited()
+    services.file.add_missing_files.assert_not_awaited()
+
+
+async def test_upload_bp_metadata_xmls_raises_on_invalid_xml():
+    """Generated XML documents are validated while they are uploaded."""
+
+    file_provider = S3InboxSDAService(AsyncMock())
+    file_provider.s3_client = MagicMock()  # type: ignore[method-assign]
+    file_provider._add_file_to_bucket = mock_add_file_to_bucket()  # type: ignore[method-assign]
+
+    def get_xml_documents(_submission_id: str, object_type: str | tuple[str, ...]):
+        async def _iter():
+            if "dataset" in object_type:
+                yield '<DATASET alias="1"><UNKNOWN/></DATASET>'
+
+        return _iter()
+
+    services = SimpleNamespace(
+        file_provider=file_provider,
+        file=SimpleNamespace(add_missing_files=AsyncMock()),
+        registration=SimpleNamespace(get_registration=AsyncMock(return_value=None)),
+        object=SimpleNamespace(get_xml_documents=get_xml_documents),
+    )
+
+    # Upload one file at a time to fail on the dataset XML before the missing mandatory XML files.
+    with (
+        patch.dict(os.environ, {"BP_METADATA_UPLOAD_CONCURRENCY": "1"}),
+        pytest.raises(SystemException, match="Generated XML document is not valid for dataset.xml.c4gh"),
+    ):
+        await upload_bp_metadata_xmls(services, "123", "request-user", "oidc-token")
+
+    services.file.add_missing_files.assert_not_awaited()
+
+
+async def test_upload_bp_metadata_xmls_concurrently():
+    """XML files are uploaded concurrently up to the concurrency limit."""
+
+    file_provider = S3InboxSDAService(AsyncMock())
+    file_provider.s3_client = MagicMock()  # type: ignore[method-assign]
+
+    running = 0
+    max_running = 0
+
+    async def _add_file_to_bucket(**kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        body = b"".join([chunk async for chunk in kwargs["body"]])
+        await asyncio.sleep(0.01)
+        running -= 1
+        return len(body)
+
+    file_provider._add_file_to_bucket = AsyncMock(side_effect=_add_file_to_bucket)  # type: ignore[method-assign]
+
+    def get_xml_documents(_submission_id: str, object_type: tuple[str, ...]):
+        async def _iter():
+            if object_type[0] == "landing_page":
+                yield (
+                    '<LANDING_PAGE alias="1"><DATASET_REF alias="1"/><ATTRIBUTES>'
+                    "<STRING_ATTRIBUTE><TAG>test</TAG><VALUE>test</VALUE></STRING_ATTRIBUTE>"
+                    "</ATTRIBUTES></LANDING_PAGE>"
+                )
+            else:
+                yield f"<{object_type[0].upper()}/>"
+
+        return _iter()
+
+    services = SimpleNamespace(
+        file_provider=file_provider,
+        file=SimpleNamespace(add_missing_files=AsyncMock()),
+        registration=SimpleNamespace(get_registration=AsyncMock(return_value=None)),
+        object=SimpleNamespace(get_xml_documents=get_xml_documents),
+    )
+
+    with (
+        patch.dict(os.environ, {"BP_METADATA_UPLOAD_CONCURRENCY": "3"}),
+        patch("metadata_backend.api.services.bigpicture.XmlStreamingSchemaValidator", MagicMock()),
+    ):
+        await upload_bp_metadata_xmls(services, "123", "request-user", "oidc-token")
+
+    assert file_provider._add_file_to_bucket.await_count == 9
+    assert max_running == 3
+
+    services.file.add_missing_files.assert_awaited_once()
+    assert len(services.file.add_missing_files.await_args.args[1]) == 9
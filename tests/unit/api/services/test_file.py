@@ -1,17 +1,25 @@
+import os
 import socket
 from io import BytesIO
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 import ujson
 from aiobotocore import session
+from crypt4gh import SEGMENT_SIZE
 from crypt4gh.lib import decrypt
 from moto.server import ThreadedMotoServer
 
 from metadata_backend.api.exceptions import UserException
 from metadata_backend.api.models.models import File as SubmissionFile
 from metadata_backend.api.models.sda import FileItem
-from metadata_backend.api.services.file import S3AllasFileProviderService, S3InboxSDAService
+from metadata_backend.api.services.file import (
+    CRYPT4GH_KEY_PARSE_SECONDS,
+    MULTIPART_UPLOAD_PART_SIZE,
+    Crypt4GHEncryptor,
+    S3AllasFileProviderService,
+    S3InboxSDAService,
+)
 from metadata_backend.conf.s3 import s3_config
 from metadata_backend.services.keystone_service import KeystoneServiceHandler
 from tests.utils import generate_crypt4gh_keypair_env_values
@@ -58,7 +66,6 @@ async def s3_endpoint(monkeypatch):
 @pytest.mark.asyncio
 async def test_verify_user_file_exists(s3_endpoint):
     service = S3AllasFileProviderService()
-    session = service._session
 
     # Bucket and file does not exist.
     size = await service._verify_user_file(bucket, file)
@@ -66,7 +73,7 @@ async def test_verify_user_file_exists(s3_endpoint):
     with pytest.raises(UserException):
         await service.verify_user_file(bucket, file)
 
-    async with session.client("s3", endpoint_url=s3_endpoint) as s3:
+    async with service._static_s3_client() as s3:
         # Create bucket.
         await s3.create_bucket(Bucket=bucket)
 
@@ -91,9 +98,8 @@ async def test_verify_user_file_exists(s3_endpoint):
 @pytest.mark.asyncio
 async def test_list_buckets_and_files(s3_endpoint):
     service = S3AllasFileProviderService()
-    session = service._session
 
-    async with session.client("s3", endpoint_url=s3_endpoint) as s3:
+    async with service._static_s3_client() as s3:
         # No buckets yet
         with pytest.raises(UserException):
             await service.list_buckets(creds)
@@ -119,12 +125,40 @@ async def test_list_buckets_and_files(s3_endpoint):
         assert files.root[0].bytes == len(content)
 
 
+@pytest.mark.asyncio
+async def test_iter_files_in_bucket_pages_and_prefix(s3_endpoint):
+    service = S3AllasFileProviderService()
+
+    async with service._static_s3_client() as s3:
+        await s3.create_bucket(Bucket=bucket)
+        await service.update_bucket_policy(bucket, creds)
+        keys = ["a/1", "a/2", "a/b/3", "c/4", "5"]
+        for key in keys:
+            await s3.put_object(Bucket=bucket, Key=key, Body=content)
+
+    # All files are listed over several pages.
+    with patch("metadata_backend.api.services.file.S3_LIST_PAGE_SIZE", 2):
+        files = [file async for file in service.iter_files_in_bucket(bucket)]
+    assert sorted(file.path for file in files) == sorted(f"S3://{bucket}/{key}" for key in keys)
+    assert all(file.bytes == len(content) for file in files)
+
+    files = [file async for file in service.iter_files_in_bucket(bucket, prefix="a/")]
+    assert sorted(file.path for file in files) == [f"S3://{bucket}/a/1", f"S3://{bucket}/a/2", f"S3://{bucket}/a/b/3"]
+
+    files = [file async for file in service.iter_files_in_bucket(bucket, prefix="a/", delimiter="/")]
+    assert sorted(file.path for file in files) == [f"S3://{bucket}/a/1", f"S3://{bucket}/a/2"]
+
+    with pytest.raises(UserException, match="No files found"):
+        _ = [file async for file in service.iter_files_in_bucket(bucket, prefix="missing/")]
+
+    await service.close()
+
+
 @pytest.mark.asyncio
 async def test_update_and_verify_bucket_policy(s3_endpoint):
     service = S3AllasFileProviderService()
-    session = service._session
 
-    async with session.client("s3", endpoint_url=s3_endpoint) as s3:
+    async with service._static_s3_client() as s3:
         # Cannot assign to non-existent bucket
         with pytest.raises(UserException):
             resp = await service.update_bucket_policy(bucket, creds)
@@ -167,9 +201,63 @@ async def test_load_crypt4gh_keys_with_generated_keypair(monkeypatch, tmp_path):
     assert len(recipient_public_key) == 32
 
 
+async def test_load_crypt4gh_keys_once(monkeypatch, tmp_path):
+    """Crypt4GH keys should be parsed once and again only when reloaded."""
+    passphrase = "unit-test-passphrase"
+    sender_env, recipient_env = generate_crypt4gh_keypair_env_values(tmp_path, passphrase)
+
+    monkeypatch.setenv("CRYPT4GH_PRIVATE_KEY", sender_env)
+    monkeypatch.setenv("CRYPT4GH_PUBLIC_KEY", recipient_env)
+    monkeypatch.setenv("CRYPT4GH_PRIVATE_KEY_PASSPHRASE", passphrase)
+
+    service = S3InboxSDAService(AsyncMock())
+    with patch.object(
+        S3InboxSDAService, "_parse_crypt4gh_keys", wraps=S3InboxSDAService._parse_crypt4gh_keys
+    ) as mock_parse:
+        keys = await service.load_crypt4gh_keys()
+        assert await service._load_crypt4gh_keys() is keys
+        assert await service.load_crypt4gh_keys() is keys
+        assert mock_parse.call_count == 1
+
+        reloaded_keys = await service.load_crypt4gh_keys(reload=True)
+        assert reloaded_keys == keys
+        assert reloaded_keys is not keys
+        assert mock_parse.call_count == 2
+
+
+async def test_reload_rotated_crypt4gh_keys_from_secrets_dir(monkeypatch, tmp_path):
+    """Reloaded Crypt4GH keys should be read again from the secrets directory."""
+    passphrase = "unit-test-passphrase"
+    secrets_dir = tmp_path / "secrets"
+    secrets_dir.mkdir()
+
+    def write_keys(key_dir):
+        key_dir.mkdir()
+        sender_env, recipient_env = generate_crypt4gh_keypair_env_values(key_dir, passphrase)
+        (secrets_dir / "CRYPT4GH_PRIVATE_KEY").write_text(sender_env)
+        (secrets_dir / "CRYPT4GH_PUBLIC_KEY").write_text(recipient_env)
+        (secrets_dir / "CRYPT4GH_PRIVATE_KEY_PASSPHRASE").write_text(passphrase)
+
+    for name in ("CRYPT4GH_PRIVATE_KEY", "CRYPT4GH_PUBLIC_KEY", "CRYPT4GH_PRIVATE_KEY_PASSPHRASE"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("CRYPT4GH_SECRETS_DIR", str(secrets_dir))
+
+    write_keys(tmp_path / "keys1")
+    service = S3InboxSDAService(AsyncMock())
+    parse_count = CRYPT4GH_KEY_PARSE_SECONDS.count()
+    keys = await service.load_crypt4gh_keys()
+
+    write_keys(tmp_path / "keys2")
+    assert await service.load_crypt4gh_keys() is keys
+    rotated_keys = await service.load_crypt4gh_keys(reload=True)
+    assert rotated_keys[0] != keys[0]
+    assert rotated_keys[1] != keys[1]
+    assert CRYPT4GH_KEY_PARSE_SECONDS.count() == parse_count + 2
+
+
 @pytest.mark.asyncio
-async def test_encrypt_file_roundtrip_with_generated_keys(monkeypatch, tmp_path):
-    """_encrypt_file should encrypt bytes that can be decrypted with matching private key."""
+async def test_crypt4gh_encryptor_roundtrip_with_generated_keys(monkeypatch, tmp_path):
+    """Crypt4GHEncryptor should encrypt chunks that can be decrypted with matching private key."""
     passphrase = "unit-test-passphrase"
     sender_env, recipient_env = generate_crypt4gh_keypair_env_values(tmp_path, passphrase)
 
@@ -180,22 +268,37 @@ async def test_encrypt_file_roundtrip_with_generated_keys(monkeypatch, tmp_path)
     service = S3InboxSDAService(AsyncMock())
     sender_secret_key, recipient_public_key = await service._load_crypt4gh_keys()
 
-    plaintext = b"<DATASET><ID>123</ID></DATASET>"
-    encrypted = await service._encrypt_file(plaintext, sender_secret_key, recipient_public_key)
+    for plaintext in (
+        b"",
+        b"<DATASET><ID>123</ID></DATASET>",
+        os.urandom(SEGMENT_SIZE),
+        os.urandom(3 * SEGMENT_SIZE + 7),
+    ):
+        encryptor = Crypt4GHEncryptor(sender_secret_key, recipient_public_key)
+        encrypted = b"".join(encryptor.update(plaintext[i : i + 1000]) for i in range(0, len(plaintext), 1000))
+        encrypted += encryptor.finalize()
 
-    assert encrypted
-    assert encrypted != plaintext
+        assert encrypted
+        assert plaintext not in encrypted or not plaintext
 
-    decrypted_out = BytesIO()
-    decrypt([(0, sender_secret_key, None)], BytesIO(encrypted), decrypted_out)
-    assert decrypted_out.getvalue() == plaintext
+        decrypted_out = BytesIO()
+        decrypt([(0, sender_secret_key, None)], BytesIO(encrypted), decrypted_out)
+        assert decrypted_out.getvalue() == plaintext
 
 
-async def test_sda_inbox_add_file_to_bucket_uploads_payload(s3_endpoint):
+@pytest.mark.parametrize("size", [100, MULTIPART_UPLOAD_PART_SIZE + SEGMENT_SIZE + 1])
+async def test_sda_inbox_add_file_to_bucket_uploads_payload(s3_endpoint, monkeypatch, tmp_path, size):
+    passphrase = "unit-test-passphrase"
+    sender_env, recipient_env = generate_crypt4gh_keypair_env_values(tmp_path, passphrase)
+
+    monkeypatch.setenv("CRYPT4GH_PRIVATE_KEY", sender_env)
+    monkeypatch.setenv("CRYPT4GH_PUBLIC_KEY", recipient_env)
+    monkeypatch.setenv("CRYPT4GH_PRIVATE_KEY_PASSPHRASE", passphrase)
+
     service = S3InboxSDAService(AsyncMock())
+    sender_secret_key, _ = await service._load_crypt4gh_keys()
 
-    upload_body = b"plaintext-xml-payload"
-    encrypted_body = b"encrypted-binary-payload"
+    upload_body = os.urandom(size)
     object_key = "DATASET_123/METADATA/dataset.xml.c4gh"
 
     # Create the target bucket first.
@@ -209,16 +312,20 @@ async def test_sda_inbox_add_file_to_bucket_uploads_payload(s3_endpoint):
     ) as s3:
         await s3.create_bucket(Bucket=bucket)
 
-    service._load_crypt4gh_keys = AsyncMock(return_value=(object(), object()))
-    service._encrypt_file = AsyncMock(return_value=encrypted_body)
-
-    await service._add_file_to_bucket(
-        bucket,
-        object_key,
-        access_key="test",
-        secret_key="test",
-        session_token="",
-        body=upload_body,
+    async def _iter_body():
+        for i in range(0, len(upload_body), 100_000):
+            yield upload_body[i : i + 100_000]
+
+    assert (
+        await service._add_file_to_bucket(
+            bucket,
+            object_key,
+            access_key="test",
+            secret_key="test",
+            session_token="",
+            body=_iter_body(),
+        )
+        == size
     )
 
     async with sess.create_client(
@@ -231,7 +338,9 @@ async def test_sda_inbox_add_file_to_bucket_uploads_payload(s3_endpoint):
         response = await s3.get_object(Bucket=bucket, Key=object_key)
         body_bytes = await response["Body"].read()
 
-    assert body_bytes == encrypted_body
+    decrypted_out = BytesIO()
+    decrypt([(0, sender_secret_key, None)], BytesIO(body_bytes), decrypted_out)
+    assert decrypted_out.getvalue() == upload_body
     assert response["ContentType"] == "application/octet-stream"
 
 
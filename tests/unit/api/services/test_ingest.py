@@ -2,13 +2,22 @@
 
 import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from metadata_backend.api.models.models import IngestFileState, IngestStatus
-from metadata_backend.api.models.sda import CreateDatasetRequest, FileItem
-from metadata_backend.api.services.ingest import SDAIngestService
+from metadata_backend.api.exceptions import ServiceHandlerSystemException
+from metadata_backend.api.models.models import IngestErrorType, IngestFileState, IngestStatus, IngestStatusUpdate
+from metadata_backend.api.models.sda import CreateDatasetRequest, FileItem, IngestFileRequest, PostAccessionIdRequest
+from metadata_backend.api.models.submission import SubmissionWorkflow
+from metadata_backend.api.services.ingest import (
+    ADMIN_REQUEST_ERRORS,
+    ADMIN_REQUEST_SECONDS,
+    BACKLOG_SUBMISSIONS,
+    FILE_STATUS_CHANGES,
+    SDAIngestService,
+)
+from tests.unit.helpers.test_cache import DictCacheBackend
 
 
 def _session_factory_provider():
@@ -62,6 +71,106 @@ async def test_sda_ingest_scan_once_processes_candidates_with_worker_bound() ->
     assert peak <= 2
 
 
+@pytest.mark.asyncio
+async def test_sda_ingest_scan_once_backs_off_unchanged_submissions() -> None:
+    """Scanner should check unchanged submissions with exponential backoff and published submissions immediately."""
+    services = SimpleNamespace(
+        submission=SimpleNamespace(
+            get_submission_ids_for_ingest=AsyncMock(return_value=["s1"]),
+            claim_submission_for_ingest=AsyncMock(return_value=None),
+        ),
+        file=SimpleNamespace(),
+    )
+    handlers = SimpleNamespace(admin=AsyncMock())
+    service = SDAIngestService(
+        services,
+        handlers,
+        session_factory_provider=_session_factory_provider,
+        scan_interval_seconds=10,
+        max_backoff_seconds=40,
+    )
+    _mock_with_session(service)
+
+    now = 0.0
+
+    async def _scan_at(t: float) -> tuple[int, int]:
+        nonlocal now
+        now = t
+        with patch("metadata_backend.api.services.ingest.time.monotonic", side_effect=lambda: now):
+            await service.scan_once()
+        return (
+            services.submission.get_submission_ids_for_ingest.await_count,
+            services.submission.claim_submission_for_ingest.await_count,
+        )
+
+    # Candidates are collected once per scan interval and checked with increasing delays.
+    assert await _scan_at(0) == (1, 1)
+    assert await _scan_at(5) == (1, 1)
+    assert await _scan_at(10) == (2, 2)
+    assert await _scan_at(29) == (3, 2)
+    assert await _scan_at(30) == (3, 3)
+    assert await _scan_at(69) == (4, 3)
+    assert await _scan_at(70) == (4, 4)
+    assert await _scan_at(109) == (5, 4)
+    assert await _scan_at(110) == (5, 5)
+
+    # Published submissions are checked immediately by the worker that runs the scan loop.
+    service._leading = True
+    service.submission_published("s1")
+    assert service._wake_up.is_set()
+    assert await _scan_at(111) == (5, 6)
+    assert not service._wake_up.is_set()
+
+    # Submissions that are no longer candidates are not checked.
+    services.submission.get_submission_ids_for_ingest.return_value = []
+    service.collect_submissions()
+    assert await _scan_at(200) == (6, 6)
+    assert service._schedule == {}
+
+
+@pytest.mark.asyncio
+async def test_sda_ingest_schedules_published_submissions_only_when_leading() -> None:
+    """Published submissions are scheduled only while the worker runs the scan loop."""
+    services = SimpleNamespace(
+        submission=SimpleNamespace(get_submission_ids_for_ingest=AsyncMock(return_value=[])),
+        file=SimpleNamespace(),
+    )
+    service = SDAIngestService(
+        services,
+        SimpleNamespace(admin=AsyncMock()),
+        session_factory_provider=_session_factory_provider,
+        scan_interval_seconds=10,
+    )
+    _mock_with_session(service)
+
+    # Workers that are not the leader ignore the notifications.
+    service.submission_published("s1")
+    assert service._schedule == {}
+    assert not service._wake_up.is_set()
+
+    scanned = asyncio.Event()
+
+    async def _scan_once() -> None:
+        service._wake_up.clear()
+        service._next_collect = float("inf")
+        scanned.set()
+
+    service.scan_once = _scan_once  # type: ignore[method-assign]
+    task = asyncio.create_task(service._scan_forever())
+    await scanned.wait()
+
+    service.submission_published("s2")
+    assert set(service._schedule) == {"s2"}
+
+    # The schedule is cleared when the worker stops being the leader.
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert service._schedule == {}
+    service.submission_published("s3")
+    assert service._schedule == {}
+
+
 @pytest.mark.asyncio
 async def test_sda_ingest_skips_when_submission_not_claimed() -> None:
     """Ingest returns False when claim fails (locked or already processed)."""
@@ -104,11 +213,12 @@ async def test_sda_ingest_marks_submission_ingested() -> None:
                 return_value=SimpleNamespace(bucket="mock_user_test.what", projectId="mock@user@test.what")
             ),
             update_ingested=AsyncMock(),
+            release_ingest_claim=AsyncMock(),
         ),
         file=SimpleNamespace(
             get_ingest_file_states=_get_ingest_file_states,
             get_ingest_file_state=_get_ingest_file_state,
-            update_ingest_status=AsyncMock(),
+            update_ingest_statuses=AsyncMock(),
             get_file_by_path=AsyncMock(
                 side_effect=lambda _sid, path: SimpleNamespace(fileId=file_states[path].file_id)
             ),
@@ -144,37 +254,18 @@ async def test_sda_ingest_marks_submission_ingested() -> None:
     )
     handlers.admin.release_dataset.assert_awaited_once_with("dataset-1")
     services.submission.update_ingested.assert_awaited_once_with("dataset-1")
+    services.submission.release_ingest_claim.assert_awaited_once_with("dataset-1")
+    services.file.update_ingest_statuses.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_sda_ingest_progresses_files_from_uploaded_to_ready() -> None:
-    """Ingest should process files and progress them from UPLOADED to VERIFIED and VERIFIED to READY."""
-    file_states = {
-        "f1": IngestFileState(file_id="id-a", path="f1", ingest_status=IngestStatus.UPLOADED),
-        "f2": IngestFileState(file_id="id-b", path="f2", ingest_status=IngestStatus.VERIFIED),
-    }
-
-    async def _get_ingest_file_states(_submission_id: str):
-        return list(file_states.values())
-
-    async def _get_ingest_file_state(file_id: str):
-        for state in file_states.values():
-            if state.file_id == file_id:
-                return state
-        raise AssertionError(f"unexpected file_id: {file_id}")
-
-    async def _update_ingest_status(file_id, ingest_status, *, ingest_error=None, ingest_error_type=None):
-        for key, state in file_states.items():
-            if state.file_id == file_id:
-                file_states[key] = IngestFileState(
-                    file_id=state.file_id,
-                    path=state.path,
-                    ingest_status=ingest_status,
-                    ingest_error=ingest_error,
-                    ingest_error_type=ingest_error_type,
-                    ingest_error_count=state.ingest_error_count,
-                )
-                return
+    """Ingest should sync statuses in bulk and progress files from UPLOADED to VERIFIED and VERIFIED to READY."""
+    file_states = [
+        IngestFileState(file_id="id-a", path="f1", ingest_status=IngestStatus.SUBMITTED),
+        IngestFileState(file_id="id-b", path="f2", ingest_status=IngestStatus.VERIFIED),
+        IngestFileState(file_id="id-c", path="f3", ingest_status=IngestStatus.READY),
+    ]
 
     services = SimpleNamespace(
         submission=SimpleNamespace(
@@ -182,30 +273,17 @@ async def test_sda_ingest_progresses_files_from_uploaded_to_ready() -> None:
                 return_value=SimpleNamespace(bucket="mock_user_test.what", projectId="mock@user@test.what")
             ),
             update_ingested=AsyncMock(),
+            extend_ingest_claim=AsyncMock(),
+            release_ingest_claim=AsyncMock(),
         ),
         file=SimpleNamespace(
-            get_ingest_file_states=_get_ingest_file_states,
-            get_ingest_file_state=_get_ingest_file_state,
-            update_ingest_status=AsyncMock(side_effect=_update_ingest_status),
-            get_file_by_path=AsyncMock(
-                side_effect=lambda _sid, path: SimpleNamespace(fileId=file_states[path].file_id)
-            ),
+            get_ingest_file_states=AsyncMock(return_value=file_states),
+            update_ingest_statuses=AsyncMock(),
         ),
     )
     handlers = SimpleNamespace(admin=AsyncMock())
 
-    async def _ingest_file_side_effect(**kwargs):
-        # Simulate progression: UPLOADED -> VERIFIED
-        await services.file.update_ingest_status("id-a", IngestStatus.VERIFIED)
-
-    async def _post_accession_id_side_effect(**kwargs):
-        # Simulate progression: VERIFIED -> READY
-        await services.file.update_ingest_status("id-b", IngestStatus.READY)
-
-    handlers.admin.ingest_file = AsyncMock(side_effect=_ingest_file_side_effect)
-    handlers.admin.post_accession_id = AsyncMock(side_effect=_post_accession_id_side_effect)
-
-    # Admin API returns files in their current states (no progression yet)
+    # Admin API reports that f1 has been uploaded since the previous run.
     handlers.admin.get_user_files.return_value = [
         FileItem(
             fileID="12345678-1234-4234-8234-1234567890ab",
@@ -225,12 +303,122 @@ async def test_sda_ingest_progresses_files_from_uploaded_to_ready() -> None:
         services,
         handlers,
         session_factory_provider=_session_factory_provider,
+        claim_timeout_seconds=60,
     )
     _mock_with_session(service)
 
+    uploaded = FILE_STATUS_CHANGES.value(status=IngestStatus.UPLOADED.value)
+
     ok = await service.ingest_submission_with_session("dataset-1")
-    # Only id-b reaches READY where id-a reaches VERIFIED, so not all are READY yet
+    # The files have not reached READY yet.
     assert ok is False
 
-    handlers.admin.ingest_file.assert_awaited_once()
-    handlers.admin.post_accession_id.assert_awaited_once()
+    services.submission.claim_submission_for_ingest.assert_awaited_once_with(
+        "dataset-1", workflow=SubmissionWorkflow.BP, claim_seconds=60
+    )
+    services.file.update_ingest_statuses.assert_awaited_once_with(
+        [IngestStatusUpdate(file_id="id-a", ingest_status=IngestStatus.UPLOADED)]
+    )
+    services.submission.extend_ingest_claim.assert_awaited_once_with("dataset-1", 60)
+    assert FILE_STATUS_CHANGES.value(status=IngestStatus.UPLOADED.value) == uploaded + 1
+    assert service._backlog_files() == {("uploaded",): 1.0, ("verified",): 1.0, ("ready",): 1.0}
+    handlers.admin.ingest_file.assert_awaited_once_with(
+        data=IngestFileRequest(user="mock@user@test.what", filepath="f1")
+    )
+    handlers.admin.post_accession_id.assert_awaited_once_with(
+        data=PostAccessionIdRequest(user="mock@user@test.what", filepath="f2", accession_id="id-b")
+    )
+    handlers.admin.create_dataset.assert_not_awaited()
+    services.submission.release_ingest_claim.assert_awaited_once_with("dataset-1")
+
+
+@pytest.mark.asyncio
+async def test_sda_ingest_saves_file_errors_with_file_concurrency_bound() -> None:
+    """Ingest should call the Admin API concurrently for files and save the file errors in bulk."""
+    file_states = [
+        IngestFileState(file_id=f"id-{i}", path=f"f{i}", ingest_status=IngestStatus.UPLOADED) for i in range(10)
+    ]
+
+    services = SimpleNamespace(
+        submission=SimpleNamespace(
+            claim_submission_for_ingest=AsyncMock(return_value=SimpleNamespace(projectId="user")),
+            extend_ingest_claim=AsyncMock(),
+            release_ingest_claim=AsyncMock(),
+        ),
+        file=SimpleNamespace(
+            get_ingest_file_states=AsyncMock(return_value=file_states),
+            update_ingest_statuses=AsyncMock(),
+        ),
+    )
+    handlers = SimpleNamespace(admin=AsyncMock())
+    handlers.admin.get_user_files.return_value = []
+
+    error = ServiceHandlerSystemException("admin")
+    active = 0
+    peak = 0
+
+    async def _ingest_file(data: IngestFileRequest) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if data.filepath == "f3":
+            raise error
+
+    handlers.admin.ingest_file = AsyncMock(side_effect=_ingest_file)
+
+    service = SDAIngestService(
+        services,
+        handlers,
+        session_factory_provider=_session_factory_provider,
+        file_concurrency=3,
+    )
+    _mock_with_session(service)
+
+    requests = ADMIN_REQUEST_SECONDS.count(endpoint="ingest_file")
+    errors = ADMIN_REQUEST_ERRORS.value(endpoint="ingest_file")
+
+    assert await service.ingest_submission_with_session("dataset-1") is False
+    assert handlers.admin.ingest_file.await_count == 10
+    assert ADMIN_REQUEST_SECONDS.count(endpoint="ingest_file") == requests + 10
+    assert ADMIN_REQUEST_ERRORS.value(endpoint="ingest_file") == errors + 1
+    assert 1 < peak <= 3
+    services.file.update_ingest_statuses.assert_awaited_once_with(
+        [
+            IngestStatusUpdate(
+                file_id="id-3",
+                ingest_status=IngestStatus.ERROR,
+                ingest_error=str(error),
+                ingest_error_type=IngestErrorType.TRANSIENT_ERROR,
+            )
+        ]
+    )
+    services.submission.release_ingest_claim.assert_awaited_once_with("dataset-1")
+
+
+@pytest.mark.asyncio
+async def test_sda_ingest_metrics_are_shared_between_workers() -> None:
+    """Ingest metrics published by the ingest scanner are returned by the other workers."""
+    backend = DictCacheBackend()
+    services = SimpleNamespace(submission=SimpleNamespace(), file=SimpleNamespace())
+    # The ingest metrics are computed from the most recently created service.
+    worker, leader = (
+        SDAIngestService(
+            services,
+            SimpleNamespace(admin=AsyncMock()),
+            session_factory_provider=_session_factory_provider,
+            metrics_backend=backend,
+        )
+        for _ in range(2)
+    )
+
+    assert await worker.get_metrics() == ""
+
+    leader._leading = True
+    leader.submission_published("submission-1")
+    leader.submission_published("submission-2")
+    await leader.publish_metrics()
+
+    assert BACKLOG_SUBMISSIONS.value() == 2
+    assert "ingest_backlog_submissions 2" in await worker.get_metrics()
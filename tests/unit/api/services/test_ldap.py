@@ -0,0 +1,74 @@
+"""Tests for shared LDAP connections."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ldap3.core.exceptions import LDAPBindError, LDAPSocketReceiveError
+
+from metadata_backend.api.services.ldap import LdapConnectionPool
+
+
+def _connect() -> MagicMock:
+    conn = MagicMock()
+    conn.bind.return_value = True
+    return conn
+
+
+async def test_ldap_connection_pool_reuses_connections():
+    """Bound connections are reused outside the event loop."""
+    connect = MagicMock(side_effect=_connect)
+    pool = LdapConnectionPool(connect, pool_size=2, idle_timeout=60)
+    event_loop_thread = threading.get_ident()
+    try:
+        conns = [await pool.run(lambda conn: conn) for _ in range(3)]
+        assert conns[0] is conns[1] is conns[2]
+        assert connect.call_count == 1
+        conns[0].bind.assert_called_once()
+        assert await pool.run(lambda _: threading.get_ident()) != event_loop_thread
+        assert len(pool) == 1
+
+        # Idle connections are closed after the idle timeout.
+        with patch("metadata_backend.api.services.ldap.time.monotonic", return_value=1e12):
+            assert await pool.run(lambda conn: conn) is not conns[0]
+        conns[0].unbind.assert_called_once()
+    finally:
+        pool.close()
+    assert len(pool) == 0
+
+
+async def test_ldap_connection_pool_errors():
+    """Failed connections are closed, and closed pooled connections are replaced."""
+    connect = MagicMock(side_effect=_connect)
+    pool = LdapConnectionPool(connect, pool_size=2, idle_timeout=60)
+    try:
+        conn = await pool.run(lambda conn: conn)
+
+        def _search(c: MagicMock) -> MagicMock:
+            if c is conn:
+                raise LDAPSocketReceiveError("connection closed")
+            return c
+
+        # The operation is retried once with a new connection.
+        new_conn = await pool.run(_search)
+        assert new_conn is not conn
+        conn.unbind.assert_called_once()
+
+        # Connections are closed if the operation fails.
+        def _fail(_: MagicMock) -> None:
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError):
+            await pool.run(_fail)
+        new_conn.unbind.assert_called_once()
+        assert len(pool) == 0
+
+        failed_conn = _connect()
+        failed_conn.bind.return_value = False
+        connect.side_effect = None
+        connect.return_value = failed_conn
+        with pytest.raises(LDAPBindError):
+            await pool.run(lambda conn: conn)
+        failed_conn.unbind.assert_called_once()
+    finally:
+        pool.close()
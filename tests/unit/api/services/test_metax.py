@@ -2,7 +2,7 @@ from pydantic_string_url import AnyUrl
 
 from metadata_backend.api.models.datacite import Subject
 from metadata_backend.api.models.metax import FieldOfScience
-from metadata_backend.api.services.metax import MetaxService
+from metadata_backend.api.services.metax import FieldOfScienceIndex, MetaxService
 
 
 class TestMetaxService(MetaxService):
@@ -102,3 +102,34 @@ async def test_get_field_of_science_empty_subject():
     subject = Subject(subject="")
     field = await service.get_field_of_science(subject)
     assert field is None
+
+
+async def test_get_field_of_science_index():
+    fields = await TestMetaxService().get_fields_of_science()
+
+    class CachedMetaxService(MetaxService):
+        async def get_fields_of_science(self) -> list[FieldOfScience]:
+            return fields
+
+    # The index is built once per list of fields of science.
+    service = CachedMetaxService()
+    subject = Subject(subject="Mathematics")
+    await service.get_field_of_science(subject)
+    index = service._field_of_science_index
+    assert await service.get_field_of_science(subject) is fields[0]
+    assert service._field_of_science_index is index
+
+    # The first matching field of science is used.
+    index = FieldOfScienceIndex(
+        [
+            FieldOfScience(id="3", url=AnyUrl("http://www.yso.fi/onto/okm-tieteenala/ta1111"), pref_label={"en": "A"}),
+            *fields,
+        ]
+    )
+    assert index.get(Subject(subject="111")).id == "3"
+    assert index.get(Subject(subject="ta111")).id == "1"
+    # URLs in subject.subject and subject.valueUri are searched together.
+    subject = Subject(subject=str(fields[0].url), valueUri=AnyUrl(str(fields[1].url)))
+    assert index.get(subject).id == "1"
+    # Codes and labels in the user interface format are searched together.
+    assert index.get(Subject(subject="222 - Mathematics")).id == "1"
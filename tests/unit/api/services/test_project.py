@@ -1,5 +1,6 @@
 """Test CSC's LDAP service."""
 
+import asyncio
 import json
 import os
 from unittest.mock import MagicMock, patch
@@ -44,6 +45,43 @@ async def test_get_user_projects_csc() -> None:
             mock_get_connection.assert_called_once_with(ldap_host, ldap_port, ldap_user, ldap_password, ldap_ssl)
 
 
+async def test_get_user_projects_csc_concurrent() -> None:
+    """Test that concurrent requests for the same user share one LDAP search and connection."""
+    service = CscProjectService()
+
+    with patch.dict(
+        os.environ,
+        {
+            "CSC_LDAP_HOST": "ldap://mockhost",
+            "CSC_LDAP_USER": "mockuser",
+            "CSC_LDAP_PASSWORD": "mockpassword",
+            "CSC_LDAP_POOL_SIZE": "1",
+        },
+    ):
+        mock_connection = MagicMock()
+        mock_connection.bind.return_value = True
+
+        def _search(conn, user_id):
+            return [Project(project_id=f"{user_id}_project")]
+
+        with (
+            patch.object(CscProjectService, "_get_connection", return_value=mock_connection) as mock_get_connection,
+            patch.object(CscProjectService, "_search_user_projects", side_effect=_search) as mock_search,
+        ):
+            try:
+                results = await asyncio.gather(*(service.get_user_projects(user) for user in ("a", "a", "a", "b")))
+                assert results == [[Project(project_id="a_project")]] * 3 + [[Project(project_id="b_project")]]
+                assert await service.get_user_projects("a") == [Project(project_id="a_project")]
+
+                assert mock_search.call_count == 2
+                # The bound LDAP connection is reused.
+                mock_get_connection.assert_called_once()
+                mock_connection.bind.assert_called_once()
+            finally:
+                await service.close()
+            mock_connection.unbind.assert_called_once()
+
+
 async def test_get_user_projects_csc_ldap_timeout() -> None:
     """Test that an LDAP connection timeout is mapped to a 504, not a bare 500."""
     service = CscProjectService()
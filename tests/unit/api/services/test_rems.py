@@ -8,7 +8,7 @@ from metadata_backend.api.models.rems import (
     RemsWorkflow,
     RemsWorkflowDetails,
 )
-from metadata_backend.api.services.rems import RemsOrganisationsService
+from metadata_backend.api.services.rems import RemsOrganisationsService, RemsReferenceData
 
 ORGANISATION_ID = "Organisation id"
 ORGANISATION_NAME = "Organisation name"
@@ -80,3 +80,23 @@ async def test_get_organizations():
     rems_workflows, rems_licenses = create_workflow_and_license()
     organisations = await RemsOrganisationsService.get_organisations(rems_workflows, rems_licenses)
     assert_organisation(list(organisations.values()))
+
+
+async def test_reference_data():
+    rems_workflows, rems_licenses = create_workflow_and_license()
+    reference_data = RemsReferenceData(workflows=rems_workflows, licenses=rems_licenses)
+
+    organisations = await reference_data.get_organisations("en")
+    assert_organisation(organisations)
+    # The organisations are built once per language.
+    assert (await reference_data.get_organisations("en"))[0] is organisations[0]
+    assert (await reference_data.get_organisations("fi"))[0] is not organisations[0]
+
+    assert_organisation(await reference_data.get_organisations("en", ORGANISATION_ID))
+    assert await reference_data.get_organisations("en", "other") == []
+
+    etag = reference_data.get_etag("en")
+    assert etag == RemsReferenceData(workflows=rems_workflows, licenses=rems_licenses).get_etag("en")
+    assert etag != reference_data.get_etag("fi")
+    assert etag != reference_data.get_etag("en", ORGANISATION_ID)
+    assert etag != RemsReferenceData(workflows=rems_workflows, licenses=[]).get_etag("en")
@@ -0,0 +1,51 @@
+"""Tests for shared S3 clients."""
+
+from unittest.mock import patch
+
+from metadata_backend.api.services.s3 import S3ClientPool
+
+endpoint = "http://localhost:9000"
+
+
+async def test_s3_client_pool_reuses_clients():
+    """Clients are reused for the same endpoint and credentials."""
+    pool = S3ClientPool(pool_size=10, idle_timeout=60, max_pool_connections=5)
+    try:
+        async with pool.client(endpoint_url=endpoint, access_key="a", secret_key="s") as client_1:
+            async with pool.client(endpoint_url=endpoint, access_key="a", secret_key="s") as client_2:
+                assert client_1 is client_2
+        async with pool.client(endpoint_url=endpoint, access_key="a", secret_key="s") as client_3:
+            assert client_3 is client_1
+        async with pool.client(endpoint_url=endpoint, access_key="a", secret_key="other") as client_4:
+            assert client_4 is not client_1
+        async with pool.client(endpoint_url=endpoint, access_key="a", secret_key="s", session_token="t") as client_5:
+            assert client_5 is not client_1
+        assert len(pool) == 3
+        assert client_1.meta.config.max_pool_connections == 5
+    finally:
+        await pool.close()
+    assert len(pool) == 0
+
+
+async def test_s3_client_pool_evicts_idle_clients():
+    """Idle clients are closed after the idle timeout and when the pool is full."""
+    pool = S3ClientPool(pool_size=2, idle_timeout=60, max_pool_connections=5)
+    try:
+        for key in ("a", "b", "c"):
+            async with pool.client(endpoint_url=endpoint, access_key=key, secret_key="s"):
+                pass
+        # The least recently used client is closed when there are more idle clients than the pool size.
+        assert len(pool) == 2
+
+        # Clients in use are not closed.
+        async with pool.client(endpoint_url=endpoint, access_key="d", secret_key="s"):
+            async with pool.client(endpoint_url=endpoint, access_key="e", secret_key="s"):
+                async with pool.client(endpoint_url=endpoint, access_key="f", secret_key="s"):
+                    assert len(pool) == 5
+
+        with patch("metadata_backend.api.services.s3.time.monotonic", return_value=1e12):
+            async with pool.client(endpoint_url=endpoint, access_key="a", secret_key="s"):
+                # All idle clients have expired.
+                assert len(pool) == 1
+    finally:
+        await pool.close()
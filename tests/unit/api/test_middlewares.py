@@ -9,6 +9,7 @@ from starlette.types import Receive, Send
 
 from metadata_backend.api.middlewares import AuthMiddleware, SessionMiddleware
 from metadata_backend.conf.deployment import deployment_config
+from metadata_backend.database.postgres.repository import create_session_factory
 
 mock_session_context: ContextVar[AsyncSession | None] = ContextVar("mock_session_context", default=None)
 
@@ -47,6 +48,47 @@ async def test_session_middleware_api_route(session_factory):
     assert mock_session_context.get() is None
 
 
+@pytest.mark.parametrize("method,read_only", [("GET", True), ("HEAD", True), ("POST", False), ("PATCH", False)])
+async def test_session_middleware_read_only_session_factory(session_factory, method, read_only):
+    """Test that session middleware uses the read-only session factory for read-only requests."""
+    used_factories = []
+
+    def _factory(name):
+        factory = create_session_factory(session_factory.kw["bind"], read_only=name == "read_only")
+
+        def _create():
+            used_factories.append(name)
+            return factory()
+
+        return _create
+
+    mock_app = MagicMock()
+    mock_app.state = SimpleNamespace()
+    mock_app.state.session_factory = _factory("default")
+    mock_app.state.read_only_session_factory = _factory("read_only")
+
+    async def _call(_scope, _receive, send):
+        session = mock_session_context.get()
+        result = await session.execute(text("SELECT 1"))
+        assert result.scalar_one() == 1
+        # Read-only sessions return the connection to the pool after each query.
+        assert session.in_transaction() is not read_only
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    mock_app.side_effect = _call
+    middleware = SessionMiddleware(mock_app, mock_session_context)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "app": mock_app,
+        "path": f"{deployment_config().API_PREFIX_V1}/test",
+    }
+
+    await middleware(scope, Mock(spec=Receive), AsyncMock(spec=Send))
+    assert used_factories == ["read_only" if read_only else "default"]
+
+
 async def test_session_middleware_non_api_route(session_factory):
     """Test session middleware for non-API routes."""
     mock_asgi_app_called = False
@@ -266,3 +308,44 @@ async def test_auth_middleware_missing_authorization_returns_401():
     assert sent_messages
     assert sent_messages[0]["type"] == "http.response.start"
     assert sent_messages[0]["status"] == 401
+
+
+async def test_auth_middleware_api_key_uses_request_session(session_factory):
+    """Test auth middleware validates API keys inside the session middleware."""
+    mock_app = MagicMock()
+    mock_app.state = SimpleNamespace()
+    mock_app.state.session_factory = session_factory
+
+    async def _call(_scope, _receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    mock_app.side_effect = _call
+
+    validated_sessions = []
+
+    async def _validate_api_key(_api_key):
+        validated_sessions.append(mock_session_context.get())
+        return "test-user"
+
+    auth_service = MagicMock()
+    auth_service.validate_api_key = _validate_api_key
+    middleware = SessionMiddleware(AuthMiddleware(mock_app, auth_service), mock_session_context)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": f"{deployment_config().API_PREFIX_V1}/test",
+        "headers": [(b"authorization", b"Bearer keyid.apikey")],
+    }
+
+    sent_messages = []
+
+    async def _send(message):
+        sent_messages.append(message)
+
+    await middleware(scope, Mock(spec=Receive), _send)
+
+    assert sent_messages[0]["status"] == 200
+    assert len(validated_sessions) == 1
+    assert validated_sessions[0] is not None
+    assert scope["state"]["user"].user_id == "test-user"
@@ -118,7 +118,7 @@ async def _session_start():
 
     os.environ["DATABASE_URL"] = get_sqllite_db_url(_temp_sqlite_file.name)
 
-    _engine = await create_engine()
+    _engine = await create_engine(create_schema=True)
     _session_factory = create_session_factory(_engine)
     _submission_repository = SubmissionRepository()
     _object_repository = ObjectRepository()
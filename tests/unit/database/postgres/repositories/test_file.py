@@ -199,3 +199,25 @@ async def test_update_ingest_status(
     await file_repository.update_file(file_id, update_callback)
 
     assert (await file_repository.get_file_by_id(file_id)).ingest_status == IngestStatus.READY
+
+
+async def test_add_missing_files_and_get_file_paths(
+    file_repository: FileRepository,
+    object_repository: ObjectRepository,
+    submission_repository: SubmissionRepository,
+) -> None:
+    project_id, submission_id = await add_submission(submission_repository)
+    object_id = await add_object(project_id, submission_id, object_repository)
+
+    def create_file(path: str) -> FileEntity:
+        return FileEntity(submission_id=submission_id, object_id=object_id, bytes=1024, path=path)
+
+    assert await file_repository.add_missing_files([], workflow) == 0
+    assert await file_repository.add_missing_files([create_file("a"), create_file("b")], workflow) == 2
+
+    # Existing paths are skipped by the database.
+    assert await file_repository.add_missing_files([create_file("a"), create_file("c")], workflow) == 1
+
+    assert await file_repository.get_file_paths(submission_id) == {"a", "b", "c"}
+    assert await file_repository.get_file_paths(submission_id, ["a", "unknown"]) == {"a"}
+    assert await file_repository.get_file_paths(submission_id, []) == set()
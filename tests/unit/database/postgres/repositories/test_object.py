@@ -1,12 +1,15 @@
 import datetime
 import uuid
 
+import pytest
 import ulid
+from sqlalchemy.exc import InvalidRequestError
 
 from metadata_backend.api.models.submission import SubmissionWorkflow
 from metadata_backend.database.postgres.models import ObjectEntity
 from metadata_backend.database.postgres.repositories.object import ObjectRepository
 from metadata_backend.database.postgres.repositories.submission import SubmissionRepository
+from metadata_backend.database.postgres.repository import session
 
 from ..helpers import create_submission_entity
 
@@ -194,3 +197,57 @@ async def test_get_and_count_objects(
     assert len(results) == 1
     assert await object_repository.count_objects(first_submission_id, second_object_type) == 1
     assert results[0].object_id == second_object_id
+
+    # Test without documents.
+
+    session().expunge_all()
+    results = [obj async for obj in object_repository.get_objects(submission_id=second_submission_id, documents=False)]
+    assert len(results) == 1
+    assert results[0].object_id == third_object_id
+    with pytest.raises(InvalidRequestError):
+        _ = results[0].document
+
+
+async def test_add_objects(submission_repository: SubmissionRepository, object_repository: ObjectRepository) -> None:
+    submission = create_submission_entity(workflow=workflow)
+    submission_id = await submission_repository.add_submission(submission)
+    project_id = submission.project_id
+
+    object_type = "test"
+    names = [f"name_{uuid.uuid4()}" for _ in range(3)]
+    given_object_id = f"id_{uuid.uuid4()}"
+
+    entities = [
+        ObjectEntity(
+            project_id=project_id,
+            submission_id=submission_id,
+            name=name,
+            object_type=object_type,
+            xml_document=f"<{name}/>",
+        )
+        for name in names
+    ]
+    entities[1].object_id = given_object_id
+
+    # No entities.
+    assert await object_repository.add_objects([], workflow) == []
+
+    object_ids = await object_repository.add_objects(entities, workflow)
+    assert len(object_ids) == 3
+    assert object_ids[1] == given_object_id
+    assert object_ids == [e.object_id for e in entities]
+
+    for name, object_id in zip(names, object_ids, strict=True):
+        entity = await object_repository.get_object_by_id(object_id)
+        assert entity.name == name
+        assert entity.object_type == object_type
+        assert entity.submission_id == submission_id
+        assert entity.xml_document == f"<{name}/>"
+        assert entity.created is not None
+
+    # Get existing object names.
+    assert await object_repository.get_object_names(project_id, [*names, "other"], [object_type]) == {
+        (object_type, name) for name in names
+    }
+    assert await object_repository.get_object_names(project_id, names, ["other"]) == set()
+    assert await object_repository.get_object_names(f"project_{uuid.uuid4()}", names, [object_type]) == set()
@@ -297,3 +297,36 @@ async def test_get_submissions(submission_repository: SubmissionRepository) -> N
     assert len(results) == 1
     assert total == 2
     assert third_submission_name in results[0].name
+
+
+async def test_claim_submission_for_ingest(submission_repository: SubmissionRepository) -> None:
+    submission = create_submission_entity(workflow=SubmissionWorkflow.BP)
+    submission_id = await submission_repository.add_submission(submission)
+
+    # Unpublished submissions are not claimable.
+    assert await submission_repository.claim_submission_for_ingest(submission_id) is None
+
+    submission.is_published = True
+    await session().flush()
+    modified = submission.modified
+
+    # Claimed submissions are not claimable until the claim expires or is released.
+    now = datetime.datetime.now(datetime.timezone.utc)
+    claim_until = now + datetime.timedelta(hours=1)
+    claimed = await submission_repository.claim_submission_for_ingest(
+        submission_id, workflow=SubmissionWorkflow.BP, claim_until=claim_until
+    )
+    assert claimed is not None
+    assert claimed.ingest_claimed_until is not None
+    assert claimed.modified == modified
+    assert await submission_repository.claim_submission_for_ingest(submission_id) is None
+
+    assert await submission_repository.update_ingest_claim(submission_id, now - datetime.timedelta(seconds=1))
+    assert await submission_repository.claim_submission_for_ingest(submission_id) is not None
+
+    assert await submission_repository.update_ingest_claim(submission_id, claim_until)
+    assert await submission_repository.claim_submission_for_ingest(submission_id) is None
+    assert await submission_repository.update_ingest_claim(submission_id, None)
+    assert await submission_repository.claim_submission_for_ingest(submission_id) is not None
+
+    assert not await submission_repository.update_ingest_claim("unknown", None)
@@ -0,0 +1,86 @@
+"""Test DatabaseCacheBackend."""
+
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+from metadata_backend.database.postgres.models import CacheEntryEntity
+from metadata_backend.database.postgres.repositories.cache import CacheRepository
+from metadata_backend.database.postgres.repository import (
+    SessionFactory,
+    create_engine,
+    create_session_factory,
+    get_sqllite_db_url,
+)
+from metadata_backend.database.postgres.services.cache import DatabaseCacheBackend
+from metadata_backend.helpers.cache import Cache, CacheEntry
+
+
+@pytest.fixture()
+async def cache_session_factory(tmp_path: Path) -> AsyncGenerator[SessionFactory, None]:
+    # The cache backend uses its own transactions, and the test session must not lock the database.
+    engine = await create_engine(get_sqllite_db_url(str(tmp_path / "cache.db")), create_schema=True)
+    yield create_session_factory(engine)
+    await engine.dispose()
+
+
+async def _count(session_factory: SessionFactory, namespace: str) -> int:
+    async with session_factory() as session:
+        stmt = select(func.count()).select_from(CacheEntryEntity).where(CacheEntryEntity.namespace == namespace)
+        return (await session.execute(stmt)).scalar_one()
+
+
+async def test_get_and_set(cache_session_factory: SessionFactory):
+    backend = DatabaseCacheBackend(CacheRepository(), lambda: cache_session_factory, prune_interval=100)
+    now = time.time()
+
+    assert await backend.get("test", "a") is None
+
+    await backend.set("test", "a", CacheEntry('"first"', now + 60, now + 120), 10)
+    await backend.set("test", "a", CacheEntry('"second"', now + 60, now + 120), 10)
+    result = await backend.get("test", "a")
+    assert result is not None
+    assert result.value == '"second"'
+    assert result.fresh_until == pytest.approx(now + 60)
+    assert result.expires == pytest.approx(now + 120)
+    assert await backend.get("other", "a") is None
+
+    # Expired values are not returned.
+    await backend.set("test", "b", CacheEntry('"expired"', now - 120, now - 60), 10)
+    assert await backend.get("test", "b") is None
+
+
+async def test_prune(cache_session_factory: SessionFactory):
+    backend = DatabaseCacheBackend(CacheRepository(), lambda: cache_session_factory, prune_interval=5)
+    now = time.time()
+
+    await backend.set("test", "expired", CacheEntry("1", now - 120, now - 60), 3)
+    await backend.set("other", "a", CacheEntry("1", now + 60, now + 60), 3)
+    for i in range(3):
+        await backend.set("test", str(i), CacheEntry("1", now + 60, now + 60 + i), 3)
+    assert await _count(cache_session_factory, "test") == 4
+
+    # The namespace is pruned after the prune interval.
+    await backend.set("test", "3", CacheEntry("1", now + 60, now + 63), 3)
+    assert await _count(cache_session_factory, "test") == 3
+    assert await backend.get("test", "0") is None
+    assert await backend.get("test", "3") is not None
+    assert await _count(cache_session_factory, "other") == 1
+
+
+async def test_shared_cache(cache_session_factory: SessionFactory):
+    backend = DatabaseCacheBackend(CacheRepository(), lambda: cache_session_factory, prune_interval=100)
+    first = Cache[dict[str, int]]("test", dict[str, int], maxsize=10, ttl=60, backend=backend)
+    second = Cache[dict[str, int]]("test", dict[str, int], maxsize=10, ttl=60, backend=backend)
+
+    async def load() -> dict[str, int]:
+        return {"a": 1}
+
+    async def fail() -> dict[str, int]:
+        raise AssertionError("The value should be cached")
+
+    assert await first.get("key", load) == {"a": 1}
+    assert await second.get("key", fail) == {"a": 1}
@@ -1,10 +1,12 @@
 """Test FileService."""
 
 from collections.abc import AsyncGenerator
+from unittest.mock import patch
 
 import pytest
 
 from metadata_backend.api.json import to_json_dict
+from metadata_backend.api.models.models import IngestErrorType, IngestStatusUpdate
 from metadata_backend.api.models.submission import SubmissionWorkflow
 from metadata_backend.database.postgres.models import IngestStatus
 from metadata_backend.database.postgres.repositories.file import FileRepository
@@ -60,6 +62,63 @@ async def test_get_file(
     assert sorted(to_json_dict(file).items()) == sorted(to_json_dict(result).items())
 
 
+async def test_add_files(
+    submission_repository: SubmissionRepository,
+    object_repository: ObjectRepository,
+    service: FileService,
+):
+    submission = create_submission_entity()
+    await submission_repository.add_submission(submission)
+    obj = create_object_entity(submission.project_id, submission.submission_id)
+    await object_repository.add_object(obj, workflow)
+
+    # Create files.
+    files = [create_file(submission.submission_id, obj.object_id) for _ in range(3)]
+
+    assert await service.add_files([], workflow) == []
+    file_ids = await service.add_files(files, workflow)
+    assert len(set(file_ids)) == 3
+    assert await service.count_files(submission.submission_id, ingest_statuses=[IngestStatus.SUBMITTED]) == 3
+
+    # Assert files.
+    for file, file_id in zip(files, file_ids, strict=True):
+        file.fileId = file_id
+        result = await service.get_file_by_id(file_id)
+        assert sorted(to_json_dict(file).items()) == sorted(to_json_dict(result).items())
+
+
+async def test_add_missing_files(
+    submission_repository: SubmissionRepository,
+    object_repository: ObjectRepository,
+    service: FileService,
+):
+    submission = create_submission_entity()
+    await submission_repository.add_submission(submission)
+    obj = create_object_entity(submission.project_id, submission.submission_id)
+    await object_repository.add_object(obj, workflow)
+
+    existing_files = [create_file(submission.submission_id, obj.object_id) for _ in range(2)]
+    await service.add_files(existing_files, workflow)
+
+    # Existing and repeated paths are skipped.
+    new_files = [create_file(submission.submission_id, obj.object_id) for _ in range(3)]
+    files = [*existing_files, *new_files, new_files[0]]
+    assert await service.add_missing_files(submission.submission_id, files, workflow) == 3
+    assert await service.count_files(submission.submission_id) == 5
+
+    async def _iter_files():
+        for file in [*files, create_file(submission.submission_id, obj.object_id)]:
+            yield file
+
+    # Files are added in batches.
+    with patch("metadata_backend.database.postgres.services.file.FILE_BATCH_SIZE", 1):
+        assert await service.add_missing_files(submission.submission_id, _iter_files(), workflow) == 1
+    assert await service.count_files(submission.submission_id) == 6
+
+    result = await service.get_file_by_path(submission.submission_id, new_files[1].path)
+    assert result.bytes == new_files[1].bytes
+
+
 async def test_get_files(
     submission_repository: SubmissionRepository,
     object_repository: ObjectRepository,
@@ -168,6 +227,69 @@ async def test_update_ingest_status(
         await service.update_ingest_status("unknown", ingest_status=IngestStatus.ERROR)
 
 
+async def test_update_ingest_statuses(
+    submission_repository: SubmissionRepository,
+    object_repository: ObjectRepository,
+    service: FileService,
+):
+    submission = create_submission_entity()
+    await submission_repository.add_submission(submission)
+    obj = create_object_entity(submission.project_id, submission.submission_id)
+    await object_repository.add_object(obj, workflow)
+
+    files = [create_file(submission.submission_id, obj.object_id) for _ in range(3)]
+    file_ids = await service.add_files(files, workflow)
+
+    def _error(file_id: str, error_type: IngestErrorType) -> IngestStatusUpdate:
+        return IngestStatusUpdate(
+            file_id=file_id, ingest_status=IngestStatus.ERROR, ingest_error="error", ingest_error_type=error_type
+        )
+
+    async def _states() -> dict[str, tuple]:
+        return {
+            s.file_id: (s.ingest_status, s.ingest_error_type, s.ingest_error_count)
+            for s in await service.get_ingest_file_states(submission.submission_id)
+        }
+
+    transient, permanent = IngestErrorType.TRANSIENT_ERROR, IngestErrorType.PERMANENT_ERROR
+
+    # Files are updated in batches and unknown files are ignored.
+    with patch("metadata_backend.database.postgres.services.file.FILE_BATCH_SIZE", 2):
+        updates = [
+            _error(file_ids[0], transient),
+            _error(file_ids[1], transient),
+            IngestStatusUpdate(file_id=file_ids[2], ingest_status=IngestStatus.VERIFIED),
+            IngestStatusUpdate(file_id="unknown", ingest_status=IngestStatus.VERIFIED),
+        ]
+        assert await service.update_ingest_statuses(updates) == 3
+    assert await _states() == {
+        file_ids[0]: (IngestStatus.ERROR, transient, 1),
+        file_ids[1]: (IngestStatus.ERROR, transient, 1),
+        file_ids[2]: (IngestStatus.VERIFIED, None, None),
+    }
+
+    # Repeated errors of the same type are counted and other statuses clear the errors.
+    updates = [
+        _error(file_ids[0], transient),
+        _error(file_ids[1], permanent),
+        IngestStatusUpdate(file_id=file_ids[2], ingest_status=IngestStatus.READY, ingest_error="ignored"),
+    ]
+    assert await service.update_ingest_statuses(updates) == 3
+    assert await _states() == {
+        file_ids[0]: (IngestStatus.ERROR, transient, 2),
+        file_ids[1]: (IngestStatus.ERROR, permanent, 1),
+        file_ids[2]: (IngestStatus.READY, None, None),
+    }
+
+    assert (
+        await service.update_ingest_statuses(
+            [IngestStatusUpdate(file_id=file_ids[0], ingest_status=IngestStatus.READY)]
+        )
+        == 1
+    )
+    assert (await _states())[file_ids[0]] == (IngestStatus.READY, None, None)
+
+
 async def test_delete_file_by_id(
     submission_repository: SubmissionRepository,
     object_repository: ObjectRepository,
@@ -1,6 +1,7 @@
 """Test ObjectService."""
 
 import uuid
+from datetime import datetime
 
 import pytest
 
@@ -10,7 +11,7 @@ from metadata_backend.api.models.submission import SubmissionWorkflow
 from metadata_backend.database.postgres.models import ObjectEntity
 from metadata_backend.database.postgres.repositories.object import ObjectRepository
 from metadata_backend.database.postgres.repositories.submission import SubmissionRepository
-from metadata_backend.database.postgres.services.object import ObjectService
+from metadata_backend.database.postgres.services.object import NewObject, ObjectService
 from tests.unit.database.postgres.helpers import create_object_entity, create_submission_entity
 
 workflow = SubmissionWorkflow.SD
@@ -211,6 +212,37 @@ async def test_get_xml_documents(
     assert set(xml_documents) == {"<test/>"}
 
 
+async def test_get_xml_documents_filter(
+    submission_repository: SubmissionRepository,
+    object_repository: ObjectRepository,
+    object_service: ObjectService,
+):
+    submission = create_submission_entity()
+    await submission_repository.add_submission(submission)
+    submission_id = submission.submission_id
+
+    # Create objects.
+    objects = [
+        create_object_entity(submission.project_id, submission_id, object_type=object_type, xml_document=f"<test{i}/>")
+        for i, object_type in enumerate(["type1", "type2", "type1"])
+    ]
+    for obj in objects:
+        await object_repository.add_object(obj, workflow)
+
+    async def _get_xml_documents(object_type, **kwargs) -> list[str]:
+        return [document async for document in object_service.get_xml_documents(submission_id, object_type, **kwargs)]
+
+    # Ordered by the object types and created date.
+    assert await _get_xml_documents(["type2", "type1"]) == ["<test1/>", "<test0/>", "<test2/>"]
+    assert await _get_xml_documents("type1") == ["<test0/>", "<test2/>"]
+
+    # Filter by object id or name.
+    assert await _get_xml_documents("type1", object_id=objects[2].object_id) == ["<test2/>"]
+    assert await _get_xml_documents("type1", name=objects[2].name) == ["<test2/>"]
+    assert await _get_xml_documents("type1", object_id=objects[2].name, name=objects[2].name) == ["<test2/>"]
+    assert await _get_xml_documents("type1", object_id=objects[1].object_id) == []
+
+
 async def test_count_objects(
     submission_repository: SubmissionRepository,
     object_repository: ObjectRepository,
@@ -229,3 +261,104 @@ async def test_count_objects(
 
     assert await object_service.count_objects(submission.submission_id, object_type) == 3
     assert await object_service.count_objects(submission.submission_id, "other") == 0
+
+
+async def test_add_objects(
+    submission_repository: SubmissionRepository,
+    object_repository: ObjectRepository,
+    object_service: ObjectService,
+):
+    submission = create_submission_entity()
+    await submission_repository.add_submission(submission)
+    project_id = submission.project_id
+    submission_id = submission.submission_id
+
+    object_type = "test"
+    name = f"name_{uuid.uuid4()}"
+    name2 = f"name_{uuid.uuid4()}"
+    object_id = f"id_{uuid.uuid4()}"
+
+    objects = [
+        NewObject(name=name, object_type=object_type, object_id=object_id, xml_document="<test/>", title="test"),
+        NewObject(name=name2, object_type=object_type, document={"test": "test"}),
+    ]
+
+    object_ids = await object_service.add_objects(project_id, submission_id, objects, workflow)
+    assert len(object_ids) == 2
+    assert object_ids[0] == object_id
+
+    entity = await object_repository.get_object_by_id(object_id)
+    assert entity.name == name
+    assert entity.title == "test"
+    assert entity.xml_document == "<test/>"
+    entity = await object_repository.get_object_by_id(object_ids[1])
+    assert entity.name == name2
+    assert entity.document == {"test": "test"}
+
+    # Test that object name must be unique for an object type within a project.
+    with pytest.raises(
+        UserException,
+        match=f"Metadata object of type {object_type} with name {name} already exists in project {project_id}",
+    ):
+        await object_service.add_objects(
+            project_id, submission_id, [NewObject(name=name, object_type=object_type)], workflow
+        )
+
+    # Test that object name must be unique within the added objects.
+    name3 = f"name_{uuid.uuid4()}"
+    with pytest.raises(
+        UserException,
+        match=f"Metadata object of type {object_type} with name {name3} already exists in project {project_id}",
+    ):
+        await object_service.add_objects(
+            project_id,
+            submission_id,
+            [NewObject(name=name3, object_type=object_type), NewObject(name=name3, object_type=object_type)],
+            workflow,
+        )
+    assert not await object_service.is_object_by_name(project_id, name3, object_type)
+
+
+async def test_get_objects_page(
+    submission_repository: SubmissionRepository,
+    object_repository: ObjectRepository,
+    object_service: ObjectService,
+):
+    submission = create_submission_entity()
+    await submission_repository.add_submission(submission)
+    submission_id = submission.submission_id
+
+    # Create objects.
+    object_types = ["type1", "type2", "type1", "type2", "type1"]
+    object_ids = [
+        await object_repository.add_object(
+            create_object_entity(submission.project_id, submission_id, object_type=object_type), workflow
+        )
+        for object_type in object_types
+    ]
+
+    async def _get_pages(object_type, page_size: int) -> list[list[str]]:
+        pages = []
+        page_token = None
+        while True:
+            objects, page_token = await object_service.get_objects_page(
+                submission_id, object_type, page_size=page_size, page_token=page_token
+            )
+            pages.append([o.objectId for o in objects])
+            if page_token is None:
+                return pages
+
+    # Ordered by the object types and created date.
+    type1_ids = [object_ids[0], object_ids[2], object_ids[4]]
+    type2_ids = [object_ids[1], object_ids[3]]
+
+    assert await _get_pages(None, 2) == [object_ids[0:2], object_ids[2:4], object_ids[4:]]
+    assert await _get_pages(None, 5) == [object_ids]
+    assert await _get_pages("type1", 2) == [type1_ids[0:2], type1_ids[2:]]
+    assert await _get_pages(["type2", "type1"], 2) == [type2_ids, type1_ids[0:2], type1_ids[2:]]
+    assert await _get_pages(["type2", "type1"], 3) == [[*type2_ids, type1_ids[0]], type1_ids[1:]]
+
+    # Invalid page tokens.
+    for page_token in ["invalid", ObjectService.encode_page_token(("type3", datetime.now(), "id"))]:
+        with pytest.raises(UserException, match="Invalid page token"):
+            await object_service.get_objects_page(submission_id, ["type1", "type2"], page_size=2, page_token=page_token)
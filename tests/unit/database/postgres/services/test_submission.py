@@ -269,3 +269,40 @@ async def test_delete_submission(submission_repository: SubmissionRepository, su
 
     await submission_service.delete_submission(submission.submission_id)
     assert not await submission_service.is_submission_by_id(submission.submission_id)
+    assert await submission_repository.get_submission_by_id(submission.submission_id) is None
+
+
+async def test_get_submission_header(
+    submission_repository: SubmissionRepository, submission_service: SubmissionService
+):
+    submission = create_submission_entity(bucket="test")
+    await submission_repository.add_submission(submission)
+    submission_id = submission.submission_id
+    session().expunge_all()
+
+    with patch.object(
+        submission_repository, "get_submission_header", wraps=submission_repository.get_submission_header
+    ) as get_submission_header:
+        # The submission header is read once per request.
+        await submission_service.check_submission_by_id(submission_id)
+        assert await submission_service.get_project_id(submission_id) == submission.project_id
+        assert await submission_service.get_workflow(submission_id) == submission.workflow
+        assert await submission_service.get_bucket(submission_id) == "test"
+        assert not await submission_service.is_published(submission_id)
+        assert get_submission_header.await_count == 1
+
+        # The submission header is read again after the submission has changed.
+        await submission_service.publish(submission_id)
+        assert await submission_service.is_published(submission_id)
+        await submission_service.update_submission(submission_id, {"title": "updated"})
+        await session().flush()
+        session().expunge_all()
+        assert await submission_service.is_published(submission_id)
+        assert get_submission_header.await_count == 2
+
+        # Deleted submission.
+        await submission_service.delete_submission(submission_id)
+        assert not await submission_service.is_submission_by_id(submission_id)
+        with pytest.raises(UnknownSubmissionUserException):
+            await submission_service.get_workflow(submission_id)
+        assert get_submission_header.await_count == 3
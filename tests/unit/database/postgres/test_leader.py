@@ -0,0 +1,28 @@
+from metadata_backend.database.postgres.leader import LeaderElection
+from metadata_backend.database.postgres.repository import session
+
+
+async def test_leader_election_not_supported():
+    """Test that every worker is the leader for databases other than PostgreSQL."""
+    leader = LeaderElection(session().bind, "test_leader", retry_interval=0)
+    assert not leader.is_supported
+
+    runs = 0
+
+    class _Stop(BaseException):
+        pass
+
+    async def _action() -> None:
+        nonlocal runs
+        runs += 1
+        if runs == 1:
+            raise ValueError("failed")
+        if runs == 3:
+            raise _Stop()
+
+    # The action is started again if it fails or returns.
+    try:
+        await leader.run_forever(_action)
+    except _Stop:
+        pass
+    assert runs == 3
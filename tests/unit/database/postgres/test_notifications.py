@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from metadata_backend.database.postgres.notifications import NotificationListener, notify
+from metadata_backend.database.postgres.repository import _session_context, session
+
+
+async def test_notifications_not_supported(session_factory):
+    """Test that notifications are delivered only in this worker for databases other than PostgreSQL."""
+    notifications = []
+    connected = []
+    listener = NotificationListener(
+        session().bind, "test_channel", notifications.append, on_connect=lambda: connected.append(True)
+    )
+    assert not listener.is_supported
+    task = asyncio.create_task(listener.run_forever())
+    await asyncio.sleep(0)
+    assert connected == [True]
+
+    async def _notify(payload: str, *, commit: bool) -> None:
+        async with session_factory() as db_session:
+            token = _session_context.set(db_session)
+            try:
+                async with db_session.begin():
+                    await notify("test_channel", payload)
+                    await notify("other_channel", payload)
+                    assert payload not in notifications
+                    if not commit:
+                        raise RuntimeError("rollback")
+            finally:
+                _session_context.reset(token)
+
+    # Notifications are delivered when the transaction is committed.
+    await _notify("committed", commit=True)
+    assert notifications == ["committed"]
+
+    # Notifications are discarded when the transaction is rolled back.
+    with pytest.raises(RuntimeError):
+        await _notify("rolled back", commit=False)
+    await _notify("committed again", commit=True)
+    assert notifications == ["committed", "committed again"]
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await _notify("stopped", commit=True)
+    assert notifications == ["committed", "committed again"]
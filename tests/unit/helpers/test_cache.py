@@ -0,0 +1,146 @@
+"""Tests for caches of asynchronously loaded values."""
+
+import asyncio
+
+import pytest
+
+from metadata_backend.helpers.cache import Cache, CacheBackend, CacheEntry
+
+
+class DictCacheBackend(CacheBackend):
+    """Cache backend using a dictionary."""
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[str, str], CacheEntry[str]] = {}
+
+    async def get(self, namespace: str, key: str) -> CacheEntry[str] | None:
+        return self.entries.get((namespace, key))
+
+    async def set(self, namespace: str, key: str, entry: CacheEntry[str], maxsize: int) -> None:
+        self.entries[(namespace, key)] = entry
+
+
+async def test_cache_coalesces_loads():
+    """Concurrent requests for a value that is not cached share one load."""
+    cache = Cache[int]("test", int, maxsize=10, ttl=60, stale_ttl=60)
+    loads = 0
+    release = asyncio.Event()
+
+    async def load() -> int:
+        nonlocal loads
+        loads += 1
+        await release.wait()
+        return loads
+
+    tasks = [asyncio.create_task(cache.get("a", load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*tasks) == [1, 1, 1, 1, 1]
+    assert await cache.get("a", load) == 1
+    assert loads == 1
+
+    # A cancelled request does not cancel the shared load.
+    cache.clear()
+    release.clear()
+    first = asyncio.create_task(cache.get("a", load))
+    second = asyncio.create_task(cache.get("a", load))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+    assert await second == 2
+    assert len(cache) == 1
+
+
+async def test_cache_returns_stale_values():
+    """Stale values are returned while the value is loaded again in the background."""
+    cache = Cache[int]("test", int, maxsize=10, ttl=0, stale_ttl=60)
+    values = iter([1, 2])
+    release = asyncio.Event()
+
+    async def load() -> int:
+        value = next(values)
+        if value > 1:
+            await release.wait()
+        return value
+
+    assert await cache.get("a", load) == 1
+    # The stale value is returned and one background load is started.
+    assert await cache.get("a", load) == 1
+    assert await cache.get("a", load) == 1
+    release.set()
+    await asyncio.sleep(0.01)
+    assert await cache.get("a", load) == 2
+
+
+async def test_cache_load_errors():
+    """Failed loads are not cached, and a failed background load keeps the stale value."""
+    cache = Cache[int]("test", int, maxsize=10, ttl=0, stale_ttl=60)
+
+    async def fail() -> int:
+        raise ValueError("failed")
+
+    async def load() -> int:
+        return 1
+
+    with pytest.raises(ValueError):
+        await cache.get("a", fail)
+    assert len(cache) == 0
+
+    assert await cache.get("a", load) == 1
+    assert await cache.get("a", fail) == 1
+    await asyncio.sleep(0.01)
+    assert await cache.get("a", fail) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+async def test_cache_negative_ttl():
+    """None values are cached using the negative TTL."""
+    cache = Cache[int | None]("test", int | None, maxsize=10, ttl=60, negative_ttl=0)
+    values = iter([None, 1])
+
+    async def load() -> int | None:
+        return next(values)
+
+    assert await cache.get("a", load) is None
+    # The None value has expired.
+    assert await cache.get("a", load) == 1
+    assert await cache.get("a", load) == 1
+
+
+async def test_cache_backend():
+    """Values cached by one worker are used by other workers."""
+    backend = DictCacheBackend()
+    first = Cache[list[str]]("test", list[str], maxsize=10, ttl=60, backend=backend)
+    second = Cache[list[str]]("test", list[str], maxsize=10, ttl=60, backend=backend)
+    loads = 0
+
+    async def load() -> list[str]:
+        nonlocal loads
+        loads += 1
+        return ["a", "b"]
+
+    assert await first.get("a", load) == ["a", "b"]
+    assert backend.entries[("test", "a")].value == '["a","b"]'
+    assert await second.get("a", load) == ["a", "b"]
+    assert loads == 1
+
+
+async def test_cache_backend_errors():
+    """Values are loaded and cached in memory if the cache backend fails."""
+
+    class FailingCacheBackend(CacheBackend):
+        async def get(self, namespace: str, key: str) -> CacheEntry[str] | None:
+            raise ConnectionError("failed")
+
+        async def set(self, namespace: str, key: str, entry: CacheEntry[str], maxsize: int) -> None:
+            raise ConnectionError("failed")
+
+    cache = Cache[int]("test", int, maxsize=10, ttl=60, backend=FailingCacheBackend())
+
+    async def load() -> int:
+        return 1
+
+    assert await cache.get("a", load) == 1
+    assert len(cache) == 1
@@ -0,0 +1,51 @@
+"""Tests for metrics."""
+
+import pytest
+
+from metadata_backend.helpers.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_render_metrics():
+    """Test that metrics are rendered in the Prometheus text exposition format."""
+    registry = MetricsRegistry()
+    counter = Counter("test_requests_total", "Requests.", ("endpoint",), registry=registry)
+    gauge = Gauge("test_backlog", "Backlog.", registry=registry)
+    function_gauge = Gauge("test_files", "Files.", ("status",), registry=registry)
+    histogram = Histogram("test_duration_seconds", "Duration.", ("endpoint",), buckets=(1.0, 0.1), registry=registry)
+
+    counter.inc(endpoint='a"b')
+    counter.inc(2, endpoint='a"b')
+    gauge.set(3)
+    function_gauge.set_function(lambda: {("ready",): 5.0})
+    histogram.observe(0.05, endpoint="a")
+    histogram.observe(0.5, endpoint="a")
+    histogram.observe(5, endpoint="a")
+
+    assert counter.value(endpoint='a"b') == 3
+    assert function_gauge.value(status="ready") == 5
+    assert histogram.count(endpoint="a") == 3
+    assert registry.render() == (
+        "# HELP test_requests_total Requests.\n"
+        "# TYPE test_requests_total counter\n"
+        'test_requests_total{endpoint="a\\"b"} 3.0\n'
+        "# HELP test_backlog Backlog.\n"
+        "# TYPE test_backlog gauge\n"
+        "test_backlog 3.0\n"
+        "# HELP test_files Files.\n"
+        "# TYPE test_files gauge\n"
+        'test_files{status="ready"} 5.0\n'
+        "# HELP test_duration_seconds Duration.\n"
+        "# TYPE test_duration_seconds histogram\n"
+        'test_duration_seconds_bucket{endpoint="a",le="0.1"} 1\n'
+        'test_duration_seconds_bucket{endpoint="a",le="1.0"} 2\n'
+        'test_duration_seconds_bucket{endpoint="a",le="+Inf"} 3\n'
+        'test_duration_seconds_sum{endpoint="a"} 5.55\n'
+        'test_duration_seconds_count{endpoint="a"} 3\n'
+    )
+
+    with pytest.raises(ValueError):
+        counter.inc(endpoint="a", other="b")
+    with pytest.raises(ValueError):
+        counter.inc(-1, endpoint="a")
+    with pytest.raises(ValueError):
+        Counter("test_backlog", "Duplicate.", registry=registry)
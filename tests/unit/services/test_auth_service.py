@@ -1,20 +1,22 @@
 """Tests for Auth API handler."""
 
+import asyncio
 import hashlib
 import json
+import threading
 from base64 import urlsafe_b64encode
 from http.cookies import SimpleCookie
+from typing import Any
 from unittest.mock import MagicMock
 
 import jwt as pyjwt
 import pytest
 from fastapi import HTTPException
 from fastapi.responses import RedirectResponse
-from requests import Session
 from starlette import status
 
 from metadata_backend.api.services.auth import AuthService
-from metadata_backend.services.auth_service import AuthServiceHandler, DPoPHandler
+from metadata_backend.services.auth_service import AuthServiceHandler, DPoPHandler, _oidc_http_request
 from tests.unit.patches.auth_service import (
     MockDPoPHandler,
     mock_response,
@@ -138,54 +140,100 @@ async def test_dpop_proof_generation(dpop_test_jwks):
     assert payload_dict["ath"] == expected_ath
 
 
-async def test_patched_request(dpop_test_jwks):
-    """Test that patched request adds DPoP header and converts Bearer to DPoP."""
-    original_session_request = Session.request
+async def test_dpop_request(dpop_test_jwks, monkeypatch):
+    """Test that DPoP request adds DPoP header and converts Bearer to DPoP."""
     handler = DPoPHandler()
 
-    handler.setup_http_interception()
-    original_request = handler._original_request  # Save original request method
+    server_nonce = "server-provided-nonce-123"
+    mock_response = MagicMock()
+    mock_response.headers = {"DPoP-Nonce": server_nonce}
+    mock_request = MagicMock(return_value=mock_response)
+    monkeypatch.setattr("metadata_backend.services.auth_service.requests.request", mock_request)
+
+    def _proof_payload(headers: dict[str, str]) -> dict[str, Any]:
+        return json.loads(pyjwt.utils.base64url_decode(headers["DPoP"].split(".")[1] + "=="))
+
+    # Test 1: Token endpoint adds DPoP header and extracts nonce
+    handler.request("POST", "https://oidc.example.com/token", data="body", headers={})
+    token_headers = mock_request.call_args.kwargs["headers"]
+    assert mock_request.call_args.kwargs["data"] == "body"
+    assert len(token_headers["DPoP"]) > 0
+    assert handler.nonce == server_nonce
+
+    # Test 2: Userinfo endpoint uses extracted nonce and converts Bearer to DPoP
+    access_token = "test_access_token"
+    userinfo_headers = {"Authorization": f"Bearer {access_token}"}
+    handler.request("GET", "https://oidc.example.com/userinfo", headers=userinfo_headers)
+    sent_headers = mock_request.call_args.kwargs["headers"]
+
+    # Verify Authorization header changed from Bearer to DPoP without changing the caller headers
+    assert sent_headers["Authorization"] == f"DPoP {access_token}"
+    assert userinfo_headers == {"Authorization": f"Bearer {access_token}"}
+
+    # Verify DPoP header was added with ath claim and nonce from token endpoint
+    payload_dict = _proof_payload(sent_headers)
+    assert "ath" in payload_dict  # Should have access token binding
+    assert payload_dict["nonce"] == server_nonce  # Should use nonce from token response
+
+    assert mock_request.call_count == 2
+
+    # A new authentication attempt shares the key and has no nonce.
+    flow = handler.new_flow()
+    assert flow.nonce is None
+    assert flow.private_key is handler.private_key
+    assert handler.nonce == server_nonce
+
+
+async def test_callback_dpop(dpop_test_jwks, monkeypatch):
+    """Test that concurrent OIDC callbacks run outside the event loop with their own DPoP handlers."""
+    monkeypatch.setenv("OIDC_URL", "http://mock/oidc")
+    monkeypatch.setenv("OIDC_DPOP", "true")
+    monkeypatch.setenv("JWT_KEY", "bW9jay1zZWNyZXQtd2hpY2gtaXMtYXQtbGVhc3QtMzItYnl0ZXM=")
+    handler = AuthServiceHandler()
+
+    proofs = []
+
+    def _request(method, url, **kwargs):
+        if "DPoP" in kwargs["headers"]:
+            payload = json.loads(pyjwt.utils.base64url_decode(kwargs["headers"]["DPoP"].split(".")[1] + "=="))
+            proofs.append((kwargs["data"], payload["nonce"]))
+        response = MagicMock()
+        response.headers = {"DPoP-Nonce": f"nonce-{kwargs['data']}"}
+        return response
+
+    monkeypatch.setattr("metadata_backend.services.auth_service.requests.request", _request)
+
+    event_loop_thread = threading.get_ident()
+    barrier = threading.Barrier(2, timeout=10)
+
+    def _finalize(_issuer, session_info):
+        # Both callbacks are finalized concurrently in the OIDC threads.
+        assert threading.get_ident() != event_loop_thread
+        _oidc_http_request("POST", "http://mock/oidc/token", data=session_info["code"], headers={})
+        barrier.wait()
+        _oidc_http_request("POST", "http://mock/oidc/token", data=session_info["code"], headers={})
+        return {"userinfo": {"sub": session_info["code"]}}
+
+    mock_rph = MagicMock()
+    mock_rph.get_session_information.side_effect = lambda state: {"iss": "http://mock/oidc"}
+    mock_rph.finalize.side_effect = _finalize
+    mock_rph.get_valid_access_token.return_value = ("oidc-access-token", 0)
+    handler._rph = mock_rph
 
     try:
-        # Mock the original request to track both token and userinfo calls
-        mock_session = MagicMock(spec=Session)
-        server_nonce = "server-provided-nonce-123"
-        mock_response = MagicMock()
-        mock_response.headers = {"DPoP-Nonce": server_nonce}
-        mock_original_request = MagicMock(return_value=mock_response)
-        handler._original_request = mock_original_request
-
-        # Test 1: Token endpoint adds DPoP header and extracts nonce
-        token_kwargs = {"headers": {}}
-        handler._patched_request(mock_session, "POST", "https://oidc.example.com/token", **token_kwargs)
-        assert "DPoP" in token_kwargs["headers"]
-        assert len(token_kwargs["headers"]["DPoP"]) > 0
-        assert handler.nonce == server_nonce
-
-        # Test 2: Userinfo endpoint uses extracted nonce and converts Bearer to DPoP
-        access_token = "test_access_token"
-        userinfo_kwargs = {"headers": {"Authorization": f"Bearer {access_token}"}}
-        handler._patched_request(mock_session, "GET", "https://oidc.example.com/userinfo", **userinfo_kwargs)
-
-        # Verify Authorization header changed from Bearer to DPoP
-        assert userinfo_kwargs["headers"]["Authorization"].startswith("DPoP ")
-        assert access_token in userinfo_kwargs["headers"]["Authorization"]
-
-        # Verify DPoP header was added with ath claim and nonce from token endpoint
-        assert "DPoP" in userinfo_kwargs["headers"]
-        proof = userinfo_kwargs["headers"]["DPoP"]
-        parts = proof.split(".")
-        payload = pyjwt.utils.base64url_decode(parts[1] + "==")
-        payload_dict = json.loads(payload)
-        assert "ath" in payload_dict  # Should have access token binding
-        assert payload_dict["nonce"] == server_nonce  # Should use nonce from token response
-
-        # Original request was called once for /token, once for /userinfo
-        assert mock_original_request.call_count == 2
+        results = await asyncio.gather(handler.callback("state-1", "a"), handler.callback("state-2", "b"))
     finally:
-        handler._original_request = original_request  # Restore original request method (not mock)
-        handler.teardown_http_interception()
-        assert Session.request == original_session_request
+        await handler.close()
+
+    assert [AuthService.validate_jwt_token(jwt_token)[0] for jwt_token, _, _ in results] == ["a", "b"]
+    # The DPoP nonce is not shared between concurrent authentication attempts.
+    assert len(proofs) == 4
+    assert set(proofs) == {("a", None), ("a", "nonce-a"), ("b", None), ("b", "nonce-b")}
+    assert handler.dpop.nonce is None
+
+    # Requests outside the OIDC flow do not include DPoP proofs.
+    _oidc_http_request("GET", "http://mock/oidc/jwks", data="jwks", headers={})
+    assert len(proofs) == 4
 
 
 async def test_get_pouta_access_token_from_userinfo_success(mock_oidc_url, async_client, monkeypatch):
@@ -1,16 +1,8 @@
 from unittest.mock import AsyncMock
 
-import pytest
-from aiocache import caches
-
 from metadata_backend.services.ror_service import RorServiceHandler
 
 
-@pytest.fixture(autouse=True)
-async def clear_cache():
-    await caches.get("default").clear()
-
-
 async def test_is_ror_organisation_found():
     handler = RorServiceHandler()
 
@@ -65,3 +57,26 @@ async def test_is_ror_organisation_not_found():
 
     result = await handler.get_organisation("Nonexistent University")
     assert result is None
+
+
+async def test_is_ror_organisation_cached():
+    handler = RorServiceHandler()
+
+    mock_response = {
+        "items": [
+            {
+                "id": "http://www.yso.fi/onto/okm-organisaatio/1",
+                "names": [{"value": "University A", "types": ["ror_display"]}],
+            }
+        ]
+    }
+    handler._request = AsyncMock(return_value=mock_response)
+
+    assert await handler.get_organisation("University A") == await handler.get_organisation("University A")
+    handler._request.assert_called_once()
+
+    # Organisations that are not found are cached.
+    handler._request = AsyncMock(return_value={"items": []})
+    assert await handler.get_organisation("Nonexistent University") is None
+    assert await handler.get_organisation("Nonexistent University") is None
+    handler._request.assert_called_once()